@@ -0,0 +1,9 @@
+"""
+PaktLang Benchmark Package
+Sentetik şema üretici ve performans ölçümleri
+"""
+
+from .generator import SchemaShape, SyntheticTree, generate_tree
+from .runner import compare, measure, run
+
+__all__ = ["SchemaShape", "SyntheticTree", "generate_tree", "compare", "measure", "run"]
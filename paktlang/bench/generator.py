@@ -0,0 +1,364 @@
+"""
+PaktLang Synthetic Schema Generator
+Benchmark'lar için gerçek modüllere (cari, satis) benzeyen, ölçeği
+ayarlanabilir sentetik PaktLang ağacı ve veri dosyaları üretir
+"""
+
+import csv
+import json
+import random
+import shutil
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+
+# Dolgu kolonlarında döngüsel kullanılan tipler (gerçek modüllerdeki dağılıma yakın)
+FILLER_COLUMNS = [
+    {"type": "string", "max_length": 100},
+    {"type": "currency"},
+    {"type": "quantity"},
+    {"type": "date"},
+    {"type": "boolean", "default": False},
+    {"type": "integer", "min": 0, "max": 1000},
+    {"type": "text"},
+    {"type": "percentage"},
+    {"type": "datetime"},
+    {"type": "account_code"},
+    {"type": "enum", "values": ["acik", "kapali", "iptal"], "default": "acik"},
+    {"type": "unit_price"},
+]
+
+# Hazır ölçekler
+SCALES = {
+    "small": {"modules": 4, "tables": 6, "columns": 12, "fk_density": 1.5, "views": 2, "relations": 10, "rows": 2000},
+    "medium": {"modules": 12, "tables": 15, "columns": 20, "fk_density": 2.0, "views": 4, "relations": 60, "rows": 20000},
+    "large": {"modules": 40, "tables": 30, "columns": 30, "fk_density": 2.5, "views": 6, "relations": 300, "rows": 100000},
+}
+
+META_DIR = Path(__file__).resolve().parent.parent / "meta"
+MAPPINGS_FILE = Path(__file__).resolve().parent.parent / "mappings" / "erp_mappings.json"
+
+BENCH_ERP = "bench"
+
+
+class SchemaShape:
+    """Sentetik ağacın ölçek parametreleri"""
+
+    __slots__ = ("modules", "tables", "columns", "fk_density", "views", "relations", "rows", "seed")
+
+    def __init__(self, modules: int = 4, tables: int = 6, columns: int = 12,
+                 fk_density: float = 1.5, views: int = 2, relations: int = 10,
+                 rows: int = 2000, seed: int = 42):
+        """
+        Args:
+            modules: Modül sayısı
+            tables: Modül başına tablo sayısı (ilki ana kart tablosu)
+            columns: Tablo başına kolon sayısı (en az temel kolonlar kadar)
+            fk_density: Hareket tablosu başına ortalama foreign key sayısı
+            views: Modül başına aggregation view sayısı
+            relations: relations.json cross_module_relationships sayısı (üst sınır)
+            rows: Veri dosyalarındaki satır sayısı
+            seed: Rastgele sayı üreteci tohumu
+        """
+        self.modules = modules
+        self.tables = max(2, tables)
+        self.columns = columns
+        self.fk_density = fk_density
+        self.views = views
+        self.relations = relations
+        self.rows = rows
+        self.seed = seed
+
+    @classmethod
+    def scale(cls, name: str, **overrides) -> "SchemaShape":
+        params = dict(SCALES[name])
+        params.update({k: v for k, v in overrides.items() if v is not None})
+        return cls(**params)
+
+    def to_dict(self) -> Dict:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+def module_name(index: int) -> str:
+    return f"mod{index:03d}"
+
+
+def master_table(module: str) -> str:
+    return f"{module}_kart"
+
+
+def movement_table(module: str, index: int) -> str:
+    return f"{module}_hareket{index:02d}"
+
+
+class SyntheticTree:
+    """
+    Sentetik PaktLang ağacı.
+
+    Her modülde bir ana kart tablosu (cari_kart benzeri) ve ona bağlı
+    hareket tabloları (cari_hareket benzeri) bulunur. Hareket tabloları
+    aynı modüldeki önceki tablolara ve bağımlı olunan modüllerin kart
+    tablolarına FK ile bağlanır; bağımlılıklar her zaman önceki modüllere
+    yöneldiği için şema döngüsüzdür.
+    """
+
+    def __init__(self, shape: SchemaShape):
+        self.shape = shape
+        self.rng = random.Random(shape.seed)
+        self.modules: Dict[str, Dict] = {}
+        # (kaynak modül, tablo, kolon, hedef modül, hedef tablo)
+        self.links: List[Tuple[str, str, str, str, str]] = []
+        self._build()
+
+    # ------------------------------------------------------------------
+    # Şema
+    # ------------------------------------------------------------------
+
+    def _build(self):
+        for m in range(self.shape.modules):
+            name = module_name(m)
+            dependencies = sorted(set(
+                module_name(d) for d in self.rng.sample(range(m), min(m, 3))
+            ))
+            tables = [self._master(name)]
+            for t in range(1, self.shape.tables):
+                tables.append(self._movement(name, t, tables, dependencies))
+            self.modules[name] = {
+                "$schema": "paktlang://schema/module/v1",
+                "$id": f"paktlang://modules/{name}/v1",
+                "module": name,
+                "version": "1.0.0",
+                "description": f"Sentetik benchmark modülü {name}",
+                "dependencies": dependencies,
+                "priority": "medium",
+                "tables": tables,
+                "views": [self._view(name, v) for v in range(self.shape.views)],
+                "business_rules": [],
+            }
+
+    def _fill(self, columns: List[Dict]):
+        for i in range(len(columns), self.shape.columns):
+            column = {"name": f"alan_{i:02d}"}
+            column.update(FILLER_COLUMNS[i % len(FILLER_COLUMNS)])
+            columns.append(column)
+
+    def _master(self, module: str) -> Dict:
+        columns = [
+            {"name": "id", "type": "bigint", "primary_key": True, "auto_increment": True},
+            {"name": "kod", "type": "erp_code", "unique": True, "required": True},
+            {"name": "ad", "type": "string", "max_length": 200, "required": True},
+            {"name": "tip", "type": "enum", "values": ["musteri", "tedarikci", "her_ikisi"], "default": "musteri"},
+            {"name": "aktif", "type": "boolean", "default": True},
+        ]
+        self._fill(columns)
+        return {
+            "pl_table": master_table(module),
+            "description": "Ana kart tablosu",
+            "is_master": True,
+            "audit": True,
+            "columns": columns,
+            "indexes": [{"name": f"idx_{module}_kart_ad", "columns": ["ad"]}],
+        }
+
+    def _movement(self, module: str, index: int, previous: List[Dict],
+                  dependencies: List[str]) -> Dict:
+        name = movement_table(module, index)
+        columns = [
+            {"name": "id", "type": "bigint", "primary_key": True, "auto_increment": True},
+            {"name": "kart_id", "type": "bigint", "required": True, "indexed": True,
+             "foreign_key": {"table": master_table(module), "column": "id", "on_delete": "RESTRICT"}},
+            {"name": "belge_no", "type": "document_number", "required": True},
+            {"name": "tarih", "type": "date", "required": True},
+            {"name": "hareket_tipi", "type": "enum", "values": ["borc", "alacak"], "required": True},
+            {"name": "tutar", "type": "currency", "required": True},
+            {"name": "kapali", "type": "boolean", "default": False},
+        ]
+
+        extra = int(self.shape.fk_density) - 1
+        if self.rng.random() < self.shape.fk_density - int(self.shape.fk_density):
+            extra += 1
+        targets = [(module, t["pl_table"]) for t in previous[1:]]
+        targets += [(dep, master_table(dep)) for dep in dependencies]
+        for n, (target_module, target_table) in enumerate(
+                self.rng.sample(targets, min(max(extra, 0), len(targets)))):
+            column = f"ref{n}_id"
+            fk = {"table": target_table, "column": "id", "on_delete": "SET NULL"}
+            if target_module != module:
+                fk["module"] = target_module
+                self.links.append((module, name, column, target_module, target_table))
+            columns.append({"name": column, "type": "bigint", "foreign_key": fk})
+
+        self._fill(columns)
+        return {
+            "pl_table": name,
+            "description": "Hareket tablosu",
+            "is_transaction": True,
+            "columns": columns,
+            "indexes": [{"name": "idx_belge", "columns": ["belge_no"]},
+                        {"name": "idx_tarih", "columns": ["kart_id", "tarih"]}],
+        }
+
+    def _view(self, module: str, index: int) -> Dict:
+        movement = movement_table(module, 1 + index % (self.shape.tables - 1))
+        return {
+            "name": f"{module}_bakiye{index:02d}",
+            "description": "Kart bazında bakiye özeti",
+            "base_tables": [master_table(module), movement],
+            "columns": [
+                {"name": "kart_id", "source": f"{master_table(module)}.id"},
+                {"name": "kod", "source": f"{master_table(module)}.kod"},
+                {"name": "ad", "source": f"{master_table(module)}.ad"},
+                {"name": "toplam_borc", "aggregation": "SUM(borc)"},
+                {"name": "toplam_alacak", "aggregation": "SUM(alacak)"},
+                {"name": "bakiye", "computed": "toplam_borc - toplam_alacak"},
+                {"name": "acik_adet", "aggregation": "COUNT(kapali=false)"},
+                {"name": "son_tarih", "aggregation": "MAX(tarih)"},
+            ],
+        }
+
+    def relations(self) -> Dict:
+        links = self.links[:self.shape.relations]
+        flows = []
+        for name, module in self.modules.items():
+            steps = [{"module": dep, "table": master_table(dep), "action": "read"}
+                     for dep in module["dependencies"]]
+            steps += [{"module": name, "table": t["pl_table"], "action": "create"}
+                      for t in module["tables"][1:3]]
+            flows.append({"id": f"flow_{name}", "name": f"{name} akışı", "steps": steps})
+        return {
+            "$schema": "paktlang://schema/relations/v1",
+            "$id": "paktlang://relations/bench/v1",
+            "version": "1.0.0",
+            "description": "Sentetik benchmark ilişkileri",
+            "module_dependencies": {
+                name: {"depends_on": module["dependencies"]} for name, module in self.modules.items()
+            },
+            "cross_module_relationships": [
+                {
+                    "id": f"rel_{i:04d}",
+                    "source": {"module": module, "table": table, "column": column},
+                    "target": {"module": target_module, "table": target_table, "column": "id"},
+                    "type": "many_to_one",
+                }
+                for i, (module, table, column, target_module, target_table) in enumerate(links)
+            ],
+            "data_flows": flows,
+            "referential_integrity_rules": [
+                {
+                    "rule_id": f"RI{i:03d}",
+                    "source_table": master_table(name),
+                    "affected_tables": [t["pl_table"] for t in module["tables"][1:]],
+                    "action": "RESTRICT",
+                }
+                for i, (name, module) in enumerate(self.modules.items())
+            ],
+        }
+
+    def mappings(self) -> Dict:
+        """İlk modülün tabloları için sentetik ERP mapping'i"""
+        with open(MAPPINGS_FILE, 'r', encoding='utf-8') as f:
+            rules = json.load(f).get("conversion_rules", {})
+        first = module_name(0)
+        tables = {}
+        for table in self.modules[first]["tables"][:2]:
+            fields = {c["name"]: c["name"].upper() for c in table["columns"] if c["name"] != "id"}
+            tables[table["pl_table"]] = {
+                "erp_table": "BENCH_" + table["pl_table"].upper(),
+                "field_mappings": fields,
+            }
+        return {
+            "$schema": "paktlang://schema/mapping/v1",
+            "$id": "paktlang://mappings/bench/v1",
+            "version": "1.0.0",
+            "mapping_info": {"supported_erp_systems": [BENCH_ERP], "bidirectional": True},
+            BENCH_ERP: {"version": "1.0", "table_prefix": "BENCH_", "modules": {first: tables}},
+            "conversion_rules": rules,
+        }
+
+    # ------------------------------------------------------------------
+    # Veri
+    # ------------------------------------------------------------------
+
+    def _value(self, column: Dict, row: int, rng: random.Random):
+        kind = column["type"]
+        if column.get("primary_key"):
+            return row
+        if column.get("foreign_key"):
+            return rng.randint(1, self.shape.rows)
+        if kind == "erp_code":
+            return f"K{row:07d}"
+        if kind == "document_number":
+            return f"BLG-{row:08d}"
+        if kind == "account_code":
+            return f"{rng.choice((100, 120, 320, 600))}.{rng.randint(1, 99):02d}"
+        if kind in ("string", "text"):
+            return f"Kayıt {row} {rng.choice(('Ticaret', 'Sanayi', 'Gıda', 'Yapı'))}"
+        if kind == "enum":
+            return rng.choice(column["values"])
+        if kind == "boolean":
+            return rng.choice(("true", "false"))
+        if kind == "integer":
+            return rng.randint(column.get("min", 0), column.get("max", 1000))
+        if kind == "date":
+            return f"2025-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}"
+        if kind == "datetime":
+            return f"2025-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d} {rng.randint(0, 23):02d}:{rng.randint(0, 59):02d}:00"
+        if kind == "percentage":
+            return f"{rng.uniform(0, 100):.2f}"
+        return f"{rng.uniform(0, 100000):.2f}"
+
+    def write_rows(self, table: Dict, path: Path, rows: int = None) -> int:
+        rows = self.shape.rows if rows is None else rows
+        rng = random.Random(self.shape.seed + rows)
+        columns = table["columns"]
+        with open(path, 'w', encoding='utf-8', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow([c["name"] for c in columns])
+            for row in range(1, rows + 1):
+                writer.writerow([self._value(c, row, rng) for c in columns])
+        return rows
+
+    # ------------------------------------------------------------------
+    # Yazma
+    # ------------------------------------------------------------------
+
+    def write(self, base_path: str, data: bool = True) -> Path:
+        """
+        Ağacı <base_path>/paktlang altına yazar (meta dosyaları gerçek
+        ağaçtan kopyalanır). data=True ise ilk modülün kart ve ilk hareket
+        tablosu için <base_path>/data/<tablo>.csv dosyaları üretilir.
+
+        Returns:
+            base_path
+        """
+        base = Path(base_path)
+        root = base / "paktlang"
+        modules_dir = root / "modules" / "core"
+        modules_dir.mkdir(parents=True, exist_ok=True)
+        for name, module in self.modules.items():
+            with open(modules_dir / f"{name}.json", 'w', encoding='utf-8') as f:
+                json.dump(module, f, ensure_ascii=False, indent=2)
+
+        (root / "relations").mkdir(exist_ok=True)
+        with open(root / "relations" / "relations.json", 'w', encoding='utf-8') as f:
+            json.dump(self.relations(), f, ensure_ascii=False, indent=2)
+
+        (root / "mappings").mkdir(exist_ok=True)
+        with open(root / "mappings" / "erp_mappings.json", 'w', encoding='utf-8') as f:
+            json.dump(self.mappings(), f, ensure_ascii=False, indent=2)
+
+        shutil.copytree(META_DIR, root / "meta", dirs_exist_ok=True)
+
+        if data:
+            data_dir = base / "data"
+            data_dir.mkdir(exist_ok=True)
+            for table in self.modules[module_name(0)]["tables"][:2]:
+                self.write_rows(table, data_dir / f"{table['pl_table']}.csv")
+        return base
+
+
+def generate_tree(base_path: str, shape: Optional[SchemaShape] = None, data: bool = True) -> SyntheticTree:
+    """Sentetik ağacı üretip diske yazar"""
+    tree = SyntheticTree(shape or SchemaShape())
+    tree.write(base_path, data)
+    return tree
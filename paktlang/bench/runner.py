@@ -0,0 +1,258 @@
+"""
+PaktLang Benchmark Runner
+Validator fonksiyonları ve CLI komutları için süre/bellek ölçümü,
+JSON rapor ve kayıtlı baseline ile regresyon karşılaştırması
+"""
+
+import argparse
+import gc
+import io
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from contextlib import redirect_stderr, redirect_stdout
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+from paktlang.validator.schema_validator import SchemaValidator
+from paktlang.cli.paktlang_cli import main as cli_main
+
+from .generator import BENCH_ERP, SCALES, SchemaShape, generate_tree, master_table, module_name, movement_table
+
+
+REPORT_VERSION = 1
+
+# Karşılaştırılan metrikler ve gürültü eşikleri (bu farkın altı regresyon sayılmaz)
+COMPARED_METRICS = {"wall_median": 0.002, "peak_kb": 64}
+
+
+def measure(func: Callable[[], None], repeat: int = 5, warmup: int = 1,
+            memory: bool = True) -> Dict:
+    """
+    Fonksiyonu ölçer.
+
+    Süreler tracemalloc kapalıyken alınır; bellek ölçümü ayrı bir
+    çalıştırmada yapılır. gc_gen0 çalıştırma başına 0. nesil GC
+    toplama sayısıdır (ayırma yoğunluğunun göstergesi).
+    """
+    for _ in range(warmup):
+        func()
+
+    gc.collect()
+    collections = gc.get_stats()[0]["collections"]
+    times = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - started)
+    gen0 = (gc.get_stats()[0]["collections"] - collections) / repeat
+
+    result = {
+        "repeat": repeat,
+        "wall_min": round(min(times), 6),
+        "wall_median": round(statistics.median(times), 6),
+        "wall_mean": round(statistics.fmean(times), 6),
+        "gc_gen0": round(gen0, 1),
+    }
+
+    if memory:
+        gc.collect()
+        tracemalloc.start()
+        try:
+            func()
+            current, peak = tracemalloc.get_traced_memory()
+            blocks = sum(stat.count for stat in tracemalloc.take_snapshot().statistics("filename"))
+        finally:
+            tracemalloc.stop()
+        result["peak_kb"] = round(peak / 1024, 1)
+        result["retained_kb"] = round(current / 1024, 1)
+        result["retained_blocks"] = blocks
+    return result
+
+
+def run_cli(argv: List[str]):
+    """CLI komutunu aynı process'te, çıktısı bastırılarak çalıştırır"""
+    with redirect_stdout(io.StringIO()), redirect_stderr(io.StringIO()):
+        code = cli_main(argv)
+    if code not in (0, None):
+        raise RuntimeError(f"Komut başarısız ({code}): paktlang {' '.join(argv)}")
+
+
+def benchmarks(base: Path, work: Path) -> List[Tuple[str, Callable[[], None]]]:
+    """Sentetik ağaç üzerinde çalıştırılacak (ad, fonksiyon) listesi"""
+    base_arg = ["--base-path", str(base), "--no-cache"]
+    modules_dir = base / "paktlang" / "modules" / "core"
+    largest = max(modules_dir.glob("*.json"), key=lambda p: p.stat().st_size)
+    modules, relations = SchemaValidator(str(base)).load_schema()
+
+    kart = master_table(module_name(0))
+    hareket = movement_table(module_name(0), 1)
+    data = base / "data"
+    database = work / "bench.db"
+
+    return [
+        ("validate_module", lambda: SchemaValidator(str(base)).validate_module(str(largest))),
+        ("validate_all", lambda: SchemaValidator(str(base)).validate_all()),
+        ("validate_all[jobs=4]", lambda: SchemaValidator(str(base)).validate_all(jobs=4)),
+        ("validate_foreign_keys", lambda: SchemaValidator(str(base)).validate_foreign_keys(modules)),
+        ("validate_cross_module", lambda: SchemaValidator(str(base)).validate_cross_module(modules, relations)),
+        ("cli.validate", lambda: run_cli(base_arg + ["validate"])),
+        ("cli.validate[cached]", lambda: run_cli(
+            ["--base-path", str(base), "--cache-dir", str(work / "cache"), "validate"])),
+        ("cli.info", lambda: run_cli(base_arg + ["info", str(largest)])),
+        ("cli.list", lambda: run_cli(base_arg + ["list"])),
+        ("cli.stats", lambda: run_cli(base_arg + ["stats"])),
+        ("cli.order", lambda: run_cli(base_arg + ["order"])),
+        ("cli.views", lambda: run_cli(base_arg + ["views"])),
+        ("cli.check-data", lambda: run_cli(base_arg + ["check-data", hareket, str(data / f"{hareket}.csv")])),
+        ("cli.translate", lambda: run_cli(base_arg + [
+            "translate", BENCH_ERP, kart, str(data / f"{kart}.csv"),
+            "--to-erp", "--output", str(work / "translated.csv")])),
+        ("cli.load", lambda: run_cli(base_arg + ["load", str(database), str(data), "--replace"])),
+    ]
+
+
+def run(shape: SchemaShape, repeat: int = 5, memory: bool = True, only: List[str] = None,
+        keep: str = None, progress: Callable[[str, Dict], None] = None) -> Dict:
+    """
+    Sentetik ağacı üretir ve benchmark'ları çalıştırır.
+
+    Args:
+        only: Verilirse sadece adında bu parçalardan biri geçen benchmark'lar
+        keep: Ağacın yazılacağı dizin (verilmezse geçici dizin silinir)
+    """
+    with tempfile.TemporaryDirectory(prefix="paktlang_bench_") as tmp:
+        base = Path(keep) if keep else Path(tmp) / "tree"
+        work = Path(tmp)
+        started = time.perf_counter()
+        generate_tree(str(base), shape)
+        generate_seconds = time.perf_counter() - started
+
+        results = {}
+        for name, func in benchmarks(base, work):
+            if only and not any(part in name for part in only):
+                continue
+            results[name] = measure(func, repeat=repeat, memory=memory)
+            if progress:
+                progress(name, results[name])
+
+    return {
+        "version": REPORT_VERSION,
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "shape": shape.to_dict(),
+        "generate_seconds": round(generate_seconds, 4),
+        "results": results,
+    }
+
+
+def compare(current: Dict, baseline: Dict, threshold: float = 0.10) -> List[Dict]:
+    """
+    Raporu baseline ile karşılaştırır.
+
+    Returns:
+        Her (benchmark, metrik) için {name, metric, baseline, current,
+        ratio, status}; status regression/improvement/ok
+    """
+    rows = []
+    for name, result in current["results"].items():
+        old = baseline.get("results", {}).get(name)
+        if old is None:
+            continue
+        for metric, floor in COMPARED_METRICS.items():
+            if metric not in result or metric not in old:
+                continue
+            before, after = old[metric], result[metric]
+            ratio = after / before if before else 1.0
+            status = "ok"
+            if abs(after - before) >= floor:
+                if ratio > 1 + threshold:
+                    status = "regression"
+                elif ratio < 1 - threshold:
+                    status = "improvement"
+            rows.append({
+                "name": name, "metric": metric, "baseline": before,
+                "current": after, "ratio": round(ratio, 3), "status": status
+            })
+    return rows
+
+
+def print_result(name: str, result: Dict):
+    line = (f"  {name:<26} {result['wall_median'] * 1000:>10.2f} ms"
+            f"  (min {result['wall_min'] * 1000:.2f})  gc0 {result['gc_gen0']:>6}")
+    if "peak_kb" in result:
+        line += f"  peak {result['peak_kb']:>10,.1f} KB"
+    print(line)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m paktlang.bench",
+        description="PaktLang benchmark'ları (sentetik şema üzerinde)"
+    )
+    parser.add_argument("--scale", choices=sorted(SCALES), default="small", help="Hazır ölçek")
+    parser.add_argument("--modules", type=int, help="Modül sayısı")
+    parser.add_argument("--tables", type=int, help="Modül başına tablo sayısı")
+    parser.add_argument("--columns", type=int, help="Tablo başına kolon sayısı")
+    parser.add_argument("--fk-density", type=float, help="Hareket tablosu başına ortalama FK sayısı")
+    parser.add_argument("--views", type=int, help="Modül başına view sayısı")
+    parser.add_argument("--relations", type=int, help="Modüller arası ilişki sayısı (üst sınır)")
+    parser.add_argument("--rows", type=int, help="Veri dosyası satır sayısı")
+    parser.add_argument("--seed", type=int, help="Rastgele tohum")
+    parser.add_argument("--repeat", type=int, default=5, help="Ölçüm tekrarı")
+    parser.add_argument("--only", action="append", help="Sadece adında bu metin geçen benchmark'lar")
+    parser.add_argument("--no-memory", action="store_true", help="tracemalloc bellek ölçümünü atla")
+    parser.add_argument("--keep", help="Sentetik ağacı bu dizine yaz ve silme")
+    parser.add_argument("--output", "-o", help="JSON raporu dosyaya yaz (baseline olarak saklanabilir)")
+    parser.add_argument("--baseline", help="Karşılaştırılacak baseline JSON raporu")
+    parser.add_argument("--threshold", type=float, default=0.10, help="Regresyon eşiği (oran, varsayılan 0.10)")
+    parser.add_argument("--json", action="store_true", help="JSON raporu stdout'a yaz")
+    args = parser.parse_args(argv)
+
+    shape = SchemaShape.scale(
+        args.scale, modules=args.modules, tables=args.tables, columns=args.columns,
+        fk_density=args.fk_density, views=args.views, relations=args.relations,
+        rows=args.rows, seed=args.seed
+    )
+
+    if not args.json:
+        print(f"Ölçek: {json.dumps(shape.to_dict())}")
+    report = run(shape, repeat=args.repeat, memory=not args.no_memory, only=args.only,
+                 keep=args.keep, progress=None if args.json else print_result)
+
+    regressions = []
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        if baseline.get("shape") != report["shape"]:
+            print("[WARN] Baseline farklı bir ölçekle üretilmiş; karşılaştırma yanıltıcı olabilir",
+                  file=sys.stderr)
+        comparison = compare(report, baseline, args.threshold)
+        report["comparison"] = comparison
+        regressions = [row for row in comparison if row["status"] == "regression"]
+        if not args.json:
+            print()
+            for row in comparison:
+                if row["status"] != "ok":
+                    print(f"  [{row['status'].upper()}] {row['name']} {row['metric']}: "
+                          f"{row['baseline']} -> {row['current']} (x{row['ratio']})")
+            print(f"Regresyon: {len(regressions)}")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+    if args.json:
+        print(json.dumps(report, indent=2, ensure_ascii=False))
+
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
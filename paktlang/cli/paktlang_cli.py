@@ -5,19 +5,58 @@ Komut satırı arayüzü
 """
 
 import argparse
+import csv
 import json
+import os
 import sys
+import time
 from pathlib import Path
 
 # Proje path'ini ekle
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
+# Sadece schema_validator'ın zaten yüklediği modüller burada; motorlar, dil
+# sunucusu ve asyncio her komutun kendi içinde yüklenir (list/info gibi
+# komutların açılış süresi bunlara bağlı kalmasın)
 from paktlang.validator.schema_validator import SchemaValidator
+from paktlang.validator.cache import (
+    SchemaCache, DEFAULT_CACHE_DIR, module_header, relations_header
+)
+from paktlang.validator.graph import build_table_graph, cycle_is_required
+from paktlang.validator.model import SchemaModel
+from paktlang.validator.diagnostics import DiagnosticSink, NDJSONSink, ReportSink, SARIFSink, run_diagnostics
+from paktlang.validator.profiling import Profiler, format_profile
+from paktlang.validator.rules import LEVELS
+from paktlang.validator.type_registry import TypeRegistry
+
+def get_cache(args):
+    """Komut satırı seçeneklerine göre önbellek nesnesi (veya None)"""
+    if args.no_cache:
+        return None
+    if args.cache_dir:
+        return SchemaCache(args.cache_dir, SchemaValidator.rules_fingerprint())
+    base_path = Path(args.base_path) if args.base_path else Path.cwd()
+    return SchemaCache(base_path / DEFAULT_CACHE_DIR, SchemaValidator.rules_fingerprint())
+
+
+def read_header(cache, file_path, builder=module_header):
+    """Dosya özetini önbellekten (veya önbellek yoksa doğrudan dosyadan) okur"""
+    if cache is not None:
+        header, _ = cache.header(str(file_path), builder)
+        return header
+    with open(file_path, 'r', encoding='utf-8') as f:
+        return builder(json.load(f))
 
 
 def cmd_validate(args):
     """validate komutu"""
-    validator = SchemaValidator(args.base_path)
+    if args.watch:
+        return watch_validate(args)
+    
+    fmt = "json" if args.json else args.format
+    profiler = Profiler() if args.profile else None
+    validator = SchemaValidator(args.base_path, cache=get_cache(args), profiler=profiler,
+                                levels=args.level, stream=True if args.stream else None)
     
     if args.file:
         is_valid, _ = validator.validate_module(args.file)
@@ -27,41 +66,115 @@ def cmd_validate(args):
             "errors": [e.to_dict() for e in validator.errors],
             "warnings": [w.to_dict() for w in validator.warnings]
         }
+        events = [("module", Path(args.file).stem, result, args.file)]
     else:
-        result = validator.validate_all()
+        events = validator.iter_validation(jobs=args.jobs or os.cpu_count() or 1)
     
-    if args.json:
+    if fmt in ("ndjson", "sarif") or (fmt == "text" and not args.file and profiler is None):
+        # Akış çıktısı: bulgular modül modül yazılır, rapor bellekte toplanmaz
+        sink = TextSink() if fmt == "text" else diagnostic_sink(fmt, validator)
+        summary = run_diagnostics(events, sink, args.max_errors, args.fail_fast)
+        if profiler is not None:
+            print(format_profile(profiler.to_dict()), file=sys.stderr)
+        return 0 if summary["valid"] else 1
+    
+    if not args.file:
+        sink = ReportSink()
+        run_diagnostics(events, sink, args.max_errors, args.fail_fast)
+        result = sink.result
+    
+    if profiler is not None:
+        result["profile"] = profiler.to_dict(result["errors"] + result["warnings"])
+    
+    if fmt == "json":
         print(json.dumps(result, indent=2, ensure_ascii=False))
     else:
         print_validation_result(result)
+        if profiler is not None:
+            print(format_profile(result["profile"]))
     
     return 0 if result.get("valid", False) else 1
 
 
+def diagnostic_sink(fmt: str, validator: SchemaValidator):
+    """ndjson / sarif çıktısı için stdout'a yazan sink"""
+    if fmt == "ndjson":
+        return NDJSONSink(sys.stdout, validator.base_path)
+    rules = dict(SchemaValidator.ERROR_CODES)
+    for rule in validator.registry.rules:
+        rules.setdefault(rule.code, rule.name)
+    return SARIFSink(sys.stdout, validator.base_path, rules)
+
+
+def watch_validate(args):
+    """validate --watch - değişen modülleri artımlı olarak yeniden doğrular"""
+    from paktlang.validator.watch import IncrementalValidator, SchemaWatcher
+    
+    incremental = IncrementalValidator(args.base_path)
+    started = time.perf_counter()
+    initial = incremental.load()
+    initial["elapsed_ms"] = round((time.perf_counter() - started) * 1000, 2)
+    watcher = SchemaWatcher(incremental.watch_dirs, interval=args.interval)
+    
+    def emit(update):
+        result = incremental.report()
+        if args.json:
+            print(json.dumps({"update": update, "summary": result["summary"],
+                              "valid": result["valid"]}, ensure_ascii=False), flush=True)
+            return
+        
+        stamp = time.strftime("%H:%M:%S")
+        names = ", ".join(Path(p).name for p in update["changed"]) or "ilk yükleme"
+        scope = "tam doğrulama" if update["full"] else f"{len(update['revalidated'])} modül"
+        summary = result["summary"]
+        print(f"[{stamp}] {names} -> {scope} ({update.get('elapsed_ms', 0)} ms) | "
+              f"Hatalar: {summary['total_errors']}, Uyarilar: {summary['total_warnings']}")
+        
+        revalidated = set(update["revalidated"])
+        for mod_name, mod_result in result["modules"].items():
+            if mod_name not in revalidated:
+                continue
+            for err in mod_result["errors"]:
+                print(f"  [ERROR] [{err['code']}] {issue_location(err)}: {err['message']}")
+        sys.stdout.flush()
+    
+    emit(initial)
+    try:
+        watcher.run(lambda changed: emit(incremental.update(changed)))
+    except KeyboardInterrupt:
+        pass
+    
+    return 0
+
+
 def cmd_info(args):
     """info komutu - modül bilgilerini göster"""
-    validator = SchemaValidator(args.base_path)
+    cache = get_cache(args)
     
-    is_valid, data = validator.validate_json_syntax(args.file)
-    if not is_valid:
+    try:
+        data = read_header(cache, args.file)
+    except Exception:
         print(f"Hata: Dosya okunamadı")
         return 1
+    finally:
+        if cache is not None:
+            cache.save()
     
     print(f"\n{'='*50}")
-    print(f"Modül: {data.get('module', 'N/A')}")
-    print(f"Versiyon: {data.get('version', 'N/A')}")
-    print(f"Açıklama: {data.get('description', 'N/A')}")
+    print(f"Modül: {data.get('module') or 'N/A'}")
+    print(f"Versiyon: {data.get('version') or 'N/A'}")
+    print(f"Açıklama: {data.get('description') or 'N/A'}")
     print(f"{'='*50}\n")
     
     print("Tablolar:")
-    for table in data.get("tables", []):
-        table_name = table.get("pl_table")
-        col_count = len(table.get("columns", []))
-        is_master = "✓" if table.get("is_master") else " "
-        has_audit = "✓" if table.get("audit") else " "
+    for table in data["tables"]:
+        table_name = table["pl_table"]
+        col_count = table["columns"]
+        is_master = "✓" if table["is_master"] else " "
+        has_audit = "✓" if table["audit"] else " "
         print(f"  • {table_name} ({col_count} kolon) [master:{is_master}] [audit:{has_audit}]")
     
-    print(f"\nToplam: {len(data.get('tables', []))} tablo")
+    print(f"\nToplam: {data['counts']['tables']} tablo")
     
     deps = data.get("dependencies", [])
     if deps:
@@ -74,23 +187,26 @@ def cmd_list(args):
     """list komutu - tüm modülleri listele"""
     base_path = Path(args.base_path) if args.base_path else Path.cwd()
     modules_dir = base_path / "paktlang" / "modules" / "core"
+    cache = get_cache(args)
     
     print(f"\nPaktLang Modülleri ({modules_dir}):\n")
     
     for json_file in sorted(modules_dir.glob("*.json")):
         try:
-            with open(json_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = read_header(cache, json_file)
             
-            module_name = data.get("module", json_file.stem)
-            version = data.get("version", "?")
-            table_count = len(data.get("tables", []))
-            priority = data.get("priority", "normal")
+            module_name = data.get("module") or json_file.stem
+            version = data.get("version") or "?"
+            table_count = data["counts"]["tables"]
+            priority = data.get("priority") or "normal"
             
             print(f"  {module_name:15} v{version:8} {table_count:2} tablo  [{priority}]")
         except Exception as e:
             print(f"  {json_file.stem:15} ❌ Hata: {e}")
     
+    if cache is not None:
+        cache.save()
+    
     return 0
 
 
@@ -98,6 +214,7 @@ def cmd_stats(args):
     """stats komutu - istatistikleri göster"""
     base_path = Path(args.base_path) if args.base_path else Path.cwd()
     modules_dir = base_path / "paktlang" / "modules" / "core"
+    cache = get_cache(args)
     
     stats = {
         "modules": 0,
@@ -110,17 +227,13 @@ def cmd_stats(args):
     
     for json_file in modules_dir.glob("*.json"):
         try:
-            with open(json_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            counts = read_header(cache, json_file)["counts"]
             
             stats["modules"] += 1
-            
-            for table in data.get("tables", []):
-                stats["tables"] += 1
-                stats["columns"] += len(table.get("columns", []))
-                stats["indexes"] += len(table.get("indexes", []))
-            
-            stats["views"] += len(data.get("views", []))
+            stats["tables"] += counts["tables"]
+            stats["columns"] += counts["columns"]
+            stats["indexes"] += counts["indexes"]
+            stats["views"] += counts["views"]
         except Exception:
             pass
     
@@ -128,12 +241,14 @@ def cmd_stats(args):
     relations_file = base_path / "paktlang" / "relations" / "relations.json"
     if relations_file.exists():
         try:
-            with open(relations_file, 'r', encoding='utf-8') as f:
-                rel_data = json.load(f)
-            stats["relations"] = len(rel_data.get("cross_module_relations", []))
+            rel_header = read_header(cache, relations_file, relations_header)
+            stats["relations"] = rel_header["counts"]["relations"]
         except Exception:
             pass
     
+    if cache is not None:
+        cache.save()
+    
     print(f"\n{'='*40}")
     print("PaktLang İstatistikleri")
     print(f"{'='*40}\n")
@@ -148,6 +263,782 @@ def cmd_stats(args):
     return 0
 
 
+def cmd_order(args):
+    """order komutu - FK güvenli tablo yükleme sırası"""
+    validator = SchemaValidator(args.base_path, cache=get_cache(args))
+    modules, relations = validator.load_schema()
+    
+    graph = build_table_graph(modules, relations)
+    defined = {f"{m}.{t.get('pl_table')}" for m, d in modules.items() for t in d.get("tables", [])}
+    levels = [[n for n in level if n in defined] for level in graph.load_levels()]
+    cycles = graph.cycles(include_self_loops=False)
+    
+    if args.json:
+        print(json.dumps({
+            "order": [n for level in levels for n in level],
+            "levels": [level for level in levels if level],
+            "cycles": [{"path": c, "required": cycle_is_required(graph, c)} for c in cycles]
+        }, indent=2, ensure_ascii=False))
+        return 0
+    
+    print(f"\n{'='*50}")
+    print("PaktLang Tablo Yükleme Sırası")
+    print(f"{'='*50}\n")
+    
+    position = 0
+    for i, level in enumerate(l for l in levels if l):
+        print(f"Seviye {i}:")
+        for node in level:
+            position += 1
+            print(f"  {position:4}. {node}")
+    
+    if cycles:
+        print(f"\nDöngüler ({len(cycles)}):")
+        for cycle in cycles:
+            kind = "zorunlu" if cycle_is_required(graph, cycle) else "opsiyonel"
+            print(f"  [{kind}] {' -> '.join(cycle)}")
+    
+    return 0
+
+
+def cmd_check_data(args):
+    """check-data komutu - CSV/JSONL satırlarını tablo şemasına göre doğrular"""
+    from paktlang.engine.records import RecordValidator, read_rows
+    from paktlang.engine.sqlite_loader import resolve_table
+    
+    validator = SchemaValidator(args.base_path, cache=get_cache(args))
+    modules, _ = validator.load_schema()
+    found = resolve_table(modules, args.table)
+    if found is None:
+        print(f"Tablo bulunamadı: {args.table}", file=sys.stderr)
+        return 2
+    
+    module_name, table = found
+    types = TypeRegistry.load(validator.base_path / "paktlang" / "meta")
+    record_validator = RecordValidator(table, types, module_name)
+    
+    rows = {"count": 0}
+    
+    def counted(source):
+        for row in source:
+            rows["count"] += 1
+            yield row
+    
+    counts = {}
+    total = 0
+    started = time.perf_counter()
+    source = counted(read_rows(args.data, args.format, args.delimiter))
+    
+    for error in record_validator.validate_stream(source, args.batch_size):
+        total += 1
+        counts[error.code] = counts.get(error.code, 0) + 1
+        if args.max_errors is None or total <= args.max_errors:
+            if args.json:
+                print(json.dumps(error.to_dict(), ensure_ascii=False, default=str))
+            else:
+                print(f"[ERROR] {error}")
+    
+    elapsed = time.perf_counter() - started
+    if not args.json:
+        rate = rows["count"] / elapsed if elapsed > 0 else 0
+        print(f"\n{module_name}.{table['pl_table']}: {rows['count']} satır, "
+              f"{total} hata ({elapsed:.2f} sn, {rate:,.0f} satır/sn)")
+        for code in sorted(counts):
+            print(f"  {code}: {counts[code]}")
+    
+    return 0 if total == 0 else 1
+
+
+def cmd_translate(args):
+    """translate komutu - ERP satırlarını PaktLang satırlarına (veya tersine) çevirir"""
+    from paktlang.engine.mapping import MappingCatalog, TranslationError
+    from paktlang.engine.records import read_rows
+    
+    validator = SchemaValidator(args.base_path, cache=get_cache(args))
+    modules, _ = validator.load_schema()
+    root = validator.base_path / "paktlang"
+    catalog = MappingCatalog.load(
+        str(root / "mappings" / "erp_mappings.json"),
+        modules, TypeRegistry.load(root / "meta")
+    )
+    
+    try:
+        translator = catalog.translator(args.erp, args.table, args.firma)
+    except KeyError as e:
+        print(e.args[0], file=sys.stderr)
+        return 2
+    
+    rows = read_rows(args.data, args.format, args.delimiter)
+    converted = translator.iter_to_erp(rows) if args.to_erp else translator.iter_to_paktlang(rows)
+    
+    out = open(args.output, 'w', encoding='utf-8', newline='') if args.output else sys.stdout
+    count = 0
+    started = time.perf_counter()
+    try:
+        if args.output and args.output.lower().endswith(".csv"):
+            fieldnames = list(translator.field_map.values() if args.to_erp else translator.field_map)
+            writer = csv.DictWriter(out, fieldnames=fieldnames)
+            writer.writeheader()
+            for row in converted:
+                writer.writerow(row)
+                count += 1
+        else:
+            for row in converted:
+                out.write(json.dumps(row, ensure_ascii=False, default=str))
+                out.write("\n")
+                count += 1
+    except TranslationError as e:
+        print(f"[ERROR] satır {count + 1}: {e}", file=sys.stderr)
+        return 1
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    
+    elapsed = time.perf_counter() - started
+    target = translator.erp_table if args.to_erp else f"{translator.module}.{translator.table}"
+    print(f"{count} satır -> {target} ({elapsed:.2f} sn)", file=sys.stderr)
+    return 0
+
+
+def cmd_load(args):
+    """load komutu - şemadan SQLite veritabanı oluşturur ve veri dosyalarını yükler"""
+    from paktlang.engine.sqlite_loader import SQLiteLoader
+    
+    validator = SchemaValidator(args.base_path, cache=get_cache(args))
+    modules, _ = validator.load_schema()
+    types = TypeRegistry.load(validator.base_path / "paktlang" / "meta")
+    loader = SQLiteLoader(args.database, modules, types,
+                          batch_size=args.batch_size, cache_size_mb=args.cache_size)
+    
+    files = loader.discover(args.data_dir) if args.data_dir else {}
+    for item in args.file or []:
+        table, _, path = item.partition("=")
+        if table not in loader.plans or not path:
+            print(f"Geçersiz --file değeri (TABLO=DOSYA, tablo tanımlı olmalı): {item}", file=sys.stderr)
+            return 2
+        files[table] = Path(path)
+    
+    def progress(result):
+        if not args.json:
+            rate = result["rows"] / result["seconds"] if result["seconds"] else 0
+            print(f"  {result['table']:<32} {result['rows']:>10} satır  "
+                  f"{result['seconds']:>7.2f} sn  ({rate:,.0f} satır/sn)")
+    
+    if not args.json:
+        print(f"{args.database}: {len(loader.plans)} tablo, {len(files)} veri dosyası")
+    report = loader.load(files, replace=args.replace, delimiter=args.delimiter,
+                         check_fk=args.check_fk, progress=progress)
+    report["duplicates"] = [f"{m}.{t}" for m, t in loader.duplicates]
+    
+    if args.json:
+        print(json.dumps(report, indent=2, ensure_ascii=False))
+    else:
+        print(f"Index: {report['indexes']} ({report['index_seconds']:.2f} sn)")
+        print(f"Toplam: {report['rows']} satır, {report['seconds']:.2f} sn")
+        if report["duplicates"]:
+            print(f"Atlanan tekrar tablo tanımları: {', '.join(report['duplicates'])}")
+        for table, count in sorted(report["fk_violations"].items()):
+            print(f"  [FK] {table}: {count} ihlal")
+    
+    return 1 if report["fk_violations"] else 0
+
+
+def cmd_views(args):
+    """views komutu - modül view'larını SQL'e derler, SQLite'a kurar/yeniler"""
+    import sqlite3
+    from paktlang.engine.views import ViewCompiler, ViewMaterializer
+    
+    validator = SchemaValidator(args.base_path, cache=get_cache(args))
+    modules, _ = validator.load_schema()
+    types = TypeRegistry.load(validator.base_path / "paktlang" / "meta")
+    views = ViewCompiler(modules, types).compile_all()
+    if args.names:
+        unknown = set(args.names) - {v.name for v in views}
+        if unknown:
+            print(f"Tanımsız view: {', '.join(sorted(unknown))}", file=sys.stderr)
+            return 2
+        views = [v for v in views if v.name in args.names]
+    
+    if args.sql:
+        for view in views:
+            print(f"-- {view.module}.{view.name} ({view.kind})")
+            print(view.sql if view.create_sql else f"-- {view.reason}")
+            print()
+        return 0
+    
+    if (args.install or args.refresh) and not args.database:
+        print("--install/--refresh için --db gerekli", file=sys.stderr)
+        return 2
+    
+    installed = {}
+    if args.install or args.refresh:
+        conn = sqlite3.connect(args.database)
+        materializer = ViewMaterializer(conn)
+        for view in views:
+            if view.kind == "unsupported":
+                continue
+            started = time.perf_counter()
+            if args.install:
+                changed = materializer.install(view, force=args.refresh)
+            else:
+                changed = view.name in materializer.installed()
+                if changed:
+                    materializer.refresh(view)
+            installed[view.name] = round(time.perf_counter() - started, 4) if changed else None
+        conn.close()
+    elif args.database:
+        conn = sqlite3.connect(args.database)
+        installed = {name: None for name in ViewMaterializer(conn).installed()}
+        conn.close()
+    
+    if args.json:
+        report = []
+        for view in views:
+            item = view.to_dict()
+            item["installed"] = view.name in installed
+            item["seconds"] = installed.get(view.name)
+            report.append(item)
+        print(json.dumps(report, indent=2, ensure_ascii=False))
+        return 0
+    
+    for view in views:
+        mark = "*" if view.name in installed else " "
+        line = f"{mark} {view.module + '.' + view.name:<40} {view.kind:<13}"
+        if view.kind == "unsupported":
+            line += f" {view.reason}"
+        elif installed.get(view.name) is not None:
+            line += f" {installed[view.name]:.2f} sn"
+        print(line)
+    supported = sum(1 for v in views if v.kind != "unsupported")
+    print(f"\n{supported}/{len(views)} view derlendi")
+    return 0
+
+
+def position_suffix(issue):
+    return f" ({issue['line']}:{issue['column']})" if issue.get("line") is not None else ""
+
+
+def issue_location(issue):
+    """Bulgunun path'i; kaynak konumu biliniyorsa (satır:sütun) ile"""
+    if issue.get("line") is None:
+        return issue["path"]
+    return f"{issue['path']} ({issue['line']}:{issue['column']})"
+
+
+def cmd_serve(args):
+    """serve komutu - şemayı bellekte tutan JSON-RPC / LSP sunucusu"""
+    import asyncio
+    from paktlang.server import LanguageServer, Workspace
+    
+    server = LanguageServer(Workspace(args.base_path), debounce=args.debounce / 1000, poll=args.poll)
+    server.start()
+    try:
+        if args.port is not None:
+            asyncio.run(server.serve_tcp(args.host, args.port))
+        else:
+            asyncio.run(server.serve_stdio())
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+def cmd_fleet(args):
+    """fleet komutu - çok sayıda müşteri şema ağacını tek çalıştırmada doğrula"""
+    from paktlang.validator.fleet import FleetValidator
+    
+    base_paths = list(args.bases)
+    if args.from_file:
+        with open(args.from_file, 'r', encoding='utf-8') as f:
+            base_paths.extend(line.strip() for line in f if line.strip() and not line.startswith("#"))
+    if not base_paths:
+        print("Hata: Şema ağacı verilmedi", file=sys.stderr)
+        return 2
+    
+    fleet = FleetValidator(base_paths, levels=args.level, jobs=args.jobs or os.cpu_count() or 1,
+                           stream=True if args.stream else None)
+    try:
+        result = fleet.validate()
+    except (FileNotFoundError, ValueError) as e:
+        print(f"Hata: {e}", file=sys.stderr)
+        return 2
+    
+    if args.output:
+        output_dir = Path(args.output)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        for name, report in result["tenants"].items():
+            file_name = "".join(c if c.isalnum() or c in "-_." else "_" for c in name.strip("/"))
+            with open(output_dir / f"{file_name}.json", 'w', encoding='utf-8') as f:
+                json.dump(report, f, indent=2, ensure_ascii=False)
+        with open(output_dir / "fleet.json", 'w', encoding='utf-8') as f:
+            json.dump(result["summary"], f, indent=2, ensure_ascii=False)
+    
+    if args.json:
+        print(json.dumps(result["summary"] if args.output else result, indent=2, ensure_ascii=False))
+    else:
+        for name, report in result["tenants"].items():
+            summary = report["summary"]
+            status = "[OK]" if report["valid"] else "[FAIL]"
+            print(f"{status} {name}: {summary['valid_modules']}/{summary['total_modules']} modul gecerli, "
+                  f"Hatalar: {summary['total_errors']}, Uyarilar: {summary['total_warnings']}")
+            if args.verbose:
+                for err in report["errors"]:
+                    print(f"  [ERROR] [{err['code']}] {issue_location(err)}: {err['message']}")
+        summary = result["summary"]
+        print(f"\n{summary['valid_tenants']}/{summary['tenants']} sema agaci gecerli | "
+              f"{summary['files']} dosya ({summary['unique_files']} tekil), "
+              f"{summary['unique_trees']} tekil agac | "
+              f"Hatalar: {summary['total_errors']}, Uyarilar: {summary['total_warnings']} | "
+              f"{summary['elapsed_ms']} ms")
+    
+    return 0 if result["summary"]["valid_tenants"] == result["summary"]["tenants"] else 1
+
+
+def cmd_query(args):
+    """query komutu - şema kataloğunda filtre sorgusu"""
+    from paktlang.validator.catalog import Catalog, QueryError, format_entity
+    
+    base_paths = list(args.tenant or [])
+    if args.from_file:
+        with open(args.from_file, 'r', encoding='utf-8') as f:
+            base_paths.extend(line.strip() for line in f if line.strip() and not line.startswith("#"))
+    if not base_paths:
+        base_paths = [args.base_path or Path.cwd()]
+    
+    started = time.perf_counter()
+    catalog = Catalog.load(base_paths, cache=get_cache(args))
+    loaded = time.perf_counter()
+    
+    if args.describe:
+        fields = catalog.describe()
+        if args.json:
+            print(json.dumps({"counts": catalog.counts(), "fields": fields}, indent=2, ensure_ascii=False))
+        else:
+            for kind, count in catalog.counts().items():
+                print(f"{kind} ({count}): {', '.join(fields.get(kind, []))}")
+        return 0
+    
+    try:
+        entities = catalog.query(" ".join(args.query))
+    except QueryError as e:
+        print(f"Sorgu hatası: {e}", file=sys.stderr)
+        return 2
+    elapsed = time.perf_counter() - loaded
+    
+    total = len(entities)
+    if args.limit is not None:
+        entities = entities[:args.limit]
+    fields = args.fields.split(",") if args.fields else None
+    
+    if args.count:
+        print(total)
+    elif args.json:
+        keys = ["kind", "id"] + fields if fields else None
+        entities = [{k: e[k] for k in (keys or ["kind", "id"] + list(e)) if k in e} for e in entities]
+        print(json.dumps({"count": total, "results": entities}, indent=2, ensure_ascii=False))
+    else:
+        for entity in entities:
+            print(format_entity(entity, fields))
+        print(f"\n{total} sonuç (katalog {(loaded - started) * 1000:.1f} ms, sorgu {elapsed * 1000:.2f} ms)",
+              file=sys.stderr)
+    
+    return 0
+
+
+def cmd_diff(args):
+    """diff komutu - iki şema sürümünün yapısal farkı ve göç planı"""
+    from paktlang.validator.diff import diff_schemas
+    
+    meta_dirs = [Path(p) / "paktlang" / "meta" for p in (args.new, args.old)]
+    meta_dirs.append((Path(args.base_path) if args.base_path else Path.cwd()) / "paktlang" / "meta")
+    types = None
+    for meta_dir in meta_dirs:
+        if meta_dir.is_dir():
+            try:
+                types = TypeRegistry.load(str(meta_dir))
+                break
+            except (OSError, ValueError):
+                pass
+    
+    cache = get_cache(args)
+    try:
+        diff = diff_schemas(args.old, args.new, types, cache)
+    except (OSError, ValueError) as e:
+        print(f"Hata: {e}", file=sys.stderr)
+        return 2
+    finally:
+        if cache is not None:
+            cache.save()
+    
+    changes = [c.to_dict() for c in diff.changes]
+    plan = diff.migration_plan()
+    summary = diff.summary()
+    
+    if args.json:
+        print(json.dumps({"old": args.old, "new": args.new, "summary": summary,
+                          "changes": changes, "plan": plan}, indent=2, ensure_ascii=False))
+        return 1 if changes else 0
+    
+    if not args.plan:
+        for change in changes:
+            risk = " [VERI KAYBI]" if change.get("destructive") else ""
+            print(f"[{change['cost']:8}] {change['kind']:22} {change['path']}: {change['detail']}{risk}")
+    
+    if plan and not args.no_plan:
+        print(f"\nGöç planı ({len(plan)} adım):")
+        for entry in plan:
+            risk = " [VERI KAYBI]" if entry.get("destructive") else ""
+            print(f"  {entry['step']:4}. [{entry['cost']:8}] {entry['phase']:16} {entry['action']:22} "
+                  f"{entry['target']}: {entry['detail']}{risk}")
+    
+    costs = summary["by_cost"]
+    stats = summary["stats"]
+    print(f"\n{summary['changes']} değişiklik (metadata {costs['metadata']}, scan {costs['scan']}, "
+          f"rewrite {costs['rewrite']}), {summary['destructive']} veri kaybı riski")
+    if summary["rewrite_tables"]:
+        print(f"Yeniden yazılacak tablolar: {', '.join(summary['rewrite_tables'])}")
+    print(f"Atlanan (hash'i aynı): {stats['modules_skipped']}/{stats['modules']} modül, "
+          f"{stats['tables_skipped']}/{stats['tables']} tablo, {stats['columns_skipped']}/{stats['columns']} kolon")
+    
+    return 1 if changes else 0
+
+
+def cmd_codegen(args):
+    """codegen komutu - tablo şemalarından kayıt sınıfları ve NumPy dtype'ları üretir"""
+    from paktlang.engine.codegen import generate_module, table_layouts
+    
+    validator = SchemaValidator(args.base_path, cache=get_cache(args))
+    modules, _ = validator.load_schema()
+    types = TypeRegistry.load(validator.base_path / "paktlang" / "meta")
+    try:
+        layouts = table_layouts(modules, types, args.tables or None)
+    except KeyError as e:
+        print(e.args[0], file=sys.stderr)
+        return 2
+    
+    if args.layout:
+        output = json.dumps([layout.to_dict() for layout in layouts], indent=2, ensure_ascii=False)
+    else:
+        output = generate_module(layouts, args.style)
+    
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(output if output.endswith("\n") else output + "\n")
+        print(f"{args.output}: {len(layouts)} tablo", file=sys.stderr)
+    else:
+        print(output.rstrip("\n"))
+    return 0
+
+
+def cmd_check_integrity(args):
+    """check-integrity komutu - tablo dosyalarında foreign key / ilişki / RI kuralı kontrolü"""
+    from paktlang.engine.integrity import IntegrityChecker
+    from paktlang.engine.sqlite_loader import discover_files, select_tables
+    
+    validator = SchemaValidator(args.base_path, cache=get_cache(args))
+    modules, relations = validator.load_schema()
+    checker = IntegrityChecker(modules, relations, max_keys=args.max_keys, partitions=args.partitions,
+                               spill_dir=args.spill_dir, samples=args.samples, delimiter=args.delimiter)
+    tables, _ = select_tables(modules)
+    
+    files = discover_files(args.data_dir, tables) if args.data_dir else {}
+    for item in args.file or []:
+        table, _, path = item.partition("=")
+        if table not in tables or not path:
+            print(f"Geçersiz --file değeri (TABLO=DOSYA, tablo tanımlı olmalı): {item}", file=sys.stderr)
+            return 2
+        files[table] = Path(path)
+    if not files:
+        print("Veri dosyası bulunamadı", file=sys.stderr)
+        return 2
+    
+    def progress(step):
+        if not args.json:
+            rate = step["rows"] / step["seconds"] if step["seconds"] else 0
+            print(f"  {step['table']:<32} {step['phase']:<10} {step['rows']:>12} satır  "
+                  f"{step['seconds']:>7.2f} sn  ({rate:,.0f} satır/sn)", file=sys.stderr)
+    
+    report = checker.check(files, progress)
+    
+    if args.json:
+        print(json.dumps(report, indent=2, ensure_ascii=False))
+        return 0 if report["valid"] else 1
+    
+    checked = [link for link in report["links"] if link["status"] in ("ok", "violated")]
+    for link in report["links"]:
+        if link["status"] == "violated":
+            rows = ", ".join(str(s["row"]) for s in link["samples"])
+            print(f"[ORPHAN] {link['id']}: {link['orphans']}/{link['checked']} satır (örnek satırlar: {rows})")
+        elif link["status"] == "missing_column" or (args.verbose and link["status"] == "skipped"):
+            print(f"[{link['status'].upper()}] {link['id']}")
+    for key in report["keys"]:
+        if key["duplicates"]:
+            print(f"[DUPLICATE] {key['key']}: {key['duplicates']} tekrar eden anahtar")
+    for rule in report["rules"]:
+        if rule["status"] != "ok":
+            detail = f"{rule['orphans']} yetim satır" if rule["orphans"] else \
+                f"doğrulanamadı: {', '.join(rule['unresolved']) or 'eksik veri dosyası'}"
+            print(f"[{rule['rule_id']}] {rule['action']} {rule['source_table']}: {rule['status']} ({detail})")
+    
+    spilled = sum(1 for key in report["keys"] if key["spilled"])
+    print(f"\n{len(checked)}/{len(report['links'])} referans kontrol edildi, {report['orphans']} yetim satır, "
+          f"{sum(report['rows'].values())} satır ({report['seconds']:.2f} sn"
+          + (f", {spilled} anahtar kümesi diske taşındı)" if spilled else ")"))
+    return 0 if report["valid"] else 1
+
+
+def cmd_advise_indexes(args):
+    """advise-indexes komutu - kolon istatistiklerinden index ekleme/kaldırma önerileri"""
+    from paktlang.engine.indexes import IndexAdvisor
+    from paktlang.engine.sqlite_loader import discover_files
+    
+    if args.sample is not None and not 0 < args.sample <= 1:
+        print("--sample 0 ile 1 arasında olmalı", file=sys.stderr)
+        return 2
+    validator = SchemaValidator(args.base_path, cache=get_cache(args))
+    modules, relations = validator.load_schema()
+    advisor = IndexAdvisor(modules, relations, delimiter=args.delimiter, limit=args.limit,
+                           sample=args.sample, seed=args.seed)
+    
+    files = discover_files(args.data_dir, advisor.tables) if args.data_dir else {}
+    for item in args.file or []:
+        table, _, path = item.partition("=")
+        if table not in advisor.tables or not path:
+            print(f"Geçersiz --file değeri (TABLO=DOSYA, tablo tanımlı olmalı): {item}", file=sys.stderr)
+            return 2
+        files[table] = Path(path)
+    
+    def progress(step):
+        if not args.json:
+            rate = step["rows"] / step["seconds"] if step["seconds"] else 0
+            print(f"  {step['table']:<32} {step['rows']:>12} satır  {step['seconds']:>7.2f} sn  "
+                  f"({rate:,.0f} satır/sn)", file=sys.stderr)
+    
+    report = advisor.advise(files, progress)
+    
+    if args.json:
+        print(json.dumps(report, indent=2, ensure_ascii=False))
+        return 0
+    
+    def evidence(item):
+        if item.get("selectivity") is None:
+            return "seçicilik bilinmiyor"
+        text = f"seçicilik {item['selectivity']:g}"
+        if "distinct" in item:
+            text += (f", {item['distinct']}{'' if item['exact'] else '~'} ayrık, "
+                     f"null %{item['null_fraction'] * 100:g}, en sık %{item['max_frequency'] * 100:g}")
+        return text
+    
+    for key, table in report["tables"].items():
+        if not (table["add"] or table["drop"] or args.verbose):
+            continue
+        rows = "veri yok" if table["rows"] is None else \
+            f"{'>=' if table['truncated'] else ''}{table['rows']} satır"
+        print(f"{key} ({rows})")
+        for item in table["add"]:
+            index = item["index"]
+            print(f"  + {index['name']} ({', '.join(index['columns'])}) [{item['priority']}] "
+                  f"{evidence(item)}; {'; '.join(item['reasons'])}")
+        for item in table["drop"]:
+            print(f"  - {item['name']} ({', '.join(item['columns'])}) {evidence(item)}; {'; '.join(item['reasons'])}")
+        if args.verbose:
+            for item in table["skipped"]:
+                print(f"  = {item['column']}: {item['reason']}; {evidence(item)}")
+            if table["patch"]:
+                print("  patch: " + json.dumps(table["patch"], ensure_ascii=False))
+    
+    summary = report["summary"]
+    print(f"\n{summary['add']} index ekleme, {summary['drop']} index kaldırma önerisi "
+          f"({len(report['rows'])} tablo tarandı, {sum(report['rows'].values())} satır, {report['seconds']:.2f} sn)")
+    return 0
+
+
+def cmd_generate(args):
+    """generate komutu - data_flows ve FK'lere göre sentetik veri üretir"""
+    from paktlang.engine.synthetic import FlowGenerator
+    
+    fmt = args.format or ("sqlite" if Path(args.output).suffix.lower() in (".db", ".sqlite", ".sqlite3") else "csv")
+    validator = SchemaValidator(args.base_path, cache=get_cache(args))
+    modules, relations = validator.load_schema()
+    types = TypeRegistry.load(validator.base_path / "paktlang" / "meta")
+    try:
+        generator = FlowGenerator(modules, relations, types, documents=args.documents, masters=args.masters,
+                                  lines=args.lines, flows=args.flow, seed=args.seed)
+    except KeyError as e:
+        print(e.args[0], file=sys.stderr)
+        return 2
+    
+    def progress(step):
+        if not args.json:
+            rate = step["documents"] / step["seconds"] if step["seconds"] else 0
+            print(f"  {step['job']:<32} {step['kind']:<7} {step['documents']:>10} belge {step['rows']:>12} satır  "
+                  f"{step['seconds']:>7.2f} sn  ({rate:,.0f} belge/sn)", file=sys.stderr)
+    
+    report = generator.generate(args.output, fmt=fmt, jobs=args.jobs or os.cpu_count() or 1,
+                                delimiter=args.delimiter, check_fk=args.check_fk, progress=progress)
+    violations = report.get("fk_violations") or {}
+    
+    if args.json:
+        print(json.dumps(report, indent=2, ensure_ascii=False))
+        return 1 if violations else 0
+    
+    for step in report["skipped_steps"]:
+        print(f"[SKIP] {step} (mevcut satırı değiştiren adım, satır üretilmez)")
+    for table in report["missing_tables"]:
+        print(f"[MISSING] {table} (tablo tanımlı değil)")
+    for column in report["unsupported"]:
+        print(f"[EMPTY] {column} (zorunlu kolon için değer üretilemedi)")
+    for table, count in sorted(violations.items()):
+        print(f"  [FK] {table}: {count} ihlal")
+    rate = report["documents"] / report["seconds"] * 60 if report["seconds"] else 0
+    print(f"\n{report['output']} ({fmt}): {len(report['flows'])} akış, {report['documents']} belge, "
+          f"{len(report['tables'])} tablo, {report['rows']} satır, {report['seconds']:.2f} sn "
+          f"({rate:,.0f} belge/dk)")
+    return 1 if violations else 0
+
+
+def cmd_match_erp(args):
+    """match-erp komutu - ERP veritabanı kataloğunu erp_mappings.json ile karşılaştırır"""
+    import sqlite3
+    from paktlang.engine.erp_schema import ERPCatalog, MappingMatcher
+    from paktlang.engine.mapping import MappingCatalog
+    
+    validator = SchemaValidator(args.base_path, cache=get_cache(args))
+    modules, _ = validator.load_schema()
+    root = validator.base_path / "paktlang"
+    mappings = MappingCatalog.load(
+        str(root / "mappings" / "erp_mappings.json"),
+        modules, TypeRegistry.load(root / "meta")
+    )
+    if args.erp and args.erp not in mappings.systems:
+        print(f"ERP mapping bulunamadı: {args.erp}", file=sys.stderr)
+        return 2
+    
+    started = time.perf_counter()
+    try:
+        catalog = ERPCatalog.load(args.catalog)
+    except (OSError, sqlite3.Error) as e:
+        print(f"Katalog okunamadı: {e}", file=sys.stderr)
+        return 2
+    loaded = time.perf_counter() - started
+    
+    matcher = MappingMatcher(mappings, catalog, suggestions=args.suggestions)
+    reports = [matcher.match(args.erp, args.firma, args.donem)] if args.erp \
+        else matcher.match_all(args.firma, args.donem)
+    incomplete = any(r["coverage"]["fields"] < r["coverage"]["fields_total"] for r in reports[:1])
+    
+    if args.json:
+        print(json.dumps({"catalog_seconds": round(loaded, 3), "reports": reports}, indent=2, ensure_ascii=False))
+        return 1 if incomplete else 0
+    
+    print(f"{catalog.source}: {len(catalog.tables)} tablo, {catalog.column_count} kolon ({loaded:.2f} sn)")
+    if not args.erp:
+        for report in reports:
+            coverage = report["coverage"]
+            print(f"  {report['erp']:<10} {coverage['tables']}/{coverage['tables_total']} tablo, "
+                  f"{coverage['fields']}/{coverage['fields_total']} alan (%{coverage['ratio'] * 100:.0f})")
+        print()
+    
+    report = reports[0]
+    for table in report["tables"]:
+        target = f"{table['module']}.{table['table']} -> {table['erp_table']}"
+        if not table["matches"]:
+            hint = f" (benzer: {', '.join(table['suggestions'])})" if table.get("suggestions") else ""
+            print(f"[MISSING] {target}{hint}")
+            continue
+        # Aynı sonucu veren firma/dönem tabloları tek satırda gösterilir
+        groups = {}
+        for match in table["matches"]:
+            key = json.dumps([match["missing"], match["conflicts"]], sort_keys=True)
+            groups.setdefault(key, []).append(match)
+        for group in groups.values():
+            first = group[0]
+            names = first["table"] if len(group) == 1 else f"{first['table']} +{len(group) - 1} firma/dönem"
+            status = "OK" if not (first["missing"] or first["conflicts"]) else "DIFF"
+            if status == "OK" and not args.verbose:
+                continue
+            print(f"[{status}] {target} ({names})")
+            for item in first["missing"]:
+                hint = f" (benzer: {', '.join(item['suggestions'])})" if item.get("suggestions") else ""
+                print(f"    eksik kolon: {item['erp']} <- {item['paktlang']}{hint}")
+            for item in first["conflicts"]:
+                print(f"    tip: {item['erp']} {item['erp_type']} <- {item['paktlang']} "
+                      f"{item['paktlang_type']} ({item['reason']})")
+    
+    coverage = report["coverage"]
+    catalog_info = report["catalog"]
+    print(f"\n{report['erp']}: {coverage['tables']}/{coverage['tables_total']} tablo, "
+          f"{coverage['fields']}/{coverage['fields_total']} alan eşleşti (%{coverage['ratio'] * 100:.1f}); "
+          f"katalogdaki {catalog_info['matched']} tablo kullanıldı ({report['seconds']:.2f} sn)")
+    return 1 if incomplete else 0
+
+
+def cmd_model(args):
+    """model komutu - sıkıştırılmış şema modelini oluşturur, dosyaya yazar veya açar"""
+    if args.file:
+        try:
+            model = SchemaModel.open(args.file)
+        except (OSError, ValueError) as e:
+            print(f"Model açılamadı: {e}", file=sys.stderr)
+            return 2
+    else:
+        validator = SchemaValidator(args.base_path, cache=get_cache(args))
+        model = validator.load_model()
+        if args.output:
+            model.save(args.output)
+    
+    summary = model.summary()
+    summary["modules_detail"] = {
+        name: {"version": model.module_version(i), "tables": len(model.module_tables(name)),
+               "columns": sum(len(t.column_ids) for t in model.module_tables(name))}
+        for i, name in enumerate(model.module_names())
+    }
+    if args.output:
+        summary["output"] = args.output
+    model.close()
+    
+    if args.json:
+        print(json.dumps(summary, indent=2, ensure_ascii=False))
+        return 0
+    
+    for name, detail in summary["modules_detail"].items():
+        print(f"  {name:<28} v{detail['version'] or '?':<8} {detail['tables']:>5} tablo {detail['columns']:>7} kolon")
+    print(f"\n{summary['modules']} modül, {summary['tables']} tablo, {summary['columns']} kolon, "
+          f"{summary['strings']} ayrı ad; {summary['bytes'] / 1024:.1f} KB"
+          f"{' (mmap)' if summary['mapped'] else ''}")
+    if args.output:
+        print(f"-> {args.output}")
+    return 0
+
+
+class TextSink(DiagnosticSink):
+    """print_validation_result() ile aynı çıktı; modüller doğrulandıkça yazılır"""
+    
+    def begin(self):
+        print(f"\n{'='*50}")
+        print("PaktLang Schema Validation Report")
+        print(f"{'='*50}\n")
+    
+    def module(self, name, valid, file, errors, warnings):
+        sys.stdout.flush()
+        print(f"{'[OK]' if valid else '[FAIL]'} {name}")
+    
+    def issue(self, issue, module, file):
+        # Modüller arası bulgular raporda olduğu gibi sadece özette sayılır
+        if module is not None:
+            tag = "ERROR" if issue["severity"] == "error" else "WARN"
+            print(f"  [{tag}] [{issue['code']}] {issue['message']}{position_suffix(issue)}")
+    
+    def end(self, summary):
+        print(f"\n{'='*50}")
+        print(f"Toplam: {summary['valid_modules']}/{summary['total_modules']} modul gecerli")
+        print(f"Hatalar: {summary['total_errors']}, Uyarilar: {summary['total_warnings']}")
+        if summary.get("stopped") == "max_errors":
+            print("Hata sınırına ulaşıldı (--max-errors), doğrulama durduruldu")
+        elif summary.get("stopped") == "fail_fast":
+            print("İlk hatada durduruldu (--fail-fast)")
+        sys.stdout.flush()
+
+
 def print_validation_result(result):
     """Doğrulama sonucunu güzel formatta yazdır"""
     print(f"\n{'='*50}")
@@ -160,10 +1051,10 @@ def print_validation_result(result):
             print(f"{status} {mod_name}")
             
             for err in mod_result.get("errors", []):
-                print(f"  [ERROR] [{err['code']}] {err['message']}")
+                print(f"  [ERROR] [{err['code']}] {err['message']}{position_suffix(err)}")
             
             for warn in mod_result.get("warnings", []):
-                print(f"  [WARN] [{warn['code']}] {warn['message']}")
+                print(f"  [WARN] [{warn['code']}] {warn['message']}{position_suffix(warn)}")
         
         summary = result.get("summary", {})
         print(f"\n{'='*50}")
@@ -175,13 +1066,15 @@ def print_validation_result(result):
         print(f"Durum: {status}\n")
         
         for err in result.get("errors", []):
-            print(f"[ERROR] [{err['code']}] {err['path']}: {err['message']}")
+            print(f"[ERROR] [{err['code']}] {issue_location(err)}: {err['message']}")
         
         for warn in result.get("warnings", []):
-            print(f"[WARN] [{warn['code']}] {warn['path']}: {warn['message']}")
+            print(f"[WARN] [{warn['code']}] {issue_location(warn)}: {warn['message']}")
 
 
-def main():
+def build_parser():
+    """Komut satırı ayrıştırıcısı; motor modüllerini yüklememek için
+    varsayılanlar motor sabitlerinin kopyasıdır (testlerde karşılaştırılır)"""
     parser = argparse.ArgumentParser(
         prog="paktlang",
         description="PaktLang Şema Yönetim Aracı"
@@ -191,15 +1084,182 @@ def main():
         help="Proje ana dizini",
         default=None
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Derlenmiş şema önbelleğini kullanma"
+    )
+    parser.add_argument(
+        "--cache-dir",
+        help=f"Önbellek dizini (varsayılan: <base-path>/{DEFAULT_CACHE_DIR})",
+        default=None
+    )
     
     subparsers = parser.add_subparsers(dest="command", help="Komutlar")
     
     # validate komutu
     validate_parser = subparsers.add_parser("validate", help="Şema doğrulama")
     validate_parser.add_argument("--file", "-f", help="Tek dosya doğrula")
-    validate_parser.add_argument("--json", action="store_true", help="JSON çıktı")
+    validate_parser.add_argument("--json", action="store_true", help="JSON çıktı (--format json)")
+    validate_parser.add_argument(
+        "--format", choices=("text", "json", "ndjson", "sarif"), default="text",
+        help="Çıktı formatı; ndjson ve sarif bulguları modül modül akış halinde yazar"
+    )
+    validate_parser.add_argument(
+        "--max-errors", type=int,
+        help="Bu kadar hata bulunduktan sonra doğrulamayı durdur"
+    )
+    validate_parser.add_argument(
+        "--fail-fast", action="store_true",
+        help="Hata içeren ilk modülden (veya ilk modüller arası hatadan) sonra durdur"
+    )
+    validate_parser.add_argument(
+        "--jobs", "-j", type=int, default=1,
+        help="Paralel doğrulama process sayısı (0: CPU sayısı)"
+    )
+    validate_parser.add_argument(
+        "--watch", "-w", action="store_true",
+        help="Dosyaları izle, değişen modülleri artımlı olarak yeniden doğrula"
+    )
+    validate_parser.add_argument(
+        "--interval", type=float, default=0.2,
+        help="İzleme tarama aralığı (saniye)"
+    )
+    validate_parser.add_argument(
+        "--level", action="append", choices=LEVELS,
+        help="Sadece bu doğrulama seviyesi (tekrarlanabilir; varsayılan: paktlang.meta.json)"
+    )
+    validate_parser.add_argument(
+        "--profile", action="store_true",
+        help="Faz, kural (PL001-PL010) ve modül bazında süre/sayaç dökümü"
+    )
+    validate_parser.add_argument(
+        "--stream", action="store_true",
+        help="Tüm modül dosyalarını tablo tablo akış halinde oku (varsayılan: sadece 4 MB üzeri)"
+    )
     validate_parser.set_defaults(func=cmd_validate)
     
+    # fleet komutu
+    fleet_parser = subparsers.add_parser("fleet", help="Çok sayıda müşteri şema ağacını doğrula")
+    fleet_parser.add_argument("bases", nargs="*", help="Şema ağaçlarının ana dizinleri")
+    fleet_parser.add_argument("--from", dest="from_file", help="Ana dizin listesi dosyası (satır başına bir dizin)")
+    fleet_parser.add_argument(
+        "--jobs", "-j", type=int, default=0,
+        help="Paralel doğrulama process sayısı (0: CPU sayısı)"
+    )
+    fleet_parser.add_argument(
+        "--level", action="append", choices=LEVELS,
+        help="Sadece bu doğrulama seviyesi (tekrarlanabilir; varsayılan: her ağacın paktlang.meta.json dosyası)"
+    )
+    fleet_parser.add_argument("--stream", action="store_true", help="Modül dosyalarını akış halinde oku")
+    fleet_parser.add_argument("--output", "-o", help="Ağaç başına JSON rapor ve fleet.json özetinin yazılacağı dizin")
+    fleet_parser.add_argument("--verbose", "-v", action="store_true", help="Hataları ağaç bazında yazdır")
+    fleet_parser.add_argument("--json", action="store_true", help="JSON çıktı")
+    fleet_parser.set_defaults(func=cmd_fleet)
+    
+    # query komutu
+    query_parser = subparsers.add_parser(
+        "query", help="Şema kataloğunda sorgu (örn: column type=currency not required)"
+    )
+    query_parser.add_argument("query", nargs="*", help="Filtre ifadesi: [tür] alan=değer and/or/not ...")
+    query_parser.add_argument("--tenant", "-t", action="append", help="Şema ağacı ana dizini (tekrarlanabilir)")
+    query_parser.add_argument("--from", dest="from_file", help="Ana dizin listesi dosyası (satır başına bir dizin)")
+    query_parser.add_argument("--fields", help="Gösterilecek alanlar (virgülle ayrılmış)")
+    query_parser.add_argument("--limit", type=int, help="En fazla sonuç sayısı")
+    query_parser.add_argument("--count", action="store_true", help="Sadece sonuç sayısını yazdır")
+    query_parser.add_argument("--describe", action="store_true", help="Varlık türlerini ve alanlarını listele")
+    query_parser.add_argument("--json", action="store_true", help="JSON çıktı")
+    query_parser.set_defaults(func=cmd_query)
+    
+    # diff komutu
+    diff_parser = subparsers.add_parser("diff", help="İki şema sürümünü karşılaştır, göç planı üret")
+    diff_parser.add_argument("old", help="Eski modül dosyası veya şema dizini")
+    diff_parser.add_argument("new", help="Yeni modül dosyası veya şema dizini")
+    diff_parser.add_argument("--plan", action="store_true", help="Sadece göç planını yazdır")
+    diff_parser.add_argument("--no-plan", action="store_true", help="Göç planını yazdırma")
+    diff_parser.add_argument("--json", action="store_true", help="JSON çıktı")
+    diff_parser.set_defaults(func=cmd_diff)
+    
+    # codegen komutu
+    codegen_parser = subparsers.add_parser("codegen", help="Tablo şemalarından kayıt sınıfları ve NumPy dtype'ları üret")
+    codegen_parser.add_argument("tables", nargs="*", help="Tablolar (varsayılan: tümü; 'tablo' veya 'modül.tablo')")
+    codegen_parser.add_argument("--style", choices=("slots", "dataclass"), default="slots",
+                                help="Sınıf stili: __slots__ veya frozen dataclass (varsayılan: slots)")
+    codegen_parser.add_argument("--layout", action="store_true", help="Kod yerine kolon yerleşimini JSON olarak yazdır")
+    codegen_parser.add_argument("--output", "-o", help="Çıktı dosyası (varsayılan: stdout)")
+    codegen_parser.set_defaults(func=cmd_codegen)
+    
+    # check-integrity komutu
+    integrity_parser = subparsers.add_parser("check-integrity",
+                                             help="Tablo dosyalarında foreign key, ilişki ve RI kurallarını kontrol et")
+    integrity_parser.add_argument("data_dir", nargs="?", help="Veri dizini (tablo.csv / modül.tablo.jsonl)")
+    integrity_parser.add_argument("--file", action="append", help="Tablo dosyası: TABLO=DOSYA (tekrarlanabilir)")
+    integrity_parser.add_argument("--max-keys", type=int, default=5_000_000,
+                                  help="Bellekte tutulacak en fazla anahtar (varsayılan: %(default)s)")
+    integrity_parser.add_argument("--partitions", type=int, default=64,
+                                  help="Diske taşan anahtar kümesi başına bölüm (varsayılan: %(default)s)")
+    integrity_parser.add_argument("--spill-dir", help="Geçici dosya dizini (varsayılan: sistem temp)")
+    integrity_parser.add_argument("--samples", type=int, default=20, help="Referans başına örnek yetim satır")
+    integrity_parser.add_argument("--delimiter", default=",", help="CSV ayırıcı")
+    integrity_parser.add_argument("--verbose", "-v", action="store_true", help="Atlanan referansları da göster")
+    integrity_parser.add_argument("--json", action="store_true", help="JSON çıktı")
+    integrity_parser.set_defaults(func=cmd_check_integrity)
+    
+    # advise-indexes komutu
+    advise_parser = subparsers.add_parser("advise-indexes",
+                                          help="Kolon istatistiklerinden index ekleme/kaldırma önerileri")
+    advise_parser.add_argument("data_dir", nargs="?",
+                               help="Veri dizini (tablo.csv / modül.tablo.jsonl); verilmezse sadece şema")
+    advise_parser.add_argument("--file", action="append", help="Tablo dosyası: TABLO=DOSYA (tekrarlanabilir)")
+    advise_parser.add_argument("--limit", type=int, help="Tablo başına en fazla incelenecek satır")
+    advise_parser.add_argument("--sample", type=float, help="Satır örnekleme oranı (0-1]")
+    advise_parser.add_argument("--seed", type=int, default=0, help="Örnekleme tohumu")
+    advise_parser.add_argument("--delimiter", default=",", help="CSV ayırıcı")
+    advise_parser.add_argument("--verbose", "-v", action="store_true",
+                               help="Öneri olmayan tabloları, atlanan adayları ve patch'leri de göster")
+    advise_parser.add_argument("--json", action="store_true", help="JSON çıktı")
+    advise_parser.set_defaults(func=cmd_advise_indexes)
+    
+    # generate komutu
+    generate_parser = subparsers.add_parser("generate",
+                                            help="data_flows ve FK'lere göre sentetik veri üret (CSV/JSONL/SQLite)")
+    generate_parser.add_argument("output", help="Çıktı dizini (csv/jsonl) veya SQLite veritabanı dosyası")
+    generate_parser.add_argument("--format", "-f", choices=("csv", "jsonl", "sqlite"),
+                                 help="Çıktı biçimi (varsayılan: .db/.sqlite uzantısında sqlite, yoksa csv)")
+    generate_parser.add_argument("--documents", "-n", type=int, default=1000,
+                                 help="Akış başına belge (varsayılan: %(default)s)")
+    generate_parser.add_argument("--masters", type=int, default=1000,
+                                 help="Master tablo başına satır (varsayılan: %(default)s)")
+    generate_parser.add_argument("--lines", type=int, default=3,
+                                 help="Belge başına kalem satırı (varsayılan: %(default)s)")
+    generate_parser.add_argument("--flow", action="append", help="Sadece bu akış (data_flows id, tekrarlanabilir)")
+    generate_parser.add_argument("--seed", type=int, default=0, help="Tohum; aynı tohum aynı çıktıyı verir")
+    generate_parser.add_argument("--jobs", "-j", type=int, default=0, help="Process sayısı (0: CPU sayısı)")
+    generate_parser.add_argument("--delimiter", default=",", help="CSV ayırıcı")
+    generate_parser.add_argument("--check-fk", action="store_true", help="SQLite çıktısında FK bütünlüğünü kontrol et")
+    generate_parser.add_argument("--json", action="store_true", help="JSON rapor")
+    generate_parser.set_defaults(func=cmd_generate)
+    
+    # match-erp komutu
+    match_parser = subparsers.add_parser("match-erp",
+                                         help="ERP veritabanı kataloğunu (DDL/SQLite) erp_mappings.json ile karşılaştır")
+    match_parser.add_argument("catalog", help="CREATE TABLE dökümü (.sql) veya SQLite kataloğu")
+    match_parser.add_argument("--erp", help="ERP sistemi (verilmezse tüm sistemler kapsama göre sıralanır)")
+    match_parser.add_argument("--firma", help="Sadece bu firma kodu (LG_{FIRMA}_ tabloları)")
+    match_parser.add_argument("--donem", help="Sadece bu dönem (LG_{FIRMA}_{DONEM}_ tabloları)")
+    match_parser.add_argument("--suggestions", type=int, default=3,
+                              help="Eksik tablo/kolon başına benzer ad önerisi (varsayılan: %(default)s)")
+    match_parser.add_argument("--verbose", "-v", action="store_true", help="Sorunsuz tabloları da listele")
+    match_parser.add_argument("--json", action="store_true", help="JSON rapor")
+    match_parser.set_defaults(func=cmd_match_erp)
+    
+    # model komutu
+    model_parser = subparsers.add_parser("model", help="Sıkıştırılmış şema modeli (mmap'lenebilir ikili dosya)")
+    model_parser.add_argument("--output", "-o", help="Modeli bu dosyaya yaz")
+    model_parser.add_argument("--file", help="Şema yerine bu model dosyasını aç")
+    model_parser.add_argument("--json", action="store_true", help="JSON çıktı")
+    model_parser.set_defaults(func=cmd_model)
+    
     # info komutu
     info_parser = subparsers.add_parser("info", help="Modül bilgileri")
     info_parser.add_argument("file", help="Modül dosyası")
@@ -213,7 +1273,71 @@ def main():
     stats_parser = subparsers.add_parser("stats", help="İstatistikler")
     stats_parser.set_defaults(func=cmd_stats)
     
-    args = parser.parse_args()
+    # order komutu
+    order_parser = subparsers.add_parser("order", help="FK güvenli tablo yükleme sırası")
+    order_parser.add_argument("--json", action="store_true", help="JSON çıktı")
+    order_parser.set_defaults(func=cmd_order)
+    
+    # check-data komutu
+    check_parser = subparsers.add_parser("check-data", help="Veri dosyasını tablo şemasına göre doğrula")
+    check_parser.add_argument("table", help="Tablo (tablo veya modül.tablo)")
+    check_parser.add_argument("data", help="CSV veya JSONL veri dosyası")
+    check_parser.add_argument("--format", choices=["csv", "jsonl"], help="Dosya formatı (varsayılan: uzantıdan)")
+    check_parser.add_argument("--delimiter", default=",", help="CSV ayracı")
+    check_parser.add_argument("--batch-size", type=int, default=10000, help="Batch başına satır sayısı")
+    check_parser.add_argument("--max-errors", type=int, default=None, help="Yazdırılacak en fazla hata sayısı")
+    check_parser.add_argument("--json", action="store_true", help="Hataları NDJSON olarak yaz")
+    check_parser.set_defaults(func=cmd_check_data)
+    
+    # translate komutu
+    translate_parser = subparsers.add_parser("translate", help="ERP <-> PaktLang satır dönüşümü")
+    translate_parser.add_argument("erp", help="ERP sistemi (netsis, logo, mikro, wolvox)")
+    translate_parser.add_argument("table", help="PaktLang tablo adı veya ERP tablo adı")
+    translate_parser.add_argument("data", help="CSV veya JSONL veri dosyası")
+    translate_parser.add_argument("--to-erp", action="store_true", help="PaktLang satırlarını ERP formatına çevir")
+    translate_parser.add_argument("--firma", help="Logo firma kodu (LG_{FIRMA}_ tabloları)")
+    translate_parser.add_argument("--format", choices=["csv", "jsonl"], help="Girdi formatı (varsayılan: uzantıdan)")
+    translate_parser.add_argument("--delimiter", default=",", help="CSV ayracı")
+    translate_parser.add_argument("--output", "-o", help="Çıktı dosyası (.csv veya JSONL; varsayılan: stdout)")
+    translate_parser.set_defaults(func=cmd_translate)
+    
+    # load komutu
+    load_parser = subparsers.add_parser("load", help="SQLite veritabanı oluştur ve veri yükle")
+    load_parser.add_argument("database", help="SQLite veritabanı dosyası")
+    load_parser.add_argument("data_dir", nargs="?", help="tablo.csv / tablo.jsonl dosyalarının dizini")
+    load_parser.add_argument("--file", action="append", metavar="TABLO=DOSYA", help="Tek dosya eşlemesi (tekrarlanabilir)")
+    load_parser.add_argument("--replace", action="store_true", help="Veritabanı varsa silip yeniden oluştur")
+    load_parser.add_argument("--delimiter", default=",", help="CSV ayracı")
+    load_parser.add_argument("--batch-size", type=int, default=50000, help="executemany batch boyutu")
+    load_parser.add_argument("--cache-size", type=int, default=256, help="SQLite sayfa önbelleği (MB)")
+    load_parser.add_argument("--check-fk", action="store_true", help="Yükleme sonrası FK bütünlüğünü kontrol et")
+    load_parser.add_argument("--json", action="store_true", help="JSON rapor")
+    load_parser.set_defaults(func=cmd_load)
+    
+    # views
+    views_parser = subparsers.add_parser("views", help="View'ları SQL'e derle, SQLite'a kur/yenile")
+    views_parser.add_argument("--db", dest="database", help="SQLite veritabanı dosyası")
+    views_parser.add_argument("names", nargs="*", help="Sadece bu view'lar")
+    views_parser.add_argument("--sql", action="store_true", help="Üretilen SQL'i yazdır")
+    views_parser.add_argument("--install", action="store_true", help="View'ları kur ve doldur (tanım değişmediyse atla)")
+    views_parser.add_argument("--refresh", action="store_true", help="Materialized view'ları tamamen yeniden hesapla")
+    views_parser.add_argument("--json", action="store_true", help="JSON çıktı")
+    views_parser.set_defaults(func=cmd_views)
+    
+    # serve
+    serve_parser = subparsers.add_parser("serve", help="Dil sunucusu (LSP / JSON-RPC)")
+    serve_parser.add_argument("--port", type=int, help="TCP portu (verilmezse stdin/stdout, 0: rastgele)")
+    serve_parser.add_argument("--host", default="127.0.0.1", help="TCP adresi")
+    serve_parser.add_argument("--debounce", type=float, default=50, help="Düzenlemeleri biriktirme süresi (ms)")
+    serve_parser.add_argument("--poll", type=float, default=0.5, help="Disk tarama aralığı (saniye, 0: kapalı)")
+    serve_parser.set_defaults(func=cmd_serve)
+    
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
     
     if not args.command:
         parser.print_help()
@@ -0,0 +1,14 @@
+"""
+PaktLang Engine Package
+Şema tanımları üzerinden ERP verisi işleyen motorlar
+"""
+
+from .records import RecordValidator, RowError, compile_tables, read_rows
+from .mapping import MappingCatalog, RowTranslator, TranslationError
+from .codegen import ColumnarTable, TableLayout, generate_module, table_layouts
+
+__all__ = [
+    "RecordValidator", "RowError", "compile_tables", "read_rows",
+    "MappingCatalog", "RowTranslator", "TranslationError",
+    "ColumnarTable", "TableLayout", "generate_module", "table_layouts"
+]
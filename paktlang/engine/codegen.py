@@ -0,0 +1,525 @@
+"""
+PaktLang Record Codegen
+Tablo şemalarından kompakt kayıt sınıfları ve NumPy sütunlu yerleşimler
+
+Satırları kolon adı anahtarlı dict olarak tutmak her satır için ayrı bir
+hash tablosu demektir. generate_module() her pl_table için __slots__'lu
+(veya slots'lu frozen dataclass) kayıt sınıfı içeren bağımsız bir Python
+modülü üretir; üretilen kod PaktLang'e veya NumPy'a bağımlı değildir.
+
+Sabit genişlikli kolonlar (tamsayı, decimal, boolean, tarih, enum) için
+NumPy structured dtype karşılığı da üretilir. Decimal kolonlar tam
+hassasiyet için ölçeklenmiş tamsayı (fixed-point) olarak tutulur:
+currency (18,4) -> int64, değer * 10^4. ColumnarTable bu yerleşimle
+satırları kolon dizilerine çevirir ve vektörel toplama yapar (NumPy
+gerekir; opsiyoneldir).
+"""
+
+import keyword
+import pprint
+import re
+from decimal import Decimal, InvalidOperation
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from paktlang.validator.symbols import column_name
+from paktlang.validator.type_registry import TypeRegistry
+
+from .sqlite_loader import BOOLEAN_CODES, select_tables
+
+
+STYLES = ("slots", "dataclass")
+
+# Temel tip -> Python tip ipucu
+PYTHON_TYPES = {
+    "integer": "int",
+    "bigint": "int",
+    "decimal": "Decimal",
+    "string": "str",
+    "text": "str",
+    "boolean": "bool",
+    "date": "date",
+    "datetime": "datetime",
+    "time": "time",
+    "enum": "str",
+    "json": "Any",
+    "uuid": "str",
+    "binary": "bytes"
+}
+
+# Temel tip -> Arrow benzeri mantıksal tip (decimal ve enum ayrıca çözülür)
+ARROW_TYPES = {
+    "integer": "int32",
+    "bigint": "int64",
+    "string": "utf8",
+    "text": "utf8",
+    "boolean": "bool",
+    "date": "date32",
+    "datetime": "timestamp[us]",
+    "time": "time64[us]",
+    "json": "utf8",
+    "uuid": "utf8",
+    "binary": "binary"
+}
+
+# Sabit genişlikli temel tipler -> NumPy dtype
+FIXED_DTYPES = {
+    "integer": "<i4",
+    "bigint": "<i8",
+    "boolean": "?",
+    "date": "<M8[D]",
+    "datetime": "<M8[us]",
+    "time": "<m8[us]"
+}
+
+_INT_RANGES = (
+    ("|i1", -2 ** 7, 2 ** 7 - 1),
+    ("<i2", -2 ** 15, 2 ** 15 - 1),
+    ("<i4", -2 ** 31, 2 ** 31 - 1),
+    ("<i8", -2 ** 63, 2 ** 63 - 1)
+)
+
+
+def _int_dtype(lo, hi, default: str) -> str:
+    """min/max biliniyorsa aralığa sığan en küçük tamsayı dtype'ı"""
+    if lo is None or hi is None:
+        return default
+    for dtype, low, high in _INT_RANGES:
+        if low <= lo and hi <= high:
+            return dtype
+    return default
+
+
+def class_name(table_name: str) -> str:
+    """stok_hareket -> StokHareket"""
+    name = "".join(part[:1].upper() + part[1:] for part in re.split(r"[^0-9A-Za-z]+", table_name) if part)
+    if not name or not name.isidentifier():
+        name = "T" + name
+    return name
+
+
+def attribute_name(name: str) -> str:
+    """Kolon adının Python tanımlayıcı karşılığı (class -> class_)"""
+    attr = re.sub(r"\W", "_", name)
+    if not attr or attr[0].isdigit():
+        attr = "_" + attr
+    if keyword.iskeyword(attr):
+        attr += "_"
+    return attr
+
+
+class ColumnLayout:
+    """Bir kolonun kayıt sınıfı ve sütunlu yerleşim bilgisi"""
+
+    __slots__ = ("name", "attr", "type", "base", "python", "nullable", "dtype",
+                 "scale", "categories", "arrow")
+
+    def __init__(self, column: Dict, types: TypeRegistry):
+        ctype = types.resolve(column)
+        self.name = column_name(column)
+        self.attr = attribute_name(self.name)
+        self.type = ctype.name
+        self.base = ctype.base
+        self.python = PYTHON_TYPES.get(ctype.base, "Any")
+        self.nullable = not (column.get("required") or column.get("primary_key"))
+        self.dtype: Optional[str] = FIXED_DTYPES.get(ctype.base)
+        self.scale: Optional[int] = None
+        self.categories: Optional[Tuple[str, ...]] = None
+        self.arrow = ARROW_TYPES.get(ctype.base, "utf8")
+
+        if ctype.base in ("integer", "bigint"):
+            self.dtype = _int_dtype(ctype.min, ctype.max, self.dtype)
+        elif ctype.base == "decimal":
+            precision = ctype.precision or 18
+            scale = ctype.scale or 0
+            self.arrow = f"decimal128({precision},{scale})"
+            if precision <= 9:
+                self.dtype, self.scale = "<i4", scale
+            elif precision <= 18:
+                self.dtype, self.scale = "<i8", scale
+            else:
+                # int64'e sığmaz; yaklaşık değer
+                self.dtype = "<f8"
+        elif ctype.base == "enum" and ctype.values:
+            self.categories = tuple(str(v) for v in ctype.values)
+            self.dtype = "|i1" if len(self.categories) <= 127 else "<i2"
+            self.arrow = f"dictionary<{'int8' if self.dtype == '|i1' else 'int16'}, utf8>"
+
+    @property
+    def fixed(self) -> bool:
+        """NumPy dtype'ı olan (sabit genişlikli) kolon mu"""
+        return self.dtype is not None
+
+    def to_dict(self) -> Dict:
+        return {slot: getattr(self, slot) for slot in self.__slots__}
+
+
+class TableLayout:
+    """Bir tablonun kayıt sınıfı ve dtype yerleşimi"""
+
+    __slots__ = ("module", "name", "class_name", "description", "columns")
+
+    def __init__(self, module: str, table: Dict, types: TypeRegistry):
+        self.module = module
+        self.name = table["pl_table"]
+        self.class_name = class_name(self.name)
+        self.description = table.get("description", "")
+        self.columns = [ColumnLayout(c, types) for c in table.get("columns", [])]
+
+    def column(self, name: str) -> ColumnLayout:
+        for layout in self.columns:
+            if layout.name == name:
+                return layout
+        raise KeyError(f"Kolon bulunamadı: {self.name}.{name}")
+
+    def dtype_spec(self) -> List[Tuple[str, str]]:
+        """NumPy structured dtype tanımı (sadece sabit genişlikli kolonlar)"""
+        return [(c.attr, c.dtype) for c in self.columns if c.fixed]
+
+    def to_dict(self) -> Dict:
+        return {
+            "module": self.module,
+            "table": self.name,
+            "class": self.class_name,
+            "dtype": self.dtype_spec(),
+            "columns": [c.to_dict() for c in self.columns]
+        }
+
+
+def table_layouts(modules: Dict[str, Dict], types: TypeRegistry,
+                  names: Iterable[str] = None) -> List[TableLayout]:
+    """
+    Tablo yerleşimleri; aynı tablo birden fazla modülde tanımlıysa en
+    yüksek sürümlü tanım kullanılır (SQLiteLoader ile aynı seçim).
+
+    Args:
+        names: Sadece bu tablolar ("stok_hareket" veya "stok.stok_hareket")
+    """
+    selected, _ = select_tables(modules)
+    # Dosya adı (stok_detailed_backup) yerine modülün kendi adı (stok)
+    found = {
+        name: (modules[stem].get("module", stem), table)
+        for name, (stem, table) in selected.items()
+    }
+    if names is None:
+        return [TableLayout(module, table, types) for module, table in found.values()]
+
+    layouts = []
+    for name in names:
+        module, _, table_name = name.rpartition(".")
+        match = found.get(table_name)
+        if match is None or (module and match[0] != module):
+            raise KeyError(f"Tablo bulunamadı: {name}")
+        layouts.append(TableLayout(match[0], match[1], types))
+    return layouts
+
+
+# ----------------------------------------------------------------------
+# Kod üretimi
+# ----------------------------------------------------------------------
+
+_HEADER = '''"""
+PaktLang kayıt sınıfları
+`paktlang codegen` ile üretilmiştir; elle düzenlemeyin.
+
+DTYPE: NumPy structured dtype tanımı (sabit genişlikli kolonlar)
+SCALES: ölçeklenmiş tamsayı olarak tutulan decimal kolonlar (değer * 10^scale)
+CATEGORIES: enum kolonların kod -> değer listesi
+"""
+{imports}
+
+class _Record:
+    """Üretilen kayıt sınıflarının ortak yardımcıları"""
+
+    __slots__ = ()
+
+    def as_tuple(self) -> tuple:
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __repr__(self):
+        fields = ", ".join(f"{{name}}={{getattr(self, name)!r}}" for name in self.__slots__)
+        return f"{{type(self).__name__}}({{fields}})"
+'''
+
+_SLOTS_EQ = '''
+    def __eq__(self, other):
+        return type(other) is type(self) and self.as_tuple() == other.as_tuple()
+
+    __hash__ = None
+'''
+
+
+def _literal(value: Any) -> str:
+    return repr(value)
+
+
+def _assign(name: str, value: Any) -> str:
+    """Sınıf gövdesinde uzun literal'leri satırlara bölen atama"""
+    prefix = f"    {name} = "
+    text = pprint.pformat(value, width=100 - len(prefix), compact=True, sort_dicts=False)
+    return prefix + text.replace("\n", "\n" + " " * len(prefix))
+
+
+def _class_source(layout: TableLayout, style: str) -> List[str]:
+    columns = layout.columns
+    attrs = [c.attr for c in columns]
+    lines = ["", ""]
+    if style == "dataclass":
+        lines.append("@dataclass(frozen=True, slots=True)")
+    lines.append(f"class {layout.class_name}(_Record):")
+    doc = f"{layout.module}.{layout.name}"
+    if layout.description:
+        doc += f" - {layout.description}"
+    lines.append(f"    {_docstring(doc)}")
+    lines.append("")
+
+    if style == "slots":
+        lines.append(_assign("__slots__", tuple(attrs)))
+        lines.append("")
+    lines.append(_assign("TABLE", f'{layout.module}.{layout.name}'))
+    lines.append(_assign("FIELDS", tuple(c.name for c in columns)))
+    lines.append(_assign("DTYPE", layout.dtype_spec()))
+    lines.append(_assign("SCALES", {c.attr: c.scale for c in columns if c.scale is not None}))
+    lines.append(_assign("CATEGORIES", {c.attr: c.categories for c in columns if c.categories}))
+    lines.append("")
+
+    if style == "dataclass":
+        for c in columns:
+            lines.append(f"    {c.attr}: Optional[{c.python}] = None")
+    else:
+        params = ",\n                 ".join(f"{c.attr}: Optional[{c.python}] = None" for c in columns)
+        lines.append(f"    def __init__(self, {params}):" if columns else "    def __init__(self):")
+        for attr in attrs:
+            lines.append(f"        self.{attr} = {attr}")
+        if not columns:
+            lines.append("        pass")
+
+    lines.append("")
+    lines.append("    @classmethod")
+    lines.append(f"    def from_dict(cls, row: Dict[str, Any]) -> \"{layout.class_name}\":")
+    lines.append("        get = row.get")
+    args = ", ".join(f"get({_literal(c.name)})" for c in columns)
+    lines.append(f"        return cls({args})")
+    lines.append("")
+    lines.append("    def to_dict(self) -> Dict[str, Any]:")
+    items = ", ".join(f"{_literal(c.name)}: self.{c.attr}" for c in columns)
+    lines.append(f"        return {{{items}}}")
+    if style == "slots":
+        lines.extend(_SLOTS_EQ.rstrip("\n").split("\n"))
+    return lines
+
+
+def _docstring(text: str) -> str:
+    return '"""' + text.replace("\\", "\\\\").replace('"""', '\\"\\"\\"') + '"""'
+
+
+def generate_module(layouts: List[TableLayout], style: str = "slots") -> str:
+    """
+    Kayıt sınıfları modülünün kaynak kodu.
+
+    Args:
+        style: "slots" (__slots__'lu sınıf) veya "dataclass"
+            (@dataclass(frozen=True, slots=True), Python 3.10+)
+    """
+    if style not in STYLES:
+        raise ValueError(f"Bilinmeyen stil: {style} (geçerli: {', '.join(STYLES)})")
+
+    used = {c.python for layout in layouts for c in layout.columns}
+    imports = []
+    if style == "dataclass":
+        imports.append("from dataclasses import dataclass")
+    temporal = sorted(used & {"date", "datetime", "time"})
+    if temporal:
+        imports.append(f"from datetime import {', '.join(temporal)}")
+    if "Decimal" in used:
+        imports.append("from decimal import Decimal")
+    imports.append("from typing import Any, Dict, Optional")
+
+    lines = [_HEADER.format(imports="\n" + "\n".join(imports) + "\n").rstrip("\n")]
+    for layout in layouts:
+        lines.extend(_class_source(layout, style))
+    lines.append("")
+    lines.append("")
+    lines.append("RECORDS = {")
+    for layout in layouts:
+        lines.append(f"    {_literal(layout.name)}: {layout.class_name},")
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+# ----------------------------------------------------------------------
+# Sütunlu yerleşim (NumPy)
+# ----------------------------------------------------------------------
+
+def _numpy():
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError("Sütunlu yerleşim için NumPy gerekli: pip install numpy") from None
+    return numpy
+
+
+def _scaled(value, scale: int) -> int:
+    """Decimal değeri 10^scale ile ölçeklenmiş tamsayıya çevirir"""
+    if isinstance(value, int) and not isinstance(value, bool):
+        return value * 10 ** scale
+    return int(Decimal(str(value)).scaleb(scale).to_integral_value())
+
+
+class ColumnarTable:
+    """
+    Bir tablonun sabit genişlikli kolonları için NumPy dizileri.
+
+    Her kolon bir değer dizisi ve Arrow'daki gibi bir geçerlilik maskesi
+    (valid[name][i] False ise satır i'de değer NULL) ile tutulur. Metin
+    kolonları alınmaz; kayıt sınıfları ile birlikte kullanılır.
+    """
+
+    def __init__(self, layout: TableLayout, values: Dict[str, Any], valid: Dict[str, Any], length: int):
+        self.layout = layout
+        self.values = values
+        self.valid = valid
+        self.length = length
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Any], layout: TableLayout) -> "ColumnarTable":
+        """
+        Args:
+            rows: Kolon adı anahtarlı dict'ler veya üretilen kayıt nesneleri
+        """
+        np = _numpy()
+        rows = rows if isinstance(rows, list) else list(rows)
+        length = len(rows)
+        records = length > 0 and not isinstance(rows[0], dict)
+
+        values = {}
+        valid = {}
+        for c in layout.columns:
+            if not c.fixed:
+                continue
+            if records:
+                attr = c.attr
+                items = [getattr(row, attr) for row in rows]
+            else:
+                name = c.name
+                items = [row.get(name) for row in rows]
+            mask = np.array([v is not None and v != "" for v in items], dtype=bool)
+            try:
+                values[c.attr] = cls._convert(np, c, items, mask)
+            except (ValueError, TypeError, InvalidOperation) as e:
+                raise ValueError(f"{layout.name}.{c.name}: {e}") from None
+            valid[c.attr] = mask
+        return cls(layout, values, valid, length)
+
+    @staticmethod
+    def _convert(np, c: ColumnLayout, items: List[Any], mask):
+        """Kolon değerlerini dtype'a çevirir; NULL yerine dolgu değeri yazılır"""
+        if c.categories is not None:
+            codes = {value: i for i, value in enumerate(c.categories)}
+            codes[""] = -1
+            try:
+                return np.array([codes[v] if type(v) is str else (-1 if v is None else codes[str(v)])
+                                 for v in items], dtype=c.dtype)
+            except KeyError as e:
+                raise ValueError(f"Geçersiz enum değeri: {e.args[0]}") from None
+        if c.base == "boolean":
+            return np.array([bool(BOOLEAN_CODES.get(v, v)) for v in items], dtype=bool)
+        if c.base == "time":
+            return np.array([_time_delta(np, str(v)) if ok else np.timedelta64("NaT")
+                             for v, ok in zip(items, mask.tolist())], dtype=c.dtype)
+
+        if not mask.all():
+            fill = "NaT" if c.base in ("date", "datetime") else ("nan" if c.dtype == "<f8" else 0)
+            items = [v if ok else fill for v, ok in zip(items, mask.tolist())]
+        if c.scale is None:
+            return np.array(items, dtype=c.dtype)
+
+        # Decimal: float üzerinden ölçeklenip yuvarlanır; |değer * 10^scale| < 2^50
+        # iken sonuç tam, daha büyük değerler Decimal ile tek tek çevrilir
+        scaled = np.rint(np.array(items, dtype=np.float64) * 10 ** c.scale)
+        if c.scale <= 15 and (not len(scaled) or np.abs(scaled).max() < 2 ** 50):
+            return scaled.astype(c.dtype)
+        return np.array([_scaled(v, c.scale) for v in items], dtype=c.dtype)
+
+    def __len__(self):
+        return self.length
+
+    @property
+    def nbytes(self) -> int:
+        return sum(a.nbytes for a in self.values.values()) + sum(m.nbytes for m in self.valid.values())
+
+    def column(self, name: str):
+        """Ham kolon dizisi (decimal: ölçeklenmiş tamsayı, enum: kategori kodu)"""
+        return self.values[self.layout.column(name).attr]
+
+    def as_float(self, name: str):
+        """Kolonun float64 karşılığı; NULL değerler NaN"""
+        np = _numpy()
+        c = self.layout.column(name)
+        result = self.values[c.attr].astype(np.float64)
+        if c.scale:
+            result /= 10 ** c.scale
+        result[~self.valid[c.attr]] = np.nan
+        return result
+
+    def sum(self, name: str):
+        """NULL olmayan değerlerin toplamı; decimal kolonlar için tam (Decimal)"""
+        c = self.layout.column(name)
+        selected = self.values[c.attr][self.valid[c.attr]]
+        return self._total(c, self._int_sum(selected) if c.scale is not None else selected.sum())
+
+    def group_sum(self, key: str, value: str) -> Dict[Any, Any]:
+        """
+        key kolonunun her değeri için value toplamı (vektörel); enum
+        anahtarlar kategori adıyla döner.
+        """
+        np = _numpy()
+        k = self.layout.column(key)
+        v = self.layout.column(value)
+        mask = self.valid[k.attr] & self.valid[v.attr]
+        keys = self.values[k.attr][mask]
+        amounts = self.values[v.attr][mask]
+        groups, inverse = np.unique(keys, return_inverse=True)
+        if amounts.dtype.kind in "iu":
+            totals = np.zeros(len(groups), dtype=np.int64)
+            np.add.at(totals, inverse, amounts.astype(np.int64))
+        else:
+            totals = np.zeros(len(groups), dtype=np.float64)
+            np.add.at(totals, inverse, amounts)
+
+        result = {}
+        for group, total in zip(groups.tolist(), totals.tolist()):
+            if k.categories is not None:
+                group = k.categories[group]
+            result[group] = self._total(v, total)
+        return result
+
+    def to_structured(self):
+        """Tüm sabit genişlikli kolonları tek structured dizide döner (DTYPE)"""
+        np = _numpy()
+        array = np.zeros(self.length, dtype=self.layout.dtype_spec())
+        for attr, values in self.values.items():
+            array[attr] = values
+        return array
+
+    @staticmethod
+    def _int_sum(values) -> int:
+        # int64 toplamı taşabilecekse Python tamsayısı ile toplanır
+        if not len(values):
+            return 0
+        bound = max(abs(int(values.max())), abs(int(values.min())))
+        if bound * len(values) < 2 ** 63:
+            return int(values.sum(dtype="<i8"))
+        return sum(values.tolist())
+
+    @staticmethod
+    def _total(c: ColumnLayout, total):
+        if c.scale is not None:
+            return Decimal(int(total)).scaleb(-c.scale)
+        return total.item() if hasattr(total, "item") else total
+
+
+def _time_delta(np, text: str):
+    hours, _, rest = text.partition(":")
+    minutes, _, seconds = rest.partition(":")
+    micros = round(float(seconds or 0) * 1_000_000)
+    return np.timedelta64((int(hours) * 3600 + int(minutes or 0) * 60) * 1_000_000 + micros, "us")
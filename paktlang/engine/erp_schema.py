@@ -0,0 +1,541 @@
+"""
+PaktLang ERP Schema Matcher
+Müşteri ERP veritabanı kataloğunun erp_mappings.json ile karşılaştırılması
+
+Katalog iki kaynaktan okunur:
+
+- DDL dökümü: CREATE TABLE ifadeleri (SSMS/Firebird/MySQL betikleri;
+  [köşeli], "çift" ve `ters` tırnaklı adlar, UTF-8 veya UTF-16 BOM'lu
+  dosyalar). Diğer ifadeler atlanır.
+- SQLite dosyası: gerçek tablolar (pragma_table_info) ya da TABLE_NAME /
+  COLUMN_NAME kolonları olan bir INFORMATION_SCHEMA.COLUMNS dökümü.
+
+Tablo adları büyük harfli anahtarla hash indekslenir; ERP'nin table_prefix'i
+firma kodu ({FIRMA}) içeriyorsa adlar önek çıkarılmış son eke göre ayrıca
+gruplanır, böylece LG_{FIRMA}_ITEMS tek sözlük aramasıyla tüm firmaların
+LG_001_ITEMS, LG_002_ITEMS tablolarını, LG_{FIRMA}_STLINE de dönem
+tablolarını (LG_001_01_STLINE) bulur. Bulunamayan tablo ve kolonlar için
+trigram indeksinden benzer ad önerileri üretilir; kolon trigramları sadece
+eksik kolonu olan tablolar için hesaplanır.
+
+Kolon tipleri yalnızca eşleşen kolonlar için ayrıştırılır ve PaktLang temel
+tipiyle karşılaştırılır (tip ailesi, metin uzunluğu, ondalık ölçeği).
+"""
+
+import codecs
+import re
+import sqlite3
+import time
+from collections import Counter
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .mapping import MappingCatalog
+
+
+# Her eksik tablo/kolon için en fazla öneri sayısı
+DEFAULT_SUGGESTIONS = 3
+
+# Öneri için en düşük trigram benzerliği (Jaccard)
+MIN_SIMILARITY = 0.4
+
+# SQL tip adı -> tip ailesi
+SQL_FAMILIES = {
+    "integer": ("INT", "INTEGER", "BIGINT", "SMALLINT", "TINYINT", "MEDIUMINT", "INT2", "INT4", "INT8",
+                "SERIAL", "BIGSERIAL", "COUNTER", "AUTOINCREMENT"),
+    "decimal": ("DECIMAL", "NUMERIC", "NUMBER", "MONEY", "SMALLMONEY", "FLOAT", "REAL", "DOUBLE",
+                "DOUBLE PRECISION", "CURRENCY", "FLOAT4", "FLOAT8"),
+    "string": ("CHAR", "VARCHAR", "NCHAR", "NVARCHAR", "VARCHAR2", "NVARCHAR2", "TEXT", "NTEXT",
+               "CLOB", "NCLOB", "STRING", "CHARACTER", "CHARACTER VARYING", "SYSNAME", "LONGTEXT",
+               "MEDIUMTEXT", "TINYTEXT", "XML"),
+    "boolean": ("BIT", "BOOL", "BOOLEAN", "YESNO"),
+    "date": ("DATE",),
+    "datetime": ("DATETIME", "DATETIME2", "SMALLDATETIME", "TIMESTAMP", "DATETIMEOFFSET", "TIMESTAMPTZ"),
+    "time": ("TIME",),
+    "binary": ("BINARY", "VARBINARY", "IMAGE", "BLOB", "BYTEA", "LONGBLOB", "ROWVERSION"),
+    "uuid": ("UNIQUEIDENTIFIER", "UUID", "GUID"),
+}
+
+FAMILY_OF = {name: family for family, names in SQL_FAMILIES.items() for name in names}
+
+# PaktLang temel tipi -> kabul edilen SQL tip aileleri
+COMPATIBLE = {
+    "integer": ("integer",),
+    "bigint": ("integer",),
+    "decimal": ("decimal", "integer"),
+    "string": ("string",),
+    "text": ("string",),
+    "boolean": ("boolean", "integer"),
+    "date": ("date", "datetime"),
+    "datetime": ("datetime", "date"),
+    "time": ("time", "datetime", "integer"),
+    "enum": ("string", "integer"),
+    "json": ("string",),
+    "uuid": ("uuid", "string"),
+    "binary": ("binary",),
+}
+
+_IDENT = r'(?:\[[^\]]+\]|"[^"]+"|`[^`]+`|[\w$#@]+)'
+_QUALIFIED = rf'{_IDENT}(?:\s*\.\s*{_IDENT})*'
+_CREATE_TABLE = re.compile(
+    rf'\bCREATE\s+(?:(?:GLOBAL\s+|LOCAL\s+)?TEMP(?:ORARY)?\s+)?TABLE\s+(?:IF\s+NOT\s+EXISTS\s+)?({_QUALIFIED})\s*\(',
+    re.IGNORECASE
+)
+# Kolon tanımı: ad (4 tırnak biçimi), şema nitelikli olabilen tip ve (uzunluk, ölçek)
+_COLUMN = re.compile(
+    r'\s*(?:\[([^\]]+)\]|"([^"]+)"|`([^`]+)`|([\w$#@]+))'
+    r'(?:\s+(?:[\w\[\]"`$#@]+\s*\.\s*)?[\["`]?([A-Za-z_]\w*(?:\s+(?:PRECISION|VARYING)\b)?)[\]"`]?'
+    r'(?:\s*\(([^)]*)\))?)?',
+    re.IGNORECASE
+)
+_PARTS = re.compile(_IDENT)
+_TOKENS = re.compile(r"'(?:[^']|'')*'?|[(),]")
+_QUOTED = r"'(?:[^']|'')*'"
+# Tablo gövdesinde tek öğe (kolon veya kısıt); iki seviyeye kadar iç içe parantez
+_ITEM_BODY = rf"(?:[^(),']+|{_QUOTED}|\((?:[^()']+|{_QUOTED}|\((?:[^()']+|{_QUOTED})*\))*\))*"
+_ITEM = re.compile(_ITEM_BODY)
+# Kolon tanımı, öğenin kalanı ve ayırıcı (',' veya gövdeyi kapatan ')') tek eşleşmede
+_ENTRY = re.compile(rf"{_COLUMN.pattern}{_ITEM_BODY}([,)])", re.IGNORECASE)
+_TABLE_CONSTRAINTS = frozenset((
+    "CONSTRAINT", "PRIMARY", "UNIQUE", "FOREIGN", "CHECK", "INDEX", "KEY", "PERIOD", "FULLTEXT", "SPATIAL"
+))
+
+
+def _unquote(name: str) -> str:
+    if name[:1] in '["`' and len(name) > 1:
+        return name[1:-1]
+    return name
+
+
+def _last_part(qualified: str) -> str:
+    """[dbo].[TBLSTKART] -> TBLSTKART"""
+    return _unquote(_PARTS.findall(qualified)[-1])
+
+
+def _decode(data: bytes) -> str:
+    """SSMS betikleri çoğunlukla UTF-16 BOM'lu kaydedilir"""
+    for bom, encoding in ((codecs.BOM_UTF8, "utf-8-sig"), (codecs.BOM_UTF16_LE, "utf-16"),
+                          (codecs.BOM_UTF16_BE, "utf-16")):
+        if data.startswith(bom):
+            return data.decode(encoding)
+    try:
+        return data.decode("utf-8")
+    except UnicodeDecodeError:
+        return data.decode("cp1254")
+
+
+def _split_body(text: str, start: int) -> Tuple[List[str], int]:
+    """
+    Açılış parantezinden sonraki tablo gövdesini en üst seviyedeki
+    virgüllerden böler; (öğeler, kapanış parantezinden sonraki konum)
+    """
+    items = []
+    pos = start
+    while True:
+        end = _ITEM.match(text, pos).end()
+        items.append(text[pos:end])
+        if text.startswith(",", end):
+            pos = end + 1
+        elif text.startswith(")", end):
+            return items, end + 1
+        else:
+            # Daha derin iç içe parantez veya kapanmamış ifade: belirteç belirteç ilerle
+            items.pop()
+            break
+
+    depth = 1
+    item_start = pos
+    for token in _TOKENS.finditer(text, pos):
+        value = token.group()
+        if value == "(":
+            depth += 1
+        elif value == ")":
+            depth -= 1
+            if depth == 0:
+                items.append(text[item_start:token.start()])
+                return items, token.end()
+        elif value == "," and depth == 1:
+            items.append(text[item_start:token.start()])
+            item_start = token.end()
+    items.append(text[item_start:])
+    return items, len(text)
+
+
+def _body_columns(text: str, start: int) -> Tuple[List[Tuple], int]:
+    """Tablo gövdesindeki öğelerin _COLUMN grupları; (gruplar, gövde sonu)"""
+    entries = []
+    pos = start
+    while True:
+        match = _ENTRY.match(text, pos)
+        if match is None:
+            items, pos = _split_body(text, pos)
+            for item in items:
+                column = _COLUMN.match(item)
+                if column is not None:
+                    entries.append(column.groups())
+            return entries, pos
+        entries.append(match.groups()[:6])
+        pos = match.end()
+        if match.group(7) == ")":
+            return entries, pos
+
+
+def parse_type(declared: Optional[str]) -> Tuple[Optional[str], Optional[int], Optional[int]]:
+    """
+    "NVARCHAR(50)" -> ("string", 50, None), "DECIMAL(28,8)" -> ("decimal", 28, 8);
+    bilinmeyen tiplerde aile None. İlk sayı metinlerde uzunluk, ondalıklarda
+    hassasiyettir; MAX ve tanımsız uzunluk None döner.
+    """
+    if not declared:
+        return None, None, None
+    name, _, args = declared.partition("(")
+    family = FAMILY_OF.get(" ".join(name.upper().split()))
+    size = scale = None
+    if args:
+        numbers = [part.strip() for part in args.rstrip(") ").split(",")]
+        if numbers[0].isdigit():
+            size = int(numbers[0])
+        if len(numbers) > 1 and numbers[1].isdigit():
+            scale = int(numbers[1])
+    return family, size, scale
+
+
+class CatalogTable:
+    """Katalogdaki bir tablo; kolonlar büyük harfli ad -> (ad, bildirilen tip)"""
+
+    __slots__ = ("name", "columns", "_trigrams")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.columns: Dict[str, Tuple[str, Optional[str]]] = {}
+        self._trigrams: Optional[Dict[str, List[str]]] = None
+
+    def add(self, name: str, declared: Optional[str]):
+        self.columns.setdefault(name.upper(), (name, declared))
+
+    def similar_columns(self, name: str, limit: int) -> List[str]:
+        if self._trigrams is None:
+            self._trigrams = _trigram_index(self.columns)
+        return [self.columns[key][0] for key in _similar(self._trigrams, name.upper(), limit)]
+
+
+def _trigrams(key: str) -> frozenset:
+    padded = f"  {key} "
+    return frozenset(padded[i:i + 3] for i in range(len(padded) - 2))
+
+
+def _trigram_index(keys: Iterable[str]) -> Dict[str, List[str]]:
+    index: Dict[str, List[str]] = {}
+    for key in keys:
+        for gram in _trigrams(key):
+            index.setdefault(gram, []).append(key)
+    return index
+
+
+def _similar(index: Dict[str, List[str]], key: str, limit: int) -> List[str]:
+    """Trigram Jaccard benzerliği MIN_SIMILARITY üstündeki en yakın anahtarlar"""
+    grams = _trigrams(key)
+    shared = Counter()
+    for gram in grams:
+        shared.update(index.get(gram, ()))
+    scored = []
+    for candidate, common in shared.items():
+        score = common / (len(grams) + len(_trigrams(candidate)) - common)
+        if score >= MIN_SIMILARITY:
+            scored.append((-score, candidate))
+    scored.sort()
+    return [candidate for _, candidate in scored[:limit]]
+
+
+class ERPCatalog:
+    """ERP veritabanı kataloğu: tablo adı hash indeksi ve trigram indeksi"""
+
+    def __init__(self, source: str = None):
+        self.source = source
+        self.tables: Dict[str, CatalogTable] = {}
+        self._trigrams: Optional[Dict[str, List[str]]] = None
+        self._suffixes: Dict[str, Dict[str, List[Tuple[CatalogTable, str, Optional[str]]]]] = {}
+
+    @property
+    def column_count(self) -> int:
+        return sum(len(table.columns) for table in self.tables.values())
+
+    def table(self, name: str) -> CatalogTable:
+        key = name.upper()
+        table = self.tables.get(key)
+        if table is None:
+            table = self.tables[key] = CatalogTable(name)
+            self._trigrams = None
+            self._suffixes.clear()
+        return table
+
+    # ------------------------------------------------------------------
+    # Okuma
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def load(cls, path: str) -> "ERPCatalog":
+        """Dosya SQLite veritabanıysa SQLite kataloğu, değilse DDL dökümü olarak okunur"""
+        with open(path, 'rb') as f:
+            header = f.read(16)
+        if header == b"SQLite format 3\x00":
+            return cls.from_sqlite(path)
+        return cls.from_ddl(path)
+
+    @classmethod
+    def from_ddl(cls, path: str) -> "ERPCatalog":
+        with open(path, 'rb') as f:
+            text = _decode(f.read())
+        catalog = cls(str(path))
+        catalog.add_ddl(text)
+        return catalog
+
+    def add_ddl(self, text: str) -> int:
+        """Metindeki CREATE TABLE ifadelerini ekler; eklenen tablo sayısı"""
+        count = 0
+        pos = 0
+        while True:
+            match = _CREATE_TABLE.search(text, pos)
+            if match is None:
+                return count
+            entries, pos = _body_columns(text, match.end())
+            table = self.table(_last_part(match.group(1)))
+            count += 1
+            columns = table.columns
+            for bracket, double, back, bare, declared, size in entries:
+                if bare is not None and bare.upper() in _TABLE_CONSTRAINTS:
+                    continue
+                name = bracket or double or back or bare
+                if declared is not None:
+                    if declared.upper() == "AS":
+                        # Hesaplanan kolon: [X] AS (...)
+                        declared = None
+                    elif size is not None:
+                        declared = f"{declared}({size.strip()})"
+                columns.setdefault(name.upper(), (name, declared))
+
+    @classmethod
+    def from_sqlite(cls, path: str) -> "ERPCatalog":
+        catalog = cls(str(path))
+        conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+        try:
+            listing = catalog._listing_table(conn)
+            if listing is not None:
+                catalog._add_listing(conn, *listing)
+            else:
+                rows = conn.execute(
+                    "SELECT m.name, p.name, p.type FROM sqlite_master m, pragma_table_info(m.name) p "
+                    "WHERE m.type = 'table' AND m.name NOT LIKE 'sqlite_%' ORDER BY m.name, p.cid"
+                )
+                for table_name, column, declared in rows:
+                    catalog.table(table_name).add(column, declared or None)
+        finally:
+            conn.close()
+        return catalog
+
+    @staticmethod
+    def _listing_table(conn: sqlite3.Connection) -> Optional[Tuple[str, Dict[str, str]]]:
+        """TABLE_NAME ve COLUMN_NAME kolonları olan döküm tablosu: (ad, küçük harf -> kolon)"""
+        tables = conn.execute("SELECT name FROM sqlite_master WHERE type IN ('table', 'view')").fetchall()
+        for (name,) in tables:
+            columns = {row[1].lower(): row[1] for row in conn.execute(
+                "SELECT * FROM pragma_table_info(?)", (name,))}
+            if "table_name" in columns and "column_name" in columns:
+                return name, columns
+        return None
+
+    def _add_listing(self, conn: sqlite3.Connection, name: str, columns: Dict[str, str]):
+        def pick(*names):
+            for n in names:
+                if n in columns:
+                    return f'"{columns[n]}"'
+            return "NULL"
+        sql = (f'SELECT {pick("table_name")}, {pick("column_name")}, {pick("data_type", "type_name")}, '
+               f'{pick("character_maximum_length", "max_length")}, {pick("numeric_precision", "precision")}, '
+               f'{pick("numeric_scale", "scale")} FROM "{name}"')
+        for table_name, column, declared, length, precision, scale in conn.execute(sql):
+            if declared:
+                if length not in (None, "", -1, "-1"):
+                    declared = f"{declared}({length})"
+                elif precision not in (None, "") and FAMILY_OF.get(str(declared).upper()) == "decimal":
+                    declared = f"{declared}({precision},{scale or 0})"
+            self.table(table_name).add(column, declared or None)
+
+    # ------------------------------------------------------------------
+    # Arama
+    # ------------------------------------------------------------------
+
+    def similar_tables(self, name: str, limit: int) -> List[str]:
+        if self._trigrams is None:
+            self._trigrams = _trigram_index(self.tables)
+        return [self.tables[key].name for key in _similar(self._trigrams, name.upper(), limit)]
+
+    def by_suffix(self, prefix: str) -> Dict[str, List[Tuple[CatalogTable, str, Optional[str]]]]:
+        """
+        Firma kodlu önek ("LG_{FIRMA}_") için son ek -> [(tablo, firma, dönem)].
+        LG_001_ITEMS -> ITEMS (001, None), LG_001_01_STLINE -> STLINE (001, 01).
+        """
+        groups = self._suffixes.get(prefix)
+        if groups is None:
+            head, _, tail = prefix.upper().partition("{FIRMA}")
+            pattern = re.compile(rf"{re.escape(head)}(\d+){re.escape(tail)}(?:(\d+)_)?(.+)")
+            groups = {}
+            for key, table in self.tables.items():
+                match = pattern.fullmatch(key)
+                if match is not None:
+                    firma, donem, suffix = match.groups()
+                    groups.setdefault(suffix, []).append((table, firma, donem))
+            self._suffixes[prefix] = groups
+        return groups
+
+
+class MappingMatcher:
+    """erp_mappings.json tanımlarını bir ERP kataloğuyla toplu karşılaştırır"""
+
+    def __init__(self, mappings: MappingCatalog, catalog: ERPCatalog, types=None,
+                 suggestions: int = DEFAULT_SUGGESTIONS):
+        """
+        Args:
+            mappings: Modüllerle yüklenmiş mapping kataloğu (kolon tipleri için)
+            types: Tip kayıt defteri; verilmezse tip karşılaştırması yapılmaz
+            suggestions: Eksik tablo/kolon başına öneri sayısı (0: öneri yok)
+        """
+        self.mappings = mappings
+        self.catalog = catalog
+        self.types = types if types is not None else mappings.types
+        self.suggestions = suggestions
+
+    def resolve(self, erp: str, template: str, firma: str = None,
+                donem: str = None) -> List[Tuple[CatalogTable, Optional[str], Optional[str]]]:
+        """ERP tablo şablonunun katalogdaki karşılıkları: [(tablo, firma, dönem)]"""
+        if "{FIRMA}" not in template:
+            table = self.catalog.tables.get(template.upper())
+            return [] if table is None else [(table, None, None)]
+
+        prefix = self.mappings.data[erp].get("table_prefix", "").upper()
+        if "{FIRMA}" in prefix and template.upper().startswith(prefix):
+            found = self.catalog.by_suffix(prefix).get(template[len(prefix):].upper(), [])
+            # Dönem filtresi sadece dönem tablolarına uygulanır (LG_001_ITEMS her dönemde ortaktır)
+            return [item for item in found
+                    if (firma is None or int(item[1]) == int(firma))
+                    and (donem is None or item[2] is None or int(item[2]) == int(donem))]
+
+        # Önekle uyuşmayan firma kodlu şablon: düzenli ifadeyle tarama
+        pattern = re.compile(re.escape(template.upper()).replace(r"\{FIRMA\}", r"(\d+)"))
+        found = []
+        for key, table in self.catalog.tables.items():
+            match = pattern.fullmatch(key)
+            if match is not None and (firma is None or int(match.group(1)) == int(firma)):
+                found.append((table, match.group(1), None))
+        return found
+
+    def _fields(self, mapping: Dict) -> Iterator[Tuple[str, str, bool]]:
+        """(PaktLang alanı, ERP alanı, kod eşlemeli mi)"""
+        for paktlang_field, erp_field in mapping.get("field_mappings", {}).items():
+            yield paktlang_field, erp_field, False
+        for paktlang_field, spec in mapping.get("special_fields", {}).items():
+            if spec.get("erp_field"):
+                yield paktlang_field, spec["erp_field"], bool(spec.get("mappings"))
+
+    def conflict(self, erp: str, column: Optional[Dict], declared: Optional[str],
+                 coded: bool = False) -> Optional[str]:
+        """
+        PaktLang kolonu ile ERP kolon tipi uyuşmazlığının açıklaması (yoksa None).
+        coded: special_fields mappings ile çevrilen alan; ERP tarafı kod tutar
+        """
+        if column is None or self.types is None:
+            return None
+        family, size, scale = parse_type(declared)
+        if family is None or (coded and family in ("integer", "string")):
+            return None
+        ctype = self.types.resolve(column)
+        accepted = COMPATIBLE.get(ctype.base)
+        if accepted is None:
+            return None
+        if ctype.base == "boolean":
+            values = self.mappings.rules.get("boolean_mappings", {}).get(erp, {}).values()
+            if any(isinstance(v, str) for v in values):
+                accepted = accepted + ("string",)
+        if family not in accepted:
+            return f"{ctype.base} <-> {family}"
+        if family == "string" and ctype.base in ("string", "enum") and size and ctype.max_length \
+                and ctype.max_length > size:
+            return f"uzunluk {ctype.max_length} > {size}"
+        if family == "decimal" and ctype.base == "decimal" and scale is not None and ctype.scale \
+                and ctype.scale > scale:
+            return f"ölçek {ctype.scale} > {scale}"
+        if family == "integer" and ctype.base == "decimal" and ctype.scale:
+            return f"ölçek {ctype.scale} > 0"
+        return None
+
+    def match(self, erp: str, firma: str = None, donem: str = None) -> Dict:
+        """
+        Returns:
+            erp, tables (mapping başına eşleşmeler, eksik kolonlar, tip
+            uyuşmazlıkları ve öneriler), coverage, catalog, seconds
+        """
+        started = time.perf_counter()
+        tables = []
+        field_total = field_found = table_found = 0
+        used = set()
+
+        for module_name, table_name, mapping in self.mappings.tables(erp):
+            template = mapping.get("erp_table", "")
+            fields = list(self._fields(mapping))
+            columns = self.mappings._paktlang_columns(module_name, table_name)
+            matches = []
+            erp_fields = {erp_field for _, erp_field, _ in fields}
+            # Eşleşen tablolardan en az birinde eksik olan ERP alanları
+            absent = set()
+
+            for table, table_firma, table_donem in self.resolve(erp, template, firma, donem):
+                used.add(table.name.upper())
+                missing = []
+                conflicts = []
+                for paktlang_field, erp_field, coded in fields:
+                    entry = table.columns.get(erp_field.upper())
+                    if entry is None:
+                        item = {"paktlang": paktlang_field, "erp": erp_field}
+                        if self.suggestions:
+                            item["suggestions"] = table.similar_columns(erp_field, self.suggestions)
+                        missing.append(item)
+                        absent.add(erp_field)
+                        continue
+                    reason = self.conflict(erp, columns.get(paktlang_field), entry[1], coded)
+                    if reason is not None:
+                        conflicts.append({
+                            "paktlang": paktlang_field, "erp": entry[0], "erp_type": entry[1],
+                            "paktlang_type": columns[paktlang_field].get("type"), "reason": reason
+                        })
+                matches.append({"table": table.name, "firma": table_firma, "donem": table_donem,
+                                "missing": missing, "conflicts": conflicts})
+
+            found = len(erp_fields - absent) if matches else 0
+            field_total += len(erp_fields)
+            field_found += found
+            item = {"module": module_name, "table": table_name, "erp_table": template,
+                    "fields": len(erp_fields), "found": found, "matches": matches}
+            if matches:
+                table_found += 1
+            elif self.suggestions:
+                item["suggestions"] = self.catalog.similar_tables(
+                    template.replace("{FIRMA}", "").replace("__", "_"), self.suggestions)
+            tables.append(item)
+
+        return {
+            "erp": erp,
+            "catalog": {"source": self.catalog.source, "tables": len(self.catalog.tables),
+                        "columns": self.catalog.column_count, "matched": len(used)},
+            "coverage": {
+                "tables": table_found, "tables_total": len(tables),
+                "fields": field_found, "fields_total": field_total,
+                "ratio": round(field_found / field_total, 4) if field_total else 0.0
+            },
+            "tables": tables,
+            "seconds": round(time.perf_counter() - started, 3)
+        }
+
+    def match_all(self, firma: str = None, donem: str = None) -> List[Dict]:
+        """Tüm ERP sistemleri; en yüksek kapsamdan başlayarak sıralı"""
+        reports = [self.match(erp, firma, donem) for erp in self.mappings.systems]
+        reports.sort(key=lambda r: (-r["coverage"]["ratio"], -r["coverage"]["tables"]))
+        return reports
@@ -0,0 +1,548 @@
+"""
+PaktLang Index Advisor
+Tablo dışa aktarımlarının kolon istatistiklerinden index ekleme/kaldırma önerileri
+
+Dosyalar parça parça, kolon başına sabit bellekle okunur. Her aday kolon
+(ve çok kolonlu index'lerin kolon demetleri) için tutulanlar:
+
+- satır ve null sayısı,
+- ayrık değer sayısı: ilk EXACT_LIMIT değere kadar kesin sayım, sonrasında
+  HyperLogLog taslağı (2^12 register, ~%1.6 standart hata),
+- en sık değerin payı (skew): Misra-Gries ağır değer özeti.
+
+İstatistikler şemadaki foreign key'ler, relations.json ilişkileri,
+data_flows adımları ve view base_tables join'leri ile birleştirilir:
+
+- index'i olmayan FK / ilişki kolonları seçiciliği yeterliyse eklenir
+  (data_flows veya view join'lerinde kullanılanlar öncelikli),
+- FK dışı, seçiciliği düşük index'ler ve başka bir index'in ön eki olan
+  index'ler kaldırılır.
+
+Öneriler tablo bazında, şemaya doğrudan uygulanabilir "indexes" dizisi ve
+kolon bayrakları (patch) olarak döner.
+"""
+
+import itertools
+import math
+import random
+import time
+import zlib
+from collections import Counter
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from paktlang.validator.symbols import column_name
+
+from .integrity import _format, _key, collect_links, file_columns, read_columns
+from .sqlite_loader import select_tables
+
+
+# Kesin sayımdan HyperLogLog'a geçilen ayrık değer sayısı
+EXACT_LIMIT = 1024
+
+# HyperLogLog register sayısının log2'si
+HLL_PRECISION = 12
+
+# Misra-Gries sayaç sayısı; en sık değerin sayısı en fazla satır/(k+1) eksik tahmin edilir
+HEAVY_HITTERS = 32
+
+# Tek seferde okunan satır sayısı
+CHUNK_ROWS = 65536
+
+# Eklenecek index için en yüksek seçicilik (eşitlik aramasında dönen satır payı)
+ADD_SELECTIVITY = 0.05
+
+# Bu seçicilik ve üstündeki FK dışı index'ler kaldırılır (5 veya daha az ayrık değer)
+DROP_SELECTIVITY = 0.2
+
+# En sık değerin non-null satırlardaki payı bu sınırı aşarsa kolon tek değere yığılmış sayılır
+SKEW_LIMIT = 0.95
+
+# İstatistiğe dayalı öneri için gereken en az satır
+MIN_ROWS = 1000
+
+_MIX = 0x9E3779B97F4A7C15
+_MASK64 = (1 << 64) - 1
+
+
+def _round(value: Optional[float]) -> Optional[float]:
+    return None if value is None else float(f"{value:.4g}")
+
+
+class HyperLogLog:
+    """Sabit boyutlu ayrık değer sayısı taslağı (register başına bir bayt)"""
+
+    __slots__ = ("precision", "registers")
+
+    def __init__(self, precision: int = HLL_PRECISION):
+        self.precision = precision
+        self.registers = bytearray(1 << precision)
+
+    def update(self, values: Iterable[str]):
+        """
+        Değerleri ekler. Hash deterministiktir (crc32 + çarpımsal karıştırma),
+        aynı dosya her çalıştırmada aynı tahmini verir.
+        """
+        registers = self.registers
+        crc = zlib.crc32
+        shift = 64 - self.precision
+        width = shift + 1
+        low = (1 << shift) - 1
+        for value in values:
+            h = (crc(value.encode('utf-8')) * _MIX) & _MASK64
+            index = h >> shift
+            rank = width - (h & low).bit_length()
+            if rank > registers[index]:
+                registers[index] = rank
+
+    def count(self) -> int:
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / sum(2.0 ** -r for r in self.registers)
+        zeros = self.registers.count(0)
+        # Küçük aralıkta boş register'lardan doğrusal sayım daha doğrudur
+        if zeros and estimate <= 2.5 * m:
+            estimate = m * math.log(m / zeros)
+        return int(round(estimate))
+
+
+class ColumnStats:
+    """Bir kolonun veya kolon demetinin akış istatistikleri"""
+
+    __slots__ = ("columns", "rows", "nulls", "exact", "sketch", "heavy")
+
+    def __init__(self, columns: Tuple[str, ...]):
+        self.columns = columns
+        self.rows = 0
+        self.nulls = 0
+        # Kesin sayım; EXACT_LIMIT aşılınca taslak + ağır değer özetine geçilir
+        self.exact: Optional[Counter] = Counter()
+        self.sketch: Optional[HyperLogLog] = None
+        self.heavy: Dict[str, int] = {}
+
+    def add(self, values: Iterable):
+        """
+        Bir parça metin değeri ekler; boş metin null sayılır. Çok kolonlu
+        demetlerde değerler parçaların "\x1f" ile birleşimidir, tüm parçaları
+        boş olan demet null'dır.
+        """
+        counts = Counter(values)
+        nulls = counts.pop("\x1f" * (len(self.columns) - 1), 0)
+        self.rows += sum(counts.values()) + nulls
+        self.nulls += nulls
+        if self.exact is not None:
+            self.exact.update(counts)
+            if len(self.exact) <= EXACT_LIMIT:
+                return
+            counts, self.exact = self.exact, None
+            self.sketch = HyperLogLog()
+        self.sketch.update(counts)
+        # Misra-Gries özetleri birleştirilebilir: parça sayımı + mevcut özet,
+        # (k+1). en büyük sayı kadar azaltılır
+        counts.update(self.heavy)
+        top = counts.most_common(HEAVY_HITTERS + 1)
+        floor = top[HEAVY_HITTERS][1] if len(top) > HEAVY_HITTERS else 0
+        self.heavy = {value: count - floor for value, count in top[:HEAVY_HITTERS] if count > floor}
+
+    @property
+    def distinct(self) -> int:
+        if self.exact is not None:
+            return len(self.exact)
+        return max(self.sketch.count(), EXACT_LIMIT)
+
+    @property
+    def null_fraction(self) -> float:
+        return self.nulls / self.rows if self.rows else 0.0
+
+    @property
+    def selectivity(self) -> Optional[float]:
+        """Eşitlik aramasında ortalama dönen satır payı: (1 - null payı) / ayrık değer"""
+        distinct = self.distinct
+        if not self.rows or not distinct:
+            return None
+        return (1 - self.null_fraction) / distinct
+
+    @property
+    def max_frequency(self) -> float:
+        """En sık değerin non-null satırlardaki payı (özet modunda alt sınır)"""
+        counts = self.exact if self.exact is not None else self.heavy
+        values = self.rows - self.nulls
+        return max(counts.values()) / values if counts and values else 0.0
+
+    def to_dict(self) -> Dict:
+        return {
+            "rows": self.rows,
+            "distinct": self.distinct,
+            "exact": self.exact is not None,
+            "selectivity": _round(self.selectivity),
+            "null_fraction": _round(self.null_fraction),
+            "max_frequency": _round(self.max_frequency)
+        }
+
+
+class TableScan:
+    """Bir tablo dosyasının taranmış kolon istatistikleri"""
+
+    __slots__ = ("table", "path", "scanned", "rows", "truncated", "columns", "missing", "seconds")
+
+    def __init__(self, table: str, path: Path):
+        self.table = table
+        self.path = path
+        self.scanned = 0
+        # Örneklemede tahmini toplam satır
+        self.rows = 0
+        # --limit ile kesildi; gerçek satır sayısı en az rows
+        self.truncated = False
+        self.columns: Dict[Tuple[str, ...], ColumnStats] = {}
+        self.missing: List[str] = []
+        self.seconds = 0.0
+
+    @property
+    def large(self) -> bool:
+        return self.truncated or self.rows >= MIN_ROWS
+
+
+def scan_table(table: str, path: Path, groups: Iterable[Tuple[str, ...]], delimiter: str = ",",
+               limit: int = None, sample: float = None, seed: int = 0) -> TableScan:
+    """
+    Dosyayı bir kez okuyup verilen kolon demetlerinin istatistiklerini çıkarır.
+
+    Args:
+        groups: Tek kolon için ("kolon",), çok kolonlu index için kolon demeti
+        limit: En fazla incelenecek satır
+        sample: Satır örnekleme oranı (0-1]; aynı seed aynı satırları seçer
+    """
+    started = time.perf_counter()
+    path = Path(path)
+    scan = TableScan(table, path)
+    fmt = _format(path)
+    available = set(file_columns(path, fmt, delimiter) or []) if fmt == "csv" else None
+
+    for group in groups:
+        missing = [c for c in group if available is not None and c not in available]
+        if missing:
+            scan.missing.extend(c for c in missing if c not in scan.missing)
+        else:
+            scan.columns[group] = ColumnStats(group)
+
+    needed = list(dict.fromkeys(c for group in scan.columns for c in group))
+    positions = {name: i for i, name in enumerate(needed)}
+    rows: Iterable[Tuple] = read_columns(path, needed, fmt, delimiter) if needed else iter(())
+    if sample is not None and sample < 1:
+        rng = random.Random(seed).random
+        rows = (row for row in rows if rng() < sample)
+    if limit:
+        rows = itertools.islice(rows, limit + 1)
+
+    while True:
+        chunk = list(itertools.islice(rows, CHUNK_ROWS))
+        if limit and scan.scanned + len(chunk) > limit:
+            chunk = chunk[:limit - scan.scanned]
+            scan.truncated = True
+        if not chunk:
+            break
+        scan.scanned += len(chunk)
+        if fmt == "jsonl":
+            columns = [[_key(v) or "" for v in values] for values in zip(*chunk)]
+        else:
+            # Kısa CSV satırlarında eksik kolonlar None gelir
+            columns = [values if None not in values else [v or "" for v in values] for values in zip(*chunk)]
+        for group, stats in scan.columns.items():
+            if len(group) == 1:
+                stats.add(columns[positions[group[0]]])
+            else:
+                stats.add(map("\x1f".join, zip(*(columns[positions[c]] for c in group))))
+        if scan.truncated:
+            break
+
+    scan.rows = scan.scanned
+    if sample is not None and 0 < sample < 1:
+        scan.rows = int(round(scan.scanned / sample))
+    scan.seconds = time.perf_counter() - started
+    return scan
+
+
+def table_indexes(table: Dict) -> List[Dict]:
+    """
+    Tablo tanımından kurulan index'ler (sqlite_loader ile aynı adlandırma).
+    Sıra: primary key, "indexes" girdileri, kolon bayrakları.
+    """
+    name = table["pl_table"]
+    result = []
+    pk = [column_name(c) for c in table.get("columns", []) if c.get("primary_key")]
+    if pk:
+        result.append({"name": f"pk_{name}", "columns": pk, "unique": True, "source": "primary_key"})
+    for index in table.get("indexes", []):
+        cols = list(index.get("columns", []))
+        if cols:
+            result.append({"name": index.get("name") or f"ix_{name}_{'_'.join(cols)}", "columns": cols,
+                           "unique": bool(index.get("unique")), "source": "indexes", "entry": index})
+    for column in table.get("columns", []):
+        if column.get("primary_key"):
+            continue
+        col = column_name(column)
+        if column.get("unique"):
+            result.append({"name": f"uq_{name}_{col}", "columns": [col], "unique": True, "source": "unique"})
+        elif column.get("indexed"):
+            result.append({"name": f"ix_{name}_{col}", "columns": [col], "unique": False, "source": "indexed"})
+    return result
+
+
+def covering_index(index: Dict, position: int, indexes: List[Dict]) -> Optional[Dict]:
+    """
+    Kolonları başka bir index'in ön eki olan (veya aynı kolonlarla daha önce
+    tanımlanmış) index için kapsayan index; yoksa None
+    """
+    cols = index["columns"]
+    for other_position, other in enumerate(indexes):
+        if other_position == position or other["columns"][:len(cols)] != cols:
+            continue
+        if len(other["columns"]) > len(cols) or other_position < position:
+            return other
+    return None
+
+
+class IndexAdvisor:
+    """
+    Şema + veri istatistiklerinden tablo bazında index önerileri.
+
+    Kullanım:
+        advisor = IndexAdvisor(modules, relations)
+        report = advisor.advise({"stok_hareket": "stok_hareket.csv", ...})
+    """
+
+    def __init__(self, modules: Dict[str, Dict], relations: Dict = None, delimiter: str = ",",
+                 limit: int = None, sample: float = None, seed: int = 0):
+        """
+        Args:
+            limit: Tablo başına en fazla incelenecek satır
+            sample: Satır örnekleme oranı (0-1]; ayrık değer sayıları örnek
+                üzerinden hesaplanır, yüksek kardinaliteli kolonlarda düşük kalır
+            seed: Örnekleme tohumu
+        """
+        self.modules = modules
+        self.tables, _ = select_tables(modules)
+        self.relations = relations or {}
+        self.links = collect_links(modules, relations)
+        self.delimiter = delimiter
+        self.limit = limit
+        self.sample = sample
+        self.seed = seed
+        self.signals = self._signals()
+        self.writes = self._writes()
+
+    def _signals(self) -> Dict[Tuple[str, str], Dict]:
+        """(tablo, kolon) -> bu kolon üzerinden yapılan aramalar"""
+        signals: Dict[Tuple[str, str], Dict] = {}
+
+        def mark(link, reason: str, hot: bool = False):
+            entry = signals.setdefault((link.child, link.column),
+                                       {"parents": [], "reasons": [], "hot": False})
+            if reason not in entry["reasons"]:
+                entry["reasons"].append(reason)
+            if (link.parent, link.parent_column) not in entry["parents"]:
+                entry["parents"].append((link.parent, link.parent_column))
+            entry["hot"] = entry["hot"] or hot
+
+        for link in self.links:
+            kind = "foreign_key" if link.origin == "foreign_key" else f"relationship {link.source}"
+            mark(link, f"{kind} -> {link.parent}.{link.parent_column}")
+
+        def joined(tables: set, reason: str):
+            for link in self.links:
+                if link.child != link.parent and link.child in tables and link.parent in tables:
+                    mark(link, reason, hot=True)
+
+        for flow in self.relations.get("data_flows", []):
+            joined({step.get("table") for step in flow.get("steps", [])}, f"data_flow {flow.get('id', '?')}")
+
+        seen = set()
+        for module_data in self.modules.values():
+            for view in module_data.get("views", []):
+                name = view.get("name")
+                if name and name not in seen:
+                    seen.add(name)
+                    joined(set(view.get("base_tables", [])), f"view {name}")
+        return signals
+
+    def _writes(self) -> Dict[str, List[str]]:
+        """Tablo -> satır yazan data_flows (her yazımda tüm index'ler güncellenir)"""
+        writes: Dict[str, List[str]] = {}
+        for flow in self.relations.get("data_flows", []):
+            for step in flow.get("steps", []):
+                if step.get("action") in ("create", "receive", "update") and step.get("table"):
+                    flows = writes.setdefault(step["table"], [])
+                    if flow.get("id", "?") not in flows:
+                        flows.append(flow.get("id", "?"))
+        return writes
+
+    def _groups(self, table_name: str, table: Dict) -> List[Tuple[str, ...]]:
+        """
+        Taranacak kolon demetleri: unique olmayan, başka index tarafından
+        kapsanmayan index'ler ve index'siz arama kolonları
+        """
+        indexes = table_indexes(table)
+        leading = {index["columns"][0] for index in indexes}
+        groups = [tuple(index["columns"]) for position, index in enumerate(indexes)
+                  if not index["unique"] and covering_index(index, position, indexes) is None]
+        for column in table.get("columns", []):
+            col = column_name(column)
+            if col not in leading and (table_name, col) in self.signals:
+                groups.append((col,))
+        return list(dict.fromkeys(groups))
+
+    def scan(self, table_name: str, path: Path) -> TableScan:
+        _, table = self.tables[table_name]
+        return scan_table(table_name, path, self._groups(table_name, table), self.delimiter,
+                          self.limit, self.sample, self.seed)
+
+    def advise(self, files: Dict[str, Path] = None,
+               progress: Callable[[Dict], None] = None) -> Dict:
+        """
+        Args:
+            files: Tablo adı -> CSV/JSONL dosyası; verilmeyen tablolar için
+                sadece şemaya dayalı öneri yapılır
+            progress: Her tablo tarandığında {"table", "rows", "seconds"} ile çağrılır
+
+        Returns:
+            {"tables": {"modül.tablo": öneri}, "summary": {...}, ...}
+        """
+        started = time.perf_counter()
+        scans: Dict[str, TableScan] = {}
+        for table_name, path in (files or {}).items():
+            if table_name not in self.tables:
+                continue
+            scans[table_name] = self.scan(table_name, Path(path))
+            if progress:
+                progress({"table": table_name, "rows": scans[table_name].scanned,
+                          "seconds": scans[table_name].seconds})
+
+        tables = {}
+        for table_name, (module_name, table) in self.tables.items():
+            advice = self._advise_table(table_name, module_name, table, scans)
+            if advice["add"] or advice["drop"] or table_name in scans:
+                tables[f"{advice['module']}.{table_name}"] = advice
+
+        return {
+            "tables": tables,
+            "rows": {name: scan.rows for name, scan in scans.items()},
+            "sample": self.sample,
+            "limit": self.limit,
+            "seconds": round(time.perf_counter() - started, 3),
+            "summary": {
+                "tables": len(tables),
+                "add": sum(len(t["add"]) for t in tables.values()),
+                "drop": sum(len(t["drop"]) for t in tables.values())
+            }
+        }
+
+    def _advise_table(self, table_name: str, module_name: str, table: Dict,
+                      scans: Dict[str, TableScan]) -> Dict:
+        scan = scans.get(table_name)
+        indexes = table_indexes(table)
+        leading = {index["columns"][0] for index in indexes}
+        names = {index["name"] for index in indexes}
+
+        add, skipped = [], []
+        for column in table.get("columns", []):
+            col = column_name(column)
+            signal = self.signals.get((table_name, col))
+            if signal is None or col in leading:
+                continue
+            evidence = {"reasons": list(signal["reasons"]), "priority": "high" if signal["hot"] else "normal"}
+            stats = scan.columns.get((col,)) if scan else None
+            if stats is not None and stats.selectivity is not None:
+                evidence.update(stats.to_dict())
+                evidence["estimate"] = "data"
+                verdict = self._add_verdict(scan, stats)
+                if verdict:
+                    skipped.append({"column": col, "reason": verdict, **evidence})
+                    continue
+            else:
+                # Veri yoksa parent satır sayısından: her parent satırına eşit pay
+                parent_rows = [scans[p].rows for p, _ in signal["parents"] if p in scans and scans[p].rows]
+                evidence["selectivity"] = _round(1 / max(parent_rows)) if parent_rows else None
+                evidence["estimate"] = "parent" if parent_rows else "schema"
+                if scan is not None:
+                    evidence["reasons"].append("kolon veri dosyasında yok veya boş")
+            name = f"idx_{table_name}_{col}"
+            suffix = 2
+            while name in names:
+                name, suffix = f"idx_{table_name}_{col}_{suffix}", suffix + 1
+            names.add(name)
+            add.append({"index": {"name": name, "columns": [col]}, **evidence})
+
+        drop = []
+        for position, index in enumerate(indexes):
+            if index["unique"]:
+                continue
+            reasons = self._drop_reasons(table_name, index, position, indexes, scan)
+            if not reasons:
+                continue
+            entry = {"name": index["name"], "columns": index["columns"], "source": index["source"],
+                     "reasons": reasons}
+            stats = scan.columns.get(tuple(index["columns"])) if scan else None
+            if stats is not None:
+                entry.update(stats.to_dict())
+            if table_name in self.writes:
+                entry["writes"] = list(self.writes[table_name])
+            drop.append(entry)
+
+        return {
+            "module": self.modules[module_name].get("module", module_name),
+            "table": table_name,
+            "rows": scan.rows if scan else None,
+            "truncated": scan.truncated if scan else False,
+            "missing_columns": list(scan.missing) if scan else [],
+            "add": add,
+            "drop": drop,
+            "skipped": skipped,
+            "patch": self._patch(table, add, drop)
+        }
+
+    def _add_verdict(self, scan: TableScan, stats: ColumnStats) -> Optional[str]:
+        """Veriye göre eklenmemesi gereken index için neden (eklenecekse None)"""
+        if not scan.large:
+            return f"az satır (< {MIN_ROWS})"
+        if stats.selectivity > ADD_SELECTIVITY:
+            return f"düşük seçicilik ({stats.distinct} ayrık değer)"
+        if stats.max_frequency >= SKEW_LIMIT:
+            return f"tek değere yığılmış (%{stats.max_frequency * 100:.1f})"
+        return None
+
+    def _drop_reasons(self, table_name: str, index: Dict, position: int,
+                      indexes: List[Dict], scan: Optional[TableScan]) -> List[str]:
+        cols = index["columns"]
+        other = covering_index(index, position, indexes)
+        if other is not None:
+            return [f"{other['name']} ({', '.join(other['columns'])}) tarafından kapsanıyor"]
+
+        stats = scan.columns.get(tuple(cols)) if scan else None
+        # Tamamen boş kolon kanıt sayılmaz (dışa aktarımda olmayabilir)
+        if stats is None or stats.selectivity is None or not scan.large:
+            return []
+        # FK / ilişki kolonu önde ise parent silme ve join aramaları için korunur
+        if (table_name, cols[0]) in self.signals:
+            return []
+        if stats.selectivity >= DROP_SELECTIVITY:
+            return [f"düşük seçicilik ({stats.distinct} ayrık değer)"]
+        # Yığılmış kolonda sadece nadir değer aramaları kazanır; yazma yolundaki
+        # tablolarda her insert'in maliyeti buna değmez
+        if stats.max_frequency >= SKEW_LIMIT and table_name in self.writes:
+            return [f"tek değere yığılmış (%{stats.max_frequency * 100:.1f}), data_flows yazma yolunda"]
+        return []
+
+    @staticmethod
+    def _patch(table: Dict, add: List[Dict], drop: List[Dict]) -> Dict:
+        """Şemaya uygulanacak değişiklik: yeni "indexes" dizisi ve kolon bayrakları"""
+        patch: Dict = {}
+        dropped = {index["name"] for index in drop if index["source"] == "indexes"}
+        if add or dropped:
+            kept = [index for index in table.get("indexes", [])
+                    if (index.get("name") or f"ix_{table['pl_table']}_{'_'.join(index.get('columns', []))}")
+                    not in dropped]
+            patch["indexes"] = kept + [entry["index"] for entry in add]
+        flags = {index["columns"][0]: {"indexed": False} for index in drop if index["source"] == "indexed"}
+        if flags:
+            patch["columns"] = flags
+        return patch
@@ -0,0 +1,542 @@
+"""
+PaktLang Referential Integrity Checker
+Tablo dışa aktarımları (CSV/JSONL) üzerinde foreign key, ilişki ve RI kuralı kontrolü
+
+Veritabanına yüklemeden, dosyalar üzerinde hash join ile çalışır:
+
+1. Her parent tablo bir kez okunur; referans verilen kolonların anahtar
+   kümeleri oluşturulur.
+2. Her child tablo bir kez okunur; tüm giden referansları aynı geçişte
+   anahtar kümelerine sorulur, bulunamayanlar yetim (orphan) satırdır.
+
+Bellekteki anahtar sayısı max_keys ile sınırlıdır. Sınır aşılınca en büyük
+anahtar kümesi hash ile bölümlenmiş geçici dosyalara taşınır (grace hash
+join); bu kümeye bakan child değerleri de aynı bölümlere yazılır ve
+bölümler sırayla, her seferinde tek bölümün anahtarları bellekte olacak
+şekilde eşleştirilir.
+"""
+
+import csv
+import heapq
+import json
+import marshal
+import operator
+import os
+import shutil
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from paktlang.validator.symbols import column_name
+
+from .sqlite_loader import select_tables
+
+
+# Bellekte tutulacak toplam anahtar sayısı (tüm parent kolonları için)
+DEFAULT_MAX_KEYS = 5_000_000
+
+# Taşan anahtar kümesi başına bölüm sayısı
+DEFAULT_PARTITIONS = 64
+
+# Bağlantı başına raporlanacak en fazla yetim satır örneği
+DEFAULT_SAMPLES = 20
+
+# Bölüm yazıcısının bellekte biriktirdiği en fazla kayıt
+SPILL_BUFFER = 65536
+
+
+def _key(value) -> Optional[str]:
+    """Anahtar değerini karşılaştırma için normalleştirir (CSV "12" == JSONL 12)"""
+    if value is None:
+        return None
+    if type(value) is str:
+        return value.strip() or None
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+
+def file_columns(path: Path, fmt: str = None, delimiter: str = ",") -> Optional[List[str]]:
+    """CSV başlığı veya JSONL ilk kaydının alanları (boş dosyada None)"""
+    if _format(path, fmt) == "jsonl":
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    return list(json.loads(line))
+        return None
+    with open(path, 'r', encoding='utf-8-sig', newline='') as f:
+        return next(csv.reader(f, delimiter=delimiter), None)
+
+
+def read_columns(path: Path, columns: List[str], fmt: str = None,
+                 delimiter: str = ",") -> Iterator[Tuple]:
+    """
+    Dosyadan sadece istenen kolonları tuple olarak okur (satır sırasıyla).
+    CSV başlığında olmayan kolonlar None döner.
+    """
+    if _format(path, fmt) == "jsonl":
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    row = json.loads(line)
+                    yield tuple(row.get(c) for c in columns)
+        return
+
+    with open(path, 'r', encoding='utf-8-sig', newline='') as f:
+        reader = csv.reader(f, delimiter=delimiter)
+        header = next(reader, None)
+        if header is None:
+            return
+        positions = {name: i for i, name in enumerate(header)}
+        indexes = [positions.get(c) for c in columns]
+        if None in indexes or not indexes:
+            for row in reader:
+                yield tuple(row[i] if i is not None and i < len(row) else None for i in indexes)
+            return
+        if len(indexes) == 1:
+            index = indexes[0]
+            for row in reader:
+                yield (row[index] if index < len(row) else None,)
+            return
+        pick = operator.itemgetter(*indexes)
+        width = max(indexes) + 1
+        for row in reader:
+            if len(row) >= width:
+                yield pick(row)
+            else:
+                yield tuple(row[i] if i < len(row) else None for i in indexes)
+
+
+def _format(path: Path, fmt: str = None) -> str:
+    return fmt or ("jsonl" if Path(path).suffix.lower() in (".jsonl", ".ndjson") else "csv")
+
+
+class Partitions:
+    """Hash ile bölümlenmiş geçici dosyalar (marshal parçaları halinde)"""
+
+    def __init__(self, directory: str, prefix: str, count: int):
+        self.paths = [os.path.join(directory, f"{prefix}.{i}") for i in range(count)]
+        self.count = count
+        self.buffers: List[List[Any]] = [[] for _ in range(count)]
+        self.buffered = 0
+        self.items = 0
+
+    def add(self, key: str, item: Any):
+        self.buffers[hash(key) % self.count].append(item)
+        self.buffered += 1
+        if self.buffered >= SPILL_BUFFER:
+            self.flush()
+
+    def flush(self):
+        # Dosyalar açık tutulmaz; çok sayıda bölümde dosya tanıtıcısı sınırına takılmamak için
+        for path, buffer in zip(self.paths, self.buffers):
+            if buffer:
+                with open(path, 'ab') as f:
+                    marshal.dump(buffer, f)
+                self.items += len(buffer)
+                buffer.clear()
+        self.buffered = 0
+
+    def read(self, index: int) -> Iterator[Any]:
+        try:
+            f = open(self.paths[index], 'rb')
+        except FileNotFoundError:
+            return
+        with f:
+            while True:
+                try:
+                    chunk = marshal.load(f)
+                except EOFError:
+                    return
+                yield from chunk
+
+
+class KeySet:
+    """Bir parent kolonunun anahtar kümesi; taşınca bölümlü dosyalarda"""
+
+    def __init__(self, table: str, column: str):
+        self.table = table
+        self.column = column
+        self.keys: Optional[set] = set()
+        self.partitions: Optional[Partitions] = None
+        self.rows = 0
+        self.duplicates = 0
+
+    @property
+    def name(self) -> str:
+        return f"{self.table}.{self.column}"
+
+    @property
+    def spilled(self) -> bool:
+        return self.partitions is not None
+
+    def spill(self, directory: str, count: int):
+        self.partitions = Partitions(directory, f"keys.{self.table}.{self.column}", count)
+        add = self.partitions.add
+        for key in self.keys:
+            add(key, key)
+        self.keys = None
+
+    def to_dict(self) -> Dict:
+        return {
+            "key": self.name,
+            "rows": self.rows,
+            "duplicates": self.duplicates,
+            "spilled": self.spilled
+        }
+
+
+class Link:
+    """Child kolonundan parent kolonuna bir referans (foreign key veya ilişki)"""
+
+    __slots__ = ("child", "column", "parent", "parent_column", "origin", "source",
+                 "on_delete", "rules", "status", "checked", "orphans", "samples", "probes")
+
+    def __init__(self, child: str, column: str, parent: str, parent_column: str,
+                 origin: str, source: str, on_delete: str = None):
+        self.child = child
+        self.column = column
+        self.parent = parent
+        self.parent_column = parent_column
+        self.origin = origin
+        self.source = source
+        self.on_delete = on_delete
+        self.rules: List[str] = []
+        self.status = "pending"
+        self.checked = 0
+        self.orphans = 0
+        # En küçük satır numaralı örnekler (max-heap: (-satır, değer))
+        self.samples: List[Tuple[int, str]] = []
+        self.probes: Optional[Partitions] = None
+
+    @property
+    def id(self) -> str:
+        return f"{self.child}.{self.column} -> {self.parent}.{self.parent_column}"
+
+    def orphan(self, row: int, key: str, limit: int):
+        self.orphans += 1
+        if len(self.samples) < limit:
+            heapq.heappush(self.samples, (-row, key))
+        elif limit and row < -self.samples[0][0]:
+            heapq.heapreplace(self.samples, (-row, key))
+
+    def to_dict(self) -> Dict:
+        result = {
+            "id": self.id,
+            "origin": self.origin,
+            "source": self.source,
+            "status": self.status,
+            "checked": self.checked,
+            "orphans": self.orphans,
+            "samples": [{"row": -row, "value": key} for row, key in sorted(self.samples, reverse=True)]
+        }
+        if self.on_delete:
+            result["on_delete"] = self.on_delete
+        if self.rules:
+            result["rules"] = list(self.rules)
+        return result
+
+
+def collect_links(modules: Dict[str, Dict], relations: Dict = None) -> List[Link]:
+    """
+    Modül foreign key'leri ve relations.json cross_module_relationships
+    kayıtlarından referans listesi; aynı kolon çifti bir kez alınır.
+    """
+    selected, _ = select_tables(modules)
+    links: Dict[Tuple[str, str, str, str], Link] = {}
+
+    for table_name, (module_name, table) in selected.items():
+        for column in table.get("columns", []):
+            fk = column.get("foreign_key")
+            if not isinstance(fk, dict) or not fk.get("table") or not fk.get("column"):
+                continue
+            name = column_name(column)
+            key = (table_name, name, fk["table"], fk["column"])
+            if key not in links:
+                links[key] = Link(table_name, name, fk["table"], fk["column"], "foreign_key",
+                                  f"{modules[module_name].get('module', module_name)}.{table_name}.{name}",
+                                  fk.get("on_delete"))
+
+    for rel in (relations or {}).get("cross_module_relationships", []):
+        source, target = rel.get("source", {}), rel.get("target", {})
+        if not (source.get("table") and source.get("column") and target.get("table") and target.get("column")):
+            continue
+        key = (source["table"], source["column"], target["table"], target["column"])
+        if key not in links:
+            links[key] = Link(source["table"], source["column"], target["table"], target["column"],
+                              "relationship", str(rel.get("id", "?")))
+    return list(links.values())
+
+
+class IntegrityChecker:
+    """
+    Dışa aktarılmış tablo dosyaları üzerinde referans bütünlüğü kontrolü.
+
+    Kullanım:
+        checker = IntegrityChecker(modules, relations)
+        report = checker.check({"stok_kart": "stok_kart.csv", ...})
+    """
+
+    def __init__(self, modules: Dict[str, Dict], relations: Dict = None,
+                 max_keys: int = DEFAULT_MAX_KEYS, partitions: int = DEFAULT_PARTITIONS,
+                 spill_dir: str = None, samples: int = DEFAULT_SAMPLES, delimiter: str = ","):
+        """
+        Args:
+            max_keys: Bellekte tutulacak toplam parent anahtarı; aşılınca
+                en büyük anahtar kümesi diske taşınır
+            partitions: Taşan küme başına bölüm sayısı (her bölüm bellekte
+                yaklaşık küme boyutu / partitions anahtar tutar)
+            spill_dir: Geçici dosyalar için dizin (varsayılan: sistem temp)
+            samples: Bağlantı başına raporlanacak yetim satır örneği
+        """
+        self.tables, _ = select_tables(modules)
+        self.relations = relations or {}
+        self.links = collect_links(modules, relations)
+        self.max_keys = max_keys
+        self.partitions = max(1, partitions)
+        self.spill_dir = spill_dir
+        self.samples = samples
+        self.delimiter = delimiter
+        self.keysets: Dict[Tuple[str, str], KeySet] = {}
+        self._resident = 0
+        self._tmp: Optional[str] = None
+
+    def check(self, files: Dict[str, Any], progress: Callable[[Dict], None] = None) -> Dict:
+        """
+        Args:
+            files: Tablo adı -> veri dosyası (CSV/JSONL)
+            progress: Her tablo okunduktan sonra {"table", "phase", "rows",
+                "seconds"} ile çağrılır
+
+        Returns:
+            links, rules, keys (parent anahtar kümeleri), rows ve seconds
+            içeren rapor
+        """
+        started = time.perf_counter()
+        self.keysets = {}
+        self._resident = 0
+        for link in self.links:
+            link.__init__(link.child, link.column, link.parent, link.parent_column,
+                          link.origin, link.source, link.on_delete)
+        files = {table: Path(path) for table, path in files.items()}
+        # JSONL kayıtlarında NULL alanlar yazılmayabilir; kolon kontrolü sadece CSV başlığında
+        columns = {
+            table: file_columns(path, delimiter=self.delimiter) if _format(path) == "csv" else None
+            for table, path in files.items()
+        }
+        rows: Dict[str, int] = {}
+
+        active = []
+        for link in self.links:
+            if link.child not in files or link.parent not in files:
+                link.status = "skipped"
+            elif self._missing_column(columns[link.child], link.column) or \
+                    self._missing_column(columns[link.parent], link.parent_column):
+                link.status = "missing_column"
+            else:
+                active.append(link)
+
+        try:
+            parents: Dict[str, List[str]] = {}
+            for link in active:
+                needed = parents.setdefault(link.parent, [])
+                if link.parent_column not in needed:
+                    needed.append(link.parent_column)
+            for table, needed in parents.items():
+                rows[table] = self._scan_parent(table, files[table], needed, progress)
+
+            children: Dict[str, List[Link]] = {}
+            for link in active:
+                children.setdefault(link.child, []).append(link)
+            for table, links in children.items():
+                rows[table] = self._scan_child(table, files[table], links, progress)
+
+            self._resolve_spilled(active)
+        finally:
+            if self._tmp is not None:
+                shutil.rmtree(self._tmp, ignore_errors=True)
+                self._tmp = None
+
+        for link in active:
+            link.status = "violated" if link.orphans else "ok"
+        rules = self._check_rules()
+
+        return {
+            "valid": not any(link.orphans for link in active),
+            "links": [link.to_dict() for link in self.links],
+            "rules": rules,
+            "keys": [keyset.to_dict() for keyset in self.keysets.values()],
+            "rows": rows,
+            "orphans": sum(link.orphans for link in active),
+            "seconds": time.perf_counter() - started
+        }
+
+    @staticmethod
+    def _missing_column(header: Optional[List[str]], column: str) -> bool:
+        return header is not None and column not in header
+
+    # ------------------------------------------------------------------
+    # Parent anahtarları
+    # ------------------------------------------------------------------
+
+    def _scan_parent(self, table: str, path: Path, needed: List[str], progress) -> int:
+        started = time.perf_counter()
+        keysets = []
+        for column in needed:
+            keyset = KeySet(table, column)
+            self.keysets[(table, column)] = keyset
+            keysets.append(keyset)
+
+        count = 0
+        check_every = 65536
+        for count, values in enumerate(read_columns(path, needed, delimiter=self.delimiter), 1):
+            for keyset, value in zip(keysets, values):
+                key = _key(value)
+                if key is None:
+                    continue
+                keyset.rows += 1
+                keys = keyset.keys
+                if keys is None:
+                    keyset.partitions.add(key, key)
+                elif key in keys:
+                    keyset.duplicates += 1
+                else:
+                    keys.add(key)
+                    self._resident += 1
+            if count % check_every == 0 and self._resident > self.max_keys:
+                self._spill_largest()
+        if self._resident > self.max_keys:
+            self._spill_largest()
+
+        if progress is not None:
+            progress({"table": table, "phase": "keys", "rows": count,
+                      "seconds": time.perf_counter() - started})
+        return count
+
+    def _spill_largest(self):
+        while self._resident > self.max_keys:
+            resident = [k for k in self.keysets.values() if k.keys is not None]
+            if not resident:
+                return
+            keyset = max(resident, key=lambda k: len(k.keys))
+            self._resident -= len(keyset.keys)
+            keyset.spill(self._spill_directory(), self.partitions)
+
+    def _spill_directory(self) -> str:
+        if self._tmp is None:
+            self._tmp = tempfile.mkdtemp(prefix="paktlang_ri_", dir=self.spill_dir)
+        return self._tmp
+
+    # ------------------------------------------------------------------
+    # Child değerleri
+    # ------------------------------------------------------------------
+
+    def _scan_child(self, table: str, path: Path, links: List[Link], progress) -> int:
+        started = time.perf_counter()
+        needed = []
+        for link in links:
+            if link.column not in needed:
+                needed.append(link.column)
+
+        probes = []
+        for link in links:
+            keyset = self.keysets[(link.parent, link.parent_column)]
+            if keyset.spilled:
+                link.probes = Partitions(self._spill_directory(), f"probe.{len(self.keysets)}.{id(link)}",
+                                         keyset.partitions.count)
+            probes.append((needed.index(link.column), link, keyset.keys))
+
+        count = 0
+        limit = self.samples
+        for count, values in enumerate(read_columns(path, needed, delimiter=self.delimiter), 1):
+            for index, link, keys in probes:
+                key = _key(values[index])
+                if key is None:
+                    continue
+                link.checked += 1
+                if keys is None:
+                    link.probes.add(key, (count, key))
+                elif key not in keys:
+                    link.orphan(count, key, limit)
+
+        if progress is not None:
+            progress({"table": table, "phase": "references", "rows": count,
+                      "seconds": time.perf_counter() - started})
+        return count
+
+    def _resolve_spilled(self, links: List[Link]):
+        """Taşan anahtar kümelerini bölüm bölüm child değerleriyle eşleştirir"""
+        by_keyset: Dict[Tuple[str, str], List[Link]] = {}
+        for link in links:
+            if link.probes is not None:
+                link.probes.flush()
+                by_keyset.setdefault((link.parent, link.parent_column), []).append(link)
+
+        for keyset in self.keysets.values():
+            if not keyset.spilled:
+                continue
+            keyset.partitions.flush()
+            waiting = by_keyset.get((keyset.table, keyset.column), [])
+            for index in range(keyset.partitions.count):
+                keys = set()
+                for key in keyset.partitions.read(index):
+                    if key in keys:
+                        keyset.duplicates += 1
+                    else:
+                        keys.add(key)
+                for link in waiting:
+                    for row, key in link.probes.read(index):
+                        if key not in keys:
+                            link.orphan(row, key, self.samples)
+            for link in waiting:
+                link.probes = None
+
+    # ------------------------------------------------------------------
+    # RI kuralları
+    # ------------------------------------------------------------------
+
+    def _check_rules(self) -> List[Dict]:
+        """
+        referential_integrity_rules: source_table'a bakan her affected_tables
+        referansı yetim satır içermemeli. Tablolar arası referans yoksa kural
+        o tablo için doğrulanamaz (unresolved).
+        """
+        results = []
+        for rule in self.relations.get("referential_integrity_rules", []):
+            rule_id = str(rule.get("rule_id", "?"))
+            source = rule.get("source_table")
+            affected = []
+            unresolved = []
+            verified = True
+            orphans = 0
+            for table in rule.get("affected_tables", []):
+                links = [l for l in self.links if l.child == table and l.parent == source]
+                if not links:
+                    unresolved.append(table)
+                    continue
+                for link in links:
+                    if rule_id not in link.rules:
+                        link.rules.append(rule_id)
+                    if link.status not in ("ok", "violated"):
+                        verified = False
+                table_orphans = sum(l.orphans for l in links)
+                orphans += table_orphans
+                affected.append({"table": table, "links": [l.id for l in links], "orphans": table_orphans})
+
+            if orphans:
+                status = "violated"
+            elif unresolved or not verified:
+                status = "unverified"
+            else:
+                status = "ok"
+            results.append({
+                "rule_id": rule_id,
+                "action": rule.get("action"),
+                "source_table": source,
+                "status": status,
+                "orphans": orphans,
+                "affected": affected,
+                "unresolved": unresolved
+            })
+        return results
@@ -0,0 +1,419 @@
+"""
+PaktLang ERP Mapping Engine
+mappings/erp_mappings.json tanımlarından derlenmiş, iki yönlü satır dönüştürücü
+"""
+
+import json
+import re
+from datetime import date, datetime
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from paktlang.validator.symbols import column_name
+from paktlang.validator.type_registry import TypeRegistry
+
+from .sqlite_loader import resolve_table
+
+
+PAKTLANG = "paktlang"
+
+# Tarih formatı belirteçleri (hepsi sabit genişlikte)
+DATE_TOKENS = {"YYYY": ("year", 4), "MM": ("month", 2), "DD": ("day", 2),
+               "HH": ("hour", 2), "mm": ("minute", 2), "ss": ("second", 2)}
+_TOKEN_RE = re.compile(r"YYYY|MM|DD|HH|mm|ss")
+_STRFTIME = {"YYYY": "%Y", "MM": "%m", "DD": "%d", "HH": "%H", "mm": "%M", "ss": "%S"}
+# Hızlı yolun kabul ettiği değer aralıkları; 29-31 günleri ay/artık yıl
+# kontrolü için yavaş yola bırakılır
+_EXACT = {"YYYY": r"\d{4}", "MM": r"0[1-9]|1[0-2]", "DD": r"0[1-9]|1\d|2[0-8]",
+          "HH": r"[01]\d|2[0-3]", "mm": r"[0-5]\d", "ss": r"[0-5]\d"}
+
+DEFAULT_DATE_FORMAT = "YYYY-MM-DD"
+DEFAULT_TIME_FORMAT = "HH:mm:ss"
+
+
+class TranslationError(ValueError):
+    """Bir alan değeri hedef formata dönüştürülemedi"""
+
+    def __init__(self, field: str, value: Any, message: str):
+        super().__init__(f"{field}: {message} ({value!r})")
+        self.field = field
+        self.value = value
+
+
+# ----------------------------------------------------------------------
+# Değer dönüştürücüler
+# ----------------------------------------------------------------------
+
+def _parse_format(fmt: str) -> List[Tuple[str, int, int]]:
+    """Format içindeki belirteçlerin (ad, başlangıç, bitiş) konumları"""
+    return [(m.group(), m.start(), m.end()) for m in _TOKEN_RE.finditer(fmt)]
+
+
+def _token_pattern(fmt: str) -> str:
+    pattern = ""
+    for part in re.split(r"(YYYY|MM|DD|HH|mm|ss)", fmt):
+        if part in DATE_TOKENS:
+            name, width = DATE_TOKENS[part]
+            pattern += rf"(?P<{name}>\d{{1,{width}}})"
+        else:
+            pattern += re.escape(part)
+    return pattern
+
+
+def _format_regex(fmt: str):
+    """Formatı esnek regex'e çevirir; tarih formatlarında saat kısmı opsiyoneldir"""
+    split = fmt.find("HH")
+    if split <= 0:
+        pattern = _token_pattern(fmt)
+    else:
+        date_fmt = fmt[:split].rstrip(" T")
+        pattern = _token_pattern(date_fmt) + r"(?:[ T]" + _token_pattern(fmt[split:]) + ")?"
+    return re.compile(pattern + r"(?:\.\d+)?\Z").match
+
+
+def _exact_regex(fmt: str):
+    """Formatla birebir aynı genişlikte ve geçerli aralıkta değerleri eşleyen regex"""
+    pattern = ""
+    for part in re.split(r"(YYYY|MM|DD|HH|mm|ss)", fmt):
+        pattern += f"(?:{_EXACT[part]})" if part in _EXACT else re.escape(part)
+    return re.compile(pattern + r"\Z").match
+
+
+def compile_date_converter(src_fmt: str, dst_fmt: str, field: str) -> Callable[[Any], Any]:
+    """
+    src_fmt biçimindeki tarihi dst_fmt biçimine çeviren fonksiyon üretir.
+
+    Hızlı yol: formatla birebir eşleşen (ayraçları yerinde, rakamları
+    geçerli aralıkta) değerler dilimlenerek yeniden dizilir (strptime
+    çağrılmaz). Eşleşmeyen değerler, date/datetime nesneleri ve boş
+    değerler yavaş yoldan işlenir; hatalı tarihler orada TranslationError
+    verir.
+    """
+    src_slices = {token: (start, end) for token, start, end in _parse_format(src_fmt)}
+    parts = []
+    pos = 0
+    for token, start, end in _parse_format(dst_fmt):
+        if start > pos:
+            parts.append(repr(dst_fmt[pos:start]))
+        if token in src_slices:
+            s, e = src_slices[token]
+            parts.append(f"v[{s}:{e}]")
+        else:
+            parts.append(repr("0" * DATE_TOKENS[token][1]))
+        pos = end
+    if pos < len(dst_fmt):
+        parts.append(repr(dst_fmt[pos:]))
+
+    strftime = _TOKEN_RE.sub(lambda m: _STRFTIME[m.group()], dst_fmt)
+    match = _format_regex(src_fmt)
+
+    def slow(v):
+        if v is None or v == "":
+            return v
+        if isinstance(v, (datetime, date)):
+            return v.strftime(strftime)
+        if not isinstance(v, str):
+            raise TranslationError(field, v, f"Tarih bekleniyor ({src_fmt})")
+        m = match(v.strip())
+        if m is None:
+            raise TranslationError(field, v, f"Tarih formatı uyuşmuyor ({src_fmt})")
+        values = {k: int(x) for k, x in m.groupdict().items() if x is not None}
+        try:
+            parsed = datetime(values["year"], values["month"], values["day"],
+                              values.get("hour", 0), values.get("minute", 0), values.get("second", 0))
+        except (KeyError, ValueError):
+            raise TranslationError(field, v, f"Geçersiz tarih ({src_fmt})")
+        return parsed.strftime(strftime)
+
+    if not src_slices or not parts:
+        return slow
+
+    if src_fmt == dst_fmt:
+        fast = "v"
+    else:
+        fast = "+".join(parts)
+    expr = f"lambda v: {fast} if v.__class__ is str and exact(v) else slow(v)"
+    return eval(expr, {"slow": slow, "exact": _exact_regex(src_fmt)})
+
+
+def compile_decimal_converter(src_sep: str, dst_sep: str) -> Optional[Callable[[Any], Any]]:
+    """Ondalık ayracı dönüşümü (ayraçlar aynıysa None)"""
+    if src_sep == dst_sep:
+        return None
+
+    def convert(v):
+        if v is None or v == "":
+            return v
+        if v.__class__ is not str:
+            v = str(v)
+        return v.replace(src_sep, dst_sep)
+
+    return convert
+
+
+def _code_keys(code: str) -> List[Any]:
+    """ERP kodu hem metin hem (sayısal ise) tam sayı olarak gelebilir"""
+    keys = [code]
+    if code.isdigit():
+        keys.append(int(code))
+    return keys
+
+
+# ----------------------------------------------------------------------
+# Satır dönüştürücü
+# ----------------------------------------------------------------------
+
+class RowTranslator:
+    """
+    Tek bir ERP tablosu ile PaktLang tablosu arasında derlenmiş dönüştürücü.
+
+    Her yön için alan listesi, değer dönüştürücüleri ile birlikte tek bir
+    Python fonksiyonuna derlenir (satır başına sözlük oluşturma + sadece
+    gereken alanlarda dönüştürücü çağrısı). Dönüşümü olmayan alanlar
+    doğrudan kopyalanır.
+    """
+
+    def __init__(self, erp: str, module: str, table: str, erp_table: str,
+                 fields: List[Dict]):
+        """
+        Args:
+            fields: {"paktlang", "erp", "to_paktlang", "to_erp"} sözlükleri;
+                dönüştürücüler None olabilir
+        """
+        self.erp = erp
+        self.module = module
+        self.table = table
+        self.erp_table = erp_table
+        self.fields = fields
+
+        self.to_paktlang, self.paktlang_source = self._compile("erp", "paktlang", "to_paktlang")
+        self.to_erp, self.erp_source = self._compile("paktlang", "erp", "to_erp")
+
+    def _compile(self, src: str, dst: str, direction: str):
+        namespace: Dict[str, Any] = {}
+        items = []
+        seen = set()
+        for i, field in enumerate(self.fields):
+            target = field[dst]
+            if target in seen:
+                continue
+            seen.add(target)
+            access = f"g({field[src]!r})"
+            converter = field.get(direction)
+            if converter is not None:
+                namespace[f"c{i}"] = converter
+                access = f"c{i}({access})"
+            items.append(f"{target!r}: {access}")
+
+        source = (
+            f"def {direction}(row):\n"
+            f"    g = row.get\n"
+            f"    return {{{', '.join(items)}}}\n"
+        )
+        exec(compile(source, f"<paktlang:{self.erp}.{self.table}.{direction}>", "exec"), namespace)
+        return namespace[direction], source
+
+    # ------------------------------------------------------------------
+    # Akış ve batch dönüşüm
+    # ------------------------------------------------------------------
+
+    def iter_to_paktlang(self, rows: Iterable[Dict]) -> Iterator[Dict]:
+        """ERP satır akışını PaktLang satırlarına çevirir (tembel)"""
+        return map(self.to_paktlang, rows)
+
+    def iter_to_erp(self, rows: Iterable[Dict]) -> Iterator[Dict]:
+        """PaktLang satır akışını ERP satırlarına çevirir (tembel)"""
+        return map(self.to_erp, rows)
+
+    def batch_to_paktlang(self, rows: List[Dict]) -> List[Dict]:
+        convert = self.to_paktlang
+        return [convert(row) for row in rows]
+
+    def batch_to_erp(self, rows: List[Dict]) -> List[Dict]:
+        convert = self.to_erp
+        return [convert(row) for row in rows]
+
+    @property
+    def field_map(self) -> Dict[str, str]:
+        """PaktLang alanı -> ERP alanı"""
+        return {f["paktlang"]: f["erp"] for f in self.fields}
+
+
+class MappingCatalog:
+    """erp_mappings.json tanımları ve derlenmiş dönüştürücü önbelleği"""
+
+    def __init__(self, data: Dict, modules: Dict[str, Dict] = None,
+                 types: TypeRegistry = None):
+        """
+        Args:
+            data: erp_mappings.json içeriği
+            modules: Modül anahtarı -> modül verisi (kolon tipleri için)
+            types: Tip kayıt defteri; verilmezse sadece special_fields dönüştürülür
+        """
+        self.data = data
+        self.modules = modules or {}
+        self.types = types
+        self.rules = data.get("conversion_rules", {})
+        self._translators: Dict[Tuple[str, str, Optional[str]], RowTranslator] = {}
+
+    @classmethod
+    def load(cls, mappings_file: str, modules: Dict[str, Dict] = None,
+             types: TypeRegistry = None) -> "MappingCatalog":
+        with open(mappings_file, 'r', encoding='utf-8') as f:
+            return cls(json.load(f), modules, types)
+
+    @property
+    def systems(self) -> List[str]:
+        info = self.data.get("mapping_info", {})
+        return [s for s in info.get("supported_erp_systems", []) if s in self.data]
+
+    def tables(self, erp: str) -> Iterator[Tuple[str, str, Dict]]:
+        """(modül, tablo, tablo mapping'i) üçlüleri"""
+        for module_name, tables in self._system(erp).get("modules", {}).items():
+            for table_name, mapping in tables.items():
+                yield module_name, table_name, mapping
+
+    def _system(self, erp: str) -> Dict:
+        system = self.data.get(erp)
+        if not isinstance(system, dict) or "modules" not in system:
+            raise KeyError(f"ERP mapping bulunamadı: {erp}")
+        return system
+
+    def erp_table_name(self, erp: str, template: str, firma: Any = None) -> str:
+        """{FIRMA} yer tutucusunu firma koduyla doldurur (Logo: LG_001_ITEMS)"""
+        if firma is None or "{FIRMA}" not in template:
+            return template
+        width = len(self._system(erp).get("firma_code_format", ""))
+        return template.replace("{FIRMA}", str(firma).zfill(width))
+
+    def find(self, erp: str, ref: str) -> Optional[Tuple[str, str, Dict]]:
+        """
+        Tabloyu PaktLang adıyla ("tablo" veya "modül.tablo") ya da ERP
+        tablo adıyla (firma kodlu Logo adları dahil) bulur.
+        """
+        module_ref, _, table_ref = ref.rpartition(".")
+        for module_name, table_name, mapping in self.tables(erp):
+            if table_name == table_ref and module_ref in ("", module_name):
+                return module_name, table_name, mapping
+        for module_name, table_name, mapping in self.tables(erp):
+            pattern = re.escape(mapping.get("erp_table", "")).replace(r"\{FIRMA\}", r"\d+")
+            if re.fullmatch(pattern, ref, re.IGNORECASE):
+                return module_name, table_name, mapping
+        return None
+
+    # ------------------------------------------------------------------
+    # Derleme
+    # ------------------------------------------------------------------
+
+    def translator(self, erp: str, table: str, firma: Any = None) -> RowTranslator:
+        """Tablo için derlenmiş dönüştürücü (önbellekli)"""
+        key = (erp, table, None if firma is None else str(firma))
+        cached = self._translators.get(key)
+        if cached is not None:
+            return cached
+
+        found = self.find(erp, table)
+        if found is None:
+            raise KeyError(f"{erp} için tablo mapping'i bulunamadı: {table}")
+        module_name, table_name, mapping = found
+
+        columns = self._paktlang_columns(module_name, table_name)
+        fields = []
+        for paktlang_field, erp_field in mapping.get("field_mappings", {}).items():
+            fields.append(self._field(erp, paktlang_field, erp_field, columns.get(paktlang_field)))
+
+        for paktlang_field, spec in mapping.get("special_fields", {}).items():
+            field = self._field(erp, paktlang_field, spec["erp_field"], columns.get(paktlang_field))
+            if spec.get("mappings"):
+                field.update(self._enum_converters(paktlang_field, spec["mappings"]))
+            fields.append(field)
+
+        erp_table = self.erp_table_name(erp, mapping.get("erp_table", ""), firma)
+        translator = RowTranslator(erp, module_name, table_name, erp_table, fields)
+        self._translators[key] = translator
+        return translator
+
+    def _paktlang_columns(self, module_name: str, table_name: str) -> Dict[str, Dict]:
+        # Mapping'deki modül adı ERP tarafının gruplamasıdır; tablo, yükleme
+        # ve üretimde olduğu gibi en yüksek sürümlü modülden çözülür
+        found = resolve_table(self.modules, table_name)
+        if found is None:
+            return {}
+        return {column_name(c): c for c in found[1].get("columns", []) if column_name(c)}
+
+    def _field(self, erp: str, paktlang_field: str, erp_field: str,
+               column: Optional[Dict]) -> Dict:
+        field = {"paktlang": paktlang_field, "erp": erp_field, "to_paktlang": None, "to_erp": None}
+        if column is None or self.types is None:
+            return field
+
+        base = self.types.base_of(column.get("type")) or column.get("type")
+        if base in ("date", "datetime", "time"):
+            paktlang_fmt = self._paktlang_format(base)
+            erp_fmt = self._erp_format(erp, base)
+            if paktlang_fmt != erp_fmt:
+                field["to_paktlang"] = compile_date_converter(erp_fmt, paktlang_fmt, paktlang_field)
+                field["to_erp"] = compile_date_converter(paktlang_fmt, erp_fmt, erp_field)
+        elif base == "decimal":
+            separators = self.rules.get("decimal_separators", {})
+            erp_sep = separators.get(erp, ".")
+            paktlang_sep = separators.get(PAKTLANG, ".")
+            field["to_paktlang"] = compile_decimal_converter(erp_sep, paktlang_sep)
+            field["to_erp"] = compile_decimal_converter(paktlang_sep, erp_sep)
+        elif base == "boolean":
+            field.update(self._boolean_converters(erp))
+        return field
+
+    def _paktlang_format(self, base: str) -> str:
+        if base == "date":
+            return self.rules.get("date_formats", {}).get(PAKTLANG, DEFAULT_DATE_FORMAT)
+        fmt = self.types.base_types.get(base, {}).get("format")
+        if fmt:
+            return fmt
+        return DEFAULT_TIME_FORMAT if base == "time" else f"{DEFAULT_DATE_FORMAT} {DEFAULT_TIME_FORMAT}"
+
+    def _erp_format(self, erp: str, base: str) -> str:
+        """ERP'nin tarih formatı; datetime kolonlarda saat kısmı eksikse eklenir"""
+        date_fmt = self.rules.get("date_formats", {}).get(erp) or self._paktlang_format("date")
+        if base == "time":
+            return DEFAULT_TIME_FORMAT
+        if base == "datetime" and "HH" not in date_fmt:
+            return f"{date_fmt} {DEFAULT_TIME_FORMAT}"
+        return date_fmt
+
+    def _boolean_converters(self, erp: str) -> Dict[str, Optional[Callable]]:
+        mapping = self.rules.get("boolean_mappings", {}).get(erp)
+        if not mapping:
+            return {}
+        true_code, false_code = mapping.get("true"), mapping.get("false")
+
+        to_paktlang: Dict[Any, bool] = {}
+        for code, value in ((true_code, True), (false_code, False)):
+            for key in _code_keys(str(code)):
+                to_paktlang[key] = value
+        to_paktlang.update({True: True, False: False})
+
+        to_erp = {True: true_code, False: false_code,
+                  "true": true_code, "false": false_code, "1": true_code, "0": false_code}
+
+        return {
+            "to_paktlang": lambda v: to_paktlang.get(v, v),
+            "to_erp": lambda v: to_erp.get(v, v)
+        }
+
+    def _enum_converters(self, field: str, mappings: Dict[str, str]) -> Dict[str, Callable]:
+        """
+        ERP kodu <-> PaktLang enum değeri. Aynı değere birden fazla kod
+        eşleniyorsa (Logo IOCODE 1/3 -> giris) ters yönde ilk kod kullanılır.
+        Tanımsız kodlar değiştirilmeden aktarılır.
+        """
+        to_paktlang: Dict[Any, str] = {}
+        to_erp: Dict[str, str] = {}
+        for code, value in mappings.items():
+            for key in _code_keys(code):
+                to_paktlang[key] = value
+            to_erp.setdefault(value, code)
+
+        return {
+            "to_paktlang": lambda v: to_paktlang.get(v, v),
+            "to_erp": lambda v: to_erp.get(v, v)
+        }
@@ -0,0 +1,490 @@
+"""
+PaktLang Record Validator
+Tablo şemalarından derlenmiş, toplu (batch) çalışan satır doğrulayıcı
+"""
+
+import csv
+import json
+import re
+import sys
+from datetime import date, datetime, time as dtime
+from decimal import Decimal, InvalidOperation
+from itertools import islice
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from paktlang.validator.symbols import column_name, iter_tables
+from paktlang.validator.type_registry import ColumnType, TypeRegistry
+
+
+# Veri seviyesi hata kodları (şema hataları PL001-PL010)
+DATA_ERROR_CODES = {
+    "PL101": "Zorunlu değer eksik",
+    "PL102": "Tip uyumsuz",
+    "PL103": "Uzunluk sınırı dışında",
+    "PL104": "Desen (pattern) uyuşmuyor",
+    "PL105": "Değer aralık dışında",
+    "PL106": "Hassasiyet/ölçek aşıldı",
+    "PL107": "Geçersiz enum değeri",
+    "PL108": "Kontrol basamağı (checksum) hatalı"
+}
+
+# Tekrar eden tarih/saat değerleri için doğrulanmış değer önbelleği sınırı
+SEEN_LIMIT = 65536
+
+BOOLEAN_VALUES = frozenset(["true", "false", "True", "False", "TRUE", "FALSE", "1", "0", "t", "f"])
+
+_INTEGER = re.compile(r"[+-]?\d+\Z").match
+_UUID = re.compile(r"[0-9a-fA-F]{8}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{12}\Z").match
+
+
+class RowError:
+    """Satır doğrulama hatası"""
+
+    __slots__ = ("row", "column", "code", "message", "value")
+
+    def __init__(self, row: int, column: str, code: str, message: str, value: Any = None):
+        self.row = row
+        self.column = column
+        self.code = code
+        self.message = message
+        self.value = value
+
+    def __str__(self):
+        return f"[{self.code}] satır {self.row}, {self.column}: {self.message}"
+
+    def to_dict(self) -> Dict:
+        return {
+            "row": self.row,
+            "column": self.column,
+            "code": self.code,
+            "message": self.message,
+            "value": self.value
+        }
+
+
+# ----------------------------------------------------------------------
+# Checksum algoritmaları
+# ----------------------------------------------------------------------
+
+def tc_kimlik_checksum(value: str) -> bool:
+    """TC Kimlik No 10. ve 11. hane kontrolü"""
+    if len(value) != 11 or not value.isdigit() or value[0] == "0":
+        return False
+    d = [int(c) for c in value]
+    tenth = ((d[0] + d[2] + d[4] + d[6] + d[8]) * 7 - (d[1] + d[3] + d[5] + d[7])) % 10
+    return tenth == d[9] and sum(d[:10]) % 10 == d[10]
+
+
+def mod11_checksum(value: str) -> bool:
+    """Vergi kimlik no (10 hane) kontrolü; 11 hane şahıs için TC Kimlik kuralı"""
+    if len(value) == 11:
+        return tc_kimlik_checksum(value)
+    if len(value) != 10 or not value.isdigit():
+        return False
+    total = 0
+    for i in range(9):
+        tmp = (int(value[i]) + 9 - i) % 10
+        v = (tmp * 2 ** (9 - i)) % 9
+        if tmp != 0 and v == 0:
+            v = 9
+        total += v
+    return (10 - total % 10) % 10 == int(value[9])
+
+
+def iban_checksum(value: str) -> bool:
+    """IBAN mod 97 kontrolü"""
+    value = value.replace(" ", "").upper()
+    if len(value) < 5 or not value.isalnum():
+        return False
+    rearranged = value[4:] + value[:4]
+    digits = "".join(str(int(c, 36)) for c in rearranged)
+    return int(digits) % 97 == 1
+
+
+CHECKSUMS: Dict[str, Callable[[str], bool]] = {
+    "tc_kimlik_checksum": tc_kimlik_checksum,
+    "mod11_checksum": mod11_checksum,
+    "iban_checksum": iban_checksum
+}
+
+
+# ----------------------------------------------------------------------
+# Kolon derleme
+# ----------------------------------------------------------------------
+
+Issue = Tuple[str, str]
+BatchCheck = Callable[[List[Any]], List[Tuple[int, str, str]]]
+
+
+def _present(v) -> bool:
+    return v is not None and v != ""
+
+
+def _bounds(ctype: ColumnType) -> Tuple[float, float]:
+    lo = ctype.min if ctype.min is not None else float("-inf")
+    hi = ctype.max if ctype.max is not None else float("inf")
+    return lo, hi
+
+
+def _decimal_pattern(precision: Optional[int], scale: Optional[int]):
+    """precision/scale kuralını tek bir regex'e derler (hızlı yol)"""
+    precision = precision or 38
+    scale = scale if scale is not None else 0
+    int_digits = max(precision - scale, 1)
+    frac = rf"(?:\.\d{{0,{scale}}})?" if scale else r"(?:\.0*)?"
+    return re.compile(rf"[+-]?\d{{1,{int_digits}}}{frac}\Z").match
+
+
+def _range_issue(number, lo, hi) -> Optional[Issue]:
+    if number < lo or number > hi:
+        return "PL105", f"Değer aralık dışında: {number} ({lo} - {hi})"
+    return None
+
+
+def _string_detail(ctype: ColumnType) -> Callable[[Any], Optional[Issue]]:
+    match = re.compile(ctype.pattern).match if ctype.pattern else None
+    checksum = CHECKSUMS.get(ctype.checksum) if ctype.checksum else None
+    lo = ctype.min_length or 0
+    hi = ctype.max_length or sys.maxsize
+    allowed = frozenset(str(v) for v in ctype.values) if ctype.values else None
+    trim = ctype.trim
+
+    def detail(value) -> Optional[Issue]:
+        if not isinstance(value, str):
+            if isinstance(value, (dict, list)):
+                return "PL102", f"Metin bekleniyor: {type(value).__name__}"
+            value = str(value)
+        if trim:
+            value = value.strip()
+        if not lo <= len(value) <= hi:
+            return "PL103", f"Uzunluk {len(value)} ({lo} - {hi} arası olmalı)"
+        if match is not None and not match(value):
+            return "PL104", f"Desen uyuşmuyor: {ctype.pattern}"
+        if allowed is not None and value not in allowed:
+            return "PL107", f"Geçersiz değer: {value}"
+        if checksum is not None and not checksum(value):
+            return "PL108", f"Kontrol basamağı hatalı ({ctype.checksum})"
+        return None
+
+    return detail
+
+
+def _compile_string(ctype: ColumnType) -> BatchCheck:
+    detail = _string_detail(ctype)
+    match = re.compile(ctype.pattern).match if ctype.pattern else None
+    lo = ctype.min_length or 0
+    hi = ctype.max_length or sys.maxsize
+
+    if ctype.checksum or ctype.values:
+        def suspects(values):
+            return [i for i, v in enumerate(values) if v is not None and v != ""]
+    elif match is not None:
+        def suspects(values):
+            return [i for i, v in enumerate(values)
+                    if v is not None and v != ""
+                    and not (type(v) is str and lo <= len(v) <= hi and match(v))]
+    else:
+        def suspects(values):
+            return [i for i, v in enumerate(values)
+                    if v is not None and v != "" and not (type(v) is str and lo <= len(v) <= hi)]
+
+    return _batch(suspects, detail)
+
+
+def _compile_integer(ctype: ColumnType) -> BatchCheck:
+    lo, hi = _bounds(ctype)
+
+    def detail(value) -> Optional[Issue]:
+        if isinstance(value, bool) or isinstance(value, float) and not value.is_integer():
+            return "PL102", f"Tam sayı bekleniyor: {value}"
+        if isinstance(value, str):
+            if not _INTEGER(value.strip()):
+                return "PL102", f"Tam sayı bekleniyor: {value}"
+            value = int(value)
+        elif not isinstance(value, (int, float)):
+            return "PL102", f"Tam sayı bekleniyor: {value}"
+        return _range_issue(value, lo, hi)
+
+    def suspects(values):
+        return [i for i, v in enumerate(values)
+                if v is not None and v != ""
+                and not ((type(v) is int and lo <= v <= hi)
+                         or (type(v) is str and _INTEGER(v) and lo <= int(v) <= hi))]
+
+    return _batch(suspects, detail)
+
+
+def _compile_decimal(ctype: ColumnType) -> BatchCheck:
+    lo, hi = _bounds(ctype)
+    bounded = ctype.min is not None or ctype.max is not None
+    fits = _decimal_pattern(ctype.precision, ctype.scale)
+    precision = ctype.precision or 38
+    scale = ctype.scale if ctype.scale is not None else 0
+
+    def detail(value) -> Optional[Issue]:
+        if isinstance(value, bool):
+            return "PL102", f"Sayı bekleniyor: {value}"
+        try:
+            number = Decimal(value.strip() if isinstance(value, str) else str(value))
+        except (InvalidOperation, TypeError, ValueError):
+            return "PL102", f"Sayı bekleniyor: {value}"
+        if not number.is_finite():
+            return "PL102", f"Sayı bekleniyor: {value}"
+        sign, digits, exponent = number.normalize().as_tuple()
+        frac_digits = max(-exponent, 0)
+        int_digits = max(len(digits) + exponent, 0) if digits != (0,) else 0
+        if frac_digits > scale or int_digits > precision - scale:
+            return "PL106", f"Hassasiyet aşıldı: {value} (decimal({precision},{scale}))"
+        if (ctype.min is not None and number < Decimal(str(ctype.min))) or \
+                (ctype.max is not None and number > Decimal(str(ctype.max))):
+            return "PL105", f"Değer aralık dışında: {value} ({lo} - {hi})"
+        return None
+
+    if bounded:
+        def suspects(values):
+            return [i for i, v in enumerate(values)
+                    if v is not None and v != ""
+                    and not (type(v) is str and fits(v) and lo <= float(v) <= hi)]
+    else:
+        def suspects(values):
+            return [i for i, v in enumerate(values)
+                    if v is not None and v != "" and not (type(v) is str and fits(v))]
+
+    return _batch(suspects, detail)
+
+
+def _compile_boolean(ctype: ColumnType) -> BatchCheck:
+    def detail(value) -> Optional[Issue]:
+        if value is True or value is False:
+            return None
+        if isinstance(value, str) and value in BOOLEAN_VALUES:
+            return None
+        if type(value) is int and value in (0, 1):
+            return None
+        if isinstance(value, (dict, list)):
+            return "PL102", f"Mantıksal değer bekleniyor: {type(value).__name__}"
+        return "PL102", f"Mantıksal değer bekleniyor: {value}"
+
+    def suspects(values):
+        return [i for i, v in enumerate(values)
+                if v is not None and v != ""
+                and not (v is True or v is False or (type(v) is str and v in BOOLEAN_VALUES))]
+
+    return _batch(suspects, detail)
+
+
+def _compile_temporal(ctype: ColumnType) -> BatchCheck:
+    parser = {"date": date.fromisoformat, "datetime": datetime.fromisoformat,
+              "time": dtime.fromisoformat}[ctype.base]
+    label = {"date": "Tarih", "datetime": "Tarih/saat", "time": "Saat"}[ctype.base]
+    # Geçerli olduğu bilinen değerler - tarih kolonlarında tekrar çok yüksektir
+    seen = set()
+
+    def detail(value) -> Optional[Issue]:
+        if not isinstance(value, str):
+            if isinstance(value, (dict, list)):
+                return "PL102", f"{label} bekleniyor: {type(value).__name__}"
+            return "PL102", f"{label} bekleniyor: {value}"
+        try:
+            parser(value.strip())
+        except ValueError:
+            return "PL102", f"{label} bekleniyor (ISO 8601): {value}"
+        if len(seen) < SEEN_LIMIT:
+            seen.add(value)
+        return None
+
+    def suspects(values):
+        return [i for i, v in enumerate(values)
+                if v is not None and v != "" and not (type(v) is str and v in seen)]
+
+    return _batch(suspects, detail)
+
+
+def _compile_enum(ctype: ColumnType) -> BatchCheck:
+    allowed = frozenset(str(v) for v in ctype.values or [])
+
+    def detail(value) -> Optional[Issue]:
+        if isinstance(value, (dict, list)):
+            return "PL102", f"Enum değeri bekleniyor: {type(value).__name__}"
+        if str(value) in allowed:
+            return None
+        return "PL107", f"Geçersiz enum değeri: {value}"
+
+    def suspects(values):
+        return [i for i, v in enumerate(values)
+                if v is not None and v != "" and not (type(v) is str and v in allowed)]
+
+    return _batch(suspects, detail)
+
+
+def _compile_json(ctype: ColumnType) -> BatchCheck:
+    def detail(value) -> Optional[Issue]:
+        if isinstance(value, (dict, list, int, float, bool)):
+            return None
+        try:
+            json.loads(value)
+        except (TypeError, ValueError):
+            return "PL102", "Geçersiz JSON değeri"
+        return None
+
+    def suspects(values):
+        return [i for i, v in enumerate(values) if type(v) is str and v != ""]
+
+    return _batch(suspects, detail)
+
+
+def _compile_uuid(ctype: ColumnType) -> BatchCheck:
+    def detail(value) -> Optional[Issue]:
+        if isinstance(value, str) and _UUID(value.strip()):
+            return None
+        return "PL102", f"UUID bekleniyor: {value}"
+
+    def suspects(values):
+        return [i for i, v in enumerate(values)
+                if v is not None and v != "" and not (type(v) is str and _UUID(v))]
+
+    return _batch(suspects, detail)
+
+
+def _batch(suspects: Callable[[List[Any]], List[int]],
+           detail: Callable[[Any], Optional[Issue]]) -> BatchCheck:
+    """
+    Hızlı filtre + detaylı kontrol: filtre tüm kolonu tek bir comprehension
+    ile tarar, detaylı (ve yavaş) kontrol sadece şüpheli değerlerde çalışır.
+    """
+    def check(values: List[Any]) -> List[Tuple[int, str, str]]:
+        issues = []
+        for i in suspects(values):
+            issue = detail(values[i])
+            if issue is not None:
+                issues.append((i, issue[0], issue[1]))
+        return issues
+    return check
+
+
+COMPILERS: Dict[str, Callable[[ColumnType], BatchCheck]] = {
+    "integer": _compile_integer,
+    "bigint": _compile_integer,
+    "decimal": _compile_decimal,
+    "string": _compile_string,
+    "text": _compile_string,
+    "boolean": _compile_boolean,
+    "date": _compile_temporal,
+    "datetime": _compile_temporal,
+    "time": _compile_temporal,
+    "enum": _compile_enum,
+    "json": _compile_json,
+    "uuid": _compile_uuid
+}
+
+
+def compile_column(ctype: ColumnType) -> Optional[BatchCheck]:
+    """Etkin tipten toplu kontrol fonksiyonu üretir (kontrol yoksa None)"""
+    compiler = COMPILERS.get(ctype.base)
+    if compiler is None:
+        return None
+    return compiler(ctype)
+
+
+# ----------------------------------------------------------------------
+# Tablo doğrulayıcı
+# ----------------------------------------------------------------------
+
+class RecordValidator:
+    """
+    Bir tablonun kolonlarından derlenmiş satır doğrulayıcı.
+
+    Satırlar batch halinde kolon kolon işlenir; her kolon için tip, uzunluk,
+    desen, aralık, hassasiyet, enum ve checksum kuralları önceden derlenmiş
+    tek bir fonksiyondadır. Bellek kullanımı batch boyutu ile sınırlıdır.
+    """
+
+    def __init__(self, table: Dict, types: TypeRegistry, module: str = None):
+        self.module = module
+        self.table_name = table.get("pl_table")
+        self.columns: List[Tuple[str, bool, Optional[BatchCheck]]] = []
+        self._order: Dict[str, int] = {}
+
+        for column in table.get("columns", []):
+            name = column_name(column)
+            if not name or name in self._order:
+                continue
+            self._order[name] = len(self.columns)
+            check = compile_column(types.resolve(column))
+            self.columns.append((name, bool(column.get("required")), check))
+
+    def validate_batch(self, rows: List[Dict], offset: int = 0) -> List[RowError]:
+        """
+        Satır listesini doğrular.
+
+        Args:
+            offset: İlk satırın numarası (hata raporları için)
+        """
+        errors = []
+        for name, required, check in self.columns:
+            values = [row.get(name) for row in rows]
+
+            if required:
+                for i, v in enumerate(values):
+                    if v is None or v == "":
+                        errors.append(RowError(offset + i, name, "PL101", "Zorunlu değer eksik"))
+
+            if check is not None:
+                for i, code, message in check(values):
+                    errors.append(RowError(offset + i, name, code, message, values[i]))
+
+        order = self._order
+        errors.sort(key=lambda e: (e.row, order[e.column]))
+        return errors
+
+    def validate_row(self, row: Dict, row_number: int = 1) -> List[RowError]:
+        return self.validate_batch([row], row_number)
+
+    def validate_stream(self, rows: Iterable[Dict], batch_size: int = 10000,
+                        start: int = 1) -> Iterator[RowError]:
+        """
+        Satır akışını batch'ler halinde doğrular; hatalar bulundukça üretilir.
+        Aynı anda bellekte en fazla bir batch bulunur.
+        """
+        iterator = iter(rows)
+        offset = start
+        while True:
+            batch = list(islice(iterator, batch_size))
+            if not batch:
+                return
+            yield from self.validate_batch(batch, offset)
+            offset += len(batch)
+
+
+def compile_tables(modules: Dict[str, Dict], types: TypeRegistry) -> Dict[str, RecordValidator]:
+    """Tüm tabloları derler; anahtar "modül.tablo" biçimindedir"""
+    return {
+        f"{module_name}.{table['pl_table']}": RecordValidator(table, types, module_name)
+        for module_name, table in iter_tables(modules)
+    }
+
+
+# ----------------------------------------------------------------------
+# Okuyucular
+# ----------------------------------------------------------------------
+
+def read_rows(path: str, fmt: str = None, delimiter: str = ",") -> Iterator[Dict]:
+    """
+    CSV veya JSONL dosyasını satır satır okur (akış halinde).
+
+    Args:
+        fmt: "csv" veya "jsonl"; verilmezse dosya uzantısından belirlenir
+    """
+    path = Path(path)
+    fmt = fmt or ("jsonl" if path.suffix.lower() in (".jsonl", ".ndjson") else "csv")
+
+    if fmt == "jsonl":
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+        return
+
+    with open(path, 'r', encoding='utf-8-sig', newline='') as f:
+        yield from csv.DictReader(f, delimiter=delimiter)
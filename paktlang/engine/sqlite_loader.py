@@ -0,0 +1,481 @@
+"""
+PaktLang SQLite Loader
+Modül şemalarından SQLite veritabanı oluşturma ve toplu veri yükleme
+"""
+
+import csv
+import json
+import sqlite3
+import time
+from itertools import groupby, islice
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from paktlang.validator.graph import DependencyGraph
+from paktlang.validator.symbols import column_name, find_table, iter_tables
+from paktlang.validator.type_registry import TypeRegistry
+
+
+DEFAULT_BATCH_SIZE = 50000
+
+# Yükleme sırasında kullanılan pragmalar (yeni oluşturulan yerel kopya için)
+LOAD_PRAGMAS = {
+    "journal_mode": "MEMORY",
+    "synchronous": "OFF",
+    "locking_mode": "EXCLUSIVE",
+    "temp_store": "MEMORY",
+    "foreign_keys": "OFF"
+}
+
+# Yükleme sonrası geri alınan değerler
+FINAL_PRAGMAS = {
+    "journal_mode": "DELETE",
+    "synchronous": "FULL",
+    "locking_mode": "NORMAL"
+}
+
+SQL_DEFAULTS = ("CURRENT_DATE", "CURRENT_TIME", "CURRENT_TIMESTAMP")
+
+BOOLEAN_CODES = {
+    "1": 1, "0": 0, "true": 1, "false": 0, "True": 1, "False": 0, "TRUE": 1, "FALSE": 0,
+    "t": 1, "f": 0, "E": 1, "H": 0, True: 1, False: 0, "": None
+}
+
+DATA_SUFFIXES = (".csv", ".jsonl", ".ndjson")
+
+
+def quote(name: str) -> str:
+    """SQLite tanımlayıcısını tırnaklar"""
+    return '"' + name.replace('"', '""') + '"'
+
+
+def sqlite_type(types: TypeRegistry, column: Dict) -> str:
+    """Kolonun SQLite tipi (base_types sql_mappings.sqlite)"""
+    base = types.base_of(column.get("type")) or column.get("type")
+    return types.base_types.get(base, {}).get("sql_mappings", {}).get("sqlite", "TEXT")
+
+
+def _version_key(module_data: Dict) -> Tuple[int, ...]:
+    parts = []
+    for part in str(module_data.get("version", "0")).split("."):
+        parts.append(int(part) if part.isdigit() else 0)
+    return tuple(parts)
+
+
+def _to_boolean(value):
+    return BOOLEAN_CODES.get(value, value)
+
+
+def _to_json(value):
+    """JSONL'deki dizi/nesne değerleri json kolonlarına metin olarak yazılır"""
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, ensure_ascii=False)
+    return value
+
+
+def discover_files(data_dir: str, tables) -> Dict[str, Path]:
+    """Veri dizinindeki tablo.csv / modül.tablo.jsonl dosyalarını tablo adına eşler"""
+    files: Dict[str, Path] = {}
+    for path in sorted(Path(data_dir).iterdir()):
+        if path.suffix.lower() not in DATA_SUFFIXES:
+            continue
+        table = path.stem.rpartition(".")[2]
+        if table in tables:
+            files.setdefault(table, path)
+    return files
+
+
+def select_tables(modules: Dict[str, Dict]) -> Tuple[Dict[str, Tuple[str, Dict]], List[Tuple[str, str]]]:
+    """
+    Tablo adı -> (modül, tablo). Aynı tablo birden fazla modülde
+    tanımlıysa en yüksek sürümlü modülün tanımı kullanılır.
+
+    Returns:
+        (seçilen tablolar, atlanan (modül, tablo) tanımları)
+    """
+    selected: Dict[str, Tuple[str, Dict]] = {}
+    duplicates: List[Tuple[str, str]] = []
+    for module_name, table in iter_tables(modules):
+        name = table["pl_table"]
+        current = selected.get(name)
+        if current is None:
+            selected[name] = (module_name, table)
+        elif _version_key(modules[module_name]) > _version_key(modules[current[0]]):
+            duplicates.append((current[0], name))
+            selected[name] = (module_name, table)
+        else:
+            duplicates.append((module_name, name))
+    return selected, duplicates
+
+
+def resolve_table(modules: Dict[str, Dict], ref: str) -> Optional[Tuple[str, Dict]]:
+    """
+    "tablo" veya "modül.tablo" referansını çözer. Modül verilmişse o modülün
+    tanımı, verilmemişse select_tables ile aynı şekilde en yüksek sürümlü
+    modülün tanımı döner.
+
+    Returns:
+        (modül anahtarı, tablo tanımı) veya bulunamazsa None
+    """
+    module_name, _, table_name = ref.rpartition(".")
+    if module_name:
+        return find_table(modules, ref)
+    selected, _ = select_tables(modules)
+    return selected.get(table_name)
+
+
+class TablePlan:
+    """Bir tablonun SQLite karşılığı: DDL, index'ler ve kolon bilgileri"""
+
+    __slots__ = ("module", "name", "columns", "booleans", "jsons", "create_sql", "index_sql",
+                 "skipped_fks")
+
+    def __init__(self, module: str, name: str):
+        self.module = module
+        self.name = name
+        self.columns: List[str] = []
+        self.booleans = set()
+        self.jsons = set()
+        self.create_sql = ""
+        self.index_sql: List[str] = []
+        self.skipped_fks: List[str] = []
+
+
+class SQLiteLoader:
+    """
+    Modül şemalarından SQLite veritabanı oluşturur ve CSV/JSONL verisini
+    toplu olarak yükler.
+
+    Tablolar FK bağımlılık sırasıyla, tablo başına tek transaction içinde
+    executemany batch'leri ile yüklenir. İkincil ve unique index'ler veri
+    yüklendikten sonra oluşturulur; FK kontrolü yükleme sırasında kapalıdır
+    ve istenirse sonunda foreign_key_check ile yapılır.
+    """
+
+    def __init__(self, db_path: str, modules: Dict[str, Dict], types: TypeRegistry,
+                 batch_size: int = DEFAULT_BATCH_SIZE, cache_size_mb: int = 256):
+        self.db_path = Path(db_path)
+        self.modules = modules
+        self.types = types
+        self.batch_size = batch_size
+        self.cache_size_mb = cache_size_mb
+        self.conn: Optional[sqlite3.Connection] = None
+
+        self.plans: Dict[str, TablePlan] = {}
+        self._index_names = set()
+        self.duplicates: List[Tuple[str, str]] = []
+        self._build_plans()
+
+    # ------------------------------------------------------------------
+    # Şema planı
+    # ------------------------------------------------------------------
+
+    def _build_plans(self):
+        selected, self.duplicates = select_tables(self.modules)
+
+        graph = DependencyGraph()
+        for name, (_, table) in selected.items():
+            graph.add_node(name)
+            for column in table.get("columns", []):
+                target = (column.get("foreign_key") or {}).get("table")
+                if target in selected and target != name:
+                    graph.add_edge(name, target)
+
+        for name in graph.topological_order():
+            module_name, table = selected[name]
+            self.plans[name] = self._plan_table(module_name, table, selected)
+
+    def _column_sql(self, column: Dict, inline_pk: bool) -> str:
+        parts = [quote(column_name(column)), sqlite_type(self.types, column)]
+
+        if inline_pk:
+            parts.append("PRIMARY KEY")
+        elif column.get("required"):
+            parts.append("NOT NULL")
+
+        default = column.get("default")
+        if isinstance(default, bool):
+            parts.append(f"DEFAULT {int(default)}")
+        elif isinstance(default, (int, float)):
+            parts.append(f"DEFAULT {default}")
+        elif isinstance(default, str):
+            if default.upper() in SQL_DEFAULTS:
+                parts.append(f"DEFAULT {default.upper()}")
+            else:
+                parts.append("DEFAULT '" + default.replace("'", "''") + "'")
+        return " ".join(parts)
+
+    def _index_name(self, name: str, table: str) -> str:
+        """Index adları veritabanı genelinde tekil olmalı; çakışmada tablo adı eklenir"""
+        if name in self._index_names:
+            name = f"{table}_{name}"
+        self._index_names.add(name)
+        return quote(name)
+
+    def _plan_table(self, module_name: str, table: Dict, selected: Dict) -> TablePlan:
+        name = table["pl_table"]
+        plan = TablePlan(module_name, name)
+        columns = [c for c in table.get("columns", []) if column_name(c)]
+        pk = [column_name(c) for c in columns if c.get("primary_key")]
+
+        definitions = []
+        constraints = []
+        seen = set()
+        for column in columns:
+            col = column_name(column)
+            if col in seen:
+                continue
+            seen.add(col)
+            plan.columns.append(col)
+            base = self.types.base_of(column.get("type")) or column.get("type")
+            if base == "boolean":
+                plan.booleans.add(col)
+            elif base == "json":
+                plan.jsons.add(col)
+
+            # Tek kolonlu tam sayı PK rowid takma adı olur (ek index yok)
+            definitions.append(self._column_sql(column, inline_pk=pk == [col]))
+
+            if column.get("unique") and not column.get("primary_key"):
+                plan.index_sql.append(
+                    f"CREATE UNIQUE INDEX IF NOT EXISTS {self._index_name(f'uq_{name}_{col}', name)} "
+                    f"ON {quote(name)} ({quote(col)})"
+                )
+            elif column.get("indexed") and not column.get("primary_key"):
+                plan.index_sql.append(
+                    f"CREATE INDEX IF NOT EXISTS {self._index_name(f'ix_{name}_{col}', name)} "
+                    f"ON {quote(name)} ({quote(col)})"
+                )
+
+            fk = column.get("foreign_key")
+            if fk and fk.get("table"):
+                if fk["table"] in selected:
+                    clause = (f"FOREIGN KEY ({quote(col)}) REFERENCES "
+                              f"{quote(fk['table'])} ({quote(fk.get('column', 'id'))})")
+                    if fk.get("on_delete"):
+                        clause += f" ON DELETE {fk['on_delete']}"
+                    constraints.append(clause)
+                else:
+                    plan.skipped_fks.append(f"{col} -> {fk['table']}")
+
+        if len(pk) > 1:
+            constraints.insert(0, f"PRIMARY KEY ({', '.join(quote(c) for c in pk)})")
+
+        for index in table.get("indexes", []):
+            cols = [c for c in index.get("columns", []) if c in seen]
+            if not cols or len(cols) != len(index.get("columns", [])):
+                continue
+            unique = "UNIQUE " if index.get("unique") else ""
+            index_name = self._index_name(index.get("name") or f"ix_{name}_{'_'.join(cols)}", name)
+            plan.index_sql.append(
+                f"CREATE {unique}INDEX IF NOT EXISTS {index_name} "
+                f"ON {quote(name)} ({', '.join(quote(c) for c in cols)})"
+            )
+
+        body = ",\n    ".join(definitions + constraints)
+        plan.create_sql = f"CREATE TABLE IF NOT EXISTS {quote(name)} (\n    {body}\n)"
+        return plan
+
+    @property
+    def load_order(self) -> List[str]:
+        return list(self.plans)
+
+    # ------------------------------------------------------------------
+    # Bağlantı ve şema
+    # ------------------------------------------------------------------
+
+    def connect(self, replace: bool = False) -> sqlite3.Connection:
+        if replace and self.db_path.exists():
+            self.db_path.unlink()
+        self.conn = sqlite3.connect(str(self.db_path), isolation_level=None)
+        for key, value in LOAD_PRAGMAS.items():
+            self.conn.execute(f"PRAGMA {key}={value}")
+        self.conn.execute(f"PRAGMA cache_size=-{self.cache_size_mb * 1024}")
+        return self.conn
+
+    def create_schema(self):
+        """Tabloları oluşturur (index'ler hariç)"""
+        self.conn.execute("BEGIN")
+        for plan in self.plans.values():
+            self.conn.execute(plan.create_sql)
+        self.conn.execute("COMMIT")
+
+    def create_indexes(self) -> int:
+        """Ertelenmiş index'leri oluşturur; oluşturulan index sayısını döner"""
+        count = 0
+        self.conn.execute("BEGIN")
+        for plan in self.plans.values():
+            for sql in plan.index_sql:
+                self.conn.execute(sql)
+                count += 1
+        self.conn.execute("COMMIT")
+        return count
+
+    def foreign_key_violations(self) -> Dict[str, int]:
+        """Tablo -> FK ihlali sayısı"""
+        violations: Dict[str, int] = {}
+        for table, _, _, _ in self.conn.execute("PRAGMA foreign_key_check"):
+            violations[table] = violations.get(table, 0) + 1
+        return violations
+
+    def finish(self, analyze: bool = True):
+        if analyze:
+            self.conn.execute("ANALYZE")
+        for key, value in FINAL_PRAGMAS.items():
+            self.conn.execute(f"PRAGMA {key}={value}")
+        self.conn.close()
+        self.conn = None
+
+    # ------------------------------------------------------------------
+    # Veri yükleme
+    # ------------------------------------------------------------------
+
+    def _row_builder(self, plan: TablePlan, positions: List[Tuple[str, Any]],
+                     access_template: str = "r[{}]") -> Callable:
+        """
+        Satırı INSERT parametre tuple'ına çeviren fonksiyonu derler.
+        Boolean ve json kolonlar dışındaki değerler dokunulmadan geçer.
+        """
+        items = []
+        for column, key in positions:
+            access = access_template.format(repr(key))
+            if column in plan.booleans:
+                access = f"b({access})"
+            elif column in plan.jsons:
+                access = f"j({access})"
+            items.append(access)
+        return eval(f"lambda r: ({', '.join(items)},)", {"b": _to_boolean, "j": _to_json})
+
+    def _insert_sql(self, plan: TablePlan, columns: List[str]) -> str:
+        # CSV'de boş metin NULL kabul edilir; dönüşüm SQLite tarafında yapılır
+        params = ", ".join("NULLIF(?, '')" for _ in columns)
+        return (f"INSERT INTO {quote(plan.name)} ({', '.join(quote(c) for c in columns)}) "
+                f"VALUES ({params})")
+
+    def _csv_batches(self, plan: TablePlan, path: Path, delimiter: str):
+        with open(path, 'r', encoding='utf-8-sig', newline='') as f:
+            reader = csv.reader(f, delimiter=delimiter)
+            header = next(reader, None)
+            if not header:
+                return
+            known = set(plan.columns)
+            positions = [(col, i) for i, col in enumerate(header) if col in known]
+            if not positions:
+                return
+            build = self._row_builder(plan, positions)
+            columns = tuple(col for col, _ in positions)
+            width = len(header)
+
+            while True:
+                chunk = list(islice(reader, self.batch_size))
+                if not chunk:
+                    return
+                try:
+                    yield columns, [build(r) for r in chunk]
+                except IndexError:
+                    # Eksik alanlı satırlar boş değerle tamamlanır
+                    yield columns, [build(r + [""] * (width - len(r))) for r in chunk]
+
+    def _jsonl_batches(self, plan: TablePlan, path: Path):
+        """
+        JSONL satırları, aynı anahtarlara sahip ardışık satır grupları
+        halinde eklenir. Her grupta yalnızca satırlarda bulunan kolonlar
+        yazılır; eksik alanlar NULL değil kolonun DEFAULT değerini alır.
+        """
+        shapes: Dict[Tuple[str, ...], Tuple[Tuple[str, ...], Callable]] = {}
+        with open(path, 'r', encoding='utf-8') as f:
+            rows = (json.loads(line) for line in f if line.strip())
+            while True:
+                chunk = list(islice(rows, self.batch_size))
+                if not chunk:
+                    return
+                for keys, group in groupby(chunk, key=tuple):
+                    shape = shapes.get(keys)
+                    if shape is None:
+                        columns = tuple(c for c in plan.columns if c in keys)
+                        build = self._row_builder(plan, [(c, c) for c in columns], "r[{}]") \
+                            if columns else None
+                        shape = shapes[keys] = (columns, build)
+                    columns, build = shape
+                    if columns:
+                        yield columns, [build(r) for r in group]
+
+    def load_table(self, table: str, path: str, fmt: str = None, delimiter: str = ",") -> Dict:
+        """
+        Tek bir veri dosyasını tabloya yükler (tek transaction).
+
+        Returns:
+            table, file, rows, seconds
+        """
+        plan = self.plans[table]
+        path = Path(path)
+        fmt = fmt or ("jsonl" if path.suffix.lower() in (".jsonl", ".ndjson") else "csv")
+        started = time.perf_counter()
+
+        source = self._jsonl_batches(plan, path) if fmt == "jsonl" else \
+            self._csv_batches(plan, path, delimiter)
+        statements: Dict[Tuple[str, ...], str] = {}
+        rows = 0
+        self.conn.execute("BEGIN")
+        try:
+            for columns, batch in source:
+                sql = statements.get(columns)
+                if sql is None:
+                    sql = statements[columns] = self._insert_sql(plan, columns)
+                self.conn.executemany(sql, batch)
+                rows += len(batch)
+            self.conn.execute("COMMIT")
+        except Exception:
+            self.conn.execute("ROLLBACK")
+            raise
+
+        return {
+            "table": table,
+            "file": str(path),
+            "rows": rows,
+            "seconds": round(time.perf_counter() - started, 3)
+        }
+
+    def discover(self, data_dir: str) -> Dict[str, Path]:
+        """Veri dizinindeki tablo.csv / modül.tablo.jsonl dosyalarını eşler"""
+        return discover_files(data_dir, self.plans)
+
+    def load(self, files: Dict[str, Path], replace: bool = False, delimiter: str = ",",
+             check_fk: bool = False, analyze: bool = True,
+             progress: Callable[[Dict], None] = None) -> Dict:
+        """
+        Şemayı oluşturur, dosyaları FK sırasıyla yükler, index'leri kurar.
+
+        Args:
+            files: Tablo adı -> veri dosyası
+        """
+        report = {"database": str(self.db_path), "tables": [], "indexes": 0,
+                  "rows": 0, "seconds": 0.0, "fk_violations": {}}
+        started = time.perf_counter()
+
+        self.connect(replace)
+        try:
+            self.create_schema()
+            for table in self.load_order:
+                if table not in files:
+                    continue
+                result = self.load_table(table, files[table], delimiter=delimiter)
+                report["tables"].append(result)
+                report["rows"] += result["rows"]
+                if progress:
+                    progress(result)
+
+            index_started = time.perf_counter()
+            report["indexes"] = self.create_indexes()
+            report["index_seconds"] = round(time.perf_counter() - index_started, 3)
+
+            if check_fk:
+                report["fk_violations"] = self.foreign_key_violations()
+            self.finish(analyze)
+        finally:
+            if self.conn is not None:
+                self.conn.close()
+                self.conn = None
+
+        report["seconds"] = round(time.perf_counter() - started, 3)
+        return report
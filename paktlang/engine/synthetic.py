@@ -0,0 +1,862 @@
+"""
+PaktLang Synthetic Data Generator
+relations.json data_flows ve FK'lere göre tutarlı, tip geçerli sentetik ERP verisi
+
+Her data_flow adımı belge başına bir satır üretir (sipariş -> irsaliye ->
+stok hareketi -> fatura -> cari hareket -> muhasebe fişi). Adım tablosuna
+zorunlu ve ON DELETE CASCADE FK ile bağlı kalem tabloları
+(satis_siparis_kalem, muhasebe_fis_satir ...) belge başına `lines` satır
+alır. Bu tabloların FK ile başvurduğu diğer tablolar (cari_kart, stok_kart,
+depo ...) ana kayıt (master) olarak üretilir. update/close gibi mevcut
+satırı değiştiren adımlar yeni satır üretmez.
+
+Kimlikler yoğun ve hesaplanabilirdir: her iş (master tablo veya akış) bir
+tabloda sabit bir kimlik aralığına sahiptir ve belge d'nin satırları
+offset + d * belge_başına_satır + sıra + 1 kimliklerini alır. Böylece
+parçalar (chunk) birbirinden bağımsız üretilir; aynı belgedeki satırlar
+birbirine (sonraki adımlar dahil) doğrudan başvurur ve FK'ler ayrıca
+eşleştirme yapmadan tutarlıdır.
+
+Değerler kolon kolon, parça başına toplu üretilir: enum, desen, checksum
+ve decimal hassasiyetine uyan değerler kolon tohumundan türetilen havuzlardan
+seçilir; unique kolonlar kimlikten türetilir. Parçalar process havuzunda
+üretilip sırayla yazılır. Parça tohumu (seed, iş, başlangıç belgesi)
+olduğundan çıktı aynı seed için process sayısından bağımsız olarak aynıdır.
+"""
+
+import csv
+import io
+import random
+import time
+import uuid
+from collections import deque
+from datetime import date, timedelta
+from itertools import islice, repeat
+from json.encoder import encode_basestring
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from paktlang.validator.graph import DependencyGraph
+from paktlang.validator.symbols import column_name
+from paktlang.validator.type_registry import ColumnType, TypeRegistry
+
+from .integrity import collect_links
+from .records import _string_detail
+from .sqlite_loader import SQLiteLoader, select_tables
+
+
+FORMATS = ("csv", "jsonl", "sqlite")
+
+DEFAULT_DOCUMENTS = 1000
+DEFAULT_MASTERS = 1000
+DEFAULT_LINES = 3
+
+# Parça başına belge; çıktı bu bölünmeye göre belirlenir (değiştirmek çıktıyı değiştirir)
+CHUNK_DOCS = 2000
+
+# Metin kolonları için kolon başına değer havuzu
+POOL_SIZE = 512
+
+# Belge tarihleri START_DATE'ten itibaren DATE_SPAN gün içinde; akış adımları birer gün sonra
+START_DATE = date(2024, 1, 1)
+DATE_SPAN = 730
+DATE_LAG = 30
+
+# Mevcut satırı değiştiren, yeni satır üretmeyen akış adımları
+MODIFY_ACTIONS = frozenset(["update", "close", "send_to_bank"])
+
+INTEGER_BASES = ("integer", "bigint")
+
+# Sınırı olmayan decimal tipleri için gerçekçi aralıklar
+DECIMAL_RANGES = {
+    "currency": (1, 100000),
+    "unit_price": (1, 10000),
+    "quantity": (1, 1000),
+    "exchange_rate": (1, 50)
+}
+
+_DATES = [(START_DATE + timedelta(days=i)).isoformat() for i in range(DATE_SPAN + 64)]
+_TIMES = [f"{s // 3600:02d}:{s // 60 % 60:02d}:{s % 60:02d}" for s in range(8 * 3600, 19 * 3600, 7)]
+
+_WORDS = (
+    "Anadolu", "Marmara", "Ege", "Akdeniz", "Karadeniz", "Yıldız", "Güneş", "Deniz", "Atlas", "Çınar",
+    "Ticaret", "Sanayi", "Gıda", "Tekstil", "Lojistik", "Yapı", "Kimya", "Metal", "Enerji", "Tarım",
+    "Mobilya", "Otomotiv", "Elektrik", "Makina", "Plastik", "Ambalaj", "Teknoloji", "Medikal", "Turizm", "Kağıt"
+)
+_SUFFIXES = ("A.Ş.", "Ltd. Şti.", "", "", "")
+_MAILBOXES = ("info", "satis", "muhasebe", "destek", "finans", "siparis")
+_DOMAINS = ("ornek.com.tr", "firma.com", "sirket.net", "test.org")
+
+
+# ----------------------------------------------------------------------
+# Değer üreticileri
+# ----------------------------------------------------------------------
+
+def _tc_kimlik(nine: int) -> str:
+    """İlk 9 hanesinden (100000000-999999999) geçerli TC Kimlik No"""
+    d = [int(c) for c in str(nine)]
+    d.append(((d[0] + d[2] + d[4] + d[6] + d[8]) * 7 - (d[1] + d[3] + d[5] + d[7])) % 10)
+    d.append(sum(d) % 10)
+    return "".join(map(str, d))
+
+
+def _tax_number(nine: int) -> str:
+    """İlk 9 hanesinden geçerli vergi kimlik no (mod11_checksum)"""
+    digits = f"{nine % 10 ** 9:09d}"
+    total = 0
+    for i in range(9):
+        tmp = (int(digits[i]) + 9 - i) % 10
+        v = (tmp * 2 ** (9 - i)) % 9
+        if tmp != 0 and v == 0:
+            v = 9
+        total += v
+    return digits + str((10 - total % 10) % 10)
+
+
+def _iban(bank: int, account: int) -> str:
+    """Geçerli TR IBAN (mod 97)"""
+    bban = f"{bank % 10 ** 5:05d}0{account % 10 ** 16:016d}"
+    return f"TR{98 - int(bban + '292700') % 97:02d}{bban}"
+
+
+def _fit(prefix: str, key: int, max_length: Optional[int]) -> str:
+    """Kimlikten tekil kod; sığmazsa önek atılır"""
+    value = f"{prefix}{key:06d}"
+    if max_length and len(value) > max_length:
+        return str(key)
+    return value
+
+
+def _pick(rng: random.Random, population, k: int) -> List:
+    """population içinden k rastgele seçim; random.choices'tan hızlı (32 bit, modül sapması ihmal edilir)"""
+    n = len(population)
+    return [population[i % n] for i in memoryview(rng.randbytes(4 * k)).cast("I")]
+
+
+def _phrase(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(_WORDS) for _ in range(words))
+
+
+# ERP tipi -> havuz değeri üreticisi (desen ve checksum'a uyar)
+SAMPLERS: Dict[str, Callable[[random.Random], str]] = {
+    "account_code": lambda rng: f"{rng.choice((100, 102, 120, 153, 191, 320, 391, 600, 770))}."
+                                f"{rng.randrange(1, 100):02d}.{rng.randrange(1, 1000):03d}",
+    "country_code": lambda rng: rng.choice(("TR", "TR", "TR", "DE", "US", "GB", "NL", "AZ")),
+    "currency_code": lambda rng: rng.choice(("TRY", "TRY", "TRY", "TRY", "USD", "EUR", "GBP")),
+    "document_number": lambda rng: f"{rng.choice('ABCDEFG')}{rng.randrange(10 ** 6):06d}",
+    "erp_code": lambda rng: f"{rng.choice(('KOD', 'GRP', 'TNM'))}-{rng.randrange(10 ** 4):04d}",
+    "email": lambda rng: f"{rng.choice(_MAILBOXES)}{rng.randrange(1000)}@{rng.choice(_DOMAINS)}",
+    "phone": lambda rng: f"+90 5{rng.randrange(30, 60)} {rng.randrange(1000):03d} "
+                         f"{rng.randrange(100):02d} {rng.randrange(100):02d}",
+    "iban": lambda rng: _iban(rng.randrange(10 ** 5), rng.randrange(10 ** 16)),
+    "tax_number": lambda rng: _tax_number(rng.randrange(10 ** 8, 10 ** 9)),
+    "tc_kimlik": lambda rng: _tc_kimlik(rng.randrange(10 ** 8, 10 ** 9)),
+    "unit_code": lambda rng: rng.choice(("ADET", "KG", "LT", "M", "M2", "M3", "PAKET", "KOLI", "TON")),
+    "warehouse_code": lambda rng: f"DEPO-{rng.randrange(1, 100):02d}"
+}
+
+# ERP tipi -> kimlikten tekil değer (unique kolonlar)
+KEYED: Dict[str, Callable[[str, int, Optional[int]], str]] = {
+    "account_code": lambda prefix, key, hi: f"{100 + key // 10 ** 4}.{key // 100 % 100:02d}.{key % 100:02d}",
+    "email": lambda prefix, key, hi: f"{prefix.lower()}{key}@ornek.com.tr",
+    "phone": lambda prefix, key, hi: f"+90 5{key // 10 ** 7 % 100:02d} {key % 10 ** 7:07d}",
+    "iban": lambda prefix, key, hi: _iban(key // 10 ** 16, key),
+    "tax_number": lambda prefix, key, hi: _tax_number(10 ** 8 + key),
+    "tc_kimlik": lambda prefix, key, hi: _tc_kimlik(10 ** 8 + key % (9 * 10 ** 8))
+}
+
+
+class Entry:
+    """Bir işin belge başına ürettiği satır grubu: akış adımı, kalem tablosu veya master"""
+
+    __slots__ = ("table", "action", "step", "lines", "slot", "header", "header_column")
+
+    def __init__(self, table: str, action: str, step: int, lines: int = 1,
+                 header: int = None, header_column: str = None):
+        self.table = table
+        self.action = action
+        self.step = step
+        self.lines = lines
+        self.slot = 0
+        self.header = header
+        self.header_column = header_column
+
+
+class Job:
+    """Belge belge üretilen iş: bir data_flow veya bir master tablo"""
+
+    __slots__ = ("name", "kind", "documents", "entries", "per_doc", "offsets")
+
+    def __init__(self, name: str, kind: str, documents: int, entries: List[Entry]):
+        self.name = name
+        self.kind = kind
+        self.documents = documents
+        self.entries = entries
+        # Tablo -> belge başına satır (aynı tablo akışta birden fazla adımda olabilir)
+        self.per_doc: Dict[str, int] = {}
+        for entry in entries:
+            entry.slot = self.per_doc.get(entry.table, 0)
+            self.per_doc[entry.table] = entry.slot + entry.lines
+        self.offsets: Dict[str, int] = {}
+
+    def first_ids(self, index: int, start: int, count: int) -> List[int]:
+        """Belgelerin bu adımdaki ilk satır kimlikleri"""
+        entry = self.entries[index]
+        per_doc = self.per_doc[entry.table]
+        base = self.offsets[entry.table] + entry.slot + 1
+        return list(range(base + start * per_doc, base + (start + count) * per_doc, per_doc))
+
+    def to_dict(self) -> Dict:
+        return {
+            "documents": self.documents,
+            "tables": {table: self.documents * rows for table, rows in self.per_doc.items()},
+            "steps": [{"table": e.table, "action": e.action, "lines": e.lines} for e in self.entries]
+        }
+
+
+class _Column:
+    """Derlenmiş kolon üreticisi"""
+
+    __slots__ = ("name", "kind", "arg", "share")
+
+    def __init__(self, name: str, kind: str, arg: Any = None, share: str = None):
+        self.name = name
+        self.kind = kind
+        self.arg = arg
+        self.share = share
+
+
+class FlowGenerator:
+    """
+    data_flows ve FK'lerden sentetik veri üretir.
+
+        generator = FlowGenerator(modules, relations, types, documents=100000, seed=7)
+        report = generator.generate("out/", fmt="jsonl", jobs=8)
+    """
+
+    def __init__(self, modules: Dict[str, Dict], relations: Dict, types: TypeRegistry,
+                 documents: int = DEFAULT_DOCUMENTS, masters: int = DEFAULT_MASTERS,
+                 lines: int = DEFAULT_LINES, flows: List[str] = None, seed: int = 0):
+        """
+        Args:
+            documents: Akış başına belge sayısı
+            masters: Master tablo başına satır
+            lines: Kalem tablolarında belge başına satır
+            flows: Sadece bu akışlar (data_flows id); verilmezse hepsi
+        """
+        selected, _ = select_tables(modules)
+        self.modules = modules
+        self.tables = {name: table for name, (_, table) in selected.items()}
+        self.types = types
+        self.documents = documents
+        self.masters = masters
+        self.lines = lines
+        self.seed = seed
+
+        self.refs: Dict[Tuple[str, str], str] = {}
+        self.inferred: List[str] = []
+        self.jobs: List[Job] = []
+        self.totals: Dict[str, int] = {}
+        self.skipped: List[str] = []
+        self.missing: List[str] = []
+        self._compiled: Dict[str, List[_Column]] = {}
+        self._plan(relations or {}, flows)
+
+    def __getstate__(self):
+        # Derlenmiş üreticiler closure içerir; process'lerde yeniden derlenir
+        state = self.__dict__.copy()
+        state["_compiled"] = {}
+        return state
+
+    # ------------------------------------------------------------------
+    # Plan
+    # ------------------------------------------------------------------
+
+    def _plan(self, relations: Dict, flow_ids: Optional[List[str]]):
+        flows = relations.get("data_flows", [])
+        known = {flow.get("id") for flow in flows}
+        for flow_id in flow_ids or []:
+            if flow_id not in known:
+                raise KeyError(f"Akış bulunamadı: {flow_id}")
+        if flow_ids:
+            flows = [flow for flow in flows if flow.get("id") in flow_ids]
+
+        for link in collect_links(self.modules, relations):
+            if link.child in self.tables and link.parent in self.tables:
+                self.refs.setdefault((link.child, link.column), link.parent)
+
+        # Kalem tabloları: tek bir zorunlu CASCADE FK ile başlığa bağlı
+        details: Dict[str, Tuple[str, str]] = {}
+        for name, table in self.tables.items():
+            cascades = [
+                (c["foreign_key"]["table"], column_name(c)) for c in table.get("columns", [])
+                if c.get("required") and isinstance(c.get("foreign_key"), dict)
+                and str(c["foreign_key"].get("on_delete", "")).upper() == "CASCADE"
+                and c["foreign_key"].get("table") in self.tables
+            ]
+            if len(cascades) == 1 and cascades[0][0] != name:
+                details[name] = cascades[0]
+
+        flow_jobs = []
+        for flow in flows:
+            step_tables = {step.get("table") for step in flow.get("steps", [])}
+            entries: List[Entry] = []
+            for position, step in enumerate(flow.get("steps", [])):
+                table, action = step.get("table"), step.get("action", "create")
+                if table not in self.tables:
+                    self.missing.append(f"{flow['id']}:{table}")
+                    continue
+                if action in MODIFY_ACTIONS:
+                    self.skipped.append(f"{flow['id']}:{table}:{action}")
+                    continue
+                header = details.get(table)
+                previous = [i for i, e in enumerate(entries) if header and e.table == header[0]]
+                if previous:
+                    entries.append(Entry(table, action, position, self.lines, previous[-1], header[1]))
+                else:
+                    entries.append(Entry(table, action, position))
+                head = len(entries) - 1
+                for child, (parent, column) in details.items():
+                    if parent == table and child not in step_tables:
+                        entries.append(Entry(child, "line", position, self.lines, head, column))
+            if entries:
+                flow_jobs.append(Job(flow["id"], "flow", self.documents, entries))
+
+        generated = {e.table for job in flow_jobs for e in job.entries}
+        for job in flow_jobs:
+            for table, rows in job.per_doc.items():
+                self.totals[table] = self.totals.get(table, 0) + job.documents * rows
+
+        # Master'lar: üretilen tabloların başvurduğu diğer tablolar (kapanış)
+        masters = set()
+        stack = list(generated)
+        while stack:
+            child = stack.pop()
+            for (table, _), parent in self.refs.items():
+                if table == child and parent not in generated and parent not in masters:
+                    masters.add(parent)
+                    stack.append(parent)
+
+        graph = DependencyGraph()
+        for name in masters:
+            graph.add_node(name)
+        for (table, _), parent in self.refs.items():
+            if table in masters and parent in masters and parent != table:
+                graph.add_edge(table, parent)
+        master_jobs = []
+        for name in graph.topological_order():
+            count = self.masters
+            for columns in self._unique_groups(name):
+                domains = [self._domain(name, c) for c in columns]
+                if all(domains):
+                    product = 1
+                    for size, _ in domains:
+                        product *= size
+                    count = min(count, product)
+            self.totals[name] = count
+            master_jobs.append(Job(name, "master", count, [Entry(name, "master", 0)]))
+
+        # Adı bir master FK kolonuyla aynı, FK'si tanımsız tamsayı kolonlar (banka_hareket.cari_id);
+        # hareket tablolarına ad üzerinden başvuru belirsizdir (irsaliye_kalem_id), çıkarılmaz
+        names: Dict[str, set] = {}
+        for (table, column), parent in self.refs.items():
+            if table in self.totals:
+                names.setdefault(column, set()).add(parent)
+        names = {column: parents for column, parents in names.items() if parents <= masters}
+        for table in self.totals:
+            for column in self.tables[table].get("columns", []):
+                name = column_name(column)
+                parents = names.get(name)
+                if (table, name) in self.refs or not parents or len(parents) != 1 or column.get("primary_key"):
+                    continue
+                if self.types.base_of(column.get("type")) in INTEGER_BASES:
+                    self.refs[(table, name)] = next(iter(parents))
+                    self.inferred.append(f"{table}.{name} -> {self.refs[(table, name)]}")
+
+        self.jobs = master_jobs + flow_jobs
+        offsets: Dict[str, int] = {}
+        for job in self.jobs:
+            for table, rows in job.per_doc.items():
+                job.offsets[table] = offsets.get(table, 0)
+                offsets[table] = job.offsets[table] + job.documents * rows
+
+    def _domain(self, table_name: str, name: str) -> Optional[Tuple[int, Callable[[int], Any]]]:
+        """
+        Sonlu değer kümesi olan kolonlar için (küme boyutu, sıra -> değer);
+        FK, sınırlı tamsayı ve enum kolonlar. Sınırsızsa None.
+        """
+        parent = self.refs.get((table_name, name))
+        if parent is not None:
+            return max(self.totals.get(parent, 0), 1), lambda i: i + 1
+        column = next((c for c in self.tables[table_name].get("columns", []) if column_name(c) == name), None)
+        if column is None:
+            return None
+        ctype = self.types.resolve(column)
+        if ctype.values:
+            values = [str(v) for v in ctype.values]
+            return len(values), values.__getitem__
+        if ctype.base in INTEGER_BASES and ctype.min is not None and ctype.max is not None:
+            lo = int(ctype.min)
+            return int(ctype.max) - lo + 1, lambda i: lo + i
+        return None
+
+    def _unique_groups(self, table_name: str) -> List[List[str]]:
+        """Tekil olması gereken kolon grupları (unique kolonlar ve unique index'ler)"""
+        table = self.tables[table_name]
+        groups = [[column_name(c)] for c in table.get("columns", [])
+                  if c.get("unique") and not c.get("primary_key")]
+        for index in table.get("indexes", []) or []:
+            if index.get("unique") and index.get("columns"):
+                groups.append(list(index["columns"]))
+        return groups
+
+    # ------------------------------------------------------------------
+    # Kolon derleme
+    # ------------------------------------------------------------------
+
+    def columns(self, table_name: str) -> List[_Column]:
+        compiled = self._compiled.get(table_name)
+        if compiled is None:
+            compiled = self._compiled[table_name] = self._compile(table_name)
+        return compiled
+
+    def _compile(self, table_name: str) -> List[_Column]:
+        table = self.tables[table_name]
+        prefix = "".join(part[:1] for part in table_name.split("_")).upper() or "X"
+
+        # Unique gruplar: tüm kolonların değer kümesi sonluysa karma taban (mixed radix),
+        # değilse sınırsız bir kolon kimlikten türetilir
+        keyed: Dict[str, Callable] = {}
+        definitions = {column_name(c): c for c in table.get("columns", [])}
+        for group in self._unique_groups(table_name):
+            if not all(c in definitions for c in group):
+                continue
+            domains = [self._domain(table_name, c) for c in group]
+            if all(domains):
+                divisor = 1
+                for c, (size, value) in zip(group, domains):
+                    keyed[c] = lambda ids, d=divisor, s=size, v=value: [v((i - 1) // d % s) for i in ids]
+                    divisor *= size
+                continue
+            for c, domain in zip(group, domains):
+                if domain is not None or c in keyed:
+                    continue
+                fn = self._keyed(definitions[c], prefix)
+                if fn is not None:
+                    keyed[c] = fn
+                    break
+
+        result = []
+        seen = set()
+        dated = set()
+        for column in table.get("columns", []):
+            name = column_name(column)
+            if not name or name in seen:
+                continue
+            seen.add(name)
+            ctype = self.types.resolve(column)
+            base = ctype.base
+            parent = self.refs.get((table_name, name))
+
+            if column.get("primary_key") and base in INTEGER_BASES:
+                result.append(_Column(name, "id"))
+            elif name in keyed:
+                result.append(_Column(name, "keyed", keyed[name]))
+            elif parent is not None:
+                result.append(_Column(name, "ref", parent, f"ref:{name}:{parent}"))
+            elif column.get("computed") or base == "binary":
+                result.append(_Column(name, "null"))
+            elif base in ("date", "datetime"):
+                # Tablonun ilk tarih kolonu belge tarihi, diğerleri birkaç gün sonrası
+                result.append(_Column(name, base, base in dated))
+                dated.add(base)
+            elif base == "time":
+                result.append(_Column(name, "pool", _TIMES))
+            elif base == "uuid":
+                result.append(_Column(name, "uuid", table_name))
+            else:
+                result.append(self._value_column(table_name, name, column, ctype))
+        return result
+
+    def _keyed(self, column: Dict, prefix: str) -> Optional[Callable[[List[int]], List]]:
+        """Kimlikten tekil değer üreticisi (desteklenmeyen tipte None)"""
+        ctype = self.types.resolve(column)
+        hi = ctype.max_length
+        make = KEYED.get(ctype.name)
+        if make is not None:
+            return lambda ids: [make(prefix, i, hi) for i in ids]
+        if ctype.base in INTEGER_BASES:
+            lo = int(ctype.min) if ctype.min is not None else 1
+            return lambda ids: [lo + i - 1 for i in ids]
+        if ctype.base in ("string", "text") and not ctype.values:
+            return lambda ids: [_fit(prefix, i, hi) for i in ids]
+        return None
+
+    def _value_column(self, table_name: str, name: str, column: Dict, ctype: ColumnType) -> _Column:
+        share = f"{name}|{sorted(ctype.to_dict().items())!r}"
+        base = ctype.base
+        if base == "boolean":
+            return _Column(name, "pool", (True, False), share)
+        if base in INTEGER_BASES:
+            lo = int(ctype.min) if ctype.min is not None else 0
+            hi = int(ctype.max) if ctype.max is not None else lo + 999
+            return _Column(name, "pool", range(lo, hi + 1), share)
+        if base == "decimal":
+            scale = ctype.scale or 0
+            digits = min(scale, 2)
+            factor = 10 ** digits
+            lo, hi = DECIMAL_RANGES.get(ctype.name, (0, 1000))
+            if ctype.min is not None:
+                lo = ctype.min
+            if ctype.max is not None:
+                hi = ctype.max
+            if ctype.precision:
+                hi = min(hi, 10 ** (ctype.precision - scale) - 1)
+            units = range(int(lo * factor), int(hi * factor) + 1)
+            return _Column(name, "decimal", (units, digits), share)
+
+        rng = random.Random(f"{self.seed}/{table_name}/{name}")
+        sampler = SAMPLERS.get(ctype.name)
+        if ctype.values:
+            values = [str(v) for v in ctype.values]
+        elif sampler is not None:
+            values = [sampler(rng) for _ in range(POOL_SIZE)]
+        elif base == "text":
+            values = [_phrase(rng, rng.randrange(3, 9)) for _ in range(POOL_SIZE)]
+        elif base == "string":
+            values = [f"{_phrase(rng, rng.randrange(1, 4))} {rng.choice(_SUFFIXES)}".strip()
+                      for _ in range(POOL_SIZE)]
+            if ctype.max_length:
+                values = [v[:ctype.max_length].rstrip() for v in values]
+        elif base == "json":
+            values = ["{}"]
+        else:
+            return _Column(name, "null")
+
+        if base != "enum":
+            if ctype.lowercase:
+                values = [v.lower() for v in values]
+            check = _string_detail(ctype)
+            values = [v for v in dict.fromkeys(values) if check(v) is None]
+        if not values:
+            return _Column(name, "null")
+        return _Column(name, "pool", values, share)
+
+    def unsupported(self) -> List[str]:
+        """Değer üretilemeyen (hep boş kalan) zorunlu kolonlar"""
+        result = []
+        for table in self.totals:
+            required = {column_name(c) for c in self.tables[table].get("columns", [])
+                        if c.get("required") or c.get("primary_key")}
+            for column in self.columns(table):
+                empty = column.kind == "null" or (column.kind == "ref" and not self.totals.get(column.arg))
+                if empty and column.name in required:
+                    result.append(f"{table}.{column.name}")
+        return result
+
+    # ------------------------------------------------------------------
+    # Parça üretimi
+    # ------------------------------------------------------------------
+
+    def chunk(self, index: int, start: int, count: int) -> List[Tuple[str, List[List[Any]]]]:
+        """
+        Bir işin [start, start + count) belgeleri.
+
+        Returns:
+            (tablo, kolon listeleri) çiftleri; kolonlar columns(tablo) sırasında
+        """
+        job = self.jobs[index]
+        rng = random.Random(f"{self.seed}/{job.name}/{start}")
+        days = _pick(rng, range(DATE_SPAN), count)
+        firsts = [job.first_ids(i, start, count) for i in range(len(job.entries))]
+        shared: Dict[str, List] = {}
+        result = []
+
+        for i, entry in enumerate(job.entries):
+            lines = entry.lines
+            if lines == 1:
+                ids = firsts[i]
+
+                def expand(values):
+                    return values
+            else:
+                ids = [first + k for first in firsts[i] for k in range(lines)]
+
+                def expand(values, lines=lines):
+                    return [v for v in values for _ in range(lines)]
+            n = len(ids)
+            # Aynı belgedeki tablolara başvurular: en yakın önceki adım, yoksa sonraki
+            local = {}
+            for j in list(range(i - 1, -1, -1)) + list(range(i + 1, len(job.entries))):
+                local.setdefault(job.entries[j].table, j)
+
+            columns = []
+            for column in self.columns(entry.table):
+                kind = column.kind
+                if kind == "id":
+                    values = ids
+                elif kind == "keyed":
+                    values = column.arg(ids)
+                elif kind == "null":
+                    values = [None] * n
+                elif kind == "date" or kind == "datetime":
+                    day = [d + entry.step for d in days]
+                    if column.arg:
+                        day = [d + lag for d, lag in zip(day, _pick(rng, range(DATE_LAG), count))]
+                    values = [_DATES[d] for d in day]
+                    if kind == "datetime":
+                        values = [f"{d} {t}" for d, t in zip(values, _pick(rng, _TIMES, count))]
+                    values = expand(values)
+                elif kind == "uuid":
+                    values = [str(uuid.UUID(int=rng.getrandbits(128), version=4)) for _ in range(n)]
+                elif kind == "ref" and entry.header is not None and column.name == entry.header_column:
+                    values = expand(firsts[entry.header])
+                elif kind == "ref" and column.arg in local and column.arg != entry.table:
+                    values = expand(firsts[local[column.arg]])
+                elif kind == "ref" and column.arg == entry.table:
+                    # Öz başvuru: belgenin kendi satırı
+                    values = ids
+                else:
+                    share = column.share if lines == 1 and job.kind == "flow" else None
+                    values = shared.get(share) if share else None
+                    if values is None:
+                        k = count if lines == 1 else n
+                        if kind == "ref":
+                            total = self.totals.get(column.arg, 0)
+                            values = _pick(rng, range(1, total + 1), k) if total else [None] * k
+                        elif kind == "decimal":
+                            units, digits = column.arg
+                            if digits:
+                                fmt = f"%d.%0{digits}d"
+                                values = list(map(fmt.__mod__, map(divmod, _pick(rng, units, k),
+                                                                   repeat(10 ** digits))))
+                            else:
+                                values = list(map(str, _pick(rng, units, k)))
+                        else:
+                            values = _pick(rng, column.arg, k)
+                        if share:
+                            shared[share] = values
+                columns.append(values)
+            result.append((entry.table, columns))
+        return result
+
+    def encode(self, index: int, start: int, count: int, fmt: str,
+               delimiter: str = ",") -> List[Tuple[str, Any, int]]:
+        """
+        Parçayı çıktı biçimine çevirir (process havuzunda çalışır).
+
+        Returns:
+            (tablo, veri, satır sayısı); csv/jsonl için metin, sqlite için satır listesi
+        """
+        encoded = []
+        for table, columns in self.chunk(index, start, count):
+            rows = len(columns[0]) if columns else 0
+            if fmt == "sqlite":
+                encoded.append((table, list(zip(*columns)), rows))
+            elif fmt == "jsonl":
+                encoded.append((table, self._jsonl(table, columns), rows))
+            else:
+                buffer = io.StringIO()
+                csv.writer(buffer, delimiter=delimiter, lineterminator="\n").writerows(zip(*columns))
+                encoded.append((table, buffer.getvalue(), rows))
+        return encoded
+
+    def _jsonl(self, table: str, columns: List[List[Any]]) -> str:
+        # Kolon kolon JSON parçaları ("ad": değer), satırlar ", " ile birleştirilir
+        compiled = self.columns(table)
+        parts = []
+        for position, (column, values) in enumerate(zip(compiled, columns)):
+            key = ("{" if position == 0 else "") + encode_basestring(column.name) + ": "
+            end = "}" if position == len(compiled) - 1 else ""
+            if column.kind in ("id", "ref") and values and values[0] is not None:
+                parts.append(list(map((key.replace("%", "%%") + "%d" + end).__mod__, values)))
+            elif column.kind in ("decimal", "date", "datetime"):
+                # Rakam, nokta, tire ve iki nokta: kaçış gerekmez
+                prefix, suffix = key + '"', '"' + end
+                parts.append([prefix + v + suffix for v in values])
+            elif column.kind in ("keyed", "uuid"):
+                parts.append([key + _json_value(v) + end for v in values])
+            else:
+                # Havuz kolonlarında ayrık değer sayısı azdır
+                encoded = {v: key + _json_value(v) + end for v in set(values)}
+                parts.append(list(map(encoded.__getitem__, values)))
+        return "\n".join(map(", ".join, zip(*parts))) + "\n"
+
+    # ------------------------------------------------------------------
+    # Çıktı
+    # ------------------------------------------------------------------
+
+    def tasks(self) -> List[Tuple[int, int, int]]:
+        return [(index, start, min(CHUNK_DOCS, job.documents - start))
+                for index, job in enumerate(self.jobs)
+                for start in range(0, job.documents, CHUNK_DOCS)]
+
+    def _encoded(self, fmt: str, delimiter: str, jobs: int) -> Iterator[Tuple[Tuple, List]]:
+        """Parçalar sırayla; process havuzunda en fazla 2 * jobs parça bekler"""
+        tasks = iter(self.tasks())
+        if jobs <= 1:
+            for task in tasks:
+                yield task, self.encode(*task, fmt, delimiter)
+            return
+
+        from concurrent.futures import ProcessPoolExecutor
+
+        pool = ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker, initargs=(self,))
+        try:
+            pending = deque((task, pool.submit(_encode_worker, task + (fmt, delimiter)))
+                            for task in islice(tasks, 2 * jobs))
+            while pending:
+                task, future = pending.popleft()
+                encoded = future.result()
+                for following in islice(tasks, 1):
+                    pending.append((following, pool.submit(_encode_worker, following + (fmt, delimiter))))
+                yield task, encoded
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    def generate(self, output: str, fmt: str = "csv", jobs: int = 1, delimiter: str = ",",
+                 check_fk: bool = False, progress: Callable[[Dict], None] = None) -> Dict:
+        """
+        Veriyi üretip yazar.
+
+        Args:
+            output: csv/jsonl için dizin (tablo.csv / tablo.jsonl), sqlite için veritabanı dosyası
+            jobs: Process sayısı
+            check_fk: sqlite çıktısında sonunda PRAGMA foreign_key_check
+            progress: Her iş bitince {job, kind, documents, rows, seconds} ile çağrılır
+
+        Returns:
+            Rapor: tables (tablo -> satır), flows, masters, rows, documents, seconds, ...
+        """
+        if fmt not in FORMATS:
+            raise ValueError(f"Bilinmeyen biçim: {fmt}")
+        started = time.perf_counter()
+        writer = _SQLiteWriter(output, self) if fmt == "sqlite" else _FileWriter(output, fmt, self, delimiter)
+        report = {
+            "format": fmt, "output": str(output), "seed": self.seed,
+            "flows": {job.name: job.to_dict() for job in self.jobs if job.kind == "flow"},
+            "masters": {job.name: job.documents for job in self.jobs if job.kind == "master"},
+            "tables": {}, "rows": 0, "documents": 0,
+            "skipped_steps": list(self.skipped), "missing_tables": list(self.missing),
+            "inferred_refs": list(self.inferred), "unsupported": self.unsupported()
+        }
+
+        # İşin süresi önceki işin son parçası yazıldıktan sonra başlar
+        current, job_rows, job_started, mark = None, 0, started, started
+        try:
+            for (index, start, count), encoded in self._encoded(fmt, delimiter, jobs):
+                if index != current:
+                    if current is not None and progress:
+                        progress(self._job_progress(current, job_rows, mark - job_started))
+                    current, job_rows, job_started = index, 0, mark
+                for table, data, rows in encoded:
+                    writer.write(table, data)
+                    report["tables"][table] = report["tables"].get(table, 0) + rows
+                    job_rows += rows
+                if self.jobs[index].kind == "flow":
+                    report["documents"] += count
+                mark = time.perf_counter()
+            if current is not None and progress:
+                progress(self._job_progress(current, job_rows, mark - job_started))
+            report.update(writer.close(check_fk))
+        finally:
+            writer.abort()
+
+        report["rows"] = sum(report["tables"].values())
+        report["seconds"] = round(time.perf_counter() - started, 3)
+        return report
+
+    def _job_progress(self, index: int, rows: int, seconds: float) -> Dict:
+        job = self.jobs[index]
+        return {"job": job.name, "kind": job.kind, "documents": job.documents, "rows": rows,
+                "seconds": round(seconds, 3)}
+
+
+def _json_value(value) -> str:
+    if value is None:
+        return "null"
+    if value is True:
+        return "true"
+    if value is False:
+        return "false"
+    if type(value) is int:
+        return str(value)
+    return encode_basestring(value)
+
+
+class _FileWriter:
+    """Tablo başına bir CSV/JSONL dosyası (SQLiteLoader.discover ile yüklenebilir)"""
+
+    def __init__(self, directory: str, fmt: str, generator: FlowGenerator, delimiter: str):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.fmt = fmt
+        self.generator = generator
+        self.delimiter = delimiter
+        self.files: Dict[str, Any] = {}
+
+    def write(self, table: str, data: str):
+        f = self.files.get(table)
+        if f is None:
+            f = self.files[table] = open(self.directory / f"{table}.{self.fmt}", 'w',
+                                         encoding='utf-8', newline='')
+            if self.fmt == "csv":
+                csv.writer(f, delimiter=self.delimiter, lineterminator="\n").writerow(
+                    [c.name for c in self.generator.columns(table)])
+        f.write(data)
+
+    def close(self, check_fk: bool) -> Dict:
+        files = {table: str(f.name) for table, f in self.files.items()}
+        self.abort()
+        return {"files": files}
+
+    def abort(self):
+        for f in self.files.values():
+            f.close()
+        self.files = {}
+
+
+class _SQLiteWriter:
+    """Yerel SQLite kopyası: şema SQLiteLoader ile, index'ler veriden sonra kurulur"""
+
+    def __init__(self, path: str, generator: FlowGenerator):
+        self.loader = SQLiteLoader(path, generator.modules, generator.types)
+        self.generator = generator
+        self.loader.connect(replace=True)
+        self.loader.create_schema()
+        self.loader.conn.execute("BEGIN")
+        self.sql: Dict[str, str] = {}
+
+    def write(self, table: str, rows: List[tuple]):
+        sql = self.sql.get(table)
+        if sql is None:
+            columns = [c.name for c in self.generator.columns(table)]
+            sql = self.sql[table] = self.loader._insert_sql(self.loader.plans[table], columns)
+        self.loader.conn.executemany(sql, rows)
+
+    def close(self, check_fk: bool) -> Dict:
+        loader = self.loader
+        loader.conn.execute("COMMIT")
+        result = {"indexes": loader.create_indexes()}
+        if check_fk:
+            result["fk_violations"] = loader.foreign_key_violations()
+        loader.finish()
+        return result
+
+    def abort(self):
+        if self.loader.conn is not None:
+            self.loader.conn.close()
+            self.loader.conn = None
+
+
+# Process havuzu: üretici her process'e bir kez aktarılır
+_WORKER: Optional[FlowGenerator] = None
+
+
+def _init_worker(generator: FlowGenerator):
+    global _WORKER
+    _WORKER = generator
+
+
+def _encode_worker(task: Tuple[int, int, int, str, str]) -> List[Tuple[str, Any, int]]:
+    return _WORKER.encode(*task)
@@ -0,0 +1,730 @@
+"""
+PaktLang View Compiler
+Modül views tanımlarının SQL'e derlenmesi ve SQLite üzerinde artımlı materialization
+"""
+
+import hashlib
+import json
+import re
+import sqlite3
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from paktlang.validator.symbols import column_name
+from paktlang.validator.type_registry import TypeRegistry
+
+from .sqlite_loader import quote, select_tables, sqlite_type
+
+
+META_TABLE = "_paktlang_views"
+MV_PREFIX = "_mv_"
+
+
+class ViewCompileError(ValueError):
+    """View tanımı SQL'e derlenemedi"""
+
+
+# ----------------------------------------------------------------------
+# İfade ayrıştırıcı
+# ----------------------------------------------------------------------
+
+_TOKEN_RE = re.compile(
+    r"\s*(?:(\d+(?:\.\d+)?)|('(?:[^']|'')*')|([^\W\d]\w*)|(<=|>=|!=|<>|[-+*/(),=<>]))"
+)
+_KEYWORDS = {"and", "or", "not", "true", "false", "null", "distinct"}
+_COMPARISONS = {"=", "!=", "<>", "<", "<=", ">", ">="}
+
+# SQL'e aynen aktarılan skaler fonksiyonlar
+SCALAR_FUNCTIONS = {"ABS", "ROUND", "COALESCE", "IFNULL", "NULLIF", "MIN", "MAX",
+                    "LOWER", "UPPER", "LENGTH"}
+_AGGREGATE_RE = re.compile(r"^\s*(SUM|COUNT|AVG|MIN|MAX)\s*\((.*)\)\s*$", re.IGNORECASE | re.DOTALL)
+
+
+def tokenize(text: str) -> List[Tuple[str, str]]:
+    text = text.strip()
+    tokens = []
+    pos = 0
+    while pos < len(text):
+        match = _TOKEN_RE.match(text, pos)
+        if match is None or match.end() == pos:
+            raise ViewCompileError(f"Çözümlenemeyen ifade: {text}")
+        number, string, ident, op = match.groups()
+        if number is not None:
+            tokens.append(("num", number))
+        elif string is not None:
+            tokens.append(("str", string))
+        elif ident is not None:
+            lowered = ident.lower()
+            tokens.append(("kw", lowered) if lowered in _KEYWORDS else ("id", ident))
+        else:
+            tokens.append(("op", op))
+        pos = match.end()
+    return tokens
+
+
+class _Parser:
+    """
+    Küçük ifade ayrıştırıcı. Düğümler tuple'dır:
+    ("num", v), ("str", v), ("bool", 1/0), ("null",), ("col", ad),
+    ("neg", x), ("not", x), ("bin", op, sol, sag), ("call", fonksiyon, [argümanlar])
+    """
+
+    def __init__(self, text: str):
+        self.text = text
+        self.tokens = tokenize(text)
+        self.pos = 0
+
+    def parse(self):
+        if not self.tokens:
+            raise ViewCompileError("Boş ifade")
+        node = self._or()
+        if self.pos != len(self.tokens):
+            raise ViewCompileError(f"Çözümlenemeyen ifade: {self.text}")
+        return node
+
+    def _peek(self) -> Tuple[str, str]:
+        return self.tokens[self.pos] if self.pos < len(self.tokens) else ("eof", "")
+
+    def _accept(self, kind: str, value: str = None) -> bool:
+        tok = self._peek()
+        if tok[0] == kind and (value is None or tok[1] == value):
+            self.pos += 1
+            return True
+        return False
+
+    def _expect(self, kind: str, value: str):
+        if not self._accept(kind, value):
+            raise ViewCompileError(f"'{value}' bekleniyor: {self.text}")
+
+    def _or(self):
+        node = self._and()
+        while self._accept("kw", "or"):
+            node = ("bin", "OR", node, self._and())
+        return node
+
+    def _and(self):
+        node = self._not()
+        while self._accept("kw", "and"):
+            node = ("bin", "AND", node, self._not())
+        return node
+
+    def _not(self):
+        if self._accept("kw", "not"):
+            return ("not", self._not())
+        return self._comparison()
+
+    def _comparison(self):
+        node = self._additive()
+        tok = self._peek()
+        if tok[0] == "op" and tok[1] in _COMPARISONS:
+            self.pos += 1
+            node = ("bin", "<>" if tok[1] == "!=" else tok[1], node, self._additive())
+        return node
+
+    def _additive(self):
+        node = self._multiplicative()
+        while self._peek() in (("op", "+"), ("op", "-")):
+            op = self.tokens[self.pos][1]
+            self.pos += 1
+            node = ("bin", op, node, self._multiplicative())
+        return node
+
+    def _multiplicative(self):
+        node = self._unary()
+        while self._peek() in (("op", "*"), ("op", "/")):
+            op = self.tokens[self.pos][1]
+            self.pos += 1
+            node = ("bin", op, node, self._unary())
+        return node
+
+    def _unary(self):
+        if self._accept("op", "-"):
+            return ("neg", self._unary())
+        return self._primary()
+
+    def _primary(self):
+        kind, value = self._peek()
+        self.pos += 1
+        if kind == "num":
+            return ("num", value)
+        if kind == "str":
+            return ("str", value)
+        if kind == "kw" and value in ("true", "false"):
+            return ("bool", 1 if value == "true" else 0)
+        if kind == "kw" and value == "null":
+            return ("null",)
+        if kind == "op" and value == "(":
+            node = self._or()
+            self._expect("op", ")")
+            return node
+        if kind == "id":
+            if self._accept("op", "("):
+                args = []
+                if not self._accept("op", ")"):
+                    args.append(self._or())
+                    while self._accept("op", ","):
+                        args.append(self._or())
+                    self._expect("op", ")")
+                return ("call", value.upper(), args)
+            return ("col", value)
+        raise ViewCompileError(f"Çözümlenemeyen ifade: {self.text}")
+
+
+def parse_expression(text: str):
+    return _Parser(text).parse()
+
+
+def is_condition(node) -> bool:
+    """Düğüm mantıksal bir koşul mu (karşılaştırma, AND/OR/NOT)"""
+    return node[0] == "not" or (node[0] == "bin" and (node[1] in _COMPARISONS or node[1] in ("AND", "OR")))
+
+
+def render(node, resolve: Callable[[str], str]) -> str:
+    """Düğümü SQL'e çevirir; kolon adları resolve() ile çözülür"""
+    kind = node[0]
+    if kind in ("num", "str"):
+        return node[1]
+    if kind == "bool":
+        return str(node[1])
+    if kind == "null":
+        return "NULL"
+    if kind == "col":
+        return resolve(node[1])
+    if kind == "neg":
+        return f"(-{render(node[1], resolve)})"
+    if kind == "not":
+        return f"(NOT {render(node[1], resolve)})"
+    if kind == "bin":
+        left, right = render(node[2], resolve), render(node[3], resolve)
+        if node[1] == "/":
+            return f"(CAST({left} AS REAL) / {right})"
+        return f"({left} {node[1]} {right})"
+    if kind == "call":
+        name, args = node[1], [render(a, resolve) for a in node[2]]
+        if name == "IF":
+            if len(args) != 3:
+                raise ViewCompileError("IF(koşul, değer, değer) üç argüman alır")
+            return f"(CASE WHEN {args[0]} THEN {args[1]} ELSE {args[2]} END)"
+        if name in SCALAR_FUNCTIONS:
+            return f"{name}({', '.join(args)})"
+        raise ViewCompileError(f"Desteklenmeyen fonksiyon: {name}")
+    raise ViewCompileError(f"Bilinmeyen ifade düğümü: {kind}")
+
+
+def parse_aggregation(text: str) -> Tuple[str, bool, Optional[tuple]]:
+    """
+    "SUM(borc)", "COUNT(*)", "COUNT(DISTINCT depo_id)", "COUNT(kapali=false)"
+
+    Returns:
+        (fonksiyon, distinct, argüman düğümü; COUNT(*) için None)
+    """
+    match = _AGGREGATE_RE.match(text)
+    if match is None:
+        raise ViewCompileError(f"Desteklenmeyen aggregation: {text}")
+    func, arg = match.group(1).upper(), match.group(2).strip()
+    if func == "COUNT" and arg == "*":
+        return func, False, None
+    distinct = False
+    if arg[:9].upper() == "DISTINCT ":
+        distinct, arg = True, arg[9:]
+    return func, distinct, parse_expression(arg)
+
+
+# ----------------------------------------------------------------------
+# Derlenmiş view
+# ----------------------------------------------------------------------
+
+class CompiledView:
+    """
+    Derlenmiş view.
+
+    kind:
+        materialized - boyut tablosu + hareket tablosu aggregation view'i;
+            _mv_<ad> tablosunda grup başına durum tutulur, hareket tablosu
+            trigger'ları ile artımlı güncellenir
+        projection - FK'lar üzerinden join edilen düz SQL view
+        unsupported - derlenemeyen (serbest metin vb.) tanımlar; reason dolu
+    """
+
+    def __init__(self, module: str, name: str, kind: str, reason: str = ""):
+        self.module = module
+        self.name = name
+        self.kind = kind
+        self.reason = reason
+        self.columns: List[str] = []
+        self.dimension: Optional[str] = None
+        self.fact: Optional[str] = None
+        self.key: Optional[str] = None
+        self.create_sql: List[str] = []
+        self.drop_sql: List[str] = []
+        self.full_refresh_sql: List[str] = []
+        self.partial_refresh: Optional[Callable[[int], List[str]]] = None
+
+    @property
+    def mv_table(self) -> str:
+        return MV_PREFIX + self.name
+
+    @property
+    def definition_hash(self) -> str:
+        payload = json.dumps([self.kind, self.create_sql], ensure_ascii=False)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+    @property
+    def sql(self) -> str:
+        return ";\n\n".join(self.create_sql) + (";" if self.create_sql else "")
+
+    def to_dict(self) -> Dict:
+        return {
+            "module": self.module,
+            "name": self.name,
+            "kind": self.kind,
+            "reason": self.reason,
+            "dimension": self.dimension,
+            "fact": self.fact,
+            "key": self.key,
+            "columns": self.columns
+        }
+
+
+class _State:
+    """Materialized tabloda tutulan tek bir aggregation durumu"""
+
+    __slots__ = ("column", "full", "insert", "combine", "delete")
+
+    def __init__(self, column: str, full: str, insert: str, combine: str, delete: str):
+        self.column = column
+        self.full = full
+        self.insert = insert
+        self.combine = combine
+        self.delete = delete
+
+
+class ViewCompiler:
+    """Modül views tanımlarını SQLite SQL'ine derler"""
+
+    def __init__(self, modules: Dict[str, Dict], types: TypeRegistry = None):
+        self.modules = modules
+        self.types = types
+        self.tables, _ = select_tables(modules)
+
+    def _columns(self, table: str) -> Dict[str, Dict]:
+        entry = self.tables.get(table)
+        if entry is None:
+            raise ViewCompileError(f"Tablo bulunamadı: {table}")
+        return {column_name(c): c for c in entry[1].get("columns", []) if column_name(c)}
+
+    def _base(self, column: Dict) -> str:
+        type_name = column.get("type")
+        if self.types is None:
+            return type_name
+        return self.types.base_of(type_name) or type_name
+
+    def compile_all(self) -> List[CompiledView]:
+        """Tüm modüllerin view'larını derler; aynı adlı view'lara modül ön eki eklenir"""
+        names: Dict[str, int] = {}
+        for module_data in self.modules.values():
+            for view in module_data.get("views", []):
+                names[view.get("name")] = names.get(view.get("name"), 0) + 1
+
+        compiled = []
+        for module_name, module_data in self.modules.items():
+            for view in module_data.get("views", []):
+                name = view.get("name")
+                if names.get(name, 0) > 1:
+                    name = f"{module_name}_{name}"
+                compiled.append(self.compile(module_name, view, name))
+        return compiled
+
+    def compile(self, module_name: str, view: Dict, name: str = None) -> CompiledView:
+        name = name or view.get("name")
+        try:
+            if any("aggregation" in c for c in view.get("columns", [])):
+                return self._compile_aggregate(module_name, view, name)
+            return self._compile_projection(module_name, view, name)
+        except ViewCompileError as e:
+            return CompiledView(module_name, name, "unsupported", str(e))
+
+    # ------------------------------------------------------------------
+    # Aggregation view'ları
+    # ------------------------------------------------------------------
+
+    def _source_table(self, source: str, base_tables: List[str]) -> Tuple[str, str]:
+        if "." in source:
+            table, col = source.split(".", 1)
+            if col not in self._columns(table):
+                raise ViewCompileError(f"Kolon bulunamadı: {source}")
+            return table, col
+        for table in base_tables:
+            if table in self.tables and source in self._columns(table):
+                return table, source
+        raise ViewCompileError(f"Kolon bulunamadı: {source}")
+
+    def _fact_resolver(self, fact: str, alias: str, used: Set[str] = None) -> Callable[[str], str]:
+        """
+        Hareket tablosu kolonlarını çözer. Kolon olmayan ad, zorunlu bir enum
+        kolonunun değeriyse (hareket_tipi: borc/alacak) tablonun zorunlu tutar
+        kolonu ile koşullu ölçüye çevrilir: SUM(borc) -> borc tipli tutarlar.
+        """
+        columns = self._columns(fact)
+        used = used if used is not None else set()
+
+        def resolve(name: str) -> str:
+            if name in columns:
+                used.add(name)
+                return f"{alias}.{quote(name)}"
+            enums = [c for c, d in columns.items()
+                     if d.get("type") == "enum" and d.get("required") and name in (d.get("values") or [])]
+            amounts = [c for c, d in columns.items()
+                       if d.get("required") and self._base(d) == "decimal"]
+            if len(enums) == 1 and amounts:
+                used.update((enums[0], amounts[0]))
+                return (f"(CASE WHEN {alias}.{quote(enums[0])} = '{name}' "
+                        f"THEN {alias}.{quote(amounts[0])} ELSE 0 END)")
+            raise ViewCompileError(f"Kolon bulunamadı: {fact}.{name}")
+
+        return resolve
+
+    def _states(self, column: str, text: str, fact: str, key: str) -> Tuple[List[_State], str, Set[str]]:
+        """
+        Aggregation için durum kolonları, okuma ifadesi ve kullanılan
+        hareket kolonları.
+        """
+        func, distinct, arg = parse_aggregation(text)
+        q = quote(column)
+        used: Set[str] = set()
+        if arg is not None:
+            render(arg, self._fact_resolver(fact, "f", used))
+
+        def expr(alias: str) -> str:
+            return render(arg, self._fact_resolver(fact, alias))
+
+        def recompute(alias_key: str, aggregate: str) -> str:
+            return (f"(SELECT {aggregate} FROM {quote(fact)} AS r "
+                    f"WHERE r.{quote(key)} = {alias_key}.{quote(key)})")
+
+        def counter(alias: str) -> str:
+            if arg is None:
+                cond = "1"
+            elif is_condition(arg):
+                cond = expr(alias)
+            else:
+                cond = f"{expr(alias)} IS NOT NULL"
+            return f"(CASE WHEN {cond} THEN 1 ELSE 0 END)"
+
+        def summing(state: str, value: Callable[[str], str]) -> _State:
+            sq = quote(state)
+            return _State(state, f"COALESCE(SUM({value('f')}), 0)", f"COALESCE({value('NEW')}, 0)",
+                          f"{sq} + excluded.{sq}", f"{sq} - COALESCE({value('OLD')}, 0)")
+
+        if distinct:
+            if func != "COUNT":
+                raise ViewCompileError(f"DISTINCT sadece COUNT ile desteklenir: {text}")
+            aggregate = f"COUNT(DISTINCT {expr('r')})"
+            state = _State(column, f"COUNT(DISTINCT {expr('f')})", recompute("NEW", aggregate),
+                           f"excluded.{q}", recompute("OLD", aggregate))
+            return [state], f"COALESCE(m.{q}, 0)", used
+
+        if func == "SUM":
+            return [summing(column, expr)], f"COALESCE(m.{q}, 0)", used
+
+        if func == "COUNT":
+            return [summing(column, counter)], f"COALESCE(m.{q}, 0)", used
+
+        if func == "AVG":
+            total, count = f"__{column}_sum", f"__{column}_n"
+            states = [summing(total, expr), summing(count, counter)]
+            return states, f"(CAST(m.{quote(total)} AS REAL) / NULLIF(m.{quote(count)}, 0))", used
+
+        # MIN / MAX: ekleme artımlı, silmede grup yeniden hesaplanır
+        cmp = ">" if func == "MAX" else "<"
+        combine = (f"CASE WHEN excluded.{q} IS NULL THEN {q} "
+                   f"WHEN {q} IS NULL OR excluded.{q} {cmp} {q} THEN excluded.{q} ELSE {q} END")
+        state = _State(column, f"{func}({expr('f')})", expr("NEW"), combine,
+                       recompute("OLD", f"{func}({expr('r')})"))
+        return [state], f"m.{q}", used
+
+    def _compile_aggregate(self, module_name: str, view: Dict, name: str) -> CompiledView:
+        base_tables = view.get("base_tables", [])
+        columns = view.get("columns", [])
+
+        dimension = None
+        for col in columns:
+            if "source" in col:
+                table, _ = self._source_table(col["source"], base_tables)
+                if dimension not in (None, table):
+                    raise ViewCompileError("Kaynak kolonlar tek bir boyut tablosundan gelmeli")
+                dimension = table
+        if dimension is None:
+            raise ViewCompileError("Boyut tablosu kaynak kolonu bulunamadı")
+
+        last_error = ViewCompileError(f"{dimension} tablosuna FK ile bağlı hareket tablosu bulunamadı")
+        for fact in base_tables:
+            if fact == dimension or fact not in self.tables:
+                continue
+            fks = [(c, d["foreign_key"]) for c, d in self._columns(fact).items()
+                   if (d.get("foreign_key") or {}).get("table") == dimension]
+            if not fks:
+                continue
+            key, fk = fks[0]
+            try:
+                return self._build_aggregate(module_name, view, name, dimension, fact, key,
+                                             fk.get("column", "id"))
+            except ViewCompileError as e:
+                last_error = e
+        raise last_error
+
+    def _build_aggregate(self, module_name: str, view: Dict, name: str, dimension: str,
+                         fact: str, key: str, dim_key: str) -> CompiledView:
+        compiled = CompiledView(module_name, name, "materialized")
+        compiled.dimension, compiled.fact, compiled.key = dimension, fact, key
+        dim_columns = self._columns(dimension)
+
+        states: List[_State] = []
+        used = {key}
+        public: List[Tuple[str, str]] = []
+        expressions: Dict[str, str] = {}
+
+        for col in view.get("columns", []):
+            out = col.get("name")
+            if "source" in col:
+                _, source_col = self._source_table(col["source"], [dimension])
+                sql = f"d.{quote(source_col)}"
+            elif "aggregation" in col:
+                col_states, sql, col_used = self._states(out, col["aggregation"], fact, key)
+                states.extend(col_states)
+                used |= col_used
+            elif "computed" in col:
+                node = parse_expression(col["computed"])
+
+                def resolve(ident: str) -> str:
+                    if ident in expressions:
+                        return expressions[ident]
+                    if ident in dim_columns:
+                        return f"d.{quote(ident)}"
+                    raise ViewCompileError(f"Kolon bulunamadı: {ident}")
+
+                sql = render(node, resolve)
+            else:
+                raise ViewCompileError(f"Kolon tanımı eksik: {out}")
+            expressions[out] = sql
+            public.append((out, sql))
+
+        if not states:
+            raise ViewCompileError("Aggregation kolonu yok")
+
+        mv, qk, qf = quote(compiled.mv_table), quote(key), quote(fact)
+        state_cols = ", ".join(quote(s.column) for s in states)
+        compiled.columns = [out for out, _ in public]
+
+        # Anahtar tipi hareket kolonuyla aynı olmalı; aksi halde join index kullanamaz
+        key_type = sqlite_type(self.types, self._columns(fact)[key]) if self.types else "INTEGER"
+        table_sql = (f"CREATE TABLE {mv} ({qk} {key_type} PRIMARY KEY, "
+                     + ", ".join(quote(s.column) for s in states) + ")")
+        view_sql = (f"CREATE VIEW {quote(name)} AS SELECT "
+                    + ", ".join(f"{sql} AS {quote(out)}" for out, sql in public)
+                    + f" FROM {quote(dimension)} AS d LEFT JOIN {mv} AS m ON m.{qk} = d.{quote(dim_key)}")
+
+        upsert = (f"INSERT INTO {mv} ({qk}, {state_cols}) "
+                  f"SELECT NEW.{qk}, {', '.join(s.insert for s in states)} WHERE NEW.{qk} IS NOT NULL "
+                  f"ON CONFLICT({qk}) DO UPDATE SET "
+                  + ", ".join(f"{quote(s.column)} = {s.combine}" for s in states))
+        retract = (f"UPDATE {mv} SET "
+                   + ", ".join(f"{quote(s.column)} = {s.delete}" for s in states)
+                   + f" WHERE {qk} = OLD.{qk}")
+        watched = ", ".join(quote(c) for c in sorted(used))
+        triggers = [
+            f"CREATE TRIGGER {quote(compiled.mv_table + '_ai')} AFTER INSERT ON {qf} "
+            f"BEGIN {upsert}; END",
+            f"CREATE TRIGGER {quote(compiled.mv_table + '_ad')} AFTER DELETE ON {qf} "
+            f"BEGIN {retract}; END",
+            f"CREATE TRIGGER {quote(compiled.mv_table + '_au')} AFTER UPDATE OF {watched} ON {qf} "
+            f"BEGIN {retract}; {upsert}; END"
+        ]
+
+        compiled.create_sql = [table_sql, view_sql] + triggers
+        compiled.drop_sql = [
+            f"DROP VIEW IF EXISTS {quote(name)}",
+            *(f"DROP TRIGGER IF EXISTS {quote(compiled.mv_table + s)}" for s in ("_ai", "_ad", "_au")),
+            f"DROP TABLE IF EXISTS {mv}"
+        ]
+
+        select = (f"SELECT f.{qk}, {', '.join(s.full for s in states)} FROM {qf} AS f "
+                  f"WHERE f.{qk} IS NOT NULL")
+        compiled.full_refresh_sql = [
+            f"DELETE FROM {mv}",
+            f"INSERT INTO {mv} ({qk}, {state_cols}) {select} GROUP BY f.{qk}"
+        ]
+
+        def partial(count: int) -> List[str]:
+            marks = ", ".join("?" for _ in range(count))
+            return [
+                f"DELETE FROM {mv} WHERE {qk} IN ({marks})",
+                f"INSERT INTO {mv} ({qk}, {state_cols}) {select} AND f.{qk} IN ({marks}) GROUP BY f.{qk}"
+            ]
+
+        compiled.partial_refresh = partial
+        return compiled
+
+    # ------------------------------------------------------------------
+    # Düz (projection) view'lar
+    # ------------------------------------------------------------------
+
+    def _compile_projection(self, module_name: str, view: Dict, name: str) -> CompiledView:
+        base_tables = view.get("base_tables", [])
+        if not base_tables:
+            raise ViewCompileError("base_tables boş")
+        for table in base_tables:
+            self._columns(table)
+
+        aliases = {base_tables[0]: "t0"}
+        joins = []
+        for table in base_tables[1:]:
+            alias = f"t{len(aliases)}"
+            condition = None
+            for joined, joined_alias in aliases.items():
+                for col, spec in self._columns(table).items():
+                    fk = spec.get("foreign_key") or {}
+                    if fk.get("table") == joined:
+                        condition = f"{alias}.{quote(col)} = {joined_alias}.{quote(fk.get('column', 'id'))}"
+                        break
+                for col, spec in self._columns(joined).items():
+                    fk = spec.get("foreign_key") or {}
+                    if condition is None and fk.get("table") == table:
+                        condition = f"{joined_alias}.{quote(col)} = {alias}.{quote(fk.get('column', 'id'))}"
+                        break
+                if condition:
+                    break
+            if condition is None:
+                raise ViewCompileError(f"{table} tablosu için FK join bulunamadı")
+            aliases[table] = alias
+            joins.append(f"JOIN {quote(table)} AS {alias} ON {condition}")
+
+        def column_ref(table: str, col: str) -> str:
+            if table not in aliases:
+                raise ViewCompileError(f"Tablo base_tables içinde değil: {table}")
+            if col not in self._columns(table):
+                raise ViewCompileError(f"Kolon bulunamadı: {table}.{col}")
+            return f"{aliases[table]}.{quote(col)}"
+
+        def unqualified(col: str) -> str:
+            for table in base_tables:
+                if col in self._columns(table):
+                    return column_ref(table, col)
+            raise ViewCompileError(f"Kolon bulunamadı: {col}")
+
+        expressions: Dict[str, str] = {}
+        public = []
+        for col in view.get("columns", []):
+            out = col.get("name")
+            if "source" in col:
+                source = col["source"]
+                sql = column_ref(*source.split(".", 1)) if "." in source else unqualified(source)
+            elif "computed" in col:
+                sql = render(parse_expression(col["computed"]),
+                             lambda ident: expressions.get(ident) or unqualified(ident))
+            else:
+                raise ViewCompileError(f"Kolon tanımı eksik: {out}")
+            expressions[out] = sql
+            public.append((out, sql))
+
+        compiled = CompiledView(module_name, name, "projection")
+        compiled.columns = [out for out, _ in public]
+        compiled.create_sql = [
+            f"CREATE VIEW {quote(name)} AS SELECT "
+            + ", ".join(f"{sql} AS {quote(out)}" for out, sql in public)
+            + f" FROM {quote(base_tables[0])} AS t0"
+            + "".join(" " + j for j in joins)
+        ]
+        compiled.drop_sql = [f"DROP VIEW IF EXISTS {quote(name)}"]
+        return compiled
+
+
+# ----------------------------------------------------------------------
+# Materialization
+# ----------------------------------------------------------------------
+
+class ViewMaterializer:
+    """
+    Derlenmiş view'ları SQLite veritabanına kurar ve günceller.
+
+    Materialized view'lar kurulduktan sonra hareket tablosuna yapılan her
+    INSERT/UPDATE/DELETE sadece etkilenen grubun durumunu günceller; toplam
+    ve sayaçlar fark ile, MIN/MAX ve COUNT(DISTINCT) sadece ilgili grup için
+    (FK index'i üzerinden) yeniden hesaplanır. Hesaplanan kolonlar okuma
+    anında view üzerinden üretilir.
+    """
+
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+        self.conn.execute(
+            f"CREATE TABLE IF NOT EXISTS {META_TABLE} ("
+            "name TEXT PRIMARY KEY, module TEXT, kind TEXT, fact_table TEXT, "
+            "definition_hash TEXT, refreshed_at TEXT, refresh_seconds REAL)"
+        )
+
+    def installed(self) -> Dict[str, Dict]:
+        cursor = self.conn.execute(f"SELECT * FROM {META_TABLE} ORDER BY name")
+        names = [d[0] for d in cursor.description]
+        return {row[0]: dict(zip(names, row)) for row in cursor}
+
+    def install(self, view: CompiledView, force: bool = False) -> bool:
+        """
+        View'ı kurar ve (materialized ise) doldurur. Tanım değişmemişse
+        hiçbir şey yapmaz.
+
+        Returns:
+            Kurulum yapıldı mı
+        """
+        if view.kind == "unsupported":
+            return False
+        current = self.installed().get(view.name)
+        if current and current["definition_hash"] == view.definition_hash and not force:
+            return False
+
+        with self.conn:
+            for sql in view.drop_sql:
+                self.conn.execute(sql)
+            for sql in view.create_sql:
+                self.conn.execute(sql)
+            self.conn.execute(
+                f"INSERT OR REPLACE INTO {META_TABLE} (name, module, kind, fact_table, definition_hash) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (view.name, view.module, view.kind, view.fact, view.definition_hash)
+            )
+        if view.kind == "materialized":
+            self.refresh(view)
+        return True
+
+    def uninstall(self, view: CompiledView):
+        with self.conn:
+            for sql in view.drop_sql:
+                self.conn.execute(sql)
+            self.conn.execute(f"DELETE FROM {META_TABLE} WHERE name = ?", (view.name,))
+
+    def refresh(self, view: CompiledView, keys: Iterable = None, chunk_size: int = 500) -> float:
+        """
+        Materialized view'ı yeniden hesaplar; keys verilirse sadece o
+        gruplar hesaplanır.
+
+        Returns:
+            Süre (saniye)
+        """
+        if view.kind != "materialized":
+            return 0.0
+        started = time.perf_counter()
+        with self.conn:
+            if keys is None:
+                for sql in view.full_refresh_sql:
+                    self.conn.execute(sql)
+            else:
+                keys = list(keys)
+                for i in range(0, len(keys), chunk_size):
+                    chunk = keys[i:i + chunk_size]
+                    for sql in view.partial_refresh(len(chunk)):
+                        self.conn.execute(sql, chunk)
+            elapsed = time.perf_counter() - started
+            self.conn.execute(
+                f"UPDATE {META_TABLE} SET refreshed_at = datetime('now'), refresh_seconds = ? WHERE name = ?",
+                (round(elapsed, 4), view.name)
+            )
+        return elapsed
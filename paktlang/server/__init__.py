@@ -0,0 +1,9 @@
+"""
+PaktLang Server Package
+Şemayı bellekte tutan JSON-RPC / LSP sunucusu (paktlang serve)
+"""
+
+from .server import LanguageServer
+from .workspace import DocumentIndex, Workspace
+
+__all__ = ["LanguageServer", "Workspace", "DocumentIndex"]
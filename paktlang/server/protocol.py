@@ -0,0 +1,103 @@
+"""
+PaktLang Server Protocol
+JSON-RPC 2.0 mesajları ve LSP (Content-Length başlıklı) çerçeveleme
+"""
+
+import asyncio
+import json
+from typing import Any, Dict, Optional
+
+
+# JSON-RPC hata kodları
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+INTERNAL_ERROR = -32603
+SERVER_NOT_INITIALIZED = -32002
+
+# LSP DiagnosticSeverity
+SEVERITY_ERROR = 1
+SEVERITY_WARNING = 2
+
+# LSP TextDocumentSyncKind
+SYNC_FULL = 1
+SYNC_INCREMENTAL = 2
+
+# Çok büyük veya bozuk başlıklara karşı üst sınır
+MAX_CONTENT_LENGTH = 64 * 1024 * 1024
+
+
+class JsonRpcError(Exception):
+    """İstemciye JSON-RPC hata cevabı olarak dönen hata"""
+
+    def __init__(self, code: int, message: str, data: Any = None):
+        super().__init__(message)
+        self.code = code
+        self.message = message
+        self.data = data
+
+    def to_dict(self) -> Dict:
+        error = {"code": self.code, "message": self.message}
+        if self.data is not None:
+            error["data"] = self.data
+        return error
+
+
+async def read_message(reader: asyncio.StreamReader) -> Optional[Dict]:
+    """
+    Tek bir LSP mesajı okur.
+
+    Returns:
+        Çözülmüş mesaj; bağlantı kapandıysa None
+
+    Raises:
+        JsonRpcError: Başlık veya gövde geçersizse (PARSE_ERROR)
+    """
+    length = None
+    while True:
+        line = await reader.readline()
+        if not line:
+            return None
+        line = line.strip()
+        if not line:
+            break
+        name, _, value = line.decode('ascii', 'replace').partition(":")
+        if name.strip().lower() == "content-length":
+            try:
+                length = int(value.strip())
+            except ValueError:
+                raise JsonRpcError(PARSE_ERROR, f"Geçersiz Content-Length: {value.strip()}")
+
+    if length is None or not 0 <= length <= MAX_CONTENT_LENGTH:
+        raise JsonRpcError(PARSE_ERROR, "Content-Length başlığı eksik veya geçersiz")
+    try:
+        body = await reader.readexactly(length)
+    except asyncio.IncompleteReadError:
+        return None
+    try:
+        message = json.loads(body.decode('utf-8'))
+    except ValueError as e:
+        raise JsonRpcError(PARSE_ERROR, f"JSON parse hatası: {e}")
+    if not isinstance(message, dict):
+        raise JsonRpcError(INVALID_REQUEST, "Mesaj bir JSON nesnesi olmalı")
+    return message
+
+
+def encode_message(message: Dict) -> bytes:
+    """Mesajı Content-Length başlığıyla çerçeveler"""
+    body = json.dumps(message, ensure_ascii=False, separators=(",", ":")).encode('utf-8')
+    return b"Content-Length: %d\r\n\r\n%s" % (len(body), body)
+
+
+def response(request_id: Any, result: Any = None, error: JsonRpcError = None) -> Dict:
+    message = {"jsonrpc": "2.0", "id": request_id}
+    if error is not None:
+        message["error"] = error.to_dict()
+    else:
+        message["result"] = result
+    return message
+
+
+def notification(method: str, params: Any) -> Dict:
+    return {"jsonrpc": "2.0", "method": method, "params": params}
@@ -0,0 +1,337 @@
+"""
+PaktLang Language Server
+asyncio tabanlı JSON-RPC / LSP sunucusu (stdio veya TCP)
+"""
+
+import asyncio
+import sys
+import time
+import traceback
+from pathlib import Path
+from typing import Dict, List, Optional, Set
+
+from paktlang.validator.watch import SchemaWatcher
+
+from .protocol import (
+    INTERNAL_ERROR, INVALID_PARAMS, INVALID_REQUEST, METHOD_NOT_FOUND, SERVER_NOT_INITIALIZED,
+    SYNC_INCREMENTAL, JsonRpcError, encode_message, notification, read_message, response
+)
+from .workspace import Workspace, path_to_uri, uri_to_path
+
+
+SERVER_NAME = "paktlang"
+SERVER_VERSION = "1.0.0"
+
+# initialize gerektirmeyen metodlar (CI ve betikler için)
+CUSTOM_PREFIX = "paktlang/"
+
+
+class Session:
+    """Tek bir istemci bağlantısı"""
+
+    def __init__(self, server: "LanguageServer", reader: asyncio.StreamReader,
+                 writer: asyncio.StreamWriter):
+        self.server = server
+        self.reader = reader
+        self.writer = writer
+        self.initialized = False
+        self.shutdown = False
+        self.closed = False
+
+    def send(self, message: Dict):
+        self.send_raw(encode_message(message))
+
+    def send_raw(self, data: bytes):
+        if not self.closed:
+            self.writer.write(data)
+
+    async def run(self):
+        try:
+            while not self.closed:
+                try:
+                    message = await read_message(self.reader)
+                except JsonRpcError as e:
+                    self.send(response(None, error=e))
+                    continue
+                if message is None:
+                    break
+                reply = self.server.dispatch(self, message)
+                if reply is not None:
+                    self.send(reply)
+                await self.writer.drain()
+        except (ConnectionError, asyncio.CancelledError):
+            pass
+        finally:
+            self.closed = True
+            self.server.sessions.discard(self)
+            try:
+                self.writer.close()
+            except Exception:
+                pass
+
+
+class LanguageServer:
+    """
+    Şema ağacını bellekte tutan dil sunucusu.
+
+    Tüm bağlantılar aynı Workspace'i paylaşır. Doküman değişiklikleri
+    debounce süresi boyunca biriktirilip tek doğrulamada uygulanır;
+    teşhisler başlatılmış (initialize) tüm istemcilere yayınlanır. Hover
+    ve tanım istekleri bekleyen değişiklikleri önce uygular.
+
+    Desteklenen metodlar: initialize, initialized, shutdown, exit,
+    textDocument/didOpen, didChange, didSave, didClose, hover, definition,
+    workspace/didChangeWatchedFiles ve paktlang/validate (tam rapor).
+    """
+
+    def __init__(self, workspace: Workspace, debounce: float = 0.05, poll: float = 0.5,
+                 log=None):
+        self.workspace = workspace
+        self.debounce = debounce
+        self.poll = poll
+        self.log = log or (lambda message: print(message, file=sys.stderr, flush=True))
+        self.sessions: Set[Session] = set()
+        self._sync_handle: Optional[asyncio.TimerHandle] = None
+
+        self.handlers = {
+            "initialize": self.initialize,
+            "initialized": self.initialized,
+            "shutdown": self.shutdown,
+            "exit": self.exit,
+            "textDocument/didOpen": self.did_open,
+            "textDocument/didChange": self.did_change,
+            "textDocument/didSave": self.did_save,
+            "textDocument/didClose": self.did_close,
+            "textDocument/hover": self.hover,
+            "textDocument/definition": self.definition,
+            "workspace/didChangeWatchedFiles": self.did_change_watched_files,
+            "paktlang/validate": self.validate,
+            "$/cancelRequest": lambda session, params: None,
+            "$/setTrace": lambda session, params: None,
+        }
+
+    # ------------------------------------------------------------------
+    # Çalıştırma
+    # ------------------------------------------------------------------
+
+    def start(self) -> Dict:
+        """Ağacı yükler (sunucu dinlemeye başlamadan önce)"""
+        started = time.perf_counter()
+        result = self.workspace.load()
+        summary = self.workspace.incremental.report()["summary"]
+        self.log(f"Şema yüklendi: {summary['total_modules']} modül, {summary['total_errors']} hata "
+                 f"({(time.perf_counter() - started) * 1000:.1f} ms)")
+        return result
+
+    async def serve_tcp(self, host: str = "127.0.0.1", port: int = 0, ready=None):
+        """
+        TCP üzerinden çok istemcili sunucu. exit sadece o bağlantıyı
+        kapatır; sunucu durdurulana kadar çalışır.
+        
+        Args:
+            ready: Verilirse dinlenen (host, port) ile çağrılır
+        """
+        server = await asyncio.start_server(self._accept, host, port)
+        address = server.sockets[0].getsockname()[:2]
+        self.log(f"Dinleniyor: {address[0]}:{address[1]}")
+        if ready is not None:
+            ready(address)
+        poller = self._start_poller()
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            if poller is not None:
+                poller.cancel()
+
+    async def serve_stdio(self):
+        """Tek istemci (editör) için stdin/stdout üzerinden; bağlantı kapanınca döner"""
+        loop = asyncio.get_running_loop()
+        reader = asyncio.StreamReader()
+        await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader), sys.stdin.buffer)
+        transport, protocol = await loop.connect_write_pipe(
+            asyncio.streams.FlowControlMixin, sys.stdout.buffer)
+        writer = asyncio.StreamWriter(transport, protocol, reader, loop)
+        poller = self._start_poller()
+        try:
+            await self._run_session(Session(self, reader, writer))
+        finally:
+            if poller is not None:
+                poller.cancel()
+
+    async def _accept(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        await self._run_session(Session(self, reader, writer))
+
+    async def _run_session(self, session: Session):
+        self.sessions.add(session)
+        await session.run()
+
+    def _start_poller(self) -> Optional[asyncio.Task]:
+        if not self.poll:
+            return None
+        return asyncio.get_running_loop().create_task(self._poll_disk())
+
+    async def _poll_disk(self):
+        """Editör dışında (git checkout vb.) değişen dosyaları izler"""
+        watcher = SchemaWatcher(self.workspace.incremental.watch_dirs, interval=self.poll)
+        while True:
+            await asyncio.sleep(self.poll)
+            changed = watcher.poll()
+            if changed:
+                self._publish(self.workspace.disk_changed(changed))
+
+    # ------------------------------------------------------------------
+    # Mesaj dağıtımı
+    # ------------------------------------------------------------------
+
+    def dispatch(self, session: Session, message: Dict) -> Optional[Dict]:
+        """Mesajı işler; istek ise cevabı döner"""
+        method = message.get("method")
+        request_id = message.get("id")
+        is_request = "id" in message
+
+        if not isinstance(method, str):
+            if is_request and "result" not in message and "error" not in message:
+                return response(request_id, error=JsonRpcError(INVALID_REQUEST, "method eksik"))
+            return None  # istemciden gelen cevaplar (sunucu istek göndermez)
+
+        try:
+            handler = self.handlers.get(method)
+            if handler is None:
+                raise JsonRpcError(METHOD_NOT_FOUND, f"Bilinmeyen metod: {method}")
+            if (not session.initialized and method not in ("initialize", "exit")
+                    and not method.startswith(CUSTOM_PREFIX)):
+                raise JsonRpcError(SERVER_NOT_INITIALIZED, "initialize bekleniyor")
+            params = message.get("params") or {}
+            if not isinstance(params, dict):
+                raise JsonRpcError(INVALID_PARAMS, "params bir nesne olmalı")
+            result = handler(session, params)
+        except JsonRpcError as e:
+            if is_request:
+                return response(request_id, error=e)
+            self.log(f"{method}: {e.message}")
+            return None
+        except (KeyError, TypeError, ValueError) as e:
+            error = JsonRpcError(INVALID_PARAMS, f"Geçersiz parametre: {e}")
+            if is_request:
+                return response(request_id, error=error)
+            self.log(f"{method}: {error.message}")
+            return None
+        except Exception as e:
+            self.log(traceback.format_exc())
+            if is_request:
+                return response(request_id, error=JsonRpcError(INTERNAL_ERROR, str(e)))
+            return None
+
+        return response(request_id, result) if is_request else None
+
+    # ------------------------------------------------------------------
+    # Yaşam döngüsü
+    # ------------------------------------------------------------------
+
+    def initialize(self, session: Session, params: Dict) -> Dict:
+        session.initialized = True
+        return {
+            "capabilities": {
+                "textDocumentSync": {
+                    "openClose": True,
+                    "change": SYNC_INCREMENTAL,
+                    "save": {"includeText": False}
+                },
+                "hoverProvider": True,
+                "definitionProvider": True
+            },
+            "serverInfo": {"name": SERVER_NAME, "version": SERVER_VERSION}
+        }
+
+    def initialized(self, session: Session, params: Dict):
+        # İlk teşhisler: sadece bu istemciye, bulgusu olan dosyalar
+        workspace = self.workspace
+        for path in workspace.affected_files({"full": True}):
+            diagnostics = workspace.diagnostics(path)
+            if diagnostics:
+                session.send(self._diagnostics_message(path, diagnostics))
+
+    def shutdown(self, session: Session, params: Dict):
+        session.shutdown = True
+        return None
+
+    def exit(self, session: Session, params: Dict):
+        session.closed = True
+
+    # ------------------------------------------------------------------
+    # Doküman senkronizasyonu
+    # ------------------------------------------------------------------
+
+    def did_open(self, session: Session, params: Dict):
+        document = params["textDocument"]
+        self._publish(self.workspace.open(document["uri"], document["text"], document.get("version", 0)))
+
+    def did_change(self, session: Session, params: Dict):
+        document = params["textDocument"]
+        if self.workspace.change(document["uri"], params["contentChanges"], document.get("version")):
+            self._schedule_sync()
+
+    def did_save(self, session: Session, params: Dict):
+        self._sync()
+
+    def did_close(self, session: Session, params: Dict):
+        self._publish(self.workspace.close(params["textDocument"]["uri"]))
+
+    def did_change_watched_files(self, session: Session, params: Dict):
+        paths = [uri_to_path(change["uri"]) for change in params.get("changes", [])]
+        self._publish(self.workspace.disk_changed(paths))
+
+    def _schedule_sync(self):
+        if self._sync_handle is None:
+            loop = asyncio.get_running_loop()
+            self._sync_handle = loop.call_later(self.debounce, self._sync)
+
+    def _sync(self):
+        if self._sync_handle is not None:
+            self._sync_handle.cancel()
+            self._sync_handle = None
+        self._publish(self.workspace.flush())
+
+    def _publish(self, result: Optional[Dict]):
+        """Güncellemeden etkilenen dosyaların teşhislerini yayınlar"""
+        if result is None:
+            return
+        targets = [s for s in self.sessions if s.initialized and not s.closed]
+        if not targets:
+            return
+        workspace = self.workspace
+        for path in workspace.affected_files(result):
+            data = encode_message(self._diagnostics_message(path, workspace.diagnostics(path)))
+            for session in targets:
+                session.send_raw(data)
+
+    def _diagnostics_message(self, path: Path, diagnostics: List[Dict]) -> Dict:
+        params = {"uri": path_to_uri(path), "diagnostics": diagnostics}
+        document = self.workspace.documents.get(path)
+        if document is not None:
+            params["version"] = document.version
+        return notification("textDocument/publishDiagnostics", params)
+
+    # ------------------------------------------------------------------
+    # Dil özellikleri
+    # ------------------------------------------------------------------
+
+    def _flush_pending(self):
+        if self._sync_handle is not None:
+            self._sync()
+
+    def hover(self, session: Session, params: Dict) -> Optional[Dict]:
+        self._flush_pending()
+        position = params["position"]
+        return self.workspace.hover(params["textDocument"]["uri"], position["line"], position["character"])
+
+    def definition(self, session: Session, params: Dict) -> Optional[List[Dict]]:
+        self._flush_pending()
+        position = params["position"]
+        return self.workspace.definition(params["textDocument"]["uri"], position["line"], position["character"])
+
+    def validate(self, session: Session, params: Dict) -> Dict:
+        """Tam doğrulama raporu (validate_all ile aynı yapıda, bellekteki modelden)"""
+        self._flush_pending()
+        return self.workspace.report()
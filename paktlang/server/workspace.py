@@ -0,0 +1,468 @@
+"""
+PaktLang Server Workspace
+Bellekteki şema ağacı, açık dokümanlar ve hover/tanım için konum index'leri
+"""
+
+import io
+import json
+import re
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from urllib.parse import unquote, urlparse
+
+from paktlang.validator.schema_validator import SchemaValidator
+from paktlang.validator.stream import (
+    Position, array_items, iter_module, object_items, offset_position
+)
+from paktlang.validator.type_registry import TypeRegistry
+from paktlang.validator.watch import IncrementalValidator
+
+from .protocol import SEVERITY_ERROR, SEVERITY_WARNING
+
+
+_DECODER = json.JSONDecoder()
+
+# Konum bilinen bulgularda vurgulanacak JSON token'ı (string, sayı, literal)
+_TOKEN = re.compile(r'"(?:[^"\\]|\\.)*"|-?\d[\d.eE+-]*|true|false|null')
+
+
+def uri_to_path(uri: str) -> Path:
+    parsed = urlparse(uri)
+    return Path(unquote(parsed.path))
+
+
+def path_to_uri(path: Path) -> str:
+    return Path(path).as_uri()
+
+
+def lsp_range(line: int, column: int, length: int = 0) -> Dict:
+    """1 tabanlı satır/sütundan LSP (0 tabanlı) aralığı"""
+    start = {"line": line - 1, "character": column - 1}
+    return {"start": start, "end": {"line": line - 1, "character": column - 1 + length}}
+
+
+def offset_at(text: str, line: int, character: int) -> int:
+    """
+    LSP konumunun (0 tabanlı) metin ofseti.
+
+    LSP karakterleri UTF-16 birimidir; şema dosyaları BMP dışı karakter
+    içermediği sürece kod noktası ile aynıdır.
+    """
+    index = 0
+    for _ in range(line):
+        index = text.find("\n", index) + 1
+        if not index:
+            return len(text)
+    end = text.find("\n", index)
+    if end < 0:
+        end = len(text)
+    return min(index + character, end)
+
+
+class Document:
+    """Editörde açık doküman"""
+
+    __slots__ = ("path", "text", "version")
+
+    def __init__(self, path: Path, text: str, version: int = 0):
+        self.path = path
+        self.text = text
+        self.version = version
+
+    def apply(self, changes: Iterable[Dict], version: int = None):
+        """didChange içerik değişikliklerini uygular (tam veya aralıklı)"""
+        for change in changes:
+            if "range" not in change:
+                self.text = change["text"]
+                continue
+            start = change["range"]["start"]
+            end = change["range"]["end"]
+            text = self.text
+            begin = offset_at(text, start["line"], start["character"])
+            finish = offset_at(text, end["line"], end["character"])
+            self.text = text[:begin] + change["text"] + text[finish:]
+        if version is not None:
+            self.version = version
+
+
+class Span:
+    """Dokümanda tek satırlık bir token ve anlamı (tip adı, FK hedefi)"""
+
+    __slots__ = ("line", "start", "end", "kind", "data")
+
+    def __init__(self, line: int, start: int, end: int, kind: str, data):
+        self.line = line
+        self.start = start
+        self.end = end
+        self.kind = kind
+        self.data = data
+
+    def to_range(self) -> Dict:
+        return lsp_range(self.line, self.start, self.end - self.start)
+
+
+class DocumentIndex:
+    """
+    Modül dokümanındaki tablo/kolon tanımlarının ve tip/FK referanslarının
+    konumları.
+
+    Doküman değiştiğinde bir kez oluşturulur; hover ve tanım istekleri
+    satır bazında sözlük aramasıdır.
+    """
+
+    def __init__(self):
+        self.tables: Dict[str, Position] = {}
+        self.columns: Dict[Tuple[str, str], Position] = {}
+        self.lines: Dict[int, List[Span]] = {}
+
+    @classmethod
+    def build(cls, text: str, module_key: str) -> "DocumentIndex":
+        index = cls()
+        for event in iter_module(io.StringIO(text), arrays=("tables",)):
+            if event[0] != "item":
+                continue
+            _, _, _, table, origin, table_text = event
+            if not isinstance(table, dict):
+                continue
+            table_name = table.get("pl_table")
+            found = _value(table_text, "pl_table", 0, len(table_text), table_name)
+            index.tables.setdefault(
+                table_name, origin if found is None else offset_position(table_text, found[0], origin))
+
+            columns = table.get("columns")
+            if not isinstance(columns, list):
+                continue
+            for column, (start, end) in zip(columns, array_items(table_text, ["columns"])):
+                if not isinstance(column, dict):
+                    continue
+                found = _value(table_text, "name", start, end, column.get("name"))
+                if found is not None:
+                    index.columns.setdefault(
+                        (table_name, column["name"]), offset_position(table_text, found[0], origin))
+                if isinstance(column.get("type"), str):
+                    found = _value(table_text, "type", start, end, column["type"])
+                    if found is not None:
+                        index._span(table_text, origin, found, "type", column["type"])
+                fk = column.get("foreign_key")
+                if isinstance(fk, dict):
+                    found = _value(table_text, "foreign_key", start, end, fk)
+                    if found is None:
+                        continue
+                    target = (fk.get("module", module_key), fk.get("table"), fk.get("column"))
+                    for key in ("module", "table", "column"):
+                        if key in fk:
+                            value = _value(table_text, key, found[0], found[1], fk[key])
+                            if value is not None:
+                                index._span(table_text, origin, value, "foreign_key", target)
+        return index
+
+    def _span(self, text: str, origin: Position, value: Tuple[int, int], kind: str, data):
+        start, end = value
+        line, column = offset_position(text, start, origin)
+        self.lines.setdefault(line, []).append(Span(line, column, column + end - start, kind, data))
+
+    def at(self, line: int, column: int) -> Optional[Span]:
+        """1 tabanlı konumdaki span"""
+        for span in self.lines.get(line, ()):
+            if span.start <= column < span.end:
+                return span
+        return None
+
+
+class Workspace:
+    """
+    Sunucunun bellekteki şema modeli.
+
+    Ağaç başlangıçta bir kez yüklenir; açık dokümanlardaki düzenlemeler
+    IncrementalValidator overlay'ine yazılır ve sadece etkilenen modüller
+    yeniden doğrulanır. Disk sadece açık olmayan dosyalar değiştiğinde
+    okunur.
+    """
+
+    def __init__(self, base_path: str = None, validator: SchemaValidator = None):
+        base = Path(base_path).resolve() if base_path else Path.cwd()
+        self.incremental = IncrementalValidator(str(base), validator=validator)
+        self.root = self.incremental.root
+        self.documents: Dict[Path, Document] = {}
+        self.dirty: Set[Path] = set()
+        self.indexes: Dict[str, DocumentIndex] = {}
+        # İçeriği değişmiş, index'i ilk ihtiyaçta yeniden oluşturulacak modüller
+        self.stale: Set[str] = set()
+        self.types: Optional[TypeRegistry] = None
+
+    # ------------------------------------------------------------------
+    # Model güncelleme
+    # ------------------------------------------------------------------
+
+    def load(self) -> Dict:
+        """Tüm ağacı yükler (başlangıçta ve meta/mappings değişince)"""
+        self._reset()
+        return self.incremental.load()
+
+    def _reset(self):
+        self.indexes.clear()
+        self.stale.clear()
+        try:
+            self.types = TypeRegistry.load(str(self.root / "meta"))
+        except (OSError, ValueError):
+            self.types = None
+
+    def is_schema_file(self, path: Path) -> bool:
+        return self.incremental._classify(path) != "other"
+
+    def open(self, uri: str, text: str, version: int = 0) -> Optional[Dict]:
+        path = uri_to_path(uri)
+        self.documents[path] = Document(path, text, version)
+        self.dirty.add(path)
+        return self.flush()
+
+    def change(self, uri: str, changes: Iterable[Dict], version: int = None) -> bool:
+        """Doküman metnini günceller; doğrulama flush() ile yapılır"""
+        path = uri_to_path(uri)
+        document = self.documents.get(path)
+        if document is None:
+            return False
+        document.apply(changes, version)
+        self.dirty.add(path)
+        return True
+
+    def close(self, uri: str) -> Optional[Dict]:
+        path = uri_to_path(uri)
+        self.documents.pop(path, None)
+        self.dirty.discard(path)
+        if path in self.incremental.overlay:
+            return self._update([path], drop=[path])
+        return None
+
+    def flush(self) -> Optional[Dict]:
+        """Bekleyen doküman değişikliklerini modele uygular"""
+        paths = [p for p in self.dirty if self.is_schema_file(p)]
+        self.dirty.clear()
+        if not paths:
+            return None
+        for path in paths:
+            self.incremental.overlay[path] = self.documents[path].text.encode('utf-8')
+        return self._update(paths)
+
+    def disk_changed(self, paths: Iterable[Path]) -> Optional[Dict]:
+        """Diskte değişen dosyalar; editörde açık olanlar yok sayılır"""
+        paths = [p for p in paths if p not in self.documents and self.is_schema_file(p)]
+        if not paths:
+            return None
+        return self._update(paths)
+
+    def _update(self, paths: List[Path], drop: List[Path] = ()) -> Dict:
+        for path in drop:
+            self.incremental.overlay.pop(path, None)
+        result = self.incremental.update(paths)
+        if result["full"]:
+            self._reset()
+        else:
+            self.stale.update(path.stem for path in paths)
+        return result
+
+    # ------------------------------------------------------------------
+    # Teşhis (diagnostics)
+    # ------------------------------------------------------------------
+
+    def module_file(self, module_key: str) -> Path:
+        return self.incremental.modules_dir / f"{module_key}.json"
+
+    def affected_files(self, result: Dict) -> List[Path]:
+        """Güncelleme sonrası teşhisleri yeniden yayınlanacak dosyalar"""
+        keys = sorted(self.incremental.outcomes) if result.get("full") else result.get("revalidated", [])
+        files = [self.module_file(key) for key in keys]
+        files.extend(p for p in map(Path, result.get("changed", [])) if p not in files)
+        if self.incremental.relations_file not in files:
+            files.append(self.incremental.relations_file)
+        return [p for p in files if self.incremental._classify(p) in ("module", "relations")]
+
+    def issues(self, path: Path) -> List[Dict]:
+        """Dosyaya ait güncel bulgular"""
+        inc = self.incremental
+        if path == inc.relations_file:
+            return [i for i in inc.global_issues
+                    if i["path"] == str(path) or i["path"].startswith("relations.")]
+
+        key = path.stem
+        issues = []
+        outcome = inc.outcomes.get(key)
+        if outcome is not None:
+            issues.extend(outcome["errors"])
+            issues.extend(outcome["warnings"])
+        issues.extend(inc.fk_issues.get(key, ()))
+        issues.extend(inc.view_issues.get(key, ()))
+        issues.extend(i for i in inc.global_issues if i["path"].split(".")[0] == key)
+        return issues
+
+    def diagnostics(self, path: Path) -> List[Dict]:
+        """Dosyanın bulguları LSP Diagnostic listesi olarak"""
+        issues = self.issues(path)
+        lines = None
+        diagnostics = []
+        for issue in issues:
+            line = issue.get("line")
+            if line is None:
+                where = lsp_range(1, 1)
+            else:
+                if lines is None:
+                    lines = self.text(path).split("\n")
+                where = lsp_range(line, issue["column"],
+                                  _token_length(lines, line, issue["column"]))
+            diagnostics.append({
+                "range": where,
+                "severity": SEVERITY_ERROR if issue["severity"] == "error" else SEVERITY_WARNING,
+                "code": issue["code"],
+                "source": "paktlang",
+                "message": issue["message"] if line is not None or not issue["path"]
+                else f"{issue['path']}: {issue['message']}"
+            })
+        return diagnostics
+
+    def text(self, path: Path) -> str:
+        """Dosyanın güncel metni (açıksa editördeki, değilse diskteki)"""
+        document = self.documents.get(path)
+        if document is not None:
+            return document.text
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return f.read()
+        except (OSError, UnicodeDecodeError):
+            return ""
+
+    def report(self) -> Dict:
+        self.flush()
+        return self.incremental.report()
+
+    # ------------------------------------------------------------------
+    # Hover ve tanıma git
+    # ------------------------------------------------------------------
+
+    def index(self, module_key: str) -> Optional[DocumentIndex]:
+        """Modül dokümanının konum index'i (ilk ihtiyaçta oluşturulur)"""
+        index = self.indexes.get(module_key)
+        if index is None or module_key in self.stale:
+            self.stale.discard(module_key)
+            text = self.text(self.module_file(module_key))
+            try:
+                index = DocumentIndex.build(text, module_key)
+            except ValueError:
+                # Düzenleme sırasında sözdizimi bozuk; son geçerli index kullanılır
+                return index
+            self.indexes[module_key] = index
+        return index
+
+    def span_at(self, uri: str, line: int, character: int) -> Optional[Tuple[Path, Span]]:
+        self.flush()
+        path = uri_to_path(uri)
+        if self.incremental._classify(path) != "module":
+            return None
+        index = self.index(path.stem)
+        if index is None:
+            return None
+        span = index.at(line + 1, character + 1)
+        return (path, span) if span is not None else None
+
+    def hover(self, uri: str, line: int, character: int) -> Optional[Dict]:
+        found = self.span_at(uri, line, character)
+        if found is None:
+            return None
+        _, span = found
+        if span.kind == "type":
+            value = self.describe_type(span.data)
+        else:
+            value = self.describe_target(*span.data)
+        return {"contents": {"kind": "markdown", "value": value}, "range": span.to_range()}
+
+    def definition(self, uri: str, line: int, character: int) -> Optional[List[Dict]]:
+        found = self.span_at(uri, line, character)
+        if found is None or found[1].kind != "foreign_key":
+            return None
+        module_key, table, column = found[1].data
+        if module_key not in self.incremental.modules:
+            return None
+        index = self.index(module_key)
+        if index is None:
+            return None
+        position = index.columns.get((table, column)) or index.tables.get(table)
+        if position is None:
+            return None
+        return [{"uri": path_to_uri(self.module_file(module_key)), "range": lsp_range(*position)}]
+
+    def describe_type(self, type_name: str) -> str:
+        """Tip için hover metni (markdown)"""
+        types = self.types
+        if types is None or type_name not in types.names:
+            return f"**{type_name}**\n\nBilinmeyen veri tipi"
+
+        erp = types.erp_types.get(type_name)
+        if erp is None:
+            spec = types.base_types[type_name]
+            lines = [f"**{type_name}** (temel tip)", "", spec.get("description", "")]
+            mappings = spec.get("sql_mappings", {})
+            if mappings:
+                lines.append("")
+                lines.extend(f"- {db}: `{sql}`" for db, sql in mappings.items())
+            return "\n".join(lines)
+
+        lines = [f"**{type_name}** (ERP tipi, temel tip `{erp.get('base_type')}`)", "",
+                 erp.get("description", "")]
+        details = [f"- {key}: `{value}`" for key, value in erp.get("extends", {}).items()]
+        metadata = erp.get("metadata", {})
+        if metadata.get("category"):
+            details.append(f"- Kategori: {metadata['category']}")
+        if metadata.get("validation"):
+            details.append(f"- Doğrulama: {metadata['validation']}")
+        if erp.get("examples"):
+            details.append("- Örnekler: " + ", ".join(f"`{e}`" for e in erp["examples"]))
+        if details:
+            lines.append("")
+            lines.extend(details)
+        return "\n".join(lines)
+
+    def describe_target(self, module_key: str, table: str, column: str) -> str:
+        """Foreign key hedefi için hover metni"""
+        name = ".".join(str(p) for p in (module_key, table, column) if p)
+        target = self.incremental.index.table(module_key, table)
+        if target is None:
+            return f"**{name}**\n\nForeign key hedef tablosu bulunamadı"
+        symbol = target.columns.get(column) if column else None
+        if column and symbol is None:
+            return f"**{name}**\n\nForeign key hedef kolonu bulunamadı"
+        if symbol is None:
+            return f"**{name}**"
+        flags = [symbol.type or "?"]
+        if symbol.primary_key:
+            flags.append("primary key")
+        elif symbol.unique:
+            flags.append("unique")
+        return f"**{name}** ({', '.join(flags)})"
+
+
+_KEYS = {key: re.compile(r'"%s"\s*:\s*' % key)
+         for key in ("pl_table", "name", "type", "foreign_key", "module", "table", "column")}
+
+
+def _value(text: str, key: str, start: int, end: int, expected) -> Optional[Tuple[int, int]]:
+    """
+    text[start:end] nesnesinde anahtarın değer ofsetleri.
+
+    Önce regex ile aranır (C hızında); bulunan değer beklenenle eşleşmezse
+    (iç içe nesnede aynı anahtar) nesne anahtar anahtar çözülür.
+    """
+    match = _KEYS[key].search(text, start, end)
+    if match is not None:
+        try:
+            value, value_end = _DECODER.raw_decode(text, match.end())
+        except ValueError:
+            value = None
+        if value == expected:
+            return match.end(), value_end
+    return object_items(text, start).get(key)
+
+
+def _token_length(lines: List[str], line: int, column: int) -> int:
+    if not 0 < line <= len(lines):
+        return 0
+    match = _TOKEN.match(lines[line - 1], column - 1)
+    return len(match.group()) if match else 1
@@ -0,0 +1,36 @@
+"""
+PaktLang test ortak fixture'ları
+"""
+
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+SCHEMA_DIRS = ("modules", "relations", "meta", "mappings")
+
+
+@pytest.fixture(scope="session")
+def repo_root() -> Path:
+    """Depodaki örnek şema ağacının ana dizini"""
+    return ROOT
+
+
+@pytest.fixture(scope="session")
+def types():
+    """Depodaki meta/ tanımlarından tip kayıt defteri"""
+    from paktlang.validator.type_registry import TypeRegistry
+    return TypeRegistry.load(ROOT / "paktlang" / "meta")
+
+
+@pytest.fixture
+def schema_tree(tmp_path) -> Path:
+    """Örnek şema ağacının değiştirilebilir kopyası (base_path)"""
+    for name in SCHEMA_DIRS:
+        shutil.copytree(ROOT / "paktlang" / name, tmp_path / "paktlang" / name)
+    return tmp_path
@@ -0,0 +1,153 @@
+"""Şema önbelleği: geçersiz kılma ve dosya formatı"""
+
+import os
+import pickle
+
+import pytest
+
+from paktlang.validator.cache import CACHE_VERSION, SchemaCache
+
+MODULE = b'{"module": "ornek", "version": "1.0.0", "tables": [{"pl_table": "t", "columns": []}]}'
+RESULTS = {"valid": True, "errors": [], "warnings": [{"code": "PL200", "message": "uyarı"}]}
+
+
+@pytest.fixture
+def module_file(tmp_path):
+    path = tmp_path / "ornek.json"
+    path.write_bytes(MODULE)
+    return path
+
+
+def stored(cache_dir, module_file, fingerprint="kurallar-1"):
+    """Dosyayı ayrıştırıp sonuçlarıyla önbelleğe yazar ve diske kaydeder"""
+    cache = SchemaCache(str(cache_dir), fingerprint)
+    probe = cache.probe(str(module_file))
+    assert not probe.fresh
+    cache.store(probe, {"module": "ornek"}, results=RESULTS)
+    cache.save()
+    return cache
+
+
+def set_mtime(path, delta_ns):
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + delta_ns))
+
+
+def test_hit_without_reading(tmp_path, module_file):
+    stored(tmp_path / "c", module_file)
+    cache = SchemaCache(str(tmp_path / "c"), "kurallar-1")
+    probe = cache.probe(str(module_file))
+    assert probe.fresh
+    assert probe.content is None
+    assert cache.results(probe.entry) == RESULTS
+    assert cache.load_data(probe.entry) == {"module": "ornek"}
+
+
+def test_touched_file_is_hit_by_digest(tmp_path, module_file):
+    stored(tmp_path / "c", module_file)
+    set_mtime(module_file, 5_000_000_000)
+    cache = SchemaCache(str(tmp_path / "c"), "kurallar-1")
+    probe = cache.probe(str(module_file))
+    assert probe.fresh
+    assert probe.content == MODULE
+    assert probe.entry["mtime_ns"] == os.stat(module_file).st_mtime_ns
+    cache.save()
+    # Güncellenen stat bilgisi kaydedildi: bir sonraki probe dosyayı okumaz
+    assert SchemaCache(str(tmp_path / "c"), "kurallar-1").probe(str(module_file)).content is None
+
+
+def test_same_size_content_change_is_miss(tmp_path, module_file):
+    stored(tmp_path / "c", module_file)
+    module_file.write_bytes(MODULE.replace(b"1.0.0", b"2.0.0"))
+    set_mtime(module_file, 5_000_000_000)
+    probe = SchemaCache(str(tmp_path / "c"), "kurallar-1").probe(str(module_file))
+    assert not probe.fresh
+    assert len(probe.content) == len(MODULE)
+
+
+def test_size_change_is_miss_even_with_same_mtime(tmp_path, module_file):
+    stored(tmp_path / "c", module_file)
+    mtime = os.stat(module_file).st_mtime_ns
+    module_file.write_bytes(MODULE + b"\n")
+    os.utime(module_file, ns=(mtime, mtime))
+    assert not SchemaCache(str(tmp_path / "c"), "kurallar-1").probe(str(module_file)).fresh
+
+
+def test_fingerprint_change_drops_results_only(tmp_path, module_file):
+    stored(tmp_path / "c", module_file)
+    cache = SchemaCache(str(tmp_path / "c"), "kurallar-2")
+    probe = cache.probe(str(module_file))
+    assert probe.fresh
+    assert cache.results(probe.entry) is None
+    assert cache.load_data(probe.entry) == {"module": "ornek"}
+
+
+def test_cross_key_depends_on_fingerprint_and_digests():
+    a = SchemaCache("unused", "kurallar-1")
+    b = SchemaCache("unused", "kurallar-2")
+    digests = {"cari": "aa", "stok": "bb"}
+    assert a.cross_key(digests) == a.cross_key(dict(reversed(list(digests.items()))))
+    assert a.cross_key(digests) != b.cross_key(digests)
+    assert a.cross_key(digests) != a.cross_key({"cari": "aa", "stok": "bc"})
+
+
+def test_corrupt_files_are_misses(tmp_path, module_file):
+    cache = stored(tmp_path / "c", module_file)
+    entry = cache.probe(str(module_file)).entry
+    for obj in (tmp_path / "c" / "objects").iterdir():
+        obj.write_bytes(b"\x00bozuk")
+    assert cache.load_data(entry) is None
+    assert entry["has_data"] is False
+
+    cache.index_path.write_bytes(b"bozuk")
+    assert not SchemaCache(str(tmp_path / "c"), "kurallar-1").probe(str(module_file)).fresh
+
+
+class Payload:
+    def __reduce__(self):
+        return (open, (str(Payload.marker), "w"))
+
+
+def test_pickled_cache_is_never_unpickled(tmp_path, module_file):
+    cache_dir = tmp_path / "c"
+    cache_dir.mkdir()
+    Payload.marker = tmp_path / "calisti"
+    payload = pickle.dumps({"version": CACHE_VERSION, "files": {}, "cross": {}, "x": Payload()})
+    for name in ("index.pickle", "index.marshal", "catalog.marshal", "catalog.pickle"):
+        (cache_dir / name).write_bytes(payload)
+
+    cache = SchemaCache(str(cache_dir), "kurallar-1")
+    assert not cache.probe(str(module_file)).fresh
+    assert cache.load_snapshot("catalog", "v2") is None
+    assert not Payload.marker.exists()
+
+
+def test_snapshot_roundtrip_and_key(tmp_path):
+    cache = SchemaCache(str(tmp_path / "c"))
+    value = {"agac": ([{"id": "x"}], {"table": {1, 2}}, {"f": {"x": {0}}}, {}, {})}
+    cache.save_snapshot("catalog", "v2", value)
+    assert cache.load_snapshot("catalog", "v2") == value
+    assert cache.load_snapshot("catalog", "v1") is None
+    with pytest.raises(ValueError):
+        cache.save_snapshot("catalog", "v2", object())
+
+
+def test_clear(tmp_path, module_file):
+    cache = stored(tmp_path / "c", module_file)
+    cache.save_snapshot("catalog", "v2", {})
+    (tmp_path / "c" / "eski.pickle").write_bytes(b"")
+    cache.clear()
+    cache.save()
+    assert sorted(p.name for p in (tmp_path / "c").rglob("*") if p.is_file()) == ["index.marshal"]
+    assert not SchemaCache(str(tmp_path / "c"), "kurallar-1").probe(str(module_file)).fresh
+
+
+def test_catalog_snapshot(tmp_path, schema_tree):
+    from paktlang.validator.catalog import Catalog
+
+    query = "kind=column and type=tax_number"
+    expected = Catalog.load([str(schema_tree)]).query(query)
+    for _ in range(2):
+        cache = SchemaCache(str(tmp_path / "c"), "kurallar-1")
+        assert Catalog.load([str(schema_tree)], cache=cache).query(query) == expected
+    assert (tmp_path / "c" / "catalog.marshal").exists()
@@ -0,0 +1,44 @@
+"""check-data komutu"""
+
+import json
+
+import pytest
+
+from paktlang.cli.paktlang_cli import main
+
+
+@pytest.fixture(scope="module")
+def generated(tmp_path_factory, repo_root):
+    """generate çıktısı (en yüksek sürümlü tablo tanımlarıyla üretilir)"""
+    out = tmp_path_factory.mktemp("generated")
+    assert main(["-b", str(repo_root), "--no-cache", "generate", str(out),
+                 "-f", "jsonl", "-n", "5", "-j", "1"]) == 0
+    return out
+
+
+def test_unqualified_table_uses_highest_version(capsys, repo_root, generated):
+    data = generated / "stok_hareket.jsonl"
+    assert data.exists()
+    capsys.readouterr()
+    code = main(["-b", str(repo_root), "--no-cache", "check-data", "stok_hareket", str(data), "--json"])
+    out = capsys.readouterr().out
+    assert code == 0, out
+    assert out.strip() == ""
+
+
+def test_qualified_table_uses_that_module(capsys, repo_root, generated):
+    data = generated / "stok_hareket.jsonl"
+    capsys.readouterr()
+    main(["-b", str(repo_root), "--no-cache", "check-data", "stok.stok_hareket", str(data), "--json"])
+    errors = [json.loads(line) for line in capsys.readouterr().out.splitlines() if line.startswith("{")]
+    assert errors and {e["column"] for e in errors} == {"tarih"}
+
+
+def test_bad_value_types(capsys, repo_root, tmp_path):
+    data = tmp_path / "cari_kart.jsonl"
+    rows = [{"cari_kodu": "C1", "unvan": "A", "cari_tipi": ["musteri"], "aktif": {"x": 1}}]
+    data.write_text("\n".join(json.dumps(r) for r in rows) + "\n", encoding="utf-8")
+    code = main(["-b", str(repo_root), "--no-cache", "check-data", "cari_kart", str(data), "--json"])
+    errors = [json.loads(line) for line in capsys.readouterr().out.splitlines() if line.startswith("{")]
+    assert code == 1
+    assert {(e["column"], e["code"]) for e in errors} >= {("cari_tipi", "PL102"), ("aktif", "PL102")}
@@ -0,0 +1,61 @@
+"""CLI açılışı: motorlar ve dil sunucusu sadece kullanan komutta yüklenir"""
+
+import argparse
+import json
+import subprocess
+import sys
+
+import pytest
+
+from paktlang.cli.paktlang_cli import build_parser
+
+
+LAZY_MODULES = ("asyncio", "sqlite3", "paktlang.engine", "paktlang.server")
+
+PROBE = """
+import json, sys
+from paktlang.cli.paktlang_cli import main
+main(sys.argv[1:])
+print(json.dumps(sorted(sys.modules)), file=sys.stderr)
+"""
+
+
+def loaded_modules(repo_root, *argv):
+    result = subprocess.run([sys.executable, "-c", PROBE, *argv], cwd=repo_root,
+                            capture_output=True, text=True, check=True)
+    return set(json.loads(result.stderr.strip().splitlines()[-1]))
+
+
+@pytest.mark.parametrize("command", ["list", "stats"])
+def test_header_commands_skip_engines(repo_root, schema_tree, command):
+    modules = loaded_modules(repo_root, "-b", str(schema_tree), "--no-cache", command)
+    for name in LAZY_MODULES:
+        assert name not in modules
+    assert not any(m.startswith(("paktlang.engine.", "paktlang.server.")) for m in modules)
+
+
+def option(parser, command, flag):
+    subparsers = next(a for a in parser._actions if isinstance(a, argparse._SubParsersAction))
+    return subparsers.choices[command]._option_string_actions[flag]
+
+
+def test_parser_defaults_match_engine_constants():
+    from paktlang.engine import codegen, erp_schema, integrity, synthetic
+
+    parser = build_parser()
+    codegen_args = parser.parse_args(["codegen"])
+    integrity_args = parser.parse_args(["check-integrity"])
+    generate_args = parser.parse_args(["generate", "out"])
+    match_args = parser.parse_args(["match-erp", "catalog.sql"])
+
+    assert codegen_args.style in codegen.STYLES
+    assert integrity_args.max_keys == integrity.DEFAULT_MAX_KEYS
+    assert integrity_args.partitions == integrity.DEFAULT_PARTITIONS
+    assert integrity_args.samples == integrity.DEFAULT_SAMPLES
+    assert generate_args.documents == synthetic.DEFAULT_DOCUMENTS
+    assert generate_args.masters == synthetic.DEFAULT_MASTERS
+    assert generate_args.lines == synthetic.DEFAULT_LINES
+    assert match_args.suggestions == erp_schema.DEFAULT_SUGGESTIONS
+
+    assert option(parser, "codegen", "--style").choices == codegen.STYLES
+    assert option(parser, "generate", "--format").choices == synthetic.FORMATS
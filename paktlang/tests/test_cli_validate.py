@@ -0,0 +1,76 @@
+"""validate komutunun çıktı biçimleri"""
+
+import json
+
+import pytest
+
+from paktlang.cli.paktlang_cli import main
+
+
+def run_json(capsys, *argv):
+    code = main(list(argv))
+    return code, json.loads(capsys.readouterr().out)
+
+
+def test_format_json_prints_report(capsys, schema_tree):
+    code, report = run_json(capsys, "-b", str(schema_tree), "--no-cache", "validate", "--format", "json")
+    assert set(report) >= {"valid", "modules", "errors", "warnings", "summary"}
+    assert code == (0 if report["valid"] else 1)
+
+
+def test_format_json_single_file(capsys, schema_tree):
+    module = schema_tree / "paktlang" / "modules" / "core" / "cari.json"
+    _, report = run_json(capsys, "-b", str(schema_tree), "--no-cache", "validate",
+                         "--format", "json", "--file", str(module))
+    assert report["file"] == str(module)
+    assert "errors" in report
+
+
+def test_json_flag_matches_format_json(capsys, schema_tree):
+    base = ["-b", str(schema_tree), "--no-cache", "validate"]
+    _, by_flag = run_json(capsys, *base, "--json")
+    _, by_format = run_json(capsys, *base, "--format", "json")
+    assert by_flag == by_format
+
+
+def run_output(capsys, base, *argv):
+    code = main(["-b", str(base), *argv])
+    return code, capsys.readouterr().out
+
+
+VARIANTS = [
+    ("--no-cache", "validate", "--jobs", "4"),
+    ("--no-cache", "validate", "--stream"),
+    ("--no-cache", "validate", "--stream", "--jobs", "3"),
+]
+
+
+@pytest.mark.parametrize("fmt", ["json", "text", "ndjson", "sarif"])
+def test_output_independent_of_jobs_stream_and_cache(capsys, schema_tree, tmp_path, fmt):
+    expected = run_output(capsys, schema_tree, "--no-cache", "validate", "--format", fmt)
+    assert expected[1]
+
+    for argv in VARIANTS:
+        assert run_output(capsys, schema_tree, *argv, "--format", fmt) == expected, argv
+
+    cache = ["--cache-dir", str(tmp_path / "cache"), "validate", "--format", fmt]
+    assert run_output(capsys, schema_tree, *cache) == expected, "soğuk önbellek"
+    assert run_output(capsys, schema_tree, *cache) == expected, "sıcak önbellek"
+    assert run_output(capsys, schema_tree, *cache, "--jobs", "4") == expected, "sıcak önbellek, --jobs"
+
+
+def test_warm_cache_sees_changes(capsys, schema_tree, tmp_path):
+    cache = ["--cache-dir", str(tmp_path / "cache"), "validate", "--json"]
+    _, before = run_json(capsys, "-b", str(schema_tree), *cache)
+
+    module = schema_tree / "paktlang" / "modules" / "core" / "cari.json"
+    data = json.loads(module.read_text(encoding="utf-8"))
+    data["tables"][0]["columns"][1]["type"] = "bilinmeyen_tip"
+    module.write_text(json.dumps(data, ensure_ascii=False, indent=4), encoding="utf-8")
+
+    _, warm = run_json(capsys, "-b", str(schema_tree), *cache)
+    _, cold = run_json(capsys, "-b", str(schema_tree), "--no-cache", "validate", "--json")
+    assert warm == cold
+    assert warm != before
+    assert any(e["code"] == "PL002" and "bilinmeyen_tip" in e["message"]
+               for e in warm["modules"]["cari"]["errors"])
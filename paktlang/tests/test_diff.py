@@ -0,0 +1,124 @@
+"""Şema farkı: değişiklik maliyet sınıfları, veri kaybı işaretleri ve göç planı"""
+
+import json
+import shutil
+
+import pytest
+
+from paktlang.cli.paktlang_cli import main
+from paktlang.validator.diff import COST_METADATA, COST_REWRITE, COST_SCAN, PHASES, diff_schemas
+
+
+def column(table, name):
+    return next(c for c in table["columns"] if c["name"] == name)
+
+
+def evolve(data):
+    """cari_kart üzerinde her maliyet sınıfından birer değişiklik"""
+    table = next(t for t in data["tables"] if t["pl_table"] == "cari_kart")
+    column(table, "unvan")["max_length"] = 500
+    column(table, "kisa_ad")["max_length"] = 50
+    column(table, "mersis_no")["type"] = "integer"
+    column(table, "vergi_dairesi")["required"] = True
+    column(table, "web_sitesi")["indexed"] = True
+    column(table, "vade_gunu")["max"] = 365
+    column(table, "cari_tipi")["values"].remove("diger")
+    column(table, "cari_sinifi")["values"].append("gold")
+    column(table, "yetkili_unvan")["name"] = "yetkili_gorev"
+    table["columns"].remove(column(table, "linkedin"))
+    table["columns"].append({"name": "musteri_notu", "type": "string", "max_length": 100, "required": True})
+
+
+@pytest.fixture
+def old_tree(schema_tree, tmp_path):
+    old = tmp_path / "old"
+    shutil.copytree(schema_tree / "paktlang" / "modules" / "core", old)
+    return old
+
+
+@pytest.fixture
+def evolved(schema_tree):
+    path = schema_tree / "paktlang" / "modules" / "core" / "cari.json"
+    data = json.loads(path.read_text(encoding="utf-8"))
+    evolve(data)
+    path.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+    return schema_tree
+
+
+EXPECTED = {
+    "cari.cari_kart.unvan": ("column_widened", COST_METADATA, False),
+    "cari.cari_kart.kisa_ad": ("column_narrowed", COST_REWRITE, True),
+    "cari.cari_kart.mersis_no": ("column_retyped", COST_REWRITE, False),
+    "cari.cari_kart.vergi_dairesi": ("column_required", COST_SCAN, False),
+    "cari.cari_kart.web_sitesi": ("index_added", COST_SCAN, False),
+    "cari.cari_kart.vade_gunu": ("constraint_changed", COST_SCAN, False),
+    "cari.cari_kart.cari_tipi": ("enum_narrowed", COST_SCAN, True),
+    "cari.cari_kart.cari_sinifi": ("enum_extended", COST_METADATA, False),
+    "cari.cari_kart.yetkili_gorev": ("column_renamed", COST_METADATA, False),
+    "cari.cari_kart.linkedin": ("column_removed", COST_METADATA, True),
+    "cari.cari_kart.musteri_notu": ("column_added", COST_REWRITE, False),
+}
+
+
+def test_changes_are_classified_by_cost(old_tree, evolved, types):
+    diff = diff_schemas(str(old_tree), str(evolved), types)
+    found = {c.path: (c.kind, c.cost, c.destructive) for c in diff.changes}
+    assert found == EXPECTED
+
+    summary = diff.summary()
+    assert summary["rewrite_tables"] == ["cari.cari_kart"]
+    assert summary["destructive"] == 3
+    assert summary["by_cost"] == {COST_METADATA: 4, COST_SCAN: 4, COST_REWRITE: 3}
+    # Sadece cari değişti; diğer modüller dosya hash'i ile atlanır
+    assert summary["stats"]["modules_skipped"] == summary["stats"]["modules"] - 1
+
+
+def test_plan_merges_rewrites_and_orders_phases(old_tree, evolved, types):
+    plan = diff_schemas(str(old_tree), str(evolved), types).migration_plan()
+    assert [entry["step"] for entry in plan] == list(range(1, len(plan) + 1))
+    phases = [PHASES.index(entry["phase"]) for entry in plan]
+    assert phases == sorted(phases)
+
+    rewrites = [entry for entry in plan if entry["action"] == "rewrite_table"]
+    assert len(rewrites) == 1
+    assert rewrites[0]["target"] == "cari.cari_kart"
+    assert rewrites[0]["destructive"] is True
+    assert sorted(rewrites[0]["includes"]) == [
+        "cari.cari_kart.kisa_ad", "cari.cari_kart.mersis_no", "cari.cari_kart.musteri_notu"
+    ]
+
+    by_target = {entry["target"]: entry for entry in plan if entry["action"] != "rewrite_table"}
+    assert by_target["cari.cari_kart.yetkili_gorev"]["phase"] == "rename"
+    assert by_target["cari.cari_kart.web_sitesi"]["phase"] == "create_indexes"
+    assert by_target["cari.cari_kart.cari_tipi"]["phase"] == "add_constraints"
+    assert by_target["cari.cari_kart.cari_tipi"]["destructive"] is True
+    assert by_target["cari.cari_kart.linkedin"]["phase"] == "drop_columns"
+
+
+def test_identical_trees_skip_every_module(old_tree, schema_tree, types):
+    diff = diff_schemas(str(old_tree), str(schema_tree), types)
+    assert diff.changes == []
+    stats = diff.summary()["stats"]
+    assert stats["modules"] > 0 and stats["modules_skipped"] == stats["modules"]
+
+
+def test_cli_json_report(old_tree, evolved, capsys):
+    code = main(["-b", str(evolved), "--no-cache", "diff", str(old_tree), str(evolved), "--json"])
+    report = json.loads(capsys.readouterr().out)
+    assert code == 1
+    assert {c["path"] for c in report["changes"] if c.get("destructive")} == {
+        path for path, (_, _, destructive) in EXPECTED.items() if destructive
+    }
+    assert report["summary"]["rewrite_tables"] == ["cari.cari_kart"]
+
+
+@pytest.mark.parametrize("side", ["old", "new"])
+def test_directory_without_modules_is_an_error(old_tree, schema_tree, side, capsys):
+    # paktlang/modules modül dosyası içermez (modüller core/ altında)
+    empty = schema_tree / "paktlang" / "modules"
+    old, new = (empty, old_tree) if side == "old" else (old_tree, empty)
+    with pytest.raises(ValueError, match="Modül dosyası bulunamadı"):
+        diff_schemas(str(old), str(new))
+
+    assert main(["--no-cache", "diff", str(old), str(new)]) == 2
+    assert "Modül dosyası bulunamadı" in capsys.readouterr().err
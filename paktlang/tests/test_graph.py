@@ -0,0 +1,90 @@
+"""Bağımlılık döngüleri (PL006) ve FK güvenli yükleme sırası"""
+
+import json
+
+from paktlang.cli.paktlang_cli import main
+from paktlang.validator.graph import build_table_graph, table_load_order
+from paktlang.validator.schema_validator import SchemaValidator
+
+
+def core_module(base, name):
+    return base / "paktlang" / "modules" / "core" / f"{name}.json"
+
+
+def edit_module(base, name, change):
+    path = core_module(base, name)
+    data = json.loads(path.read_text(encoding="utf-8"))
+    change(data)
+    path.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+
+
+def find_table(data, name):
+    return next(t for t in data["tables"] if t["pl_table"] == name)
+
+
+def pl006(base):
+    validator = SchemaValidator(str(base))
+    modules, relations = validator.load_schema()
+    return [(i.severity, i.message) for i in validator.validate_dependencies(modules, relations)]
+
+
+def test_inferred_and_optional_cycles_are_warnings(schema_tree):
+    issues = pl006(schema_tree)
+    assert ("warning", "Modül bağımlılık döngüsü: cari -> finans -> cari") in issues
+    assert ("warning", "Foreign key döngüsü: satis.satis_siparis -> satis.satis_teklif -> satis.satis_siparis") \
+        in issues
+    assert all(severity == "warning" for severity, _ in issues)
+
+
+def test_declared_module_cycle_is_error(schema_tree, capsys):
+    edit_module(schema_tree, "cari", lambda d: d.__setitem__("dependencies", ["finans"]))
+
+    assert ("error", "Modül bağımlılık döngüsü: cari -> finans -> cari") in pl006(schema_tree)
+    code = main(["-b", str(schema_tree), "--no-cache", "validate", "--format", "json"])
+    report = json.loads(capsys.readouterr().out)
+    assert code == 1
+    assert any(e["code"] == "PL006" and e["severity"] == "error" for e in report["errors"])
+
+
+def test_required_fk_cycle_is_error(schema_tree):
+    def require_links(data):
+        for table, column in (("satis_siparis", "teklif_id"), ("satis_teklif", "siparis_id")):
+            col = next(c for c in find_table(data, table)["columns"] if c["name"] == column)
+            col["required"] = True
+
+    edit_module(schema_tree, "satis", require_links)
+    assert ("error", "Foreign key döngüsü: satis.satis_siparis -> satis.satis_teklif -> satis.satis_siparis") \
+        in pl006(schema_tree)
+
+
+def test_self_reference_is_not_a_cycle(schema_tree):
+    # satis_teklif.onceki_teklif_id kendi tablosuna referanstır
+    assert not any("satis_teklif -> satis.satis_teklif" in message for _, message in pl006(schema_tree))
+
+
+def test_order_loads_fk_targets_first(schema_tree, capsys):
+    assert main(["-b", str(schema_tree), "--no-cache", "order", "--json"]) == 0
+    report = json.loads(capsys.readouterr().out)
+    position = {node: i for i, node in enumerate(report["order"])}
+    level_of = {node: i for i, level in enumerate(report["levels"]) for node in level}
+    assert position.keys() == level_of.keys()
+    assert report["cycles"] == [{"path": ["satis.satis_siparis", "satis.satis_teklif", "satis.satis_siparis"],
+                                 "required": False}]
+    in_cycle = {node for cycle in report["cycles"] for node in cycle["path"]}
+
+    modules, relations = SchemaValidator(str(schema_tree)).load_schema()
+    graph = build_table_graph(modules, relations)
+    checked = 0
+    for source, targets in graph.edges.items():
+        for target in targets:
+            if source == target or source not in position or target not in position:
+                continue
+            if source in in_cycle and target in in_cycle:
+                continue
+            assert position[target] < position[source], (source, target)
+            assert level_of[target] < level_of[source], (source, target)
+            checked += 1
+    assert checked > 0
+
+    # Seviyeler düzleştirilince de, doğrudan topolojik sırada da aynı tablolar
+    assert sorted(f"{m}.{t}" for m, t in table_load_order(modules, relations)) == sorted(report["order"])
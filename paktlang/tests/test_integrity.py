@@ -0,0 +1,108 @@
+"""Dosya tabanlı referans bütünlüğü: bellekte ve diske taşan (bölümlü) anahtar kümeleri"""
+
+import csv
+import json
+
+import pytest
+
+from paktlang.cli.paktlang_cli import main
+from paktlang.engine.integrity import IntegrityChecker
+from paktlang.engine.sqlite_loader import discover_files, select_tables
+from paktlang.validator.schema_validator import SchemaValidator
+
+ORPHAN_KASA = "kasa_hareket.kasa_id -> kasa.id"
+ORPHAN_CARI = "kasa_hareket.cari_id -> cari_kart.id"
+
+
+def append_rows(path, change, count):
+    """İlk veri satırının değiştirilmiş kopyalarını dosyaya ekler; eklenen satır numaraları"""
+    with open(path, encoding="utf-8", newline="") as f:
+        rows = list(csv.DictReader(f))
+    header = list(rows[0])
+    with open(path, "a", encoding="utf-8", newline="") as f:
+        writer = csv.DictWriter(f, header)
+        for i in range(count):
+            writer.writerow(change(dict(rows[0]), i))
+    return list(range(len(rows) + 1, len(rows) + count + 1))
+
+
+@pytest.fixture
+def schema(schema_tree):
+    return SchemaValidator(str(schema_tree)).load_schema()
+
+
+@pytest.fixture
+def data_dir(schema_tree, tmp_path, capsys):
+    """Sentetik veri; kasa_hareket'te yetim satırlar, kasa'da tekrar eden anahtar"""
+    out = tmp_path / "data"
+    assert main(["-b", str(schema_tree), "--no-cache", "generate", str(out), "-f", "csv",
+                 "-n", "10", "--masters", "10", "-j", "1",
+                 "--flow", "flow_tahsilat", "--flow", "flow_odeme"]) == 0
+    capsys.readouterr()
+
+    def orphan(row, i):
+        row["id"] = str(10_000 + i)
+        row["kasa_id"] = str(900 + i)
+        row["cari_id"] = "999" if i % 2 else row["cari_id"]
+        return row
+
+    orphan_rows = append_rows(out / "kasa_hareket.csv", orphan, 5)
+    append_rows(out / "kasa.csv", lambda row, i: row, 1)
+    return out, orphan_rows
+
+
+def check(schema, data_dir, **options):
+    modules, relations = schema
+    tables, _ = select_tables(modules)
+    return IntegrityChecker(modules, relations, **options).check(discover_files(data_dir, tables))
+
+
+def links(report):
+    return {link["id"]: link for link in report["links"]}
+
+
+def test_orphans_and_duplicates_in_memory(schema, data_dir):
+    data_dir, orphan_rows = data_dir
+    report = check(schema, data_dir, samples=3)
+    found = links(report)
+    assert not report["valid"]
+
+    kasa = found[ORPHAN_KASA]
+    assert kasa["status"] == "violated" and kasa["orphans"] == 5
+    # En küçük satır numaralı örnekler, sıralı
+    assert [s["row"] for s in kasa["samples"]] == orphan_rows[:3]
+    assert [s["value"] for s in kasa["samples"]] == ["900", "901", "902"]
+    assert found[ORPHAN_CARI]["orphans"] == 2
+
+    assert {link_id for link_id, link in found.items() if link["status"] == "violated"} == {ORPHAN_KASA, ORPHAN_CARI}
+    assert report["orphans"] == 7
+    keys = {key["key"]: key for key in report["keys"]}
+    assert keys["kasa.id"]["duplicates"] == 1
+    assert not any(key["spilled"] for key in report["keys"])
+
+
+def test_spilled_partitions_match_in_memory(schema, data_dir, tmp_path):
+    spill = tmp_path / "spill"
+    spill.mkdir()
+    data_dir, _ = data_dir
+    memory = check(schema, data_dir)
+    spilled = check(schema, data_dir, max_keys=1, partitions=4, spill_dir=str(spill))
+
+    assert all(key["spilled"] for key in spilled["keys"])
+    for report in (memory, spilled):
+        report.pop("seconds")
+        for key in report["keys"]:
+            key.pop("spilled")
+    assert spilled == memory
+    # Bölüm dosyaları kontrol sonunda silinir
+    assert list(spill.iterdir()) == []
+
+
+def test_cli_reports_spill(schema_tree, data_dir, capsys):
+    data_dir, _ = data_dir
+    code = main(["-b", str(schema_tree), "--no-cache", "check-integrity", str(data_dir),
+                 "--max-keys", "1", "--partitions", "2", "--json"])
+    report = json.loads(capsys.readouterr().out)
+    assert code == 1
+    assert links(report)[ORPHAN_KASA]["orphans"] == 5
+    assert any(key["spilled"] for key in report["keys"])
@@ -0,0 +1,101 @@
+"""ERP <-> PaktLang değer dönüştürücüleri"""
+
+import pytest
+
+from paktlang.engine.mapping import MappingCatalog, TranslationError, compile_date_converter
+
+MIKRO = "DD.MM.YYYY"
+PAKTLANG = "YYYY-MM-DD"
+
+
+@pytest.fixture
+def to_paktlang():
+    return compile_date_converter(MIKRO, PAKTLANG, "tarih")
+
+
+@pytest.fixture
+def catalog():
+    return MappingCatalog({"conversion_rules": {"boolean_mappings": {
+        "logo": {"true": 1, "false": 0},
+        "mikro": {"true": "E", "false": "H"}
+    }}})
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("15.01.2024", "2024-01-15"),
+    ("29.02.2024", "2024-02-29"),
+    ("31.12.1999", "1999-12-31"),
+    ("1.2.2024", "2024-02-01"),
+    (" 15.01.2024 ", "2024-01-15"),
+    (None, None),
+    ("", ""),
+])
+def test_date_to_paktlang(to_paktlang, value, expected):
+    assert to_paktlang(value) == expected
+
+
+@pytest.mark.parametrize("value", [
+    "2024-01-15",   # başka formatta, aynı uzunlukta
+    "99.99.9999",   # ayraçlar doğru, değerler geçersiz
+    "31.02.2023",
+    "29.02.2023",
+    "15/01/2024",
+    "ab.cd.efgh",
+    12345,
+])
+def test_malformed_date_raises(to_paktlang, value):
+    with pytest.raises(TranslationError) as info:
+        to_paktlang(value)
+    assert info.value.field == "tarih"
+    assert info.value.value == value
+
+
+def test_date_to_erp_roundtrip(to_paktlang):
+    to_erp = compile_date_converter(PAKTLANG, MIKRO, "tarih")
+    assert to_erp("2024-01-15") == "15.01.2024"
+    assert to_paktlang(to_erp("2024-02-29")) == "2024-02-29"
+    with pytest.raises(TranslationError):
+        to_erp("15.01.2024")
+
+
+def test_datetime_adds_time():
+    convert = compile_date_converter(MIKRO, "YYYY-MM-DD HH:mm:ss", "tarih")
+    assert convert("15.01.2024") == "2024-01-15 00:00:00"
+    convert = compile_date_converter("YYYY-MM-DD HH:mm:ss", MIKRO, "tarih")
+    assert convert("2024-01-15 23:59:59") == "15.01.2024"
+    with pytest.raises(TranslationError):
+        convert("2024-01-15 24:00:00")
+
+
+@pytest.mark.parametrize("erp, code, value", [
+    ("logo", 1, True), ("logo", "1", True), ("logo", 0, False), ("logo", "0", False),
+    ("mikro", "E", True), ("mikro", "H", False),
+])
+def test_boolean_codes(catalog, erp, code, value):
+    converters = catalog._boolean_converters(erp)
+    assert converters["to_paktlang"](code) is value
+    assert str(converters["to_erp"](value)) == str(code)
+
+
+def test_boolean_unknown_codes_pass_through(catalog):
+    converters = catalog._boolean_converters("mikro")
+    assert converters["to_paktlang"]("X") == "X"
+    assert converters["to_paktlang"](None) is None
+    assert converters["to_erp"]("true") == "E"
+    assert converters["to_erp"]("belki") == "belki"
+    assert catalog._boolean_converters("netsis") == {}
+
+
+def test_columns_from_highest_module_version(repo_root, types):
+    from paktlang.engine.sqlite_loader import select_tables
+    from paktlang.validator.schema_validator import SchemaValidator
+
+    modules, _ = SchemaValidator(str(repo_root)).load_schema()
+    catalog = MappingCatalog.load(str(repo_root / "paktlang" / "mappings" / "erp_mappings.json"),
+                                  modules, types)
+    selected, _ = select_tables(modules)
+    for table in ("stok_kart", "stok_hareket"):
+        module_name, definition = selected[table]
+        assert modules[module_name]["version"] > modules["stok"]["version"]
+        columns = catalog._paktlang_columns("stok", table)
+        assert [c["type"] for c in columns.values()] == [c["type"] for c in definition["columns"]]
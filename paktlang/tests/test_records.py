@@ -0,0 +1,60 @@
+"""Satır doğrulayıcının tip kontrolleri"""
+
+import pytest
+
+from paktlang.engine.records import RecordValidator
+
+TABLE = {
+    "pl_table": "ornek",
+    "columns": [
+        {"name": "aktif", "type": "boolean"},
+        {"name": "tarih", "type": "date"},
+        {"name": "zaman", "type": "datetime"},
+        {"name": "tip", "type": "enum", "values": ["musteri", "tedarikci", "1"]},
+        {"name": "ad", "type": "string", "max_length": 10},
+        {"name": "adet", "type": "integer"},
+        {"name": "tutar", "type": "decimal", "precision": 10, "scale": 2},
+    ]
+}
+
+BAD_TYPES = [["a"], {"a": 1}, [], {}]
+
+
+@pytest.fixture
+def validator(types):
+    return RecordValidator(TABLE, types, "test")
+
+
+def codes(errors):
+    return [(e.row, e.column, e.code) for e in errors]
+
+
+def test_valid_rows(validator):
+    rows = [
+        {"aktif": True, "tarih": "2024-01-15", "zaman": "2024-01-15 10:00:00",
+         "tip": "musteri", "ad": "Ali", "adet": 3, "tutar": "12.50"},
+        {"aktif": "0", "tarih": "2024-01-15", "zaman": "2024-01-15T10:00:00",
+         "tip": 1, "ad": "Veli", "adet": "4", "tutar": "0.5"},
+        {"aktif": 1, "tarih": None, "zaman": "", "tip": None},
+    ]
+    assert validator.validate_batch(rows) == []
+
+
+@pytest.mark.parametrize("column", ["aktif", "tarih", "zaman", "tip", "ad", "adet", "tutar"])
+@pytest.mark.parametrize("value", BAD_TYPES, ids=["list", "dict", "empty_list", "empty_dict"])
+def test_unhashable_values_report_pl102(validator, column, value):
+    rows = [{"tarih": "2024-01-15"}, {column: value}, {"tarih": "2024-01-15"}]
+    assert codes(validator.validate_batch(rows, 1)) == [(2, column, "PL102")]
+
+
+def test_invalid_values(validator):
+    rows = [{"aktif": "evet", "tarih": "15.01.2024", "tip": "ortak", "adet": 1.5}]
+    assert codes(validator.validate_batch(rows)) == [
+        (0, "aktif", "PL102"), (0, "tarih", "PL102"), (0, "tip", "PL107"), (0, "adet", "PL102")
+    ]
+
+
+def test_stream_continues_after_bad_types(validator):
+    rows = [{"tarih": ["2024-01-15"]}] + [{"tarih": "2024-01-15"}] * 5 + [{"aktif": {"x": 1}}]
+    errors = list(validator.validate_stream(rows, batch_size=3))
+    assert codes(errors) == [(1, "tarih", "PL102"), (7, "aktif", "PL102")]
@@ -0,0 +1,124 @@
+"""Modül kuralları: bulguların raporlanma sırası"""
+
+import json
+
+from paktlang.validator.rules import RULES, RuleRegistry
+from paktlang.validator.schema_validator import SchemaValidator
+
+MODULE = {
+    "module": "ornek", "version": "1.0.0", "description": "sıra", "tables": [
+        {"pl_table": "t1", "columns": [
+            {"name": "a", "type": "integer"},
+            {"name": "select", "type": "nope"},
+            {"name": "a", "type": "decimal", "precision": 2, "scale": 5},
+            {"type": "string"},
+            {"name": "select", "type": "enum"},
+            {"name": "b", "type": "string", "pattern": "("}
+        ]},
+        {"pl_table": "t2", "columns": [
+            {"name": "x", "type": "integer", "primary_key": True},
+            {"name": "x", "type": "bad"}
+        ]}
+    ]
+}
+
+# Kolon bazlı sıra: duplike ad hatası ilgili kolonun kendi hatalarından hemen önce
+EXPECTED = [
+    ("PL002", "ornek.t1.select"),
+    ("PL010", "ornek.t1.select"),
+    ("PL004", "ornek.t1"),
+    ("PL009", "ornek.t1.a"),
+    ("PL003", "ornek.t1.columns[3]"),
+    ("PL004", "ornek.t1"),
+    ("PL010", "ornek.t1.select"),
+    ("PL003", "ornek.t1.select"),
+    ("PL008", "ornek.t1.b"),
+    ("PL004", "ornek.t2"),
+    ("PL002", "ornek.t2.x"),
+]
+
+
+def write_module(tmp_path):
+    path = tmp_path / "paktlang" / "modules" / "core" / "ornek.json"
+    path.parent.mkdir(parents=True)
+    path.write_text(json.dumps(MODULE, indent=1), encoding="utf-8")
+    return path
+
+
+def test_issue_order(tmp_path):
+    path = write_module(tmp_path)
+    validator = SchemaValidator(str(tmp_path))
+    valid, errors = validator.validate_module(str(path))
+    assert not valid
+    assert [(e.code, e.path) for e in validator.errors] == EXPECTED
+    assert [(e.code, e.path) for e in validator.warnings] == [("PL003", "ornek.t1")]
+
+
+def test_issue_order_with_profiler(tmp_path):
+    from paktlang.validator.profiling import Profiler
+
+    path = write_module(tmp_path)
+    profiler = Profiler()
+    validator = SchemaValidator(str(tmp_path), profiler=profiler)
+    validator.validate_module(str(path))
+    assert [(e.code, e.path) for e in validator.errors] == EXPECTED
+
+
+def test_columns_scope_can_be_disabled(tmp_path):
+    path = write_module(tmp_path)
+    registry = RuleRegistry([r for r in RULES.rules if r.name != "duplicate_columns"])
+    validator = SchemaValidator(str(tmp_path), registry=registry)
+    validator.validate_module(str(path))
+    assert [(e.code, e.path) for e in validator.errors] == [i for i in EXPECTED if i[0] != "PL004"]
+
+
+BAD_TYPES = {
+    "module": "kotu", "version": "1.0.0", "description": "hatalı tipler", "tables": [
+        {"pl_table": "t", "columns": [
+            {"name": "id", "type": "integer", "primary_key": True},
+            {"name": "a", "type": ["string"]},
+            {"name": "b", "type": {"base": "string"}},
+            {"name": ["c"], "type": "string"},
+            {"name": ["c"], "type": "string", "pattern": 5}
+        ]}
+    ]
+}
+
+
+def test_unhashable_column_types_report_pl002(tmp_path):
+    path = tmp_path / "paktlang" / "modules" / "core" / "kotu.json"
+    path.parent.mkdir(parents=True)
+    path.write_text(json.dumps(BAD_TYPES), encoding="utf-8")
+    validator = SchemaValidator(str(tmp_path))
+    valid, _ = validator.validate_module(str(path))
+    assert not valid
+    assert [(e.code, e.path) for e in validator.errors] == [
+        ("PL002", "kotu.t.a"), ("PL002", "kotu.t.b"), ("PL008", "kotu.t.['c']")
+    ]
+
+
+def test_unhashable_column_types_in_service(repo_root):
+    from paktlang.validator.service import ValidationService
+
+    result = ValidationService(str(repo_root)).validate_document(json.dumps(BAD_TYPES), "kotu.json")
+    assert not result.valid
+    assert [e.code for e in result.errors] == ["PL002", "PL002", "PL008"]
+
+
+def test_validator_constant_aliases():
+    from paktlang.validator import rules
+
+    assert SchemaValidator.BASE_TYPES == rules.BASE_TYPES
+    assert SchemaValidator.ERP_TYPES == rules.ERP_TYPES
+    assert SchemaValidator.REQUIRED_MODULE_FIELDS == rules.REQUIRED_MODULE_FIELDS
+    assert SchemaValidator.REQUIRED_TABLE_FIELDS == rules.REQUIRED_TABLE_FIELDS
+    assert SchemaValidator.REQUIRED_COLUMN_FIELDS == rules.REQUIRED_COLUMN_FIELDS
+    assert SchemaValidator.RESERVED_KEYWORDS == rules.RESERVED_KEYWORDS
+    assert "currency" in SchemaValidator.BASE_TYPES + SchemaValidator.ERP_TYPES
+
+
+def test_validate_type_rejects_non_strings():
+    validator = SchemaValidator()
+    assert validator.validate_type("integer", "t.a")
+    assert not validator.validate_type(["integer"], "t.b")
+    assert [(e.code, e.path) for e in validator.errors] == [("PL002", "t.b")]
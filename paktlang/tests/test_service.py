@@ -0,0 +1,43 @@
+"""ValidationService: müşteri yüklemelerinin doğrulanması"""
+
+import json
+
+import pytest
+
+from paktlang.validator.schema_validator import SchemaValidator
+from paktlang.validator.service import ValidationService
+
+NOT_OBJECTS = [b"[1,2]", b'"modul"', b"42", b"null", b"true"]
+
+
+@pytest.fixture(scope="module")
+def service(repo_root):
+    return ValidationService(str(repo_root))
+
+
+@pytest.mark.parametrize("content", NOT_OBJECTS)
+def test_non_object_document_is_pl001(service, content):
+    result = service.validate_document(content, "yukleme.json")
+    assert not result.valid
+    assert [(e.code, e.path) for e in result.errors] == [("PL001", "yukleme.json")]
+    assert "JSON nesnesi" in result.errors[0].message
+
+
+def test_non_object_documents_in_schema(service, repo_root):
+    cari = (repo_root / "paktlang" / "modules" / "core" / "cari.json").read_bytes()
+    result = service.validate_schema({"cari.json": cari, "liste.json": b"[1]", "sayi.json": b"7"})
+    assert not result.valid
+    assert result.modules["cari"].valid
+    assert not result.modules["liste"].valid and not result.modules["sayi"].valid
+    assert [e.code for e in result.errors] == ["PL001", "PL001"]
+
+
+@pytest.mark.parametrize("stream", [False, True])
+def test_validator_non_object_module(tmp_path, stream):
+    path = tmp_path / "paktlang" / "modules" / "core" / "liste.json"
+    path.parent.mkdir(parents=True)
+    path.write_text(json.dumps([{"module": "x"}]), encoding="utf-8")
+    validator = SchemaValidator(str(tmp_path), stream=stream)
+    valid, errors = validator.validate_module(str(path))
+    assert not valid
+    assert [e.code for e in errors] == ["PL001"]
@@ -0,0 +1,99 @@
+"""SQLite yükleyici: farklı alanlara sahip satırların yüklenmesi"""
+
+import json
+
+import pytest
+
+from paktlang.engine.sqlite_loader import SQLiteLoader, resolve_table, select_tables
+from paktlang.validator.schema_validator import SchemaValidator
+
+COLUMNS = ("cari_kodu", "unvan", "vergi_no", "email", "vade_gunu", "aktif")
+
+
+@pytest.fixture(scope="module")
+def modules(repo_root):
+    modules, _ = SchemaValidator(str(repo_root)).load_schema()
+    return modules
+
+
+@pytest.fixture
+def loader(tmp_path, modules, types):
+    loader = SQLiteLoader(str(tmp_path / "test.db"), modules, types, batch_size=2)
+    loader.connect(replace=True)
+    loader.create_schema()
+    yield loader
+    loader.conn.close()
+
+
+def fetch(loader):
+    sql = f"SELECT {', '.join(COLUMNS)} FROM cari_kart ORDER BY rowid"
+    return [dict(zip(COLUMNS, row)) for row in loader.conn.execute(sql)]
+
+
+def test_jsonl_heterogeneous_rows(tmp_path, loader):
+    rows = [
+        {"cari_kodu": "C1", "unvan": "Bir"},
+        {"cari_kodu": "C2", "unvan": "İki", "vergi_no": "1234567890", "email": "a@b.com"},
+        {"email": "c@d.com", "cari_kodu": "C3", "unvan": "Üç"},
+        {"cari_kodu": "C4", "unvan": "Dört", "vade_gunu": 60, "aktif": False, "bilinmeyen": 1},
+        {"bilinmeyen": 1},
+        {"cari_kodu": "C5", "unvan": "Beş", "vergi_no": "9876543210"},
+    ]
+    path = tmp_path / "cari_kart.jsonl"
+    path.write_text("\n".join(json.dumps(r, ensure_ascii=False) for r in rows) + "\n", encoding="utf-8")
+
+    result = loader.load_table("cari_kart", str(path))
+    assert result["rows"] == 5
+    assert fetch(loader) == [
+        {"cari_kodu": "C1", "unvan": "Bir", "vergi_no": None, "email": None, "vade_gunu": 30, "aktif": 1},
+        {"cari_kodu": "C2", "unvan": "İki", "vergi_no": "1234567890", "email": "a@b.com",
+         "vade_gunu": 30, "aktif": 1},
+        {"cari_kodu": "C3", "unvan": "Üç", "vergi_no": None, "email": "c@d.com", "vade_gunu": 30, "aktif": 1},
+        {"cari_kodu": "C4", "unvan": "Dört", "vergi_no": None, "email": None, "vade_gunu": 60, "aktif": 0},
+        {"cari_kodu": "C5", "unvan": "Beş", "vergi_no": "9876543210", "email": None,
+         "vade_gunu": 30, "aktif": 1},
+    ]
+
+
+def test_csv_short_rows_and_unknown_columns(tmp_path, loader):
+    path = tmp_path / "cari_kart.csv"
+    path.write_text(
+        "cari_kodu,bilinmeyen,unvan,vergi_no,email,aktif\n"
+        "C1,x,Bir,,,\n"
+        "C2,x,İki,1234567890,a@b.com,0\n"
+        "C3,x,Üç\n",
+        encoding="utf-8"
+    )
+    result = loader.load_table("cari_kart", str(path))
+    assert result["rows"] == 3
+    assert [(r["cari_kodu"], r["vergi_no"], r["email"], r["aktif"]) for r in fetch(loader)] == [
+        ("C1", None, None, None), ("C2", "1234567890", "a@b.com", 0), ("C3", None, None, None)
+    ]
+
+
+def test_resolve_table(modules):
+    selected, _ = select_tables(modules)
+    assert resolve_table(modules, "stok_hareket") == selected["stok_hareket"]
+    assert resolve_table(modules, "stok.stok_hareket")[0] == "stok"
+    assert resolve_table(modules, "yok") is None
+    assert resolve_table(modules, "stok.yok") is None
+
+
+def test_jsonl_nested_values_in_json_columns(tmp_path, loader):
+    rows = [
+        {"cari_kodu": "C1", "unvan": "Bir", "etiketler": ["bayi", "İstanbul"],
+         "ozel_alanlar": {"bölge": "Ege", "puan": [1, 2]}},
+        {"cari_kodu": "C2", "unvan": "İki", "etiketler": [], "ozel_alanlar": '{"hazır": true}'},
+        {"cari_kodu": "C3", "unvan": "Üç", "etiketler": None},
+    ]
+    path = tmp_path / "cari_kart.jsonl"
+    path.write_text("\n".join(json.dumps(r, ensure_ascii=False) for r in rows) + "\n", encoding="utf-8")
+
+    assert loader.load_table("cari_kart", str(path))["rows"] == 3
+    stored = list(loader.conn.execute("SELECT etiketler, ozel_alanlar FROM cari_kart ORDER BY rowid"))
+    assert stored == [
+        ('["bayi", "İstanbul"]', '{"bölge": "Ege", "puan": [1, 2]}'),
+        ("[]", '{"hazır": true}'),
+        (None, None),
+    ]
+    assert json.loads(stored[0][1]) == rows[0]["ozel_alanlar"]
@@ -0,0 +1,92 @@
+"""Trigger ile artımlı güncellenen materialized view'lar"""
+
+import sqlite3
+
+import pytest
+
+from paktlang.cli.paktlang_cli import main
+from paktlang.engine.views import ViewCompiler, ViewMaterializer
+from paktlang.validator.schema_validator import SchemaValidator
+
+
+@pytest.fixture
+def views(schema_tree, types):
+    modules, _ = SchemaValidator(str(schema_tree)).load_schema()
+    return {v.name: v for v in ViewCompiler(modules, types).compile_all() if v.kind == "materialized"}
+
+
+@pytest.fixture
+def conn(schema_tree, tmp_path, capsys):
+    database = tmp_path / "erp.db"
+    assert main(["-b", str(schema_tree), "--no-cache", "generate", str(database),
+                 "-n", "10", "--masters", "10", "-j", "1",
+                 "--flow", "flow_tahsilat", "--flow", "flow_odeme"]) == 0
+    capsys.readouterr()
+    connection = sqlite3.connect(database)
+    yield connection
+    connection.close()
+
+
+def snapshot(conn, view):
+    rows = conn.execute(f'SELECT * FROM "{view.name}" ORDER BY 1').fetchall()
+    return [tuple(round(v, 6) if isinstance(v, float) else v for v in row) for row in rows]
+
+
+def mutate(conn, view):
+    """Hareket tablosunda INSERT, UPDATE (grup değişimi dahil) ve DELETE"""
+    fact, key = view.fact, view.key
+    ids = [r[0] for r in conn.execute(f'SELECT id FROM "{fact}" ORDER BY id')]
+    groups = [r[0] for r in conn.execute(f'SELECT DISTINCT "{key}" FROM "{fact}" ORDER BY 1')]
+    assert len(ids) >= 3 and len(groups) >= 2
+    columns = [r[1] for r in conn.execute(f'PRAGMA table_info("{fact}")')]
+    copied = ", ".join("?" if c == "id" else f'"{c}"' for c in columns)
+    with conn:
+        conn.execute(f'INSERT INTO "{fact}" SELECT {copied} FROM "{fact}" WHERE id = ?', (ids[-1] + 1, ids[0]))
+        current = conn.execute(f'SELECT "{key}" FROM "{fact}" WHERE id = ?', (ids[1],)).fetchone()[0]
+        other = next(g for g in groups if g != current)
+        conn.execute(f'UPDATE "{fact}" SET "{key}" = ?, tutar = tutar * 2 + 1 WHERE id = ?', (other, ids[1]))
+        conn.execute(f'DELETE FROM "{fact}" WHERE id = ?', (ids[2],))
+
+
+@pytest.mark.parametrize("name", ["cari_bakiye", "kasa_bakiye"])
+def test_triggers_match_full_refresh(conn, views, name):
+    view = views[name]
+    materializer = ViewMaterializer(conn)
+    assert materializer.install(view)
+    before = snapshot(conn, view)
+
+    mutate(conn, view)
+    incremental = snapshot(conn, view)
+    assert incremental != before
+
+    materializer.refresh(view)
+    assert snapshot(conn, view) == incremental
+
+
+def test_partial_refresh_rebuilds_only_given_groups(conn, views):
+    view = views["kasa_bakiye"]
+    materializer = ViewMaterializer(conn)
+    materializer.install(view)
+    expected = snapshot(conn, view)
+    keys = [r[0] for r in conn.execute(f'SELECT "{view.key}" FROM "{view.mv_table}" ORDER BY 1')]
+    assert len(keys) >= 2
+
+    with conn:
+        conn.execute(f'DELETE FROM "{view.mv_table}"')
+    materializer.refresh(view, keys=keys[:1])
+    restored = {r[0] for r in conn.execute(f'SELECT "{view.key}" FROM "{view.mv_table}"')}
+    assert restored == {keys[0]}
+
+    materializer.refresh(view, keys=keys, chunk_size=1)
+    assert snapshot(conn, view) == expected
+
+
+def test_install_skips_unchanged_definition(conn, views):
+    view = views["kasa_bakiye"]
+    materializer = ViewMaterializer(conn)
+    assert materializer.install(view)
+    assert not materializer.install(view)
+    assert materializer.install(view, force=True)
+    meta = materializer.installed()[view.name]
+    assert meta["definition_hash"] == view.definition_hash
+    assert meta["fact_table"] == view.fact
@@ -2,7 +2,12 @@
 PaktLang Validator Package
 """
 
+from .model import SchemaModel
 from .schema_validator import SchemaValidator, ValidationError
+from .service import Issue, ModuleResult, SchemaResult, ValidationService
 
 __version__ = "1.0.0"
-__all__ = ["SchemaValidator", "ValidationError"]
+__all__ = [
+    "SchemaValidator", "ValidationError", "SchemaModel",
+    "ValidationService", "Issue", "ModuleResult", "SchemaResult"
+]
@@ -0,0 +1,358 @@
+"""
+PaktLang Schema Cache
+Derlenmiş şema önbelleği - değişmeyen dosyalar yeniden ayrıştırılmaz
+"""
+
+import hashlib
+import json
+import marshal
+import os
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+
+# Önbellek format versiyonu - format değiştiğinde artırılır
+CACHE_VERSION = 2
+
+# Önbellek dosyaları marshal ile yazılır: sadece temel tipler (dict, list,
+# set, tuple, str, sayı) saklanır ve yükleme sırasında kod çalıştırılmaz;
+# depoya eklenmiş bir önbellek dizini pickle'daki gibi kod yürütemez
+SUFFIX = ".marshal"
+
+# Yüklenemeyen (bozuk veya eski formatta) önbellek dosyalarında oluşan hatalar
+LOAD_ERRORS = (OSError, EOFError, ValueError, TypeError)
+
+# Varsayılan önbellek dizini (proje ana dizinine göre)
+DEFAULT_CACHE_DIR = ".paktlang_cache"
+
+
+def module_header(data: Dict) -> Dict:
+    """Modül verisinden list/info/stats için gereken özet bilgiyi çıkarır"""
+    tables = []
+    for table in data.get("tables", []):
+        tables.append({
+            "pl_table": table.get("pl_table"),
+            "columns": len(table.get("columns", [])),
+            "indexes": len(table.get("indexes", [])),
+            "is_master": bool(table.get("is_master")),
+            "audit": bool(table.get("audit"))
+        })
+
+    return {
+        "module": data.get("module"),
+        "version": data.get("version"),
+        "description": data.get("description"),
+        "priority": data.get("priority"),
+        "dependencies": list(data.get("dependencies", [])),
+        "tables": tables,
+        "counts": {
+            "tables": len(tables),
+            "columns": sum(t["columns"] for t in tables),
+            "indexes": sum(t["indexes"] for t in tables),
+            "views": len(data.get("views", []))
+        }
+    }
+
+
+def relations_header(data: Dict) -> Dict:
+    """relations.json özet bilgisi"""
+    return {
+        "version": data.get("version"),
+        "counts": {
+            "module_dependencies": len(data.get("module_dependencies", {})),
+            "relations": len(data.get("cross_module_relationships", [])),
+            "data_flows": len(data.get("data_flows", [])),
+            "referential_integrity_rules": len(data.get("referential_integrity_rules", []))
+        }
+    }
+
+
+def _read(path: Path) -> Any:
+    with open(path, 'rb') as f:
+        return marshal.load(f)
+
+
+def _write(path: Path, value: Any):
+    """Geçici dosyaya yazıp yerine taşır (eşzamanlı okuyucular yarım dosya görmez)"""
+    data = marshal.dumps(value)
+    tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+class CacheProbe:
+    """Bir dosyanın önbellek durumuna tek seferlik bakış (stat + içerik)"""
+
+    __slots__ = ("path", "mtime_ns", "size", "digest", "content", "entry")
+
+    def __init__(self, path: str, mtime_ns: int, size: int):
+        self.path = path
+        self.mtime_ns = mtime_ns
+        self.size = size
+        self.digest: Optional[str] = None
+        self.content: Optional[bytes] = None
+        self.entry: Optional[Dict] = None
+
+    @property
+    def fresh(self) -> bool:
+        return self.entry is not None
+
+
+class SchemaCache:
+    """
+    Dosya yolu, mtime/size ve içerik hash'ine göre anahtarlanan disk önbelleği.
+
+    Index dosyası her dosya için özet (header) ve doğrulama sonuçlarını tutar;
+    ayrıştırılmış JSON içerik hash'i ile adreslenen ayrı nesnelerde saklanır
+    ve sadece gerektiğinde yüklenir. Tüm dosyalar marshal formatındadır.
+    """
+
+    def __init__(self, cache_dir: str, fingerprint: str = ""):
+        """
+        Args:
+            cache_dir: Önbellek dizini
+            fingerprint: Doğrulama kurallarının parmak izi; değişirse
+                önbellekteki doğrulama sonuçları geçersiz sayılır
+        """
+        self.cache_dir = Path(cache_dir)
+        self.index_path = self.cache_dir / f"index{SUFFIX}"
+        self.objects_dir = self.cache_dir / "objects"
+        self.fingerprint = fingerprint
+        self._index: Optional[Dict] = None
+        self._dirty = False
+
+    # ------------------------------------------------------------------
+    # Index
+    # ------------------------------------------------------------------
+
+    @property
+    def index(self) -> Dict:
+        if self._index is None:
+            self._index = self._load_index()
+        return self._index
+
+    def _empty_index(self) -> Dict:
+        return {"version": CACHE_VERSION, "files": {}, "cross": {}}
+
+    def _load_index(self) -> Dict:
+        try:
+            index = _read(self.index_path)
+        except LOAD_ERRORS:
+            return self._empty_index()
+
+        if not isinstance(index, dict) or index.get("version") != CACHE_VERSION \
+                or not isinstance(index.get("files"), dict) or not isinstance(index.get("cross"), dict):
+            return self._empty_index()
+        return index
+
+    def save(self):
+        """Değişiklik varsa index'i atomik olarak diske yazar"""
+        if not self._dirty:
+            return
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        _write(self.index_path, self.index)
+        self._dirty = False
+
+    def clear(self):
+        """Tüm önbelleği temizler"""
+        self._index = self._empty_index()
+        self._dirty = True
+        # *.pickle: önceki format sürümünden kalan dosyalar
+        if self.objects_dir.exists():
+            for obj in [*self.objects_dir.glob(f"*{SUFFIX}"), *self.objects_dir.glob("*.pickle")]:
+                try:
+                    obj.unlink()
+                except OSError:
+                    pass
+        for snapshot in [*self.cache_dir.glob(f"*{SUFFIX}"), *self.cache_dir.glob("*.pickle"),
+                         *self.cache_dir.glob("*.model")]:
+            if snapshot != self.index_path:
+                try:
+                    snapshot.unlink()
+                except OSError:
+                    pass
+
+    # ------------------------------------------------------------------
+    # Dosya kayıtları
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _key(file_path: str) -> str:
+        return os.path.realpath(file_path)
+
+    def probe(self, file_path: str) -> CacheProbe:
+        """
+        Dosyanın önbellekteki kaydını kontrol eder.
+
+        mtime ve boyut aynıysa dosya okunmadan kayıt döner. Farklıysa içerik
+        okunur ve hash karşılaştırılır; içerik aynıysa sadece stat bilgisi
+        güncellenir. Önbellek kaçağında okunan içerik probe üzerinde kalır,
+        böylece dosya ikinci kez okunmaz.
+
+        Raises:
+            FileNotFoundError: Dosya yoksa
+        """
+        key = self._key(file_path)
+        st = os.stat(key)
+        probe = CacheProbe(key, st.st_mtime_ns, st.st_size)
+
+        entry = self.index["files"].get(key)
+        if entry and entry["mtime_ns"] == st.st_mtime_ns and entry["size"] == st.st_size:
+            probe.digest = entry["digest"]
+            probe.entry = entry
+            return probe
+
+        with open(key, 'rb') as f:
+            probe.content = f.read()
+        probe.digest = hashlib.sha256(probe.content).hexdigest()
+
+        if entry and entry["digest"] == probe.digest:
+            entry["mtime_ns"] = st.st_mtime_ns
+            entry["size"] = st.st_size
+            self._dirty = True
+            probe.entry = entry
+
+        return probe
+
+    def store(self, probe: CacheProbe, data: Optional[Dict],
+              header: Optional[Dict] = None,
+              results: Optional[Dict] = None) -> Dict:
+        """
+        Ayrıştırılmış dosyayı (ve varsa doğrulama sonuçlarını) kaydeder.
+        header verilmezse modül özeti veriden üretilir.
+        """
+        if header is None and isinstance(data, dict):
+            header = module_header(data)
+        if data is not None:
+            self._write_object(probe.digest, data)
+
+        entry = {
+            "mtime_ns": probe.mtime_ns,
+            "size": probe.size,
+            "digest": probe.digest,
+            "has_data": data is not None,
+            "header": header,
+            "results": None,
+            "fingerprint": None
+        }
+        self.index["files"][probe.path] = entry
+        self._dirty = True
+        probe.entry = entry
+
+        if results is not None:
+            self.store_results(entry, results)
+        return entry
+
+    def store_results(self, entry: Dict, results: Dict):
+        """Kayda doğrulama sonuçlarını ekler"""
+        entry["results"] = results
+        entry["fingerprint"] = self.fingerprint
+        self._dirty = True
+
+    def results(self, entry: Dict) -> Optional[Dict]:
+        """Kural parmak izi eşleşiyorsa önbellekteki doğrulama sonuçları"""
+        if entry.get("results") is None or entry.get("fingerprint") != self.fingerprint:
+            return None
+        return entry["results"]
+
+    def load_data(self, entry: Dict) -> Optional[Dict]:
+        """Kayda ait ayrıştırılmış JSON içeriğini yükler"""
+        if not entry.get("has_data"):
+            return None
+        try:
+            return _read(self.objects_dir / f"{entry['digest']}{SUFFIX}")
+        except LOAD_ERRORS:
+            entry["has_data"] = False
+            self._dirty = True
+            return None
+
+    def _write_object(self, digest: str, data: Dict):
+        obj_path = self.objects_dir / f"{digest}{SUFFIX}"
+        if obj_path.exists():
+            return
+        self.objects_dir.mkdir(parents=True, exist_ok=True)
+        _write(obj_path, data)
+
+    def header(self, file_path: str, builder=module_header) -> Tuple[Dict, Dict]:
+        """
+        Dosyanın özet bilgisini döner; güncel değilse dosyayı ayrıştırıp kaydeder.
+
+        Returns:
+            (header, entry)
+
+        Raises:
+            FileNotFoundError, json.JSONDecodeError, UnicodeDecodeError
+        """
+        probe = self.probe(file_path)
+        if probe.fresh and probe.entry.get("header") is not None:
+            return probe.entry["header"], probe.entry
+
+        if probe.content is None:
+            with open(probe.path, 'rb') as f:
+                probe.content = f.read()
+        data = json.loads(probe.content.decode('utf-8'))
+        header = builder(data)
+
+        if probe.fresh:
+            probe.entry["header"] = header
+            self._write_object(probe.digest, data)
+            probe.entry["has_data"] = True
+            self._dirty = True
+            return header, probe.entry
+
+        entry = self.store(probe, data, header)
+        return header, entry
+
+    def prune(self, keep_paths: Iterable[str]):
+        """Verilen dosyalar dışındaki (örn. silinmiş) kayıtları index'ten çıkarır"""
+        keep = {self._key(p) for p in keep_paths}
+        files = self.index["files"]
+        for key in [k for k in files if k not in keep and not os.path.exists(k)]:
+            del files[key]
+            self._dirty = True
+
+    # ------------------------------------------------------------------
+    # Anlık görüntüler
+    # ------------------------------------------------------------------
+
+    def load_snapshot(self, name: str, key: str) -> Optional[Any]:
+        """
+        Adlandırılmış anlık görüntüyü (örn. katalog) anahtar eşleşirse yükler.
+        Değer sadece temel tiplerden oluşur (bkz. save_snapshot).
+        """
+        try:
+            stored_key, value = _read(self.cache_dir / f"{name}{SUFFIX}")
+        except LOAD_ERRORS:
+            return None
+        return value if stored_key == key else None
+
+    def save_snapshot(self, name: str, key: str, value: Any):
+        """
+        Anlık görüntüyü atomik olarak yazar (aynı adlı önceki görüntünün yerine).
+
+        Raises:
+            ValueError: Değer marshal ile yazılamayan bir nesne içeriyorsa
+        """
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        _write(self.cache_dir / f"{name}{SUFFIX}", (key, value))
+
+    # ------------------------------------------------------------------
+    # Modüller arası sonuçlar
+    # ------------------------------------------------------------------
+
+    def cross_key(self, digests: Dict[str, str]) -> str:
+        """Modül adı -> içerik hash'i eşlemesinden modüller arası anahtar üretir"""
+        h = hashlib.sha256(self.fingerprint.encode('utf-8'))
+        for name in sorted(digests):
+            h.update(f"\0{name}\0{digests[name]}".encode('utf-8'))
+        return h.hexdigest()
+
+    def get_cross(self, key: str) -> Optional[List[Dict]]:
+        return self.index["cross"].get(key)
+
+    def set_cross(self, key: str, value: List[Dict]):
+        # Sadece en güncel modül kümesinin sonucu tutulur
+        self.index["cross"] = {key: value}
+        self._dirty = True
@@ -0,0 +1,766 @@
+"""
+PaktLang Schema Catalog
+Modül, tablo, kolon, indeks, view, ilişki ve ERP mapping'leri üzerinde
+ters index'li (inverted index) sorgulanabilir katalog
+"""
+
+import hashlib
+import re
+from fnmatch import fnmatchcase
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from .fleet import file_digest, tenant_names
+from .rules import LEVELS
+from .schema_validator import SchemaValidator
+from .symbols import column_name
+from .type_registry import TypeRegistry
+
+
+# Katalog formatı değiştiğinde artırılır (önbellekteki anlık görüntü geçersiz olur)
+CATALOG_VERSION = 2
+
+# Önbellekteki anlık görüntüde en fazla tutulan farklı ağaç kataloğu
+SNAPSHOT_TREES = 64
+
+KINDS = ("module", "table", "column", "index", "view", "relation", "mapping")
+
+# Sorguda kabul edilen çoğul / kısa adlar
+KIND_ALIASES = {
+    "modules": "module", "tables": "table", "columns": "column", "indexes": "index",
+    "indices": "index", "views": "view", "relations": "relation", "mappings": "mapping",
+}
+
+# Metin çıktısında varlık adının yanında gösterilen alanlar
+DISPLAY_FIELDS = {
+    "module": ("version", "tables", "priority"),
+    "table": ("columns", "mapped"),
+    "column": ("type", "required", "primary_key", "unique", "references"),
+    "index": ("columns", "unique"),
+    "view": ("base_tables", "materialized"),
+    "relation": ("source", "target", "type"),
+    "mapping": ("erp_table", "fields"),
+}
+
+# Varlık alanına kopyalanmayan (ayrıca işlenen) tanım anahtarları
+_SKIP_KEYS = frozenset(("name", "pl_column", "pl_table", "columns", "indexes", "views",
+                        "tables", "foreign_key", "source", "target"))
+
+_FALSY = frozenset(("", "false", "0", "none", "null"))
+
+
+class QueryError(ValueError):
+    """Sorgu ifadesi geçersiz"""
+
+
+def _norm(value: Any) -> str:
+    """Index anahtarı: büyük/küçük harf duyarsız metin"""
+    if value is True:
+        return "true"
+    if value is False:
+        return "false"
+    if value is None:
+        return "null"
+    return str(value).casefold()
+
+
+def _number(text: str) -> Optional[float]:
+    try:
+        return float(text)
+    except ValueError:
+        return None
+
+
+def _copy_fields(entity: Dict, definition: Dict):
+    """Tanımdaki skaler ve skaler liste alanlarını varlığa kopyalar"""
+    for key, value in definition.items():
+        if key in _SKIP_KEYS or key.startswith("$") or key in entity:
+            continue
+        if isinstance(value, (str, int, float, bool)):
+            entity[key] = value
+        elif isinstance(value, list) and all(isinstance(v, (str, int, float, bool)) for v in value):
+            entity[key] = list(value)
+
+
+def _append(entity: Dict, field: str, value: Any):
+    values = entity.setdefault(field, [])
+    if value not in values:
+        values.append(value)
+
+
+class TreeCatalog:
+    """
+    Tek bir şema ağacının varlıkları ve alan bazında ters index'ler.
+
+    Her varlık düz bir sözlüktür (kind, id ve alanlar). Her alan için
+    normalize edilmiş değer -> varlık numaraları index'i tutulur; liste
+    alanlarının her elemanı ayrı ayrı index'lenir. Sorgular bu kümeler
+    üzerinde küme işlemleri olarak çalışır, varlıklar taranmaz.
+
+    Kolonların references alanı modül foreign_key tanımlarından ve
+    relations.json cross_module_relationships kayıtlarından gelir; tablo
+    ve kolonların mapped/erp_table/erp_field alanları erp_mappings.json'dan.
+    """
+
+    def __init__(self):
+        self.entities: List[Dict] = []
+        self.kinds: Dict[str, Set[int]] = {kind: set() for kind in KINDS}
+        self.index: Dict[str, Dict[str, Set[int]]] = {}
+        self.fields: Dict[str, Set[str]] = {kind: set() for kind in KINDS}
+        # Alan -> firma kodlu ERP adı şablonları (LG_{FIRMA}_ITEMS)
+        self.templates: Dict[str, List[str]] = {}
+
+    @classmethod
+    def build(cls, base_path: Path, cache=None) -> "TreeCatalog":
+        """Ağacın modül, relations, mapping ve tip dosyalarından katalog oluşturur"""
+        validator = SchemaValidator(str(base_path), cache=cache, levels=LEVELS)
+        modules, relations = validator.load_schema()
+        root = Path(base_path) / "paktlang"
+        mappings = validator._load_json(root / "mappings" / "erp_mappings.json", lambda data: None)
+        try:
+            types = TypeRegistry.load(str(root / "meta"))
+        except (OSError, ValueError):
+            types = None
+
+        catalog = cls()
+        TreeBuilder(catalog, types).build(modules, relations, mappings)
+        catalog.reindex()
+        return catalog
+
+    def snapshot(self) -> Tuple:
+        """Önbelleğe yazılabilen (sadece temel tiplerden oluşan) durum"""
+        return self.entities, self.kinds, self.index, self.fields, self.templates
+
+    @classmethod
+    def from_snapshot(cls, state: Tuple) -> "TreeCatalog":
+        """
+        Raises:
+            ValueError: Durum beklenen yapıda değilse
+        """
+        try:
+            entities, kinds, index, fields, templates = state
+        except (TypeError, ValueError):
+            raise ValueError("Geçersiz katalog görüntüsü")
+        if not (isinstance(entities, list) and isinstance(kinds, dict) and isinstance(index, dict)
+                and isinstance(fields, dict) and isinstance(templates, dict)):
+            raise ValueError("Geçersiz katalog görüntüsü")
+        catalog = cls()
+        catalog.entities = entities
+        catalog.kinds = kinds
+        catalog.index = index
+        catalog.fields = fields
+        catalog.templates = templates
+        return catalog
+
+    def add(self, kind: str, entity_id: str, entity: Dict) -> int:
+        """Varlığı ekler (alanları reindex() ile index'lenir); varlık numarasını döner"""
+        number = len(self.entities)
+        entity["kind"] = kind
+        entity["id"] = entity_id
+        self.entities.append(entity)
+        self.kinds[kind].add(number)
+        return number
+
+    def reindex(self):
+        """Tüm alan index'lerini varlıklardan yeniden oluşturur"""
+        self.index = {}
+        self.fields = {kind: set() for kind in KINDS}
+        self.templates = {}
+        for number, entity in enumerate(self.entities):
+            fields = self.fields[entity["kind"]]
+            for field, value in entity.items():
+                fields.add(field)
+                values = self.index.setdefault(field, {})
+                if isinstance(value, list):
+                    for item in value:
+                        values.setdefault(_norm(item), set()).add(number)
+                else:
+                    values.setdefault(_norm(value), set()).add(number)
+        for field, values in self.index.items():
+            templates = [k for k in values if "{firma}" in k]
+            if templates:
+                self.templates[field] = templates
+
+    # ------------------------------------------------------------------
+    # Index erişimi
+    # ------------------------------------------------------------------
+
+    def lookup(self, field: str, op: str, value: str) -> Set[int]:
+        """Tek bir alan koşulunun varlık kümesi (index üzerinden)"""
+        values = self.index.get(field)
+        if not values:
+            return set()
+        key = value.casefold()
+
+        if op in ("=", "!="):
+            if any(c in key for c in "*?["):
+                matched = _union(ids for k, ids in values.items() if fnmatchcase(k, key))
+            else:
+                matched = set(values.get(key, ()))
+                # Firma kodlu ERP adları (LG_{FIRMA}_ITEMS <- LG_001_ITEMS)
+                for template in self.templates.get(field, ()):
+                    if _template_match(template, key):
+                        matched |= values[template]
+            if op == "!=":
+                return self._having(field) - matched
+            return matched
+
+        if op == "~":
+            return _union(ids for k, ids in values.items() if key in k)
+
+        number = _number(key)
+        if number is None:
+            raise QueryError(f"Sayı bekleniyor: {field} {op} {value}")
+        compare = _COMPARE[op]
+        return _union(ids for k, ids in values.items()
+                      if _number(k) is not None and compare(_number(k), number))
+
+    def truthy(self, field: str) -> Set[int]:
+        """Alanı olan ve değeri boş/false olmayan varlıklar (örn. "required")"""
+        values = self.index.get(field, {})
+        return _union(ids for k, ids in values.items() if k not in _FALSY)
+
+    def _having(self, field: str) -> Set[int]:
+        return _union(self.index.get(field, {}).values())
+
+    def universe(self, kinds: Optional[Set[str]] = None) -> Set[int]:
+        if kinds is None:
+            return set(range(len(self.entities)))
+        return _union(self.kinds[k] for k in kinds)
+
+
+class Catalog:
+    """
+    Bir veya birçok (müşteri) şema ağacının sorgulanabilir kataloğu.
+
+    Aynı içerikli ağaçlar (modül, relations, mapping ve tip dosyalarının
+    hash'leri aynı) tek bir TreeCatalog'u paylaşır; sorgu her farklı ağaç
+    için bir kez çalışır ve sonuç o ağaca sahip tüm müşterilere açılır.
+    Önbellek verilirse ağaç katalogları içerik anahtarlarıyla saklanır;
+    değişmeyen ağaçlar ayrıştırılmadan yüklenir.
+    """
+
+    def __init__(self, tenants: List[Tuple[Optional[str], TreeCatalog]]):
+        """
+        Args:
+            tenants: (müşteri adı veya tek ağaçta None, ağaç kataloğu) çiftleri
+        """
+        self.tenants = tenants
+
+    @classmethod
+    def load(cls, base_paths: Iterable[str], cache=None) -> "Catalog":
+        """
+        Args:
+            base_paths: Şema ağaçlarının ana dizinleri; birden fazlaysa
+                varlıklar tenant alanı ve "tenant:" önekli kimlikle ayrılır
+        """
+        base_paths = [Path(p) for p in base_paths]
+        names = tenant_names(base_paths) if len(base_paths) > 1 else [None]
+
+        stored = {}
+        if cache is not None:
+            stored = cache.load_snapshot("catalog", f"v{CATALOG_VERSION}") or {}
+
+        if not isinstance(stored, dict):
+            stored = {}
+
+        trees: Dict[str, TreeCatalog] = {}
+        tenants = []
+        for name, base_path in zip(names, base_paths):
+            key = cls._tree_key(base_path, cache)
+            tree = trees.get(key)
+            if tree is None and key in stored:
+                try:
+                    tree = TreeCatalog.from_snapshot(stored[key])
+                except ValueError:
+                    del stored[key]
+            if tree is None:
+                tree = TreeCatalog.build(base_path, cache)
+            trees[key] = tree
+            tenants.append((name, tree))
+
+        if cache is not None:
+            if not set(trees) <= set(stored):
+                # Önceki ağaçlar da (sınır dahilinde) tutulur: farklı ağaç kümeleriyle
+                # sırayla yapılan sorgular birbirinin görüntüsünü silmesin
+                merged = {key: tree.snapshot() for key, tree in trees.items()}
+                for key, state in stored.items():
+                    if len(merged) >= SNAPSHOT_TREES:
+                        break
+                    merged.setdefault(key, state)
+                cache.save_snapshot("catalog", f"v{CATALOG_VERSION}", merged)
+            cache.save()
+        return cls(tenants)
+
+    @staticmethod
+    def _tree_key(base_path: Path, cache=None) -> str:
+        """Ağacın katalogla ilgili dosyalarının içerik anahtarı"""
+        root = base_path / "paktlang"
+        files = sorted((root / "modules" / "core").glob("*.json"))
+        files += [root / "relations" / "relations.json", root / "mappings" / "erp_mappings.json",
+                  root / "meta" / "base_types.json", root / "meta" / "erp_types.json"]
+
+        h = hashlib.sha256()
+        for file_path in files:
+            try:
+                if cache is None:
+                    digest = file_digest(file_path)
+                else:
+                    probe = cache.probe(str(file_path))
+                    if not probe.fresh:
+                        # Paylaşılan ağaçların dosyaları bir sonraki çalıştırmada tekrar hash'lenmesin
+                        cache.store(probe, None)
+                    digest = probe.digest
+            except OSError:
+                digest = "-"
+            h.update(f"\0{file_path.relative_to(root)}\0{digest}".encode('utf-8'))
+        return h.hexdigest()
+
+    @property
+    def trees(self) -> int:
+        """Farklı ağaç kataloğu sayısı"""
+        return len({id(tree) for _, tree in self.tenants})
+
+    def query(self, text: str) -> List[Dict]:
+        """
+        Sorguyu çalıştırır; eşleşen varlıkları müşteri ve ekleniş sırasıyla döner.
+
+        Raises:
+            QueryError: Sorgu geçersizse
+        """
+        query = Query(text)
+        known = set().union(*(tree.index for _, tree in self.tenants)) | {"tenant"}
+        unknown = sorted(query.fields - known)
+        if unknown:
+            fields = sorted(set().union(*(f for k, f in self.describe().items()
+                                          if query.kinds is None or k in query.kinds)))
+            raise QueryError(f"Bilinmeyen alan: {', '.join(unknown)} (alanlar: {', '.join(fields)})")
+
+        results = []
+        shared: Dict[int, List[int]] = {}
+        for tenant, tree in self.tenants:
+            if "tenant" in query.fields:
+                numbers = sorted(query.evaluate(tree, tenant))
+            else:
+                numbers = shared.get(id(tree))
+                if numbers is None:
+                    numbers = shared[id(tree)] = sorted(query.evaluate(tree, tenant))
+            for number in numbers:
+                entity = tree.entities[number]
+                if tenant is not None:
+                    entity = dict(kind=entity["kind"], id=f"{tenant}:{entity['id']}", tenant=tenant,
+                                  **{k: v for k, v in entity.items() if k not in ("kind", "id")})
+                results.append(entity)
+        return results
+
+    def describe(self) -> Dict[str, List[str]]:
+        """Varlık türü -> alan adları"""
+        fields: Dict[str, Set[str]] = {kind: set() for kind in KINDS}
+        for tenant, tree in self.tenants:
+            for kind, names in tree.fields.items():
+                fields[kind] |= names
+                if tenant is not None and names:
+                    fields[kind].add("tenant")
+        return {kind: sorted(names - {"kind", "id"}) for kind, names in fields.items() if names}
+
+    def counts(self) -> Dict[str, int]:
+        counts = {kind: 0 for kind in KINDS}
+        for _, tree in self.tenants:
+            for kind, ids in tree.kinds.items():
+                counts[kind] += len(ids)
+        return counts
+
+
+def _union(sets: Iterable[Set[int]]) -> Set[int]:
+    result: Set[int] = set()
+    for ids in sets:
+        result |= ids
+    return result
+
+
+def _template_match(template: str, key: str) -> bool:
+    pattern = re.escape(template).replace(r"\{firma\}", r"\d+")
+    return re.fullmatch(pattern, key) is not None
+
+
+_COMPARE = {
+    "<": lambda a, b: a < b,
+    "<=": lambda a, b: a <= b,
+    ">": lambda a, b: a > b,
+    ">=": lambda a, b: a >= b,
+}
+
+
+class TreeBuilder:
+    """Tek bir şema ağacının varlıklarını kataloğa ekler"""
+
+    def __init__(self, catalog: TreeCatalog, types: Optional[TypeRegistry]):
+        self.catalog = catalog
+        self.types = types
+        self.tables: Dict[Tuple[str, str], Dict] = {}
+        self.table_modules: Dict[str, str] = {}
+        self.columns: Dict[Tuple[str, str, str], Dict] = {}
+
+    def _add(self, kind: str, entity: Dict, *parts: str) -> Dict:
+        self.catalog.add(kind, ".".join(parts), entity)
+        return entity
+
+    def build(self, modules: Dict[str, Dict], relations: Optional[Dict], mappings: Optional[Dict]):
+        for module_key, data in modules.items():
+            self._module(module_key, data)
+        for module_key, data in modules.items():
+            self._foreign_keys(module_key, data)
+        if isinstance(relations, dict):
+            self._relations(relations)
+        if isinstance(mappings, dict):
+            self._mappings(mappings)
+
+    def _table(self, module_key: str, table_name: str) -> Optional[Dict]:
+        table = self.tables.get((module_key, table_name))
+        if table is None and table_name in self.table_modules:
+            table = self.tables[(self.table_modules[table_name], table_name)]
+        return table
+
+    def _module(self, module_key: str, data: Dict):
+        module = {"name": data.get("module") or module_key, "module": module_key,
+                  "tables": len(data.get("tables", [])), "views": len(data.get("views", []))}
+        _copy_fields(module, data)
+        self._add("module", module, module_key)
+
+        for table in data.get("tables", []):
+            table_name = table.get("pl_table")
+            if not table_name:
+                continue
+            entity = {"name": table_name, "module": module_key, "table": table_name,
+                      "columns": len(table.get("columns", [])),
+                      "indexes": len(table.get("indexes", []))}
+            _copy_fields(entity, table)
+            self._add("table", entity, module_key, table_name)
+            self.tables.setdefault((module_key, table_name), entity)
+            self.table_modules.setdefault(table_name, module_key)
+
+            for column in table.get("columns", []):
+                name = column_name(column)
+                if not name:
+                    continue
+                col = {"name": name, "module": module_key, "table": table_name}
+                _copy_fields(col, column)
+                if self.types is not None and isinstance(column.get("type"), str):
+                    base = self.types.base_of(column["type"])
+                    if base is not None:
+                        col["base"] = base
+                self._add("column", col, module_key, table_name, name)
+                self.columns.setdefault((module_key, table_name, name), col)
+
+            for index in table.get("indexes", []):
+                if not isinstance(index, dict) or not index.get("name"):
+                    continue
+                entity = {"name": index["name"], "module": module_key, "table": table_name,
+                          "columns": [c for c in index.get("columns", []) if isinstance(c, str)]}
+                _copy_fields(entity, index)
+                self._add("index", entity, module_key, table_name, index["name"])
+
+        for view in data.get("views", []):
+            if not isinstance(view, dict) or not view.get("name"):
+                continue
+            entity = {"name": view["name"], "module": module_key,
+                      "columns": len(view.get("columns", [])),
+                      "sources": [c["source"] for c in view.get("columns", [])
+                                  if isinstance(c, dict) and isinstance(c.get("source"), str)]}
+            _copy_fields(entity, view)
+            self._add("view", entity, module_key, view["name"])
+
+    def _reference(self, source: Tuple[str, str, str], target_module: str,
+                   target_table: str, target_column: Optional[str]):
+        """Kaynak kolon/tablodan hedef tablo/kolona referans ekler"""
+        table = self._table(source[0], source[1])
+        column = self.columns.get((table["module"], source[1], source[2])) if table is not None else None
+        target = self._table(target_module, target_table)
+        targets = [target_table]
+        if target_column:
+            targets.append(f"{target_table}.{target_column}")
+
+        for ref in targets:
+            if column is not None:
+                _append(column, "references", ref)
+            if table is not None:
+                _append(table, "references", ref)
+        if target is not None:
+            _append(target, "referenced_by", source[1])
+            if target_column:
+                target_col = self.columns.get((target["module"], target_table, target_column))
+                if target_col is not None:
+                    _append(target_col, "referenced_by", f"{source[1]}.{source[2]}")
+
+    def _foreign_keys(self, module_key: str, data: Dict):
+        for table in data.get("tables", []):
+            table_name = table.get("pl_table")
+            for column in table.get("columns", []):
+                fk = column.get("foreign_key")
+                if not isinstance(fk, dict) or not fk.get("table"):
+                    continue
+                self._reference((module_key, table_name, column_name(column)),
+                                fk.get("module", module_key), fk["table"], fk.get("column"))
+
+    def _relations(self, relations: Dict):
+        for number, rel in enumerate(relations.get("cross_module_relationships", [])):
+            if not isinstance(rel, dict):
+                continue
+            src = rel.get("source") if isinstance(rel.get("source"), dict) else {}
+            dst = rel.get("target") if isinstance(rel.get("target"), dict) else {}
+            rel_id = rel.get("id") or f"relation_{number}"
+            entity = {
+                "name": rel_id,
+                "module": src.get("module"),
+                "table": src.get("table"),
+                "source": f"{src.get('table')}.{src.get('column')}",
+                "target": f"{dst.get('table')}.{dst.get('column')}",
+                "source_module": src.get("module"),
+                "target_module": dst.get("module"),
+                "target_table": dst.get("table"),
+            }
+            _copy_fields(entity, rel)
+            self._add("relation", {k: v for k, v in entity.items() if v is not None}, rel_id)
+            if src.get("table") and dst.get("table"):
+                self._reference((src.get("module"), src["table"], src.get("column")),
+                                dst.get("module"), dst["table"], dst.get("column"))
+
+    def _mappings(self, mappings: Dict):
+        systems = mappings.get("mapping_info", {}).get("supported_erp_systems", [])
+        for erp in systems:
+            system = mappings.get(erp)
+            if not isinstance(system, dict) or not isinstance(system.get("modules"), dict):
+                continue
+            for module_key, tables in system["modules"].items():
+                for table_name, mapping in tables.items():
+                    if not isinstance(mapping, dict):
+                        continue
+                    self._mapping(erp, module_key, table_name, mapping)
+
+    def _mapping(self, erp: str, module_key: str, table_name: str, mapping: Dict):
+        fields = dict(mapping.get("field_mappings", {}))
+        for field, special in mapping.get("special_fields", {}).items():
+            if isinstance(special, dict) and special.get("erp_field"):
+                fields[field] = special["erp_field"]
+        erp_table = mapping.get("erp_table")
+
+        entity = {"name": table_name, "erp": erp, "module": module_key, "table": table_name,
+                  "fields": len(fields), "field": list(fields),
+                  "erp_field": [f for f in fields.values() if isinstance(f, str)]}
+        if erp_table:
+            entity["erp_table"] = erp_table
+        self._add("mapping", entity, erp, module_key, table_name)
+
+        table = self._table(module_key, table_name)
+        if table is None:
+            return
+        _append(table, "mapped", erp)
+        if erp_table:
+            _append(table, "erp_table", erp_table)
+        for field, erp_field in fields.items():
+            column = self.columns.get((table["module"], table_name, field))
+            if column is not None and isinstance(erp_field, str):
+                _append(column, "mapped", erp)
+                _append(column, "erp_field", erp_field)
+
+
+class Query:
+    """
+    Filtre dili:
+
+        sorgu   := [tür] [ifade]
+        ifade   := ve ("or" ve)*
+        ve      := değil (["and"] değil)*
+        değil   := ("not" | "!") değil | "(" ifade ")" | koşul
+        koşul   := alan [op değer]
+        op      := = != ~ < <= > >=
+
+    Tür: module, table, column, index, view, relation, mapping (çoğulları da).
+    Sadece alan adı yazılırsa değeri boş/false olmayanlar seçilir
+    ("required"). = değerinde * ve ? joker karakterdir; ~ içerir demektir.
+    Karşılaştırmalar büyük/küçük harf duyarsızdır.
+
+    Örnekler:
+        column type=currency not required
+        column references=cari_kart.id
+        table mapped=logo
+        table columns>30 or (audit and not is_master)
+
+    Sorgu bir kez ayrıştırılır (tuple düğümlerden ağaç) ve her ağaç
+    kataloğunda ayrı değerlendirilir.
+    """
+
+    _TOKEN = re.compile(r"""\s*(?:(\(|\)|!=|<=|>=|=|~|<|>|!)|"((?:[^"\\]|\\.)*)"|'([^']*)'|([^\s()=!<>~"']+))""")
+    _OPS = ("=", "!=", "~", "<", "<=", ">", ">=")
+
+    def __init__(self, text: str):
+        """
+        Raises:
+            QueryError: Sorgu sözdizimi geçersizse
+        """
+        self.text = text
+        self.kinds: Optional[Set[str]] = None
+        self.fields: Set[str] = set()
+        self._tokens = self._tokenize(text)
+        self._pos = 0
+        self.root = self._parse()
+
+    @classmethod
+    def _tokenize(cls, text: str) -> List[Tuple[str, str]]:
+        """("op" | "word" | "string", değer) çiftleri"""
+        tokens = []
+        pos = 0
+        text = text.rstrip()
+        while pos < len(text):
+            m = cls._TOKEN.match(text, pos)
+            if m is None or m.end() == pos:
+                raise QueryError(f"Geçersiz karakter: {text[pos:].strip()[:1]!r} (konum {pos + 1})")
+            op, dquoted, squoted, word = m.groups()
+            if op is not None:
+                tokens.append(("op", op))
+            elif dquoted is not None:
+                tokens.append(("string", re.sub(r"\\(.)", r"\1", dquoted)))
+            elif squoted is not None:
+                tokens.append(("string", squoted))
+            else:
+                tokens.append(("word", word))
+            pos = m.end()
+        return tokens
+
+    # ------------------------------------------------------------------
+    # Ayrıştırma
+    # ------------------------------------------------------------------
+
+    def _peek(self) -> Optional[Tuple[str, str]]:
+        return self._tokens[self._pos] if self._pos < len(self._tokens) else None
+
+    def _next(self) -> Tuple[str, str]:
+        token = self._peek()
+        if token is None:
+            raise QueryError("Sorgu beklenmedik şekilde bitti")
+        self._pos += 1
+        return token
+
+    def _is(self, kind: str, value: str = None) -> bool:
+        token = self._peek()
+        return token is not None and token[0] == kind and (value is None or token[1].lower() == value)
+
+    def _parse(self) -> Optional[Tuple]:
+        token = self._peek()
+        following = self._tokens[1] if len(self._tokens) > 1 else None
+        if token is not None and token[0] == "word" and not (following and following[0] == "op"
+                                                             and following[1] in self._OPS):
+            kind = KIND_ALIASES.get(token[1].lower(), token[1].lower())
+            if kind in KINDS:
+                self.kinds = {kind}
+                self._pos += 1
+
+        if self._peek() is None:
+            return None
+        root = self._or()
+        if self._peek() is not None:
+            raise QueryError(f"Beklenmeyen ifade: {self._peek()[1]}")
+        return root
+
+    def _or(self) -> Tuple:
+        node = self._and()
+        while self._is("word", "or"):
+            self._pos += 1
+            node = ("or", node, self._and())
+        return node
+
+    def _and(self) -> Tuple:
+        node = self._not()
+        while self._peek() is not None and not self._is("op", ")") and not self._is("word", "or"):
+            if self._is("word", "and"):
+                self._pos += 1
+            node = ("and", node, self._not())
+        return node
+
+    def _not(self) -> Tuple:
+        if self._is("word", "not") or self._is("op", "!"):
+            self._pos += 1
+            return ("not", self._not())
+        if self._is("op", "("):
+            self._pos += 1
+            node = self._or()
+            if not self._is("op", ")"):
+                raise QueryError("Kapanmamış parantez")
+            self._pos += 1
+            return node
+        return self._condition()
+
+    def _condition(self) -> Tuple:
+        kind, field = self._next()
+        if kind != "word":
+            raise QueryError(f"Alan adı bekleniyor: {field}")
+        self.fields.add(field)
+
+        token = self._peek()
+        if token is None or token[0] != "op" or token[1] not in self._OPS:
+            return ("flag", field)
+        self._pos += 1
+        value_kind, value = self._next()
+        if value_kind == "op":
+            raise QueryError(f"Değer bekleniyor: {field} {token[1]}")
+        if token[1] in ("<", "<=", ">", ">=") and _number(value) is None:
+            raise QueryError(f"Sayı bekleniyor: {field} {token[1]} {value}")
+        return ("cond", field, token[1], value)
+
+    # ------------------------------------------------------------------
+    # Değerlendirme
+    # ------------------------------------------------------------------
+
+    def evaluate(self, tree: TreeCatalog, tenant: str = None) -> Set[int]:
+        """Sorguya uyan varlık numaraları"""
+        universe = tree.universe(self.kinds)
+        if self.root is None:
+            return universe
+        return self._evaluate(self.root, tree, tenant, universe) & universe
+
+    def _evaluate(self, node: Tuple, tree: TreeCatalog, tenant: Optional[str],
+                  universe: Set[int]) -> Set[int]:
+        op = node[0]
+        if op == "and":
+            left = self._evaluate(node[1], tree, tenant, universe)
+            return left & self._evaluate(node[2], tree, tenant, universe) if left else left
+        if op == "or":
+            return self._evaluate(node[1], tree, tenant, universe) | self._evaluate(node[2], tree, tenant, universe)
+        if op == "not":
+            return universe - self._evaluate(node[1], tree, tenant, universe)
+        if node[1] == "tenant":
+            return universe if self._tenant_matches(node, tenant) else set()
+        if op == "flag":
+            return tree.truthy(node[1])
+        return tree.lookup(node[1], node[2], node[3])
+
+    @staticmethod
+    def _tenant_matches(node: Tuple, tenant: Optional[str]) -> bool:
+        if tenant is None:
+            return False
+        if node[0] == "flag":
+            return True
+        _, _, op, value = node
+        name, value = tenant.casefold(), value.casefold()
+        if op in ("=", "!="):
+            matched = fnmatchcase(name, value)
+            return matched if op == "=" else not matched
+        if op == "~":
+            return value in name
+        return False
+
+
+def format_entity(entity: Dict, fields: Optional[List[str]] = None) -> str:
+    """Varlığın tek satırlık metin gösterimi"""
+    parts = [f"{entity['kind']:8} {entity['id']}"]
+    for field in fields or DISPLAY_FIELDS.get(entity["kind"], ()):
+        value = entity.get(field)
+        if value is None or value is False or value == []:
+            continue
+        if value is True:
+            parts.append(field)
+        elif isinstance(value, list):
+            parts.append(f"{field}={','.join(str(v) for v in value)}")
+        else:
+            parts.append(f"{field}={value}")
+    return "  ".join(parts)
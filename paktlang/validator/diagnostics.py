@@ -0,0 +1,259 @@
+"""
+PaktLang Diagnostics
+Doğrulama bulgularının akış halinde çıktıya yazılması (rapor, NDJSON, SARIF)
+
+SchemaValidator.iter_validation() bulguları modül modül, hazır oldukça
+üretir; run_diagnostics() bu olayları bir sink'e aktarır ve --max-errors /
+--fail-fast sınırlarını uygular. Sınıra ulaşılınca üretici kapatılır, kalan
+modüller doğrulanmaz:
+
+    sink = NDJSONSink(sys.stdout, base_path)
+    summary = run_diagnostics(validator.iter_validation(), sink, max_errors=100)
+
+Akış sink'leri bulguları saklamaz; bellek kullanımı bulgu sayısından
+bağımsızdır. ReportSink validate_all() ile aynı yapıda tam rapor toplar.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Dict, Iterable, Optional, TextIO, Tuple
+
+SARIF_SCHEMA = "https://json.schemastore.org/sarif-2.1.0.json"
+SARIF_VERSION = "2.1.0"
+
+
+class DiagnosticSink:
+    """Bulgu alıcısı; alt sınıflar ihtiyaç duydukları olayları uygular"""
+
+    def begin(self):
+        pass
+
+    def module(self, name: str, valid: bool, file: Optional[str], errors: int, warnings: int):
+        """Modül sonucu; ardından bu modülün bulguları (önce hatalar) gelir"""
+
+    def issue(self, issue: Dict, module: Optional[str], file: Optional[str]):
+        """Tek bulgu; modüller arası bulgularda module None'dır"""
+
+    def end(self, summary: Dict):
+        pass
+
+
+class ReportSink(DiagnosticSink):
+    """validate_all() raporunu toplar (bulgular bellekte tutulur)"""
+
+    def __init__(self):
+        self.result = {"valid": True, "modules": {}, "errors": [], "warnings": [], "summary": {}}
+        self._current: Optional[Dict] = None
+
+    def module(self, name, valid, file, errors, warnings):
+        self._current = {"valid": valid, "errors": [], "warnings": []}
+        self.result["modules"][name] = self._current
+        if not valid:
+            self.result["valid"] = False
+
+    def issue(self, issue, module, file):
+        error = issue.get("severity", "error") == "error"
+        if module is not None:
+            current = self._current
+            current["errors" if error else "warnings"].append(issue)
+            # Geçerli sayılan modülün hataları genel listeye girmez (validate_all ile aynı)
+            if error and current["valid"]:
+                return
+        elif error:
+            self.result["valid"] = False
+        self.result["errors" if error else "warnings"].append(issue)
+
+    def end(self, summary):
+        result = self.result
+        result["summary"] = {
+            "total_modules": len(result["modules"]),
+            "valid_modules": sum(1 for m in result["modules"].values() if m["valid"]),
+            "total_errors": len(result["errors"]),
+            "total_warnings": len(result["warnings"])
+        }
+        if summary.get("stopped"):
+            result["valid"] = False
+            result["stopped"] = summary["stopped"]
+
+
+class _Paths:
+    """Dosya yollarını base_path'e göreli, '/' ayırıcılı yapar (CI ek açıklamaları için)"""
+
+    def __init__(self, base_path: Optional[str]):
+        self.base_path = Path(base_path) if base_path else None
+        self._cache: Dict[str, Optional[str]] = {}
+
+    def __call__(self, file: Optional[str]) -> Optional[str]:
+        if not file:
+            return None
+        relative = self._cache.get(file)
+        if relative is None:
+            relative = Path(file).as_posix()
+            if self.base_path is not None:
+                try:
+                    relative = Path(os.path.relpath(file, self.base_path)).as_posix()
+                except ValueError:
+                    pass
+            self._cache[file] = relative
+        return relative
+
+
+class NDJSONSink(DiagnosticSink):
+    """
+    Satır başına bir JSON kaydı:
+        {"type": "module", ...}, {"type": "issue", ...}, ..., {"type": "summary", ...}
+    Çıktı her modülden sonra flush edilir.
+    """
+
+    def __init__(self, stream: TextIO, base_path: str = None):
+        self.stream = stream
+        self.relative = _Paths(base_path)
+
+    def _write(self, record: Dict):
+        self.stream.write(json.dumps(record, ensure_ascii=False))
+        self.stream.write("\n")
+
+    def module(self, name, valid, file, errors, warnings):
+        self.stream.flush()
+        self._write({"type": "module", "module": name, "valid": valid,
+                     "file": self.relative(file), "errors": errors, "warnings": warnings})
+
+    def issue(self, issue, module, file):
+        record = {"type": "issue", "module": module, "file": self.relative(file)}
+        record.update(issue)
+        self._write(record)
+
+    def end(self, summary):
+        self._write({"type": "summary", **summary})
+        self.stream.flush()
+
+
+class SARIFSink(DiagnosticSink):
+    """
+    SARIF 2.1.0 log'u; results dizisi bulgular geldikçe yazılır, çalıştırma
+    özeti (invocations) en sonda kapatılır.
+    """
+
+    def __init__(self, stream: TextIO, base_path: str = None, rules: Dict[str, str] = None):
+        """
+        Args:
+            base_path: Dosya URI'lerinin göreli olduğu kök (SRCROOT)
+            rules: Kural kodu -> açıklama (tool.driver.rules)
+        """
+        self.stream = stream
+        self.base_path = Path(base_path) if base_path else None
+        self.relative = _Paths(base_path)
+        self.rules = rules or {}
+        self._first = True
+
+    def begin(self):
+        driver = {
+            "name": "paktlang",
+            "rules": [{"id": code, "shortDescription": {"text": text}}
+                      for code, text in sorted(self.rules.items())]
+        }
+        head = json.dumps({"tool": {"driver": driver}}, ensure_ascii=False)
+        # Run nesnesi açık bırakılır: results dizisi akış halinde eklenir
+        self.stream.write(f'{{"$schema": "{SARIF_SCHEMA}", "version": "{SARIF_VERSION}", "runs": [')
+        self.stream.write(head[:-1] + ', "results": [\n')
+
+    def module(self, name, valid, file, errors, warnings):
+        self.stream.flush()
+
+    def issue(self, issue, module, file):
+        location: Dict = {"logicalLocations": [{"fullyQualifiedName": issue.get("path", "")}]}
+        uri = self.relative(file)
+        if uri:
+            physical: Dict = {"artifactLocation": {"uri": uri}}
+            if self.base_path is not None and not Path(uri).is_absolute():
+                physical["artifactLocation"]["uriBaseId"] = "SRCROOT"
+            if issue.get("line") is not None:
+                physical["region"] = {"startLine": issue["line"], "startColumn": issue.get("column") or 1}
+            location["physicalLocation"] = physical
+        result = {
+            "ruleId": issue["code"],
+            "level": "error" if issue.get("severity", "error") == "error" else "warning",
+            "message": {"text": issue["message"]},
+            "locations": [location]
+        }
+        if not self._first:
+            self.stream.write(",\n")
+        self._first = False
+        self.stream.write(json.dumps(result, ensure_ascii=False))
+
+    def end(self, summary):
+        # Sınır nedeniyle erken durmak araç hatası değildir
+        invocation = {"executionSuccessful": True, "properties": summary}
+        tail = {"invocations": [invocation]}
+        if self.base_path is not None:
+            tail["originalUriBaseIds"] = {"SRCROOT": {"uri": self.base_path.resolve().as_uri() + "/"}}
+        self.stream.write("\n], " + json.dumps(tail, ensure_ascii=False)[1:] + "]}\n")
+        self.stream.flush()
+
+
+def run_diagnostics(events: Iterable[Tuple], sink: DiagnosticSink, max_errors: int = None,
+                    fail_fast: bool = False) -> Dict:
+    """
+    Doğrulama olaylarını sink'e aktarır.
+
+    Args:
+        events: SchemaValidator.iter_validation() olayları
+        max_errors: Bu kadar hata yazıldıktan sonra durulur
+        fail_fast: Hata içeren ilk modülün bulguları veya ilk modüller
+            arası hata yazıldıktan sonra durulur
+
+    Returns:
+        Özet: valid, total_modules, valid_modules, total_errors,
+        total_warnings; erken durulduysa stopped ("max_errors"/"fail_fast")
+    """
+    summary = {"valid": True, "total_modules": 0, "valid_modules": 0,
+               "total_errors": 0, "total_warnings": 0}
+    stopped = None
+    events = iter(events)
+    sink.begin()
+
+    def emit(issue: Dict, module: Optional[str], file: Optional[str]) -> bool:
+        """Bulguyu yazar; hata sınırına ulaşıldıysa True"""
+        sink.issue(issue, module, file)
+        if issue.get("severity", "error") != "error":
+            summary["total_warnings"] += 1
+            return False
+        summary["total_errors"] += 1
+        return max_errors is not None and summary["total_errors"] >= max_errors
+
+    try:
+        for event in events:
+            errors_before = summary["total_errors"]
+            if event[0] == "module":
+                _, name, outcome, file = event
+                summary["total_modules"] += 1
+                if outcome["valid"]:
+                    summary["valid_modules"] += 1
+                else:
+                    summary["valid"] = False
+                sink.module(name, outcome["valid"], file, len(outcome["errors"]), len(outcome["warnings"]))
+                for issue in outcome["errors"] + outcome["warnings"]:
+                    if emit(issue, name, file):
+                        stopped = "max_errors"
+                        break
+            else:
+                _, issue, file = event
+                if issue.get("severity", "error") == "error":
+                    summary["valid"] = False
+                if emit(issue, None, file):
+                    stopped = "max_errors"
+            if stopped is None and fail_fast and summary["total_errors"] > errors_before:
+                stopped = "fail_fast"
+            if stopped is not None:
+                break
+    finally:
+        close = getattr(events, "close", None)
+        if close is not None:
+            close()
+
+    if stopped is not None:
+        summary["valid"] = False
+        summary["stopped"] = stopped
+    sink.end(summary)
+    return summary
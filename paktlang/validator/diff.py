@@ -0,0 +1,728 @@
+"""
+PaktLang Schema Diff
+Yapısal (Merkle) hash'ler, şema değişikliği sınıflandırması ve göç (migration) planı
+"""
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from .graph import table_load_order
+from .symbols import column_name
+from .type_registry import TypeRegistry
+
+
+# Değişikliğin mevcut veriye maliyeti (artan sırada)
+COST_METADATA = "metadata"   # sadece katalog / tanım değişikliği
+COST_SCAN = "scan"           # tablo okunur (index oluşturma, kısıt doğrulama), yeniden yazılmaz
+COST_REWRITE = "rewrite"     # tablo yeniden yazılır (tip dönüşümü, PK değişikliği, doldurma)
+COSTS = (COST_METADATA, COST_SCAN, COST_REWRITE)
+
+# Göç planı fazları (uygulama sırası)
+PHASES = (
+    "drop_views", "drop_constraints", "create_tables", "rename", "alter_columns",
+    "create_indexes", "add_constraints", "drop_columns", "drop_tables", "create_views",
+)
+
+# Kolon adı anahtarları (yapısal hash'e girmez; ad ayrıca hash'lenir)
+_NAME_KEYS = ("name", "pl_column")
+
+# Değişince mevcut verinin doğrulanması gereken kısıtlar
+_CONSTRAINT_KEYS = ("min", "max", "min_length", "pattern")
+
+# Ayrıca sınıflandırılan kolon anahtarları
+_CLASSIFIED_KEYS = frozenset((
+    "type", "values", "max_length", "precision", "scale", "required", "default",
+    "primary_key", "unique", "indexed", "foreign_key", "auto_increment",
+) + _CONSTRAINT_KEYS + _NAME_KEYS)
+
+
+def node_hash(value: Any) -> str:
+    """JSON değerinin kanonik (anahtar sırasından bağımsız) hash'i"""
+    text = json.dumps(value, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def canonical(definition: Dict) -> Dict:
+    """Boş değerli anahtarları atar ("real_name": "" ile anahtarın hiç olmaması aynı sayılır)"""
+    return {k: v for k, v in definition.items() if not _empty(v)}
+
+
+def _empty(value: Any) -> bool:
+    return value is None or (isinstance(value, (str, list, dict)) and not value)
+
+
+def combine(*parts: str) -> str:
+    """Alt düğüm hash'lerinden üst düğüm hash'i"""
+    h = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        h.update(part.encode('utf-8'))
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+# ----------------------------------------------------------------------
+# Merkle ağacı
+# ----------------------------------------------------------------------
+
+class ColumnNode:
+    """Kolon düğümü; shape adı hariç tanımın hash'idir (yeniden adlandırma tespiti)"""
+
+    __slots__ = ("name", "definition", "shape", "hash")
+
+    def __init__(self, name: str, definition: Dict):
+        self.name = name
+        self.definition = canonical(definition)
+        self.shape = node_hash({k: v for k, v in self.definition.items() if k not in _NAME_KEYS})
+        self.hash = combine(name, self.shape)
+
+
+class IndexNode:
+    __slots__ = ("name", "definition", "hash")
+
+    def __init__(self, name: str, definition: Dict):
+        self.name = name
+        self.definition = canonical(definition)
+        self.hash = node_hash(self.definition)
+
+
+class TableNode:
+    """Tablo düğümü: özellikler + sıralı kolon hash'leri + index hash'leri"""
+
+    __slots__ = ("name", "props", "props_hash", "columns", "indexes", "shape", "hash")
+
+    def __init__(self, name: str, table: Dict):
+        self.name = name
+        self.props = canonical({k: v for k, v in table.items() if k not in ("pl_table", "columns", "indexes")})
+        self.props_hash = node_hash(self.props)
+        self.columns: Dict[str, ColumnNode] = {}
+        for column in table.get("columns", []):
+            col = column_name(column)
+            if col and col not in self.columns:
+                self.columns[col] = ColumnNode(col, column)
+        self.indexes: Dict[str, IndexNode] = {}
+        for index in table.get("indexes", []):
+            if not isinstance(index, dict):
+                continue
+            key = index.get("name") or "_".join(str(c) for c in index.get("columns", []))
+            self.indexes.setdefault(key, IndexNode(key, index))
+        self.shape = combine(self.props_hash, *(c.hash for c in self.columns.values()),
+                             "indexes", *(i.hash for i in self.indexes.values()))
+        self.hash = combine(name, self.shape)
+
+
+class ModuleNode:
+    """Modül düğümü: başlık özellikleri + tablo ve view hash'leri"""
+
+    __slots__ = ("key", "data", "props", "props_hash", "tables", "views", "hash")
+
+    def __init__(self, key: str, data: Dict):
+        self.key = key
+        self.data = data
+        self.props = canonical({k: v for k, v in data.items() if k not in ("tables", "views")})
+        self.props_hash = node_hash(self.props)
+        self.tables: Dict[str, TableNode] = {}
+        for table in data.get("tables", []):
+            name = table.get("pl_table") if isinstance(table, dict) else None
+            if name and name not in self.tables:
+                self.tables[name] = TableNode(name, table)
+        self.views: Dict[str, Tuple[str, Dict]] = {}
+        for view in data.get("views", []):
+            if isinstance(view, dict) and view.get("name"):
+                self.views.setdefault(view["name"], (node_hash(canonical(view)), view))
+        self.hash = combine(self.props_hash, *(t.hash for t in self.tables.values()),
+                            "views", *(h for h, _ in self.views.values()))
+
+
+# ----------------------------------------------------------------------
+# Değişiklikler
+# ----------------------------------------------------------------------
+
+class Change:
+    """Tek bir şema değişikliği"""
+
+    __slots__ = ("kind", "module", "table", "target", "cost", "destructive", "detail", "old", "new")
+
+    def __init__(self, kind: str, module: str, table: Optional[str], target: Optional[str],
+                 cost: str, detail: str, old: Any = None, new: Any = None, destructive: bool = False):
+        self.kind = kind
+        self.module = module
+        self.table = table
+        self.target = target
+        self.cost = cost
+        self.destructive = destructive
+        self.detail = detail
+        self.old = old
+        self.new = new
+
+    @property
+    def path(self) -> str:
+        return ".".join(p for p in (self.module, self.table, self.target) if p)
+
+    def to_dict(self) -> Dict:
+        result = {"kind": self.kind, "path": self.path, "cost": self.cost, "detail": self.detail}
+        if self.destructive:
+            result["destructive"] = True
+        if self.old is not None:
+            result["old"] = self.old
+        if self.new is not None:
+            result["new"] = self.new
+        return result
+
+
+class SchemaDiff:
+    """
+    İki şema sürümü arasındaki yapısal fark.
+
+    Modüller önce dosya içerik hash'i ile karşılaştırılır (aynıysa dosya
+    ayrıştırılmaz), sonra Merkle hash'leri ile: hash'i aynı olan modül,
+    tablo, kolon ve index alt ağaçları tek karşılaştırmayla atlanır. Böylece
+    maliyet şemanın boyutuyla değil değişikliğin boyutuyla büyür.
+
+    Değişiklikler mevcut veriye maliyetine göre sınıflandırılır:
+    metadata (tanım), scan (tablo okunur: index, kısıt doğrulama) ve
+    rewrite (tablo yeniden yazılır). Veri kaybına yol açabilenler
+    destructive olarak işaretlenir.
+    """
+
+    def __init__(self, types: TypeRegistry = None):
+        self.types = types
+        self.changes: List[Change] = []
+        self.old_modules: Dict[str, Dict] = {}
+        self.new_modules: Dict[str, Dict] = {}
+        self.stats = {"modules": 0, "modules_skipped": 0, "tables": 0, "tables_skipped": 0,
+                      "columns": 0, "columns_skipped": 0}
+
+    # ------------------------------------------------------------------
+    # Girdiler
+    # ------------------------------------------------------------------
+
+    def compare_files(self, old_file: str, new_file: str, cache=None) -> List[Change]:
+        """İki modül dosyasını karşılaştırır (modül anahtarı yeni dosyanın modül adı)"""
+        old_digest, new_digest = _file_digest(old_file, cache), _file_digest(new_file, cache)
+        self.stats["modules"] += 1
+        if old_digest == new_digest:
+            self.stats["modules_skipped"] += 1
+            return self.changes
+        old_data, new_data = _load(old_file, cache), _load(new_file, cache)
+        key = new_data.get("module") or Path(new_file).stem
+        self.old_modules[key] = old_data
+        self.new_modules[key] = new_data
+        self.diff_module(ModuleNode(key, old_data), ModuleNode(key, new_data))
+        return self.changes
+
+    def compare_dirs(self, old_dir: Path, new_dir: Path, cache=None) -> List[Change]:
+        """
+        İki modül dizinini dosya adlarına göre eşleştirerek karşılaştırır.
+
+        Raises:
+            ValueError: Dizinlerden birinde modül dosyası yoksa (yanlış dizin
+                verildiğinde "0 değişiklik" raporlanmasın)
+        """
+        old_files = {p.stem: p for p in sorted(Path(old_dir).glob("*.json"))}
+        new_files = {p.stem: p for p in sorted(Path(new_dir).glob("*.json"))}
+        for directory, files in ((old_dir, old_files), (new_dir, new_files)):
+            if not files:
+                raise ValueError(f"Modül dosyası bulunamadı: {directory} "
+                                 "(şema ağacı ana dizini veya modül dizini verilmeli)")
+
+        for key in list(old_files) + [k for k in new_files if k not in old_files]:
+            self.stats["modules"] += 1
+            old_file, new_file = old_files.get(key), new_files.get(key)
+            if old_file is not None and new_file is not None \
+                    and _file_digest(old_file, cache) == _file_digest(new_file, cache):
+                self.stats["modules_skipped"] += 1
+                continue
+            old_data = _load(old_file, cache) if old_file is not None else None
+            new_data = _load(new_file, cache) if new_file is not None else None
+            if old_data is not None:
+                self.old_modules[key] = old_data
+            if new_data is not None:
+                self.new_modules[key] = new_data
+
+            if old_data is None:
+                self._module_added(ModuleNode(key, new_data))
+            elif new_data is None:
+                self._module_removed(ModuleNode(key, old_data))
+            else:
+                self.diff_module(ModuleNode(key, old_data), ModuleNode(key, new_data))
+        return self.changes
+
+    def _add(self, *args, **kwargs) -> Change:
+        change = Change(*args, **kwargs)
+        self.changes.append(change)
+        return change
+
+    # ------------------------------------------------------------------
+    # Modül ve tablo
+    # ------------------------------------------------------------------
+
+    def _module_added(self, module: ModuleNode):
+        self._add("module_added", module.key, None, None, COST_METADATA, "Yeni modül")
+        for table in module.tables.values():
+            self._add("table_added", module.key, table.name, None, COST_METADATA,
+                      f"Yeni tablo ({len(table.columns)} kolon)")
+        for name in module.views:
+            self._view_change("view_added", module.key, name, None, module.views[name][1])
+
+    def _module_removed(self, module: ModuleNode):
+        for table in module.tables.values():
+            self._add("table_removed", module.key, table.name, None, COST_METADATA,
+                      "Tablo kaldırıldı", destructive=True)
+        for name in module.views:
+            self._add("view_removed", module.key, None, name, COST_METADATA, "View kaldırıldı")
+        self._add("module_removed", module.key, None, None, COST_METADATA, "Modül kaldırıldı",
+                  destructive=True)
+
+    def diff_module(self, old: ModuleNode, new: ModuleNode):
+        if old.hash == new.hash:
+            self.stats["modules_skipped"] += 1
+            return
+        key = new.key
+
+        if old.props_hash != new.props_hash:
+            changed = sorted(k for k in set(old.props) | set(new.props)
+                             if old.props.get(k) != new.props.get(k) and not k.startswith("$"))
+            if changed:
+                self._add("module_changed", key, None, None, COST_METADATA,
+                          f"Modül özellikleri: {', '.join(changed)}",
+                          old={k: old.props.get(k) for k in changed},
+                          new={k: new.props.get(k) for k in changed})
+
+        removed = [t for name, t in old.tables.items() if name not in new.tables]
+        added = [t for name, t in new.tables.items() if name not in old.tables]
+
+        # Yeniden adlandırma: aynı yapıda (shape) kaldırılan + eklenen tablo
+        shapes = {t.shape: t for t in removed}
+        for table in list(added):
+            source = shapes.pop(table.shape, None)
+            if source is not None:
+                removed.remove(source)
+                added.remove(table)
+                self._add("table_renamed", key, table.name, None, COST_METADATA,
+                          f"Tablo yeniden adlandırıldı: {source.name} -> {table.name}",
+                          old=source.name, new=table.name)
+
+        for table in added:
+            self._add("table_added", key, table.name, None, COST_METADATA,
+                      f"Yeni tablo ({len(table.columns)} kolon)")
+        for table in removed:
+            self._add("table_removed", key, table.name, None, COST_METADATA,
+                      "Tablo kaldırıldı", destructive=True)
+
+        for name, new_table in new.tables.items():
+            old_table = old.tables.get(name)
+            if old_table is None:
+                continue
+            self.stats["tables"] += 1
+            if old_table.hash == new_table.hash:
+                self.stats["tables_skipped"] += 1
+                self.stats["columns"] += len(new_table.columns)
+                self.stats["columns_skipped"] += len(new_table.columns)
+                continue
+            self.diff_table(key, old_table, new_table)
+
+        for name in old.views.keys() | new.views.keys():
+            old_view, new_view = old.views.get(name), new.views.get(name)
+            if old_view is None:
+                self._view_change("view_added", key, name, None, new_view[1])
+            elif new_view is None:
+                self._add("view_removed", key, None, name, COST_METADATA, "View kaldırıldı")
+            elif old_view[0] != new_view[0]:
+                self._view_change("view_changed", key, name, old_view[1], new_view[1])
+
+    def _view_change(self, kind: str, module: str, name: str, old: Optional[Dict], new: Dict):
+        materialized = bool(new.get("materialized"))
+        detail = "Materialized view yeniden hesaplanır" if materialized else "View tanımı"
+        self._add(kind, module, None, name, COST_SCAN if materialized else COST_METADATA, detail)
+
+    def diff_table(self, module: str, old: TableNode, new: TableNode):
+        table = new.name
+
+        if old.props_hash != new.props_hash:
+            changed = sorted(k for k in set(old.props) | set(new.props)
+                             if old.props.get(k) != new.props.get(k))
+            self._add("table_changed", module, table, None, COST_METADATA,
+                      f"Tablo özellikleri: {', '.join(changed)}",
+                      old={k: old.props.get(k) for k in changed},
+                      new={k: new.props.get(k) for k in changed})
+
+        removed = [c for name, c in old.columns.items() if name not in new.columns]
+        added = [c for name, c in new.columns.items() if name not in old.columns]
+        shapes = {c.shape: c for c in removed}
+        for column in list(added):
+            source = shapes.pop(column.shape, None)
+            if source is not None:
+                removed.remove(source)
+                added.remove(column)
+                self._add("column_renamed", module, table, column.name, COST_METADATA,
+                          f"Kolon yeniden adlandırıldı: {source.name} -> {column.name}",
+                          old=source.name, new=column.name)
+
+        for column in added:
+            definition = column.definition
+            if definition.get("primary_key"):
+                cost, detail = COST_REWRITE, "Yeni primary key kolonu"
+            elif definition.get("required") and "default" not in definition \
+                    and not definition.get("auto_increment"):
+                cost, detail = COST_REWRITE, "Zorunlu ve varsayılansız kolon: mevcut satırlar doldurulmalı"
+            else:
+                cost, detail = COST_METADATA, "Yeni kolon"
+            self._add("column_added", module, table, column.name, cost, detail,
+                      new=definition.get("type"))
+            if definition.get("unique") or definition.get("indexed"):
+                self._add("index_added", module, table, column.name, COST_SCAN,
+                          "Kolon index'i oluşturulur")
+            if definition.get("foreign_key"):
+                self._add("foreign_key_added", module, table, column.name, COST_SCAN,
+                          f"Foreign key: {_fk_text(definition['foreign_key'])}",
+                          new=definition["foreign_key"])
+        for column in removed:
+            self._add("column_removed", module, table, column.name, COST_METADATA,
+                      "Kolon kaldırıldı", old=column.definition.get("type"), destructive=True)
+
+        old_order = [n for n in old.columns if n in new.columns]
+        new_order = [n for n in new.columns if n in old.columns]
+        if old_order != new_order:
+            self._add("columns_reordered", module, table, None, COST_METADATA, "Kolon sırası değişti")
+
+        for name, new_column in new.columns.items():
+            old_column = old.columns.get(name)
+            if old_column is None:
+                continue
+            self.stats["columns"] += 1
+            if old_column.shape == new_column.shape:
+                self.stats["columns_skipped"] += 1
+                continue
+            self.diff_column(module, table, old_column.definition, new_column.definition)
+
+        for name in old.indexes.keys() | new.indexes.keys():
+            old_index, new_index = old.indexes.get(name), new.indexes.get(name)
+            if old_index is None:
+                self._add("index_added", module, table, name, COST_SCAN,
+                          f"Index: {', '.join(map(str, new_index.definition.get('columns', [])))}",
+                          new=new_index.definition)
+            elif new_index is None:
+                self._add("index_removed", module, table, name, COST_METADATA, "Index kaldırıldı",
+                          old=old_index.definition)
+            elif old_index.hash != new_index.hash:
+                self._add("index_changed", module, table, name, COST_SCAN, "Index yeniden oluşturulur",
+                          old=old_index.definition, new=new_index.definition)
+
+    # ------------------------------------------------------------------
+    # Kolon
+    # ------------------------------------------------------------------
+
+    def _base(self, column: Dict) -> Optional[str]:
+        if self.types is None:
+            return column.get("type")
+        return self.types.base_of(column.get("type")) or column.get("type")
+
+    def _effective(self, column: Dict) -> Dict:
+        """Tipin varsayılanları uygulanmış uzunluk / hassasiyet / enum değerleri"""
+        if self.types is None:
+            return {k: column.get(k) for k in ("max_length", "precision", "scale", "values")}
+        ctype = self.types.resolve(column)
+        return {"max_length": ctype.max_length, "precision": ctype.precision,
+                "scale": ctype.scale, "values": ctype.values}
+
+    def diff_column(self, module: str, table: str, old: Dict, new: Dict):
+        name = column_name(new)
+
+        def add(kind, cost, detail, old_value=None, new_value=None, destructive=False):
+            self._add(kind, module, table, name, cost, detail, old=old_value, new=new_value,
+                      destructive=destructive)
+
+        old_base, new_base = self._base(old), self._base(new)
+        old_eff, new_eff = self._effective(old), self._effective(new)
+
+        if old_base != new_base:
+            add("column_retyped", COST_REWRITE, f"Tip dönüşümü: {old.get('type')} -> {new.get('type')}",
+                old.get("type"), new.get("type"))
+        else:
+            if old.get("type") != new.get("type"):
+                add("column_retyped", COST_METADATA,
+                    f"Aynı temel tip ({new_base}): {old.get('type')} -> {new.get('type')}",
+                    old.get("type"), new.get("type"))
+            self._diff_size(add, old_eff, new_eff)
+            self._diff_enum(add, old_eff.get("values"), new_eff.get("values"))
+
+        if bool(old.get("primary_key")) != bool(new.get("primary_key")):
+            add("primary_key_changed", COST_REWRITE, "Primary key değişti",
+                bool(old.get("primary_key")), bool(new.get("primary_key")))
+        if bool(old.get("auto_increment")) != bool(new.get("auto_increment")):
+            add("auto_increment_changed", COST_METADATA, "auto_increment (değer üretici) değişti", bool(old.get("auto_increment")), bool(new.get("auto_increment")))
+
+        if bool(old.get("required")) != bool(new.get("required")):
+            if new.get("required"):
+                add("column_required", COST_SCAN, "NOT NULL: mevcut satırlar doğrulanır", False, True)
+            else:
+                add("column_optional", COST_METADATA, "NOT NULL kaldırıldı", True, False)
+        if old.get("default") != new.get("default"):
+            add("default_changed", COST_METADATA, "Varsayılan değer değişti",
+                old.get("default"), new.get("default"))
+
+        if bool(old.get("unique")) != bool(new.get("unique")):
+            if new.get("unique"):
+                add("unique_added", COST_SCAN, "Unique index oluşturulur (tekrarlı değer kontrolü)")
+            else:
+                add("unique_removed", COST_METADATA, "Unique kısıtı kaldırıldı")
+        elif bool(old.get("indexed")) != bool(new.get("indexed")) and not new.get("unique"):
+            if new.get("indexed"):
+                add("index_added", COST_SCAN, "Kolon index'i oluşturulur")
+            else:
+                add("index_removed", COST_METADATA, "Kolon index'i kaldırıldı")
+
+        old_fk, new_fk = old.get("foreign_key") or None, new.get("foreign_key") or None
+        if old_fk != new_fk:
+            if old_fk is None:
+                add("foreign_key_added", COST_SCAN, f"Foreign key: {_fk_text(new_fk)}", None, new_fk)
+            elif new_fk is None:
+                add("foreign_key_removed", COST_METADATA, f"Foreign key kaldırıldı: {_fk_text(old_fk)}",
+                    old_fk, None)
+            else:
+                add("foreign_key_changed", COST_SCAN,
+                    f"Foreign key: {_fk_text(old_fk)} -> {_fk_text(new_fk)}", old_fk, new_fk)
+
+        constraints = [k for k in _CONSTRAINT_KEYS if old.get(k) != new.get(k)]
+        if constraints:
+            tightened = [k for k in constraints if new.get(k) is not None]
+            add("constraint_changed", COST_SCAN if tightened else COST_METADATA,
+                f"Kısıtlar: {', '.join(constraints)}",
+                {k: old.get(k) for k in constraints}, {k: new.get(k) for k in constraints})
+
+        other = sorted(k for k in set(old) | set(new)
+                       if k not in _CLASSIFIED_KEYS and old.get(k) != new.get(k))
+        if other:
+            add("column_changed", COST_METADATA, f"Özellikler: {', '.join(other)}",
+                {k: old.get(k) for k in other}, {k: new.get(k) for k in other})
+
+    @staticmethod
+    def _diff_size(add, old: Dict, new: Dict):
+        old_len, new_len = old.get("max_length"), new.get("max_length")
+        if old_len != new_len:
+            if new_len is None or (old_len is not None and new_len > old_len):
+                add("column_widened", COST_METADATA, f"max_length: {old_len} -> {new_len}", old_len, new_len)
+            elif old_len is None:
+                add("column_bounded", COST_SCAN, f"max_length: sınırsız -> {new_len} (uzun değerler doğrulanır)",
+                    old_len, new_len, destructive=True)
+            else:
+                add("column_narrowed", COST_REWRITE, f"max_length: {old_len} -> {new_len} (kırpılma riski)",
+                    old_len, new_len, destructive=True)
+
+        old_p, new_p = old.get("precision"), new.get("precision")
+        old_s, new_s = old.get("scale"), new.get("scale")
+        if old_s != new_s:
+            add("column_rescaled", COST_REWRITE, f"scale: {old_s} -> {new_s}", old_s, new_s,
+                destructive=new_s is not None and old_s is not None and new_s < old_s)
+        elif old_p != new_p:
+            if new_p is None or (old_p is not None and new_p > old_p):
+                add("column_widened", COST_METADATA, f"precision: {old_p} -> {new_p}", old_p, new_p)
+            else:
+                add("column_narrowed", COST_REWRITE, f"precision: {old_p} -> {new_p} (taşma riski)",
+                    old_p, new_p, destructive=True)
+
+    @staticmethod
+    def _diff_enum(add, old: Optional[List], new: Optional[List]):
+        if old == new or (not old and not new):
+            return
+        old_set, new_set = set(map(str, old or [])), set(map(str, new or []))
+        grown = sorted(new_set - old_set)
+        dropped = sorted(old_set - new_set)
+        if dropped:
+            add("enum_narrowed", COST_SCAN,
+                f"Enum değerleri kaldırıldı: {', '.join(dropped)} ({len(old or [])} -> {len(new or [])})",
+                dropped, grown or None, destructive=True)
+        elif grown:
+            add("enum_extended", COST_METADATA,
+                f"Enum büyüdü: {len(old or [])} -> {len(new or [])} (+{', '.join(grown)})", None, grown)
+        else:
+            add("enum_reordered", COST_METADATA, "Enum değer sırası değişti")
+
+    # ------------------------------------------------------------------
+    # Özet ve göç planı
+    # ------------------------------------------------------------------
+
+    def summary(self) -> Dict:
+        counts = {cost: 0 for cost in COSTS}
+        for change in self.changes:
+            counts[change.cost] += 1
+        rewrites = sorted({f"{c.module}.{c.table}" for c in self.changes if c.cost == COST_REWRITE and c.table})
+        return {
+            "changes": len(self.changes),
+            "by_cost": counts,
+            "destructive": sum(1 for c in self.changes if c.destructive),
+            "rewrite_tables": rewrites,
+            "stats": dict(self.stats)
+        }
+
+    def migration_plan(self) -> List[Dict]:
+        """
+        Sıralı göç adımları.
+
+        Görünümler ve eski kısıtlar önce kaldırılır; yeni tablolar FK
+        güvenli sırayla oluşturulur; kolon değişiklikleri, index'ler ve yeni
+        kısıtlar ardından gelir; kolon ve tablo silme (ters FK sırası) ile
+        view'ların yeniden kurulması en sondadır. Aynı tablodaki birden
+        fazla rewrite değişikliği tek bir yeniden yazma adımında toplanır.
+        """
+        phases: Dict[str, List[Dict]] = {phase: [] for phase in PHASES}
+        rewrites: Dict[Tuple[str, str], Dict] = {}
+
+        def step(phase: str, change: Change):
+            entry = {"phase": phase, "action": change.kind, "target": change.path,
+                     "cost": change.cost, "detail": change.detail}
+            if change.destructive:
+                entry["destructive"] = True
+            if change.cost == COST_REWRITE and change.table and phase == "alter_columns":
+                key = (change.module, change.table)
+                if key in rewrites:
+                    merged = rewrites[key]
+                    merged["detail"] += f"; {change.detail}"
+                    merged.setdefault("includes", []).append(change.path)
+                    merged["destructive"] = merged.get("destructive", False) or change.destructive
+                    return
+                entry["action"] = "rewrite_table"
+                entry["target"] = f"{change.module}.{change.table}"
+                entry["detail"] = f"{change.path}: {change.detail}"
+                entry["includes"] = [change.path]
+                rewrites[key] = entry
+            phases[phase].append(entry)
+
+        created = {}
+        dropped = {}
+        removed_modules = []
+        for change in self.changes:
+            kind = change.kind
+            if kind in _REPLACED:
+                # Değişen tanımın eskisi önce kaldırılır
+                phase = _REPLACED[kind]
+                phases[phase].append({"phase": phase, "action": kind.replace("_changed", "_dropped"),
+                                      "target": change.path, "cost": COST_METADATA,
+                                      "detail": "Eski tanım kaldırılır"})
+            if kind == "table_added":
+                created[(change.module, change.table)] = change
+            elif kind == "table_removed":
+                dropped[(change.module, change.table)] = change
+            elif kind == "module_removed":
+                removed_modules.append(change)
+            else:
+                step(_PHASE_OF[kind], change)
+
+        # Yeni tablolar FK güvenli sırayla, kaldırılanlar ters sırayla
+        for key in _ordered(created, self.new_modules):
+            step("create_tables", created[key])
+        for key in reversed(_ordered(dropped, self.old_modules)):
+            step("drop_tables", dropped[key])
+        for change in removed_modules:
+            step("drop_tables", change)
+
+        plan = []
+        for phase in PHASES:
+            for entry in phases[phase]:
+                entry["step"] = len(plan) + 1
+                plan.append(entry)
+        return plan
+
+
+# Değişiklik türü -> göç planı fazı (table_added/removed ve module_removed ayrıca sıralanır)
+_PHASE_OF = {
+    "view_removed": "drop_views",
+    "foreign_key_removed": "drop_constraints",
+    "index_removed": "drop_constraints",
+    "unique_removed": "drop_constraints",
+    "table_renamed": "rename",
+    "column_renamed": "rename",
+    "module_added": "alter_columns",
+    "module_changed": "alter_columns",
+    "table_changed": "alter_columns",
+    "column_added": "alter_columns",
+    "column_retyped": "alter_columns",
+    "column_widened": "alter_columns",
+    "column_narrowed": "alter_columns",
+    "column_bounded": "add_constraints",
+    "column_rescaled": "alter_columns",
+    "enum_extended": "alter_columns",
+    "enum_reordered": "alter_columns",
+    "column_optional": "alter_columns",
+    "default_changed": "alter_columns",
+    "primary_key_changed": "alter_columns",
+    "auto_increment_changed": "alter_columns",
+    "columns_reordered": "alter_columns",
+    "column_changed": "alter_columns",
+    "index_added": "create_indexes",
+    "index_changed": "create_indexes",
+    "unique_added": "create_indexes",
+    "foreign_key_added": "add_constraints",
+    "foreign_key_changed": "add_constraints",
+    "column_required": "add_constraints",
+    "enum_narrowed": "add_constraints",
+    "constraint_changed": "add_constraints",
+    "column_removed": "drop_columns",
+    "view_added": "create_views",
+    "view_changed": "create_views",
+}
+
+# Yeni tanımı kurulmadan önce eskisi kaldırılan değişiklikler
+_REPLACED = {
+    "foreign_key_changed": "drop_constraints",
+    "index_changed": "drop_constraints",
+    "view_changed": "drop_views",
+}
+
+
+def _ordered(changes: Dict[Tuple[str, str], Change], modules: Dict[str, Dict]) -> List[Tuple[str, str]]:
+    order = [key for key in table_load_order(modules) if key in changes]
+    return order + [key for key in changes if key not in order]
+
+
+def _fk_text(fk: Any) -> str:
+    if not isinstance(fk, dict):
+        return str(fk)
+    target = ".".join(str(fk[k]) for k in ("module", "table", "column") if fk.get(k))
+    return target or json.dumps(fk, ensure_ascii=False)
+
+
+def _file_digest(path: Path, cache=None) -> str:
+    if cache is not None:
+        return cache.probe(str(path)).digest
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def _load(path: Path, cache=None) -> Dict:
+    if cache is not None:
+        probe = cache.probe(str(path))
+        if probe.fresh:
+            data = cache.load_data(probe.entry)
+            if data is not None:
+                return data
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def modules_dir(path: Path) -> Path:
+    """Şema ağacı ana dizini verildiyse paktlang/modules/core, değilse dizinin kendisi"""
+    candidate = Path(path) / "paktlang" / "modules" / "core"
+    return candidate if candidate.is_dir() else Path(path)
+
+
+def diff_schemas(old: str, new: str, types: TypeRegistry = None, cache=None) -> SchemaDiff:
+    """
+    İki modül dosyasını veya iki şema dizinini (ağaç ana dizini ya da modül
+    dizini) karşılaştırır.
+
+    Raises:
+        ValueError: Biri dosya, diğeri dizinse ya da dizinlerden birinde
+            modül dosyası yoksa
+    """
+    old_path, new_path = Path(old), Path(new)
+    diff = SchemaDiff(types)
+    if old_path.is_file() and new_path.is_file():
+        diff.compare_files(old_path, new_path, cache)
+    elif old_path.is_dir() and new_path.is_dir():
+        diff.compare_dirs(modules_dir(old_path), modules_dir(new_path), cache)
+    else:
+        raise ValueError("İki modül dosyası veya iki dizin verilmeli")
+    return diff
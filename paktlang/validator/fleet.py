@@ -0,0 +1,364 @@
+"""
+PaktLang Fleet Validation
+Birçok müşteri (tenant) şema ağacının içerik hash'i ile tekilleştirilerek tek çalıştırmada doğrulanması
+"""
+
+import hashlib
+import json
+import os
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from .rules import LEVELS, RULES, RuleRegistry, load_levels
+from .schema_validator import SchemaValidator, ValidationError
+
+
+# Worker başına tutulan ayrıştırılmış modül sayısı (içerik hash'i -> veri)
+PARSED_LIMIT = 256
+
+
+class TenantTree:
+    """Bir müşterinin şema ağacı: dosyaları ve içerik hash'leri"""
+
+    __slots__ = ("name", "base_path", "modules_dir", "relations_file", "files",
+                 "relations_digest", "levels")
+
+    def __init__(self, name: str, base_path: Path):
+        self.name = name
+        self.base_path = base_path
+        self.modules_dir = base_path / "paktlang" / "modules" / "core"
+        self.relations_file: Optional[Path] = None
+        # (dosya adı, yol, içerik hash'i) - dosya adı sırasıyla
+        self.files: List[Tuple[str, Path, str]] = []
+        self.relations_digest: Optional[str] = None
+        self.levels: Tuple[str, ...] = LEVELS
+
+    def tree_key(self) -> Tuple:
+        """Modüller arası kontrollerin sonucunu belirleyen içerik anahtarı"""
+        return (self.levels, tuple((stem, digest) for stem, _, digest in self.files),
+                self.relations_digest)
+
+
+def file_digest(path: Path) -> str:
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def _normalize(levels: Iterable[str]) -> Tuple[str, ...]:
+    """Seviyeleri LEVELS sırasına dizer (SchemaValidator ile aynı kontrol)"""
+    unknown = set(levels) - set(LEVELS)
+    if unknown:
+        raise ValueError(f"Bilinmeyen doğrulama seviyesi: {', '.join(sorted(unknown))}")
+    return tuple(level for level in LEVELS if level in levels)
+
+
+def tenant_names(base_paths: Iterable[Path]) -> List[str]:
+    """Dizin adları; aynı ada sahip ağaçlar tam yol ile ayrılır"""
+    paths = list(base_paths)
+    names = [p.name or str(p) for p in paths]
+    return [str(p) if names.count(n) > 1 else n for p, n in zip(paths, names)]
+
+
+class FleetValidator:
+    """
+    Çok sayıda şema ağacını tek çalıştırmada doğrular.
+
+    Her modül dosyası içerik hash'i, dosya adı ve doğrulama seviyeleri ile
+    anahtarlanır; aynı anahtarlı dosyalar bir kez doğrulanır. Modüller arası
+    kontroller de modül ve relations hash'leri aynı olan ağaçlar için bir
+    kez çalışır. meta/paktlang.meta.json içerikleri hash'lenir ve her farklı
+    içerik bir kez okunur. İş process havuzuna dağıtılır; worker'lar
+    ayrıştırdıkları modülleri modüller arası kontroller için saklar.
+    """
+
+    def __init__(self, base_paths: Iterable[str], levels: List[str] = None,
+                 registry: RuleRegistry = None, jobs: int = 1, stream: Optional[bool] = None):
+        """
+        Args:
+            base_paths: Müşteri şema ağaçlarının ana dizinleri
+            levels: Tüm ağaçlar için doğrulama seviyeleri (varsayılan: her
+                ağacın kendi paktlang.meta.json validation.levels değeri)
+            jobs: Process sayısı (1: sıralı)
+        """
+        self.base_paths = [Path(p) for p in base_paths]
+        self.levels = _normalize(levels) if levels else None
+        self.registry = registry or RULES
+        self.jobs = max(1, jobs)
+        self.stream = stream
+
+    # ------------------------------------------------------------------
+    # Tarama
+    # ------------------------------------------------------------------
+
+    def scan(self) -> List[TenantTree]:
+        """Ağaçları tarar ve dosyaları hash'ler"""
+        tenants = []
+        meta_levels: Dict[str, Tuple[str, ...]] = {}
+
+        for name, base_path in zip(tenant_names(self.base_paths), self.base_paths):
+            tenant = TenantTree(name, base_path)
+            if not tenant.modules_dir.is_dir():
+                raise FileNotFoundError(f"Modül dizini bulunamadı: {tenant.modules_dir}")
+
+            for json_file in sorted(tenant.modules_dir.glob("*.json")):
+                tenant.files.append((json_file.stem, json_file, file_digest(json_file)))
+
+            relations_file = base_path / "paktlang" / "relations" / "relations.json"
+            if relations_file.exists():
+                tenant.relations_file = relations_file
+                tenant.relations_digest = file_digest(relations_file)
+
+            if self.levels is not None:
+                tenant.levels = self.levels
+            else:
+                meta_file = base_path / "paktlang" / "meta" / "paktlang.meta.json"
+                try:
+                    key = file_digest(meta_file)
+                except OSError:
+                    key = ""
+                if key not in meta_levels:
+                    meta_levels[key] = _normalize(load_levels(meta_file))
+                tenant.levels = meta_levels[key]
+
+            tenants.append(tenant)
+        return tenants
+
+    # ------------------------------------------------------------------
+    # Doğrulama
+    # ------------------------------------------------------------------
+
+    def validate(self, progress: Callable[[str, int, int], None] = None) -> Dict:
+        """
+        Tüm ağaçları doğrular.
+
+        Args:
+            progress: Verilirse (faz, tamamlanan, toplam) ile çağrılır
+
+        Returns:
+            tenants (ad -> validate_all yapısında rapor) ve summary
+        """
+        started = time.perf_counter()
+        tenants = self.scan()
+
+        # Tekil modül dosyaları: (hash, dosya adı, seviyeler) -> temsilci yol
+        unique_files: Dict[Tuple, Path] = {}
+        for tenant in tenants:
+            for stem, path, digest in tenant.files:
+                unique_files.setdefault((digest, stem, tenant.levels), path)
+
+        # Tekil ağaçlar (relations sözdizimi ve modüller arası kontroller için)
+        unique_trees: Dict[Tuple, TenantTree] = {}
+        for tenant in tenants:
+            unique_trees.setdefault(tenant.tree_key(), tenant)
+
+        file_tasks = [(str(path), digest, levels) for (digest, _, levels), path in unique_files.items()]
+        cross_tasks = [
+            (str(t.modules_dir), [(stem, str(path), digest) for stem, path, digest in t.files],
+             str(t.relations_file) if t.relations_file else None, t.levels)
+            for t in unique_trees.values()
+        ]
+
+        outcomes, cross = self._run(file_tasks, cross_tasks, progress)
+        file_results = dict(zip(unique_files, outcomes))
+        cross_results = dict(zip(unique_trees, cross))
+
+        reports = {}
+        for tenant in tenants:
+            reports[tenant.name] = self._tenant_report(
+                tenant, unique_files, file_results, unique_trees, cross_results)
+
+        files = sum(len(t.files) for t in tenants)
+        return {
+            "tenants": reports,
+            "summary": {
+                "tenants": len(tenants),
+                "valid_tenants": sum(1 for r in reports.values() if r["valid"]),
+                "files": files,
+                "unique_files": len(unique_files),
+                "unique_trees": len(unique_trees),
+                "total_errors": sum(r["summary"]["total_errors"] for r in reports.values()),
+                "total_warnings": sum(r["summary"]["total_warnings"] for r in reports.values()),
+                "jobs": self.jobs,
+                "elapsed_ms": round((time.perf_counter() - started) * 1000, 2)
+            }
+        }
+
+    def _run(self, file_tasks: List[Tuple], cross_tasks: List[Tuple],
+             progress: Callable[[str, int, int], None] = None) -> Tuple[List[Dict], List[Dict]]:
+        """Modül ve modüller arası görevleri (sıralı veya process havuzunda) çalıştırır"""
+        if self.jobs == 1 or len(file_tasks) + len(cross_tasks) < 2:
+            _init_worker(self.registry, self.stream)
+            try:
+                outcomes = self._collect("modules", map(_validate_file_task, file_tasks),
+                                         len(file_tasks), progress)
+                cross = self._collect("cross_module", map(_cross_module_task, cross_tasks),
+                                      len(cross_tasks), progress)
+            finally:
+                _init_worker(None, None)
+            return outcomes, cross
+
+        from concurrent.futures import ProcessPoolExecutor
+
+        workers = min(self.jobs, os.cpu_count() or 1, max(len(file_tasks), len(cross_tasks)))
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(self.registry, self.stream)) as pool:
+            outcomes = self._collect(
+                "modules", pool.map(_validate_file_task, file_tasks,
+                                    chunksize=_chunksize(len(file_tasks), workers)),
+                len(file_tasks), progress)
+            cross = self._collect(
+                "cross_module", pool.map(_cross_module_task, cross_tasks,
+                                         chunksize=_chunksize(len(cross_tasks), workers)),
+                len(cross_tasks), progress)
+        return outcomes, cross
+
+    @staticmethod
+    def _collect(phase: str, results: Iterable, total: int,
+                 progress: Callable[[str, int, int], None] = None) -> List:
+        collected = []
+        for result in results:
+            collected.append(result)
+            if progress is not None:
+                progress(phase, len(collected), total)
+        return collected
+
+    def _tenant_report(self, tenant: TenantTree, unique_files: Dict[Tuple, Path],
+                       file_results: Dict[Tuple, Dict], unique_trees: Dict[Tuple, TenantTree],
+                       cross_results: Dict[Tuple, Dict]) -> Dict:
+        """Ağacın raporu (validate_all ile aynı yapıda)"""
+        results = {
+            "tenant": tenant.name,
+            "base_path": str(tenant.base_path),
+            "valid": True,
+            "modules": {},
+            "errors": [],
+            "warnings": [],
+            "summary": {}
+        }
+
+        for stem, path, digest in tenant.files:
+            key = (digest, stem, tenant.levels)
+            outcome = file_results[key]
+            errors = _rebase(outcome["errors"], unique_files[key], path)
+            warnings = _rebase(outcome["warnings"], unique_files[key], path)
+            results["modules"][stem] = {"valid": outcome["valid"], "errors": errors, "warnings": warnings}
+            if not outcome["valid"]:
+                results["valid"] = False
+                results["errors"].extend(errors)
+            results["warnings"].extend(warnings)
+
+        tree_key = tenant.tree_key()
+        cross = cross_results[tree_key]
+        source = unique_trees[tree_key]
+        issues = cross["issues"]
+        if source.relations_file is not None and tenant.relations_file is not None:
+            issues = _rebase(issues, source.relations_file, tenant.relations_file)
+        if cross["relations_valid"] is False:
+            results["valid"] = False
+        errors = [i for i in issues if i["severity"] == "error"]
+        if errors:
+            results["valid"] = False
+            results["errors"].extend(errors)
+        results["warnings"].extend(i for i in issues if i["severity"] != "error")
+
+        results["summary"] = {
+            "total_modules": len(results["modules"]),
+            "valid_modules": sum(1 for m in results["modules"].values() if m["valid"]),
+            "total_errors": len(results["errors"]),
+            "total_warnings": len(results["warnings"])
+        }
+        return results
+
+
+def _rebase(issues: List[Dict], source: Path, target: Path) -> List[Dict]:
+    """Temsilci dosyanın yolunu taşıyan bulguları (PL001) hedef dosyaya taşır"""
+    if source == target:
+        return issues
+    source = str(source)
+    return [dict(i, path=str(target)) if i["path"] == source else i for i in issues]
+
+
+def _chunksize(tasks: int, workers: int) -> int:
+    return max(1, tasks // (workers * 4))
+
+
+# ----------------------------------------------------------------------
+# Worker tarafı (her process kendi validator'larını ve ayrıştırma önbelleğini tutar)
+# ----------------------------------------------------------------------
+
+_REGISTRY: Optional[RuleRegistry] = None
+_STREAM: Optional[bool] = None
+_VALIDATORS: Dict[Tuple[str, ...], SchemaValidator] = {}
+_PARSED: "OrderedDict[str, Optional[Dict]]" = OrderedDict()
+
+
+def _init_worker(registry: Optional[RuleRegistry], stream: Optional[bool]):
+    global _REGISTRY, _STREAM
+    _REGISTRY = registry
+    _STREAM = stream
+    _VALIDATORS.clear()
+    _PARSED.clear()
+
+
+def _worker_validator(levels: Tuple[str, ...]) -> SchemaValidator:
+    validator = _VALIDATORS.get(levels)
+    if validator is None:
+        validator = SchemaValidator(levels=levels, registry=_REGISTRY, stream=_STREAM)
+        _VALIDATORS[levels] = validator
+    return validator
+
+
+def _remember(digest: str, data: Optional[Dict]):
+    _PARSED[digest] = data
+    _PARSED.move_to_end(digest)
+    while len(_PARSED) > PARSED_LIMIT:
+        _PARSED.popitem(last=False)
+
+
+def _parsed(digest: str, path: str) -> Optional[Dict]:
+    if digest in _PARSED:
+        _PARSED.move_to_end(digest)
+        return _PARSED[digest]
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        data = None
+    _remember(digest, data)
+    return data
+
+
+def _validate_file_task(task: Tuple[str, str, Tuple[str, ...]]) -> Dict:
+    """Tekil modül dosyasını doğrular; ayrıştırılan veri worker'da kalır"""
+    file_path, digest, levels = task
+    outcome = _worker_validator(levels)._validate_file(file_path)
+    _remember(digest, outcome.pop("data"))
+    outcome.pop("entry", None)
+    return outcome
+
+
+def _cross_module_task(task: Tuple[str, List[Tuple[str, str, str]], Optional[str], Tuple[str, ...]]) -> Dict:
+    """Tekil ağacın modüller arası kontrolleri"""
+    modules_dir, files, relations_file, levels = task
+    validator = _worker_validator(levels)
+
+    modules = {}
+    for stem, path, digest in files:
+        data = _parsed(digest, path)
+        if data:
+            modules[stem] = data
+
+    issues: List[ValidationError] = []
+    relations = None
+    relations_valid = None
+    if relations_file is not None:
+        validator.errors = []
+        relations_valid, relations = validator.validate_json_syntax(relations_file)
+        issues.extend(validator.errors)
+
+    cross = validator.validate_cross_module(modules, relations)
+    validator.locate_issues(cross, Path(modules_dir), Path(relations_file) if relations_file else None)
+    issues.extend(cross)
+    return {"relations_valid": relations_valid, "issues": [i.to_dict() for i in issues]}
@@ -0,0 +1,309 @@
+"""
+PaktLang Dependency Graph
+Modül ve tablo bağımlılık grafiği - döngü tespiti ve yükleme sırası
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+
+class DependencyGraph:
+    """
+    Yönlü bağımlılık grafiği. A -> B kenarı "A, B'ye bağımlı" demektir.
+
+    Güçlü bağlı bileşenler (SCC) iteratif Tarjan algoritması ile O(V + E)
+    zamanda bulunur; bu sayede derin FK zincirlerinde recursion limiti
+    sorunu yaşanmaz.
+    """
+
+    def __init__(self):
+        # Ekleme sırası korunur - sonuçlar deterministik
+        self.edges: Dict[str, Dict[str, Any]] = {}
+
+    def add_node(self, node: str):
+        if node not in self.edges:
+            self.edges[node] = {}
+
+    def add_edge(self, source: str, target: str, meta: Any = None):
+        """source -> target bağımlılığı ekler; aynı kenar tekrar eklenmez"""
+        self.add_node(source)
+        self.add_node(target)
+        self.edges[source].setdefault(target, meta)
+
+    def edge_meta(self, source: str, target: str) -> Any:
+        return self.edges.get(source, {}).get(target)
+
+    @property
+    def nodes(self) -> List[str]:
+        return list(self.edges)
+
+    def __len__(self) -> int:
+        return len(self.edges)
+
+    # ------------------------------------------------------------------
+    # Tarjan SCC
+    # ------------------------------------------------------------------
+
+    def strongly_connected_components(self) -> List[List[str]]:
+        """
+        Güçlü bağlı bileşenleri döner.
+
+        Bileşenler ters topolojik sırada üretilir: bir bileşen, bağımlı
+        olduğu tüm bileşenlerden sonra gelir. Yani liste doğrudan
+        "önce bağımlılıklar" yükleme sırasıdır.
+        """
+        index_of: Dict[str, int] = {}
+        lowlink: Dict[str, int] = {}
+        on_stack = set()
+        stack: List[str] = []
+        components: List[List[str]] = []
+        counter = 0
+
+        for root in self.edges:
+            if root in index_of:
+                continue
+
+            # (düğüm, komşu iteratörü) çiftleriyle iteratif DFS
+            index_of[root] = lowlink[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack.add(root)
+            work = [(root, iter(self.edges[root]))]
+
+            while work:
+                node, neighbors = work[-1]
+                advanced = False
+
+                for target in neighbors:
+                    if target not in index_of:
+                        index_of[target] = lowlink[target] = counter
+                        counter += 1
+                        stack.append(target)
+                        on_stack.add(target)
+                        work.append((target, iter(self.edges[target])))
+                        advanced = True
+                        break
+                    if target in on_stack and index_of[target] < lowlink[node]:
+                        lowlink[node] = index_of[target]
+
+                if advanced:
+                    continue
+
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    if lowlink[node] < lowlink[parent]:
+                        lowlink[parent] = lowlink[node]
+
+                if lowlink[node] == index_of[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    component.reverse()
+                    components.append(component)
+
+        return components
+
+    def _cycle_in(self, component: List[str]) -> List[str]:
+        """
+        Bileşen içinden tam döngü yolunu çıkarır: [a, b, ..., a].
+        BFS ile ilk düğümden kendisine dönen en kısa yol bulunur.
+        """
+        members = set(component)
+        start = component[0]
+        parent: Dict[str, Optional[str]] = {start: None}
+        queue = [start]
+        head = 0
+
+        while head < len(queue):
+            node = queue[head]
+            head += 1
+            for target in self.edges[node]:
+                if target not in members:
+                    continue
+                if target == start:
+                    path = [node]
+                    while path[-1] != start:
+                        path.append(parent[path[-1]])
+                    path.reverse()
+                    return path + [start]
+                if target not in parent:
+                    parent[target] = node
+                    queue.append(target)
+        return [start, start]
+
+    def cycles(self, include_self_loops: bool = True) -> List[List[str]]:
+        """Her döngüsel bileşen için bir tam döngü yolu"""
+        cycles = []
+        for component in self.strongly_connected_components():
+            if len(component) > 1:
+                cycles.append(self._cycle_in(component))
+            elif include_self_loops and component[0] in self.edges[component[0]]:
+                cycles.append([component[0], component[0]])
+        return cycles
+
+    def topological_order(self) -> List[str]:
+        """
+        Bağımlılıklar önce gelecek şekilde düğüm sırası. Döngüsel
+        bileşenlerin üyeleri ekleme sırasıyla yan yana yer alır.
+        """
+        return [node for component in self.strongly_connected_components() for node in component]
+
+    def load_levels(self) -> List[List[str]]:
+        """
+        Yükleme sırasını seviyelere ayırır; aynı seviyedeki düğümler
+        birbirinden bağımsızdır ve paralel yüklenebilir.
+        """
+        level_of: Dict[str, int] = {}
+        levels: List[List[str]] = []
+
+        for component in self.strongly_connected_components():
+            members = set(component)
+            level = 0
+            for node in component:
+                for target in self.edges[node]:
+                    if target not in members:
+                        level = max(level, level_of[target] + 1)
+            for node in component:
+                level_of[node] = level
+            while len(levels) <= level:
+                levels.append([])
+            levels[level].extend(component)
+
+        return levels
+
+    def dependents(self, nodes: Iterable[str]) -> List[str]:
+        """Verilen düğümlere (doğrudan veya dolaylı) bağımlı olan düğümler, kendileri dahil"""
+        reverse: Dict[str, List[str]] = {node: [] for node in self.edges}
+        for source, targets in self.edges.items():
+            for target in targets:
+                reverse[target].append(source)
+
+        queue = [n for n in nodes if n in reverse]
+        visited = set(queue)
+        while queue:
+            node = queue.pop()
+            for source in reverse[node]:
+                if source not in visited:
+                    visited.add(source)
+                    queue.append(source)
+        return [node for node in self.edges if node in visited]
+
+
+def table_key(module_name: str, table_name: str) -> str:
+    return f"{module_name}.{table_name}"
+
+
+def build_module_graph(modules: Dict[str, Dict], relations: Dict = None) -> DependencyGraph:
+    """
+    Modül bağımlılık grafiği: modül `dependencies`, relations.json
+    `module_dependencies`, modüller arası FK'lar ve `cross_module_relationships`.
+    """
+    graph = DependencyGraph()
+
+    # Önce beyan edilen bağımlılıklar; kenar meta'sı ilk eklenen kaynaktır
+    for module_name, module_data in modules.items():
+        graph.add_node(module_name)
+        for dep in module_data.get("dependencies", []):
+            graph.add_edge(module_name, dep, "dependencies")
+
+    if relations:
+        for module_name, info in relations.get("module_dependencies", {}).items():
+            for dep in info.get("depends_on", []):
+                graph.add_edge(module_name, dep, "module_dependencies")
+
+    # Sonra FK ve ilişkilerden çıkarılan bağımlılıklar
+    for module_name, module_data in modules.items():
+        for table in module_data.get("tables", []):
+            for column in table.get("columns", []):
+                fk = column.get("foreign_key")
+                if fk and fk.get("module", module_name) != module_name:
+                    graph.add_edge(module_name, fk["module"], "foreign_key")
+
+    if relations:
+        for rel in relations.get("cross_module_relationships", []):
+            source = rel.get("source", {}).get("module")
+            target = rel.get("target", {}).get("module")
+            if source and target and source != target:
+                graph.add_edge(source, target, "cross_module_relationships")
+
+    return graph
+
+
+DECLARED_DEPENDENCY_SOURCES = ("dependencies", "module_dependencies")
+
+
+def cycle_is_declared(graph: DependencyGraph, cycle: List[str]) -> bool:
+    """Döngüdeki tüm kenarlar beyan edilmiş modül bağımlılığı mı (modül grafiği için)"""
+    return all(graph.edge_meta(a, b) in DECLARED_DEPENDENCY_SOURCES for a, b in zip(cycle, cycle[1:]))
+
+
+def build_table_graph(modules: Dict[str, Dict], relations: Dict = None) -> DependencyGraph:
+    """
+    Tablo bağımlılık grafiği ("modül.tablo" düğümleri). Kenar meta'sı FK
+    kolonunun zorunlu (required/NOT NULL) olup olmadığıdır; zorunlu
+    kenarlardan oluşan bir döngü veri olarak yüklenemez.
+    """
+    graph = DependencyGraph()
+
+    for module_name, module_data in modules.items():
+        for table in module_data.get("tables", []):
+            table_name = table.get("pl_table")
+            if not table_name:
+                continue
+            source = table_key(module_name, table_name)
+            graph.add_node(source)
+
+            for column in table.get("columns", []):
+                fk = column.get("foreign_key")
+                if not fk or not fk.get("table"):
+                    continue
+                target = table_key(fk.get("module", module_name), fk["table"])
+                required = bool(column.get("required") or column.get("primary_key"))
+                graph.add_node(target)
+                graph.edges[source][target] = bool(graph.edges[source].get(target)) or required
+
+    if relations:
+        for rel in relations.get("cross_module_relationships", []):
+            src = rel.get("source", {})
+            dst = rel.get("target", {})
+            if not (src.get("module") and src.get("table") and dst.get("module") and dst.get("table")):
+                continue
+            graph.add_edge(
+                table_key(src["module"], src["table"]),
+                table_key(dst["module"], dst["table"]),
+                False
+            )
+
+    return graph
+
+
+def cycle_is_required(graph: DependencyGraph, cycle: List[str]) -> bool:
+    """Döngüdeki tüm kenarlar zorunlu mu (tablo grafiği için)"""
+    return all(graph.edge_meta(a, b) for a, b in zip(cycle, cycle[1:]))
+
+
+def table_load_order(modules: Dict[str, Dict], relations: Dict = None,
+                     known_only: bool = True) -> List[Tuple[str, str]]:
+    """
+    FK güvenli tablo yükleme sırası: (modül, tablo) çiftleri.
+
+    Args:
+        known_only: Sadece modüllerde tanımlı tabloları döndür
+            (çözülemeyen FK hedeflerini atla)
+    """
+    defined = {
+        table_key(m, t.get("pl_table"))
+        for m, data in modules.items()
+        for t in data.get("tables", [])
+    }
+    order = []
+    for node in build_table_graph(modules, relations).topological_order():
+        if known_only and node not in defined:
+            continue
+        module_name, table_name = node.split(".", 1)
+        order.append((module_name, table_name))
+    return order
@@ -0,0 +1,589 @@
+"""
+PaktLang Schema Model
+Modül / tablo / kolon tanımlarının sıkıştırılmış, salt okunur bellek modeli
+
+Modül verisi iç içe dict/list yerine sabit genişlikli int32 kayıt
+dizilerinde tutulur; tüm adlar ve tipler tek bir string havuzunda bir kez
+saklanır (intern), tablo ve kolonlar tamsayı kimliklerle anılır:
+
+    modules: (ad, sürüm, ilk tablo, tablo sayısı)
+    tables:  (modül, ad, ilk kolon, kolon sayısı, bayraklar)
+    columns: (tablo, ad, tip, bayraklar, FK modül, FK tablo, FK kolon,
+              çözülmüş FK kolonu, max_length, precision, scale)
+
+Model düz bir ikili dosyaya yazılabilir (save) ve mmap ile açılabilir
+(open); kayıt dizileri dosya sayfaları üzerinde memoryview'dır, bu yüzden
+aynı dosyayı açan process'ler tek bir salt okunur kopyayı paylaşır. Adlar
+ilk erişimde çözülür ve process içinde önbelleğe alınır.
+
+SchemaModel, SymbolIndex'in arama arayüzünü (has_module, table, column,
+find_table, resolve_source) uygular; modüller arası kontroller doğrudan
+model üzerinde çalışır.
+"""
+
+import mmap
+import os
+import struct
+import sys
+from array import array
+from pathlib import Path
+from typing import Dict, Iterator, List, Mapping, Optional, Tuple
+
+from .symbols import column_name
+
+
+# Dosya formatı değiştiğinde artırılır
+MODEL_VERSION = 1
+
+MAGIC = b"PKTM"
+
+# SchemaValidator.load_model() önbellek dizinindeki dosya adı
+MODEL_FILE = "schema.model"
+
+# magic, sürüm, bayt sırası, string / modül / tablo / kolon sayısı, blob boyutu, anahtar
+_HEADER = struct.Struct("<4sHBxIIIII32s")
+
+MODULE_FIELDS = 4
+TABLE_FIELDS = 5
+COLUMN_FIELDS = 11
+
+# Kolon bayrakları
+PRIMARY_KEY = 1
+UNIQUE = 2
+REQUIRED = 4
+INDEXED = 8
+AUTO_INCREMENT = 16
+FOREIGN_KEY = 32
+
+# Tablo bayrakları
+MASTER = 1
+AUDIT = 2
+SOFT_DELETE = 4
+
+_COLUMN_FLAGS = (("primary_key", PRIMARY_KEY), ("unique", UNIQUE), ("required", REQUIRED),
+                 ("indexed", INDEXED), ("auto_increment", AUTO_INCREMENT))
+_TABLE_FLAGS = (("is_master", MASTER), ("audit", AUDIT), ("soft_delete", SOFT_DELETE))
+
+_INT32_MAX = 2 ** 31 - 1
+_BYTE_ORDER = 0 if sys.byteorder == "little" else 1
+
+NONE = -1
+
+
+def _int(value) -> int:
+    """int32'ye sığan negatif olmayan tamsayı, değilse NONE"""
+    if isinstance(value, int) and not isinstance(value, bool) and 0 <= value <= _INT32_MAX:
+        return value
+    return NONE
+
+
+class ColumnDef:
+    """Kolon görünümü; alanlar kayıt dizisinden okunur"""
+
+    __slots__ = ("model", "id")
+
+    def __init__(self, model: "SchemaModel", column_id: int):
+        self.model = model
+        self.id = column_id
+
+    def _field(self, offset: int) -> int:
+        return self.model.columns[self.id * COLUMN_FIELDS + offset]
+
+    def _flag(self, flag: int) -> bool:
+        return bool(self._field(3) & flag)
+
+    @property
+    def owner(self) -> "TableDef":
+        return TableDef(self.model, self._field(0))
+
+    @property
+    def table(self) -> str:
+        return self.owner.name
+
+    @property
+    def module(self) -> str:
+        return self.owner.module
+
+    @property
+    def name(self) -> str:
+        return self.model.string(self._field(1))
+
+    @property
+    def type(self) -> Optional[str]:
+        return self.model.string(self._field(2))
+
+    primary_key = property(lambda self: self._flag(PRIMARY_KEY))
+    unique = property(lambda self: self._flag(UNIQUE))
+    required = property(lambda self: self._flag(REQUIRED))
+    indexed = property(lambda self: self._flag(INDEXED))
+    auto_increment = property(lambda self: self._flag(AUTO_INCREMENT))
+
+    @property
+    def is_key(self) -> bool:
+        """Referans hedefi olabilir mi (PK veya unique)"""
+        return bool(self._field(3) & (PRIMARY_KEY | UNIQUE))
+
+    @property
+    def foreign_key(self) -> Optional[Dict]:
+        """Tanımdaki {module?, table, column} referansı"""
+        if not self._flag(FOREIGN_KEY):
+            return None
+        string = self.model.string
+        fk = {"table": string(self._field(5)), "column": string(self._field(6))}
+        if self._field(4) != NONE:
+            fk["module"] = string(self._field(4))
+        return fk
+
+    @property
+    def references(self) -> Optional["ColumnDef"]:
+        """FK'nin çözülmüş hedef kolonu (hedef bulunamadıysa None)"""
+        target = self._field(7)
+        return None if target == NONE else ColumnDef(self.model, target)
+
+    def _size(self, offset: int) -> Optional[int]:
+        value = self._field(offset)
+        return None if value == NONE else value
+
+    max_length = property(lambda self: self._size(8))
+    precision = property(lambda self: self._size(9))
+    scale = property(lambda self: self._size(10))
+
+    def __eq__(self, other):
+        return isinstance(other, ColumnDef) and other.model is self.model and other.id == self.id
+
+    def __hash__(self):
+        return hash(("column", self.id))
+
+    def __repr__(self):
+        return f"<ColumnDef {self.module}.{self.table}.{self.name} {self.type}>"
+
+
+class ColumnMap(Mapping):
+    """Tablonun kolonları: ad -> ColumnDef (tanım sırasıyla)"""
+
+    __slots__ = ("model", "table_id")
+
+    def __init__(self, model: "SchemaModel", table_id: int):
+        self.model = model
+        self.table_id = table_id
+
+    def __getitem__(self, name: str) -> ColumnDef:
+        return ColumnDef(self.model, self.model._column_ids(self.table_id)[name])
+
+    def __contains__(self, name) -> bool:
+        return name in self.model._column_ids(self.table_id)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.model._column_ids(self.table_id))
+
+    def __len__(self) -> int:
+        return len(self.model._column_ids(self.table_id))
+
+
+class TableDef:
+    """Tablo görünümü"""
+
+    __slots__ = ("model", "id")
+
+    def __init__(self, model: "SchemaModel", table_id: int):
+        self.model = model
+        self.id = table_id
+
+    def _field(self, offset: int) -> int:
+        return self.model.tables[self.id * TABLE_FIELDS + offset]
+
+    @property
+    def module(self) -> str:
+        return self.model.module_name(self._field(0))
+
+    @property
+    def name(self) -> str:
+        return self.model.string(self._field(1))
+
+    @property
+    def column_ids(self) -> range:
+        first = self._field(2)
+        return range(first, first + self._field(3))
+
+    @property
+    def columns(self) -> ColumnMap:
+        return ColumnMap(self.model, self.id)
+
+    @property
+    def primary_key(self) -> List[str]:
+        model = self.model
+        return [name for name, column_id in model._column_ids(self.id).items()
+                if model.columns[column_id * COLUMN_FIELDS + 3] & PRIMARY_KEY]
+
+    is_master = property(lambda self: bool(self._field(4) & MASTER))
+    audit = property(lambda self: bool(self._field(4) & AUDIT))
+    soft_delete = property(lambda self: bool(self._field(4) & SOFT_DELETE))
+
+    def __eq__(self, other):
+        return isinstance(other, TableDef) and other.model is self.model and other.id == self.id
+
+    def __hash__(self):
+        return hash(("table", self.id))
+
+    def __repr__(self):
+        return f"<TableDef {self.module}.{self.name}>"
+
+
+class SchemaModel:
+    """
+    Salt okunur şema modeli.
+
+    build() ile modül verisinden oluşturulur veya open() ile dosyadan
+    eşlenir; iki durumda da aynı arayüz kullanılır.
+    """
+
+    def __init__(self, strings: List[Optional[str]], offsets, blob, modules, tables, columns,
+                 key: bytes = b"", buffer=None):
+        # strings: çözülmüş adlar; mmap'li modelde ilk erişimde doldurulur
+        self._strings = strings
+        self._offsets = offsets
+        self._blob = blob
+        self.modules = modules
+        self.tables = tables
+        self.columns = columns
+        self.key = key
+        self._buffer = buffer
+        self._root: Optional[memoryview] = None
+        self._module_ids: Optional[Dict[str, int]] = None
+        self._table_index: Optional[Dict[Tuple[int, str], int]] = None
+        self._table_modules: Optional[Dict[str, List[int]]] = None
+        self._columns_by_table: Dict[int, Dict[str, int]] = {}
+
+    # ------------------------------------------------------------------
+    # Oluşturma
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def build(cls, modules: Dict[str, Dict], key: bytes = b"") -> "SchemaModel":
+        """
+        Args:
+            modules: Modül anahtarı -> ayrıştırılmış modül verisi
+            key: Dosyaya yazılan içerik anahtarı (32 bayta tamamlanır)
+        """
+        pool: Dict[str, int] = {}
+        strings: List[str] = []
+
+        def intern(value) -> int:
+            if not isinstance(value, str):
+                return NONE
+            sid = pool.get(value)
+            if sid is None:
+                sid = pool[value] = len(strings)
+                strings.append(sys.intern(value))
+            return sid
+
+        module_rows = array("i")
+        table_rows = array("i")
+        column_rows = array("i")
+        # (modül id, tablo adı) -> tablo id; aynı modülde tekrar eden tabloda sonuncusu
+        table_index: Dict[Tuple[int, str], int] = {}
+        pending: List[Tuple[int, Dict, int]] = []
+
+        for module_id, (module_name, module_data) in enumerate(modules.items()):
+            first_table = len(table_rows) // TABLE_FIELDS
+            for table in module_data.get("tables", []):
+                table_name = table.get("pl_table")
+                if not table_name or not isinstance(table_name, str):
+                    continue
+                table_id = len(table_rows) // TABLE_FIELDS
+                first_column = len(column_rows) // COLUMN_FIELDS
+                seen = set()
+                for column in table.get("columns", []):
+                    if not isinstance(column, dict):
+                        continue
+                    name = column_name(column)
+                    if not name or not isinstance(name, str) or name in seen:
+                        continue
+                    seen.add(name)
+                    flags = 0
+                    for attr, flag in _COLUMN_FLAGS:
+                        if column.get(attr):
+                            flags |= flag
+                    fk = column.get("foreign_key")
+                    if isinstance(fk, dict) and fk:
+                        flags |= FOREIGN_KEY
+                        pending.append((len(column_rows) // COLUMN_FIELDS, fk, module_id))
+                        fk_fields = (intern(fk.get("module")), intern(fk.get("table")), intern(fk.get("column")))
+                    else:
+                        fk_fields = (NONE, NONE, NONE)
+                    column_rows.extend((table_id, intern(name), intern(column.get("type")), flags)
+                                       + fk_fields + (NONE, _int(column.get("max_length")),
+                                                      _int(column.get("precision")), _int(column.get("scale"))))
+                flags = 0
+                for attr, flag in _TABLE_FLAGS:
+                    if table.get(attr):
+                        flags |= flag
+                table_rows.extend((module_id, intern(table_name), first_column,
+                                   len(column_rows) // COLUMN_FIELDS - first_column, flags))
+                table_index[(module_id, table_name)] = table_id
+            module_rows.extend((intern(module_name), intern(module_data.get("version")), first_table,
+                                len(table_rows) // TABLE_FIELDS - first_table))
+
+        offsets = array("i", [0])
+        blob = bytearray()
+        for value in strings:
+            blob += value.encode("utf-8")
+            offsets.append(len(blob))
+
+        model = cls(strings, offsets, bytes(blob), module_rows, table_rows, column_rows,
+                    key[:32].ljust(32, b"\0"))
+        model._table_index = table_index
+
+        # FK hedeflerini çöz (validate_foreign_keys ile aynı kurallar)
+        module_ids = model._modules_by_name()
+        for column_id, fk, module_id in pending:
+            target_module, target_table, target_column = fk.get("module"), fk.get("table"), fk.get("column")
+            if not (isinstance(target_table, str) and isinstance(target_column, str)):
+                continue
+            if "module" in fk:
+                module_id = module_ids.get(target_module) if isinstance(target_module, str) else None
+            target = table_index.get((module_id, target_table))
+            if target is None:
+                continue
+            target_column = model._column_ids(target).get(target_column)
+            if target_column is not None:
+                column_rows[column_id * COLUMN_FIELDS + 7] = target_column
+        return model
+
+    # ------------------------------------------------------------------
+    # İkili format
+    # ------------------------------------------------------------------
+
+    def to_bytes(self) -> bytes:
+        header = _HEADER.pack(MAGIC, MODEL_VERSION, _BYTE_ORDER, len(self._offsets) - 1,
+                              len(self.modules) // MODULE_FIELDS, len(self.tables) // TABLE_FIELDS,
+                              len(self.columns) // COLUMN_FIELDS, len(self._blob), self.key)
+        parts = [header]
+        for values in (self._offsets, self.modules, self.tables, self.columns):
+            parts.append(values.tobytes() if isinstance(values, array) else bytes(values.cast("B")))
+        parts.append(bytes(self._blob))
+        return b"".join(parts)
+
+    def save(self, path: str):
+        """Atomik yazım; açık mmap'ler eski dosyayı görmeye devam eder"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, 'wb') as f:
+            f.write(self.to_bytes())
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def from_buffer(cls, buffer, owner=None) -> "SchemaModel":
+        """
+        Kayıt dizilerini kopyalamadan tampon üzerinde kurar.
+
+        Raises:
+            ValueError: Tampon bu sürümün model formatında değilse
+        """
+        size = len(buffer)
+        if size < _HEADER.size:
+            raise ValueError("Model dosyası eksik")
+        magic, version, byte_order, n_strings, n_modules, n_tables, n_columns, blob_size, key = \
+            _HEADER.unpack_from(buffer)
+        if magic != MAGIC or version != MODEL_VERSION:
+            raise ValueError("Desteklenmeyen model dosyası")
+        if byte_order != _BYTE_ORDER:
+            raise ValueError("Model dosyası farklı bayt sırasıyla yazılmış")
+        counts = (n_strings + 1, n_modules * MODULE_FIELDS, n_tables * TABLE_FIELDS, n_columns * COLUMN_FIELDS)
+        if _HEADER.size + sum(counts) * 4 + blob_size > size:
+            raise ValueError("Model dosyası eksik")
+
+        # Boyutlar doğrulandıktan sonra görünüm alınır (hata halinde mmap kapatılabilsin)
+        view = memoryview(buffer)
+        pos = _HEADER.size
+        sections = []
+        for count in counts:
+            end = pos + count * 4
+            sections.append(view[pos:end].cast("i"))
+            pos = end
+        offsets, modules, tables, columns = sections
+        model = cls([None] * n_strings, offsets, view[pos:pos + blob_size], modules, tables, columns,
+                    key, owner)
+        model._root = view
+        return model
+
+    @classmethod
+    def open(cls, path: str) -> "SchemaModel":
+        """Dosyayı salt okunur eşler; sayfalar process'ler arasında paylaşılır"""
+        with open(path, 'rb') as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            return cls.from_buffer(mapped, mapped)
+        except ValueError:
+            mapped.close()
+            raise
+
+    def close(self):
+        """mmap'li modeli kapatır (görünümler artık kullanılamaz)"""
+        if self._buffer is None:
+            return
+        for view in (self._offsets, self.modules, self.tables, self.columns, self._blob, self._root):
+            view.release()
+        self._buffer.close()
+        self._buffer = None
+
+    @property
+    def mapped(self) -> bool:
+        return self._buffer is not None
+
+    @property
+    def nbytes(self) -> int:
+        """Kayıt dizileri ve string havuzunun bayt boyutu"""
+        return sum(len(v) * 4 for v in (self._offsets, self.modules, self.tables, self.columns)) \
+            + len(self._blob)
+
+    # ------------------------------------------------------------------
+    # Erişim
+    # ------------------------------------------------------------------
+
+    def string(self, sid: int) -> Optional[str]:
+        if sid == NONE:
+            return None
+        value = self._strings[sid]
+        if value is None:
+            value = self._strings[sid] = sys.intern(
+                str(self._blob[self._offsets[sid]:self._offsets[sid + 1]], "utf-8"))
+        return value
+
+    @property
+    def module_count(self) -> int:
+        return len(self.modules) // MODULE_FIELDS
+
+    @property
+    def table_count(self) -> int:
+        return len(self.tables) // TABLE_FIELDS
+
+    @property
+    def column_count(self) -> int:
+        return len(self.columns) // COLUMN_FIELDS
+
+    @property
+    def string_count(self) -> int:
+        return len(self._offsets) - 1
+
+    def module_name(self, module_id: int) -> str:
+        return self.string(self.modules[module_id * MODULE_FIELDS])
+
+    def module_version(self, module_id: int) -> Optional[str]:
+        return self.string(self.modules[module_id * MODULE_FIELDS + 1])
+
+    def module_names(self) -> List[str]:
+        return [self.module_name(i) for i in range(self.module_count)]
+
+    def module_tables(self, module_name: str) -> List[TableDef]:
+        module_id = self._modules_by_name().get(module_name)
+        if module_id is None:
+            return []
+        first = self.modules[module_id * MODULE_FIELDS + 2]
+        return [TableDef(self, i) for i in range(first, first + self.modules[module_id * MODULE_FIELDS + 3])]
+
+    def iter_tables(self) -> Iterator[TableDef]:
+        for table_id in range(self.table_count):
+            yield TableDef(self, table_id)
+
+    def _modules_by_name(self) -> Dict[str, int]:
+        if self._module_ids is None:
+            self._module_ids = {self.module_name(i): i for i in range(self.module_count)}
+        return self._module_ids
+
+    def _tables_by_name(self) -> Dict[Tuple[int, str], int]:
+        if self._table_index is None:
+            tables = self.tables
+            self._table_index = {
+                (tables[i * TABLE_FIELDS], self.string(tables[i * TABLE_FIELDS + 1])): i
+                for i in range(self.table_count)
+            }
+        return self._table_index
+
+    def _owners(self) -> Dict[str, List[int]]:
+        """Nitelenmemiş tablo adı -> tanımlayan modül id'leri (modül sırasıyla)"""
+        if self._table_modules is None:
+            owners: Dict[str, List[int]] = {}
+            for module_id, name in self._tables_by_name():
+                owners.setdefault(name, []).append(module_id)
+            for module_ids in owners.values():
+                module_ids.sort()
+            self._table_modules = owners
+        return self._table_modules
+
+    def _column_ids(self, table_id: int) -> Dict[str, int]:
+        ids = self._columns_by_table.get(table_id)
+        if ids is None:
+            first = self.tables[table_id * TABLE_FIELDS + 2]
+            count = self.tables[table_id * TABLE_FIELDS + 3]
+            columns = self.columns
+            ids = self._columns_by_table[table_id] = {
+                self.string(columns[i * COLUMN_FIELDS + 1]): i for i in range(first, first + count)
+            }
+        return ids
+
+    # ------------------------------------------------------------------
+    # SymbolIndex arayüzü
+    # ------------------------------------------------------------------
+
+    def has_module(self, module_name: str) -> bool:
+        return module_name in self._modules_by_name()
+
+    def table(self, module_name: str, table_name: str) -> Optional[TableDef]:
+        module_id = self._modules_by_name().get(module_name)
+        if module_id is None:
+            return None
+        table_id = self._tables_by_name().get((module_id, table_name))
+        return None if table_id is None else TableDef(self, table_id)
+
+    def column(self, module_name: str, table_name: str, column_name: str) -> Optional[ColumnDef]:
+        table = self.table(module_name, table_name)
+        if table is None:
+            return None
+        column_id = self._column_ids(table.id).get(column_name)
+        return None if column_id is None else ColumnDef(self, column_id)
+
+    def find_table(self, table_name: str, prefer_module: str = None) -> Optional[TableDef]:
+        """
+        Nitelenmemiş tablo adını çözer; önce tercih edilen modüle,
+        sonra tabloyu tanımlayan ilk modüle bakar.
+        """
+        if prefer_module is not None:
+            table = self.table(prefer_module, table_name)
+            if table is not None:
+                return table
+
+        owners = self._owners().get(table_name)
+        if not owners:
+            return None
+        return TableDef(self, self._tables_by_name()[(owners[0], table_name)])
+
+    def resolve_source(self, source: str, module_name: str,
+                       base_tables: List[str]) -> Tuple[Optional[TableDef], Optional[ColumnDef]]:
+        """View kolon kaynağını ("tablo.kolon" veya sadece "kolon") çözer"""
+        if "." in source:
+            table_name, column_name = source.split(".", 1)
+            table = self.find_table(table_name, module_name)
+            if table is None:
+                return None, None
+            column_id = self._column_ids(table.id).get(column_name)
+            return table, None if column_id is None else ColumnDef(self, column_id)
+
+        for table_name in base_tables:
+            table = self.find_table(table_name, module_name)
+            if table is not None:
+                column_id = self._column_ids(table.id).get(source)
+                if column_id is not None:
+                    return table, ColumnDef(self, column_id)
+        return None, None
+
+    def summary(self) -> Dict:
+        return {
+            "modules": self.module_count,
+            "tables": self.table_count,
+            "columns": self.column_count,
+            "strings": self.string_count,
+            "bytes": self.nbytes,
+            "mapped": self.mapped
+        }
@@ -0,0 +1,180 @@
+"""
+PaktLang Validation Profiler
+Doğrulama fazları ve kuralları için süre ölçümü, sayaçlar ve hook'lar
+"""
+
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+
+# Kural kodu -> ölçülen kontrol
+RULE_LABELS = {
+    "PL001": "JSON okuma/ayrıştırma",
+    "PL002": "Tip kontrolü",
+    "PL003": "Zorunlu alanlar",
+    "PL004": "Duplike kolon",
+    "PL005": "Referans kontrolleri (FK, view, relations)",
+    "PL006": "Bağımlılık döngüleri",
+    "PL007": "Versiyon formatı",
+    "PL008": "Regex pattern",
+    "PL009": "Değer aralığı",
+    "PL010": "Reserved keyword",
+}
+
+COUNTERS = (
+    "files", "cache_hits", "modules", "tables", "columns",
+    "regex_compiled", "foreign_keys", "view_columns", "relation_refs"
+)
+
+
+class Profiler:
+    """
+    Doğrulama profili.
+
+    SchemaValidator'a verildiğinde faz (parse, module_rules, symbol_index,
+    foreign_keys, ...) ve kural kodu (PL001-PL010) bazında süre, modül
+    bazında döküm ve sayaçlar toplar. Validator profiler verilmediğinde
+    sadece `is not None` kontrolü yapar.
+
+    Hook'lar:
+        phase(name, seconds) - her faz bitiminde
+        module(name, stats) - her modül doğrulandığında
+    """
+
+    clock = staticmethod(time.perf_counter)
+
+    def __init__(self):
+        self.phases: Dict[str, List[float]] = {}
+        self.rules: Dict[str, List[float]] = {}
+        self.counters: Dict[str, int] = dict.fromkeys(COUNTERS, 0)
+        self.modules: Dict[str, Dict[str, Any]] = {}
+        self.hooks: Dict[str, List[Callable]] = {"phase": [], "module": []}
+
+    def on(self, event: str, callback: Callable):
+        """Hook ekler (event: phase veya module)"""
+        self.hooks[event].append(callback)
+
+    # ------------------------------------------------------------------
+    # Kayıt
+    # ------------------------------------------------------------------
+
+    def lap(self, code: str, started: float) -> float:
+        """
+        started anından beri geçen süreyi kural koduna ekler.
+
+        Returns:
+            Şimdiki zaman (bir sonraki kontrolün başlangıcı)
+        """
+        now = time.perf_counter()
+        entry = self.rules.get(code)
+        if entry is None:
+            entry = self.rules[code] = [0.0, 0]
+        entry[0] += now - started
+        entry[1] += 1
+        return now
+
+    def phase(self, name: str, started: float) -> float:
+        """started anından beri geçen süreyi faza ekler; şimdiki zamanı döner"""
+        now = time.perf_counter()
+        entry = self.phases.get(name)
+        if entry is None:
+            entry = self.phases[name] = [0.0, 0]
+        entry[0] += now - started
+        entry[1] += 1
+        for callback in self.hooks["phase"]:
+            callback(name, now - started)
+        return now
+
+    def count(self, name: str, amount: int = 1):
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    def module(self, name: str, seconds: float, data: Optional[Dict],
+               issues: Iterable[Dict] = ()):
+        """Modül dökümü: süre, tablo/kolon sayısı ve kural kodu başına bulgu"""
+        tables = data.get("tables", []) if isinstance(data, dict) else []
+        stats = {
+            "seconds": seconds,
+            "tables": len(tables),
+            "columns": sum(len(t.get("columns", [])) for t in tables if isinstance(t, dict)),
+            "issues": {},
+        }
+        for issue in issues:
+            stats["issues"][issue["code"]] = stats["issues"].get(issue["code"], 0) + 1
+        self.modules[name] = stats
+        self.counters["modules"] += 1
+        self.counters["tables"] += stats["tables"]
+        self.counters["columns"] += stats["columns"]
+        for callback in self.hooks["module"]:
+            callback(name, stats)
+
+    def merge(self, other: Dict):
+        """Başka bir profilin to_dict() çıktısını ekler (process havuzu için)"""
+        for target, source in ((self.phases, other["phases"]), (self.rules, other["rules"])):
+            for name, item in source.items():
+                entry = target.setdefault(name, [0.0, 0])
+                entry[0] += item["seconds"]
+                entry[1] += item["calls"]
+        for name, value in other["counters"].items():
+            self.count(name, value)
+        for name, stats in other["modules"].items():
+            self.modules[name] = stats
+            for callback in self.hooks["module"]:
+                callback(name, stats)
+
+    # ------------------------------------------------------------------
+    # Rapor
+    # ------------------------------------------------------------------
+
+    def to_dict(self, issues: Iterable[Dict] = ()) -> Dict:
+        """
+        Args:
+            issues: Kural kodu başına bulgu sayısı için hata/uyarı listesi
+        """
+        found: Dict[str, int] = {}
+        for issue in issues:
+            found[issue["code"]] = found.get(issue["code"], 0) + 1
+
+        def timings(entries: Dict[str, List[float]]) -> Dict[str, Dict]:
+            return {
+                name: {"seconds": round(seconds, 6), "calls": calls}
+                for name, (seconds, calls) in entries.items()
+            }
+
+        rules = timings(self.rules)
+        for code, item in rules.items():
+            item["issues"] = found.get(code, 0)
+        for code, count in found.items():
+            rules.setdefault(code, {"seconds": 0.0, "calls": 0, "issues": count})
+
+        return {
+            "phases": timings(self.phases),
+            "rules": dict(sorted(rules.items())),
+            "counters": dict(self.counters),
+            "modules": {
+                name: dict(stats, seconds=round(stats["seconds"], 6))
+                for name, stats in self.modules.items()
+            },
+        }
+
+
+def format_profile(profile: Dict) -> str:
+    """to_dict() çıktısının metin raporu"""
+    lines = ["", "Profil", "-" * 50, "Fazlar:"]
+    for name, item in sorted(profile["phases"].items(), key=lambda kv: -kv[1]["seconds"]):
+        lines.append(f"  {name:<22} {item['seconds'] * 1000:>10.2f} ms  {item['calls']:>7} çağrı")
+
+    lines.append("Kurallar:")
+    for code, item in profile["rules"].items():
+        label = RULE_LABELS.get(code, "")
+        lines.append(f"  {code} {label:<42} {item['seconds'] * 1000:>9.2f} ms  "
+                     f"{item['calls']:>7} kontrol  {item['issues']:>4} bulgu")
+
+    lines.append("Modüller:")
+    for name, stats in sorted(profile["modules"].items(), key=lambda kv: -kv[1]["seconds"]):
+        issues = ", ".join(f"{code}={n}" for code, n in sorted(stats["issues"].items()))
+        lines.append(f"  {name:<28} {stats['seconds'] * 1000:>9.2f} ms  {stats['tables']:>4} tablo  "
+                     f"{stats['columns']:>5} kolon  {issues}")
+
+    counters = ", ".join(f"{k}={v}" for k, v in profile["counters"].items())
+    lines.append(f"Sayaçlar: {counters}")
+    return "\n".join(lines)
@@ -0,0 +1,463 @@
+"""
+PaktLang Rule Registry
+Doğrulama kurallarının kaydı ve seviye bazında tip dispatch tablolarına derlenmesi
+"""
+
+import json
+import re
+import threading
+from pathlib import Path
+from typing import Callable, Dict, FrozenSet, Iterable, List, Optional, Pattern, Tuple
+
+
+# Doğrulama seviyeleri (meta/paktlang.meta.json validation.levels)
+LEVELS = ("syntax", "schema", "semantic", "cross_module")
+
+SCOPES = ("module", "table", "columns", "column", "cross_module")
+
+# Temel veri tipleri
+BASE_TYPES = (
+    "integer", "bigint", "decimal", "string", "text", "boolean",
+    "date", "datetime", "time", "enum", "json", "uuid", "binary"
+)
+
+# ERP özel tipleri
+ERP_TYPES = (
+    "currency", "quantity", "unit_price", "percentage", "tax_rate",
+    "discount_rate", "exchange_rate", "erp_code", "document_number",
+    "tax_number", "tc_kimlik", "phone", "email", "iban",
+    "currency_code", "country_code", "unit_code", "fiscal_year",
+    "fiscal_period", "account_code", "warehouse_code"
+)
+
+KNOWN_TYPES: FrozenSet[str] = frozenset(BASE_TYPES + ERP_TYPES)
+
+# Reserved keywords (SQL)
+RESERVED_KEYWORDS = (
+    "select", "insert", "update", "delete", "from", "where", "and", "or",
+    "table", "index", "create", "drop", "alter", "primary", "foreign", "key"
+)
+
+_RESERVED: FrozenSet[str] = frozenset(RESERVED_KEYWORDS)
+
+REQUIRED_MODULE_FIELDS = ("module", "version", "description", "tables")
+REQUIRED_TABLE_FIELDS = ("pl_table", "columns")
+REQUIRED_COLUMN_FIELDS = ("name", "type")
+
+_VERSION_RE = re.compile(r'^\d+\.\d+\.\d+$')
+
+# pattern -> derlenmiş regex (geçersizse None); şema genelinde aynı
+# pattern'ler tekrar ettiği için her biri bir kez derlenir. Uzun süre
+# çalışan süreçlerde (servis) sınırsız büyümemesi için en eski kayıtlar
+# PATTERNS_LIMIT aşıldığında atılır.
+PATTERNS: Dict[str, Optional[Pattern]] = {}
+PATTERNS_LIMIT = 4096
+_PATTERNS_LOCK = threading.Lock()
+
+
+def compile_pattern(pattern: str) -> Optional[Pattern]:
+    """Memoize edilmiş re.compile; geçersiz pattern için None"""
+    try:
+        return PATTERNS[pattern]
+    except KeyError:
+        pass
+    try:
+        compiled = re.compile(pattern)
+    except (re.error, TypeError):
+        compiled = None
+    with _PATTERNS_LOCK:
+        while len(PATTERNS) >= PATTERNS_LIMIT:
+            del PATTERNS[next(iter(PATTERNS))]
+        PATTERNS[pattern] = compiled
+    return compiled
+
+
+def load_levels(meta_file: Path) -> Tuple[str, ...]:
+    """paktlang.meta.json validation.levels; dosya yoksa tüm seviyeler"""
+    try:
+        with open(meta_file, 'r', encoding='utf-8') as f:
+            levels = json.load(f).get("validation", {}).get("levels")
+    except (OSError, ValueError):
+        return LEVELS
+    return tuple(levels) if levels else LEVELS
+
+
+class Rule:
+    """
+    Tek bir doğrulama kuralı.
+
+    module/table/column kapsamındaki kurallar check(node, path, errors,
+    warnings) imzasındadır; bulguları ilgili listeye ekler ve düğümü
+    geçersiz kılan bir hata bulduysa True döner. gate=True kurallar
+    hata bulduğunda aynı düğümün kalan kuralları çalıştırılmaz.
+
+    columns kapsamındaki kurallar tablo başına bir kez check(table, path,
+    errors, warnings) ile çağrılır ve kolon sırasıyla çağrılacak
+    each(column, errors, warnings) fonksiyonunu (veya None) döner; kolonlar
+    arası kontroller (duplike ad gibi) böylece bulguları ilgili kolonun
+    kendi kurallarından hemen önce raporlar.
+
+    cross_module kuralları check(validator, modules, relations, index)
+    imzasındadır ve bulgu listesi döner.
+    """
+
+    __slots__ = ("name", "code", "level", "scope", "types", "gate", "check")
+
+    def __init__(self, name: str, code: str, level: str, scope: str, check: Callable,
+                 types: Iterable[str] = None, gate: bool = False):
+        if level not in LEVELS:
+            raise ValueError(f"Bilinmeyen doğrulama seviyesi: {level}")
+        if scope not in SCOPES:
+            raise ValueError(f"Bilinmeyen kural kapsamı: {scope}")
+        self.name = name
+        self.code = code
+        self.level = level
+        self.scope = scope
+        self.types: Optional[FrozenSet[str]] = frozenset(types) if types is not None else None
+        self.gate = gate
+        self.check = check
+
+
+class CompiledRules:
+    """
+    Seviye seçimine göre derlenmiş kural tabloları.
+
+    Kolon kuralları tip başına tuple'lara dağıtılır; bir kolon için sadece
+    kendi tipine uygulanan kurallar çalışır.
+    """
+
+    def __init__(self, levels: FrozenSet[str]):
+        self.levels = levels
+        self.module_gates: Tuple[Callable, ...] = ()
+        self.module_checks: Tuple[Callable, ...] = ()
+        self.table_gates: Tuple[Callable, ...] = ()
+        self.table_checks: Tuple[Callable, ...] = ()
+        self.column_sequences: Tuple[Callable, ...] = ()
+        self.column_gates: Tuple[Callable, ...] = ()
+        self.column_dispatch: Dict[str, Tuple[Callable, ...]] = {}
+        self.column_default: Tuple[Callable, ...] = ()
+        self.cross: Tuple[Tuple[str, Callable], ...] = ()
+
+    @property
+    def cross_module(self) -> bool:
+        return "cross_module" in self.levels
+
+    def check_column(self, column: Dict, table_path: str, index: int,
+                     errors: List, warnings: List) -> bool:
+        failed = False
+        if self.column_gates:
+            path = f"{table_path}.columns[{index}]"
+            for check in self.column_gates:
+                if check(column, path, errors, warnings):
+                    return False
+        path = f"{table_path}.{column.get('name', 'unknown')}"
+        type_name = column.get("type")
+        # Liste/sözlük gibi hatalı tipler dispatch anahtarı olamaz; genel kurallar PL002 raporlar
+        checks = self.column_dispatch.get(type_name, self.column_default) \
+            if isinstance(type_name, str) else self.column_default
+        for check in checks:
+            if check(column, path, errors, warnings):
+                failed = True
+        return not failed
+
+    def check_table(self, table: Dict, module_name: str, index: int,
+                    errors: List, warnings: List) -> bool:
+        path = f"{module_name}.tables[{index}]"
+        for check in self.table_gates:
+            if check(table, path, errors, warnings):
+                return False
+        path = f"{module_name}.{table.get('pl_table', 'unknown')}"
+        failed = False
+        for check in self.table_checks:
+            if check(table, path, errors, warnings):
+                failed = True
+        sequences = [each for each in (start(table, path, errors, warnings)
+                                       for start in self.column_sequences) if each is not None]
+        check_column = self.check_column
+        for i, column in enumerate(table.get("columns", [])):
+            for each in sequences:
+                if each(column, errors, warnings):
+                    failed = True
+            if not check_column(column, path, i, errors, warnings):
+                failed = True
+        return not failed
+
+    def check_module_header(self, data: Dict, module_name: str,
+                            errors: List, warnings: List) -> Optional[bool]:
+        """Modül kapsamındaki kurallar (tablolar hariç); gate kuralı hata bulduysa None"""
+        for check in self.module_gates:
+            if check(data, module_name, errors, warnings):
+                return None
+        failed = False
+        for check in self.module_checks:
+            if check(data, module_name, errors, warnings):
+                failed = True
+        return not failed
+
+    def check_module(self, data: Dict, module_name: str, errors: List, warnings: List) -> bool:
+        valid = self.check_module_header(data, module_name, errors, warnings)
+        if valid is None:
+            return False
+        failed = not valid
+        check_table = self.check_table
+        for i, table in enumerate(data.get("tables", [])):
+            if not check_table(table, module_name, i, errors, warnings):
+                failed = True
+        return not failed
+
+
+class RuleRegistry:
+    """
+    Kural kaydı.
+
+    Kurallar bir kez tanımlanır; compile() seçilen seviyeler için dispatch
+    tablolarını üretir. Müşteriye özel kurallar register() veya rule()
+    dekoratörü ile eklenir:
+
+        @RULES.rule("CUST001", "semantic", "column", types=["string"])
+        def string_length_required(column, path, errors, warnings):
+            ...
+    """
+
+    def __init__(self, rules: Iterable[Rule] = ()):
+        self.rules: List[Rule] = list(rules)
+
+    def register(self, rule: Rule) -> Rule:
+        self.rules = [r for r in self.rules if r.name != rule.name]
+        self.rules.append(rule)
+        return rule
+
+    def rule(self, code: str, level: str, scope: str, types: Iterable[str] = None,
+             gate: bool = False, name: str = None):
+        """Fonksiyonu kural olarak kaydeden dekoratör"""
+        def decorator(func: Callable) -> Callable:
+            self.register(Rule(name or func.__name__, code, level, scope, func, types, gate))
+            return func
+        return decorator
+
+    def copy(self) -> "RuleRegistry":
+        return RuleRegistry(self.rules)
+
+    def signature(self) -> List[Tuple[str, str, str, str]]:
+        """Önbellek parmak izi için kural listesi"""
+        return [(r.name, r.code, r.level, r.scope) for r in self.rules]
+
+    def compile(self, levels: Iterable[str] = LEVELS, profiler=None) -> CompiledRules:
+        """
+        Args:
+            levels: Çalıştırılacak doğrulama seviyeleri
+            profiler: Verilirse her kural, süresini kural koduna yazan
+                bir sarmalayıcı ile derlenir
+        """
+        compiled = CompiledRules(frozenset(levels))
+        selected = [r for r in self.rules if r.level in compiled.levels]
+
+        def checks(scope: str, gate: bool, type_name: str = None) -> Tuple[Callable, ...]:
+            return tuple(
+                _timed(r, profiler)
+                for r in selected
+                if r.scope == scope and r.gate == gate
+                and (type_name is None or r.types is None or type_name in r.types)
+            )
+
+        compiled.module_gates = checks("module", True)
+        compiled.module_checks = checks("module", False)
+        compiled.table_gates = checks("table", True)
+        compiled.table_checks = checks("table", False)
+        compiled.column_sequences = checks("columns", False)
+        compiled.column_gates = checks("column", True)
+
+        typed = set(KNOWN_TYPES)
+        for r in selected:
+            if r.scope == "column" and r.types:
+                typed.update(r.types)
+        compiled.column_dispatch = {t: checks("column", False, t) for t in typed}
+        compiled.column_default = tuple(
+            _timed(r, profiler) for r in selected
+            if r.scope == "column" and not r.gate and r.types is None
+        )
+        compiled.cross = tuple(
+            (r.name, _timed(r, profiler)) for r in selected if r.scope == "cross_module"
+        )
+        return compiled
+
+
+def _timed(rule: Rule, profiler) -> Callable:
+    if profiler is None:
+        return rule.check
+    check, code, name = rule.check, rule.code, rule.name
+    clock = profiler.clock
+
+    if rule.scope == "cross_module":
+        def timed(*args):
+            started = clock()
+            try:
+                return check(*args)
+            finally:
+                profiler.lap(code, started)
+                profiler.phase(name, started)
+    elif rule.scope == "columns":
+        def timed_each(each):
+            def timed(column, errors, warnings):
+                started = clock()
+                try:
+                    return each(column, errors, warnings)
+                finally:
+                    profiler.lap(code, started)
+            return timed
+
+        def timed(node, path, errors, warnings):
+            started = clock()
+            try:
+                each = check(node, path, errors, warnings)
+            finally:
+                profiler.lap(code, started)
+            return timed_each(each) if each is not None else None
+    else:
+        def timed(node, path, errors, warnings):
+            started = clock()
+            try:
+                return check(node, path, errors, warnings)
+            finally:
+                profiler.lap(code, started)
+    return timed
+
+
+# ----------------------------------------------------------------------
+# Yerleşik kurallar
+# ----------------------------------------------------------------------
+
+RULES = RuleRegistry()
+
+
+def _issue(code: str, message: str, path: str, severity: str = "error"):
+    # ValidationError schema_validator'da tanımlı; döngüsel import olmaması için geç import
+    from .schema_validator import ValidationError
+    return ValidationError(code, message, path, severity)
+
+
+def _required(fields: Tuple[str, ...], node: Dict, path: str, errors: List) -> bool:
+    failed = False
+    for field in fields:
+        if field not in node:
+            errors.append(_issue("PL003", f"Zorunlu alan eksik: {field}", path))
+            failed = True
+    return failed
+
+
+@RULES.rule("PL003", "syntax", "module")
+def module_required_fields(data, module_name, errors, warnings):
+    return _required(REQUIRED_MODULE_FIELDS, data, module_name, errors)
+
+
+@RULES.rule("PL007", "syntax", "module")
+def module_version(data, module_name, errors, warnings):
+    version = data.get("version", "")
+    if not isinstance(version, str) or not _VERSION_RE.match(version):
+        errors.append(_issue(
+            "PL007", f"Geçersiz versiyon formatı: {version} (beklenen: X.Y.Z)", module_name
+        ))
+        return True
+    return False
+
+
+@RULES.rule("PL003", "syntax", "table", gate=True)
+def table_required_fields(table, path, errors, warnings):
+    return _required(REQUIRED_TABLE_FIELDS, table, path, errors)
+
+
+@RULES.rule("PL004", "schema", "columns")
+def duplicate_columns(table, path, errors, warnings):
+    seen = set()
+
+    def each(column, errors, warnings):
+        name = column.get("name")
+        if not name or not isinstance(name, str):
+            return False
+        if name in seen:
+            errors.append(_issue("PL004", f"Duplike kolon adı: {name}", path))
+            return True
+        seen.add(name)
+        return False
+
+    return each
+
+
+@RULES.rule("PL003", "schema", "table")
+def primary_key_defined(table, path, errors, warnings):
+    if not any(col.get("primary_key") for col in table.get("columns", [])):
+        warnings.append(_issue("PL003", "Primary key tanımlanmamış", path, "warning"))
+    return False
+
+
+@RULES.rule("PL003", "syntax", "column", gate=True)
+def column_required_fields(column, path, errors, warnings):
+    return _required(REQUIRED_COLUMN_FIELDS, column, path, errors)
+
+
+@RULES.rule("PL002", "schema", "column")
+def column_type(column, path, errors, warnings):
+    type_name = column.get("type")
+    if not isinstance(type_name, str) or type_name not in KNOWN_TYPES:
+        errors.append(_issue("PL002", f"Bilinmeyen veri tipi: {type_name}", path))
+    # Bilinmeyen tip kolonu geçersiz kılmaz (tarihsel davranış)
+    return False
+
+
+@RULES.rule("PL010", "semantic", "column")
+def reserved_keyword(column, path, errors, warnings):
+    name = column.get("name", "unknown")
+    if isinstance(name, str) and name.lower() in _RESERVED:
+        errors.append(_issue("PL010", f"Reserved keyword kullanılmış: {name}", path))
+        return True
+    return False
+
+
+@RULES.rule("PL008", "schema", "column")
+def column_pattern(column, path, errors, warnings):
+    pattern = column.get("pattern")
+    if "pattern" in column and (not isinstance(pattern, str) or compile_pattern(pattern) is None):
+        errors.append(_issue("PL008", "Geçersiz regex pattern", path))
+        return True
+    return False
+
+
+@RULES.rule("PL003", "schema", "column", types=["enum"])
+def enum_values(column, path, errors, warnings):
+    if not column.get("values"):
+        errors.append(_issue("PL003", "Enum tipi için 'values' zorunlu", path))
+        return True
+    return False
+
+
+@RULES.rule("PL009", "semantic", "column", types=["decimal"])
+def decimal_scale(column, path, errors, warnings):
+    precision = column.get("precision", 18)
+    scale = column.get("scale", 2)
+    if scale > precision:
+        errors.append(_issue(
+            "PL009", f"Scale ({scale}) precision'dan ({precision}) büyük olamaz", path
+        ))
+        return True
+    return False
+
+
+# Modüller arası kontroller validator metodlarıdır; kayıt sırasıyla çalışır
+@RULES.rule("PL005", "cross_module", "cross_module", name="foreign_keys")
+def check_foreign_keys(validator, modules, relations, index):
+    return validator.validate_foreign_keys(modules, index)
+
+
+@RULES.rule("PL005", "cross_module", "cross_module", name="views")
+def check_views(validator, modules, relations, index):
+    return validator.validate_views(modules, index)
+
+
+@RULES.rule("PL005", "cross_module", "cross_module", name="relations")
+def check_relations(validator, modules, relations, index):
+    return validator.validate_relations(relations, index) if relations else []
+
+
+@RULES.rule("PL006", "cross_module", "cross_module", name="dependencies")
+def check_dependencies(validator, modules, relations, index):
+    return validator.validate_dependencies(modules, relations)
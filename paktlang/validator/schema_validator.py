@@ -3,31 +3,72 @@ PaktLang Schema Validator
 Şema dosyalarını doğrulama modülü
 """
 
+import copy
+import hashlib
+import io
 import json
 import os
-import re
+import sys
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional, Any
+from typing import Dict, Iterator, List, Tuple, Optional, Any
+
+if __name__ == "__main__" and not __package__:
+    # Script olarak çalıştırıldığında paket içi importlar için (PEP 366)
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+    __package__ = "paktlang.validator"
+
+from .cache import module_header, relations_header
+from .diagnostics import ReportSink, run_diagnostics
+from .graph import (
+    build_module_graph, build_table_graph, cycle_is_declared, cycle_is_required
+)
+from .profiling import Profiler
+from .rules import (
+    BASE_TYPES, ERP_TYPES, KNOWN_TYPES, LEVELS, PATTERNS, REQUIRED_COLUMN_FIELDS,
+    REQUIRED_MODULE_FIELDS, REQUIRED_TABLE_FIELDS, RESERVED_KEYWORDS, RULES,
+    RuleRegistry, load_levels
+)
+from .stream import (
+    StreamError, annotate_header, annotate_module, annotate_table, iter_module,
+    locate, offset_position, reference_positions
+)
+from .model import MODEL_FILE, SchemaModel
+from .symbols import SymbolIndex
 
 
 class ValidationError:
     """Doğrulama hatası"""
-    def __init__(self, code: str, message: str, path: str = "", severity: str = "error"):
+    def __init__(self, code: str, message: str, path: str = "", severity: str = "error",
+                 line: int = None, column: int = None):
         self.code = code
         self.message = message
         self.path = path
         self.severity = severity  # error, warning
+        # Kaynak dosyadaki konum (1 tabanlı); bilinmiyorsa None
+        self.line = line
+        self.column = column
     
     def __str__(self):
+        if self.line is not None:
+            return f"[{self.code}] {self.path} ({self.line}:{self.column}): {self.message}"
         return f"[{self.code}] {self.path}: {self.message}"
     
     def to_dict(self) -> Dict:
-        return {
+        result = {
             "code": self.code,
             "message": self.message,
             "path": self.path,
             "severity": self.severity
         }
+        if self.line is not None:
+            result["line"] = self.line
+            result["column"] = self.column
+        return result
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> "ValidationError":
+        return cls(data["code"], data["message"], data.get("path", ""), data.get("severity", "error"),
+                   data.get("line"), data.get("column"))
 
 
 class SchemaValidator:
@@ -47,45 +88,94 @@ class SchemaValidator:
         "PL010": "Reserved keyword kullanımı"
     }
     
-    # Temel veri tipleri
-    BASE_TYPES = [
-        "integer", "bigint", "decimal", "string", "text", "boolean",
-        "date", "datetime", "time", "enum", "json", "uuid", "binary"
-    ]
-    
-    # ERP özel tipleri
-    ERP_TYPES = [
-        "currency", "quantity", "unit_price", "percentage", "tax_rate",
-        "discount_rate", "exchange_rate", "erp_code", "document_number",
-        "tax_number", "tc_kimlik", "phone", "email", "iban",
-        "currency_code", "country_code", "unit_code", "fiscal_year",
-        "fiscal_period", "account_code", "warehouse_code"
-    ]
-    
-    # Zorunlu modül alanları
-    REQUIRED_MODULE_FIELDS = ["module", "version", "description", "tables"]
-    
-    # Zorunlu tablo alanları
-    REQUIRED_TABLE_FIELDS = ["pl_table", "columns"]
-    
-    # Zorunlu kolon alanları
-    REQUIRED_COLUMN_FIELDS = ["name", "type"]
-    
-    # Reserved keywords (SQL)
-    RESERVED_KEYWORDS = [
-        "select", "insert", "update", "delete", "from", "where", "and", "or",
-        "table", "index", "create", "drop", "alter", "primary", "foreign", "key"
-    ]
-    
-    def __init__(self, base_path: str = None):
+    # Geriye uyumluluk için validator.rules sabitlerinin takma adları;
+    # kurallar bu sabitleri doğrudan kullanır
+    BASE_TYPES = BASE_TYPES
+    ERP_TYPES = ERP_TYPES
+    REQUIRED_MODULE_FIELDS = REQUIRED_MODULE_FIELDS
+    REQUIRED_TABLE_FIELDS = REQUIRED_TABLE_FIELDS
+    REQUIRED_COLUMN_FIELDS = REQUIRED_COLUMN_FIELDS
+    RESERVED_KEYWORDS = RESERVED_KEYWORDS
+    
+    # Bu boyuttan büyük modül dosyaları varsayılan olarak akış halinde okunur
+    STREAM_THRESHOLD = 4 * 1024 * 1024
+    
+    def __init__(self, base_path: str = None, cache=None, profiler: Profiler = None,
+                 levels: List[str] = None, registry: RuleRegistry = None,
+                 stream: Optional[bool] = None):
         """
         Args:
             base_path: PaktLang şema dosyalarının bulunduğu ana dizin
+            cache: Opsiyonel SchemaCache; verilirse değişmeyen dosyalar
+                yeniden ayrıştırılmaz ve doğrulanmaz
+            profiler: Opsiyonel Profiler; verilirse faz/kural süreleri ve
+                sayaçlar toplanır
+            levels: Çalıştırılacak doğrulama seviyeleri (varsayılan:
+                meta/paktlang.meta.json validation.levels)
+            registry: Kural kaydı (varsayılan: yerleşik kurallar)
+            stream: True ise modül dosyaları tablo tablo akış halinde
+                okunur, False ise tek seferde; None ise STREAM_THRESHOLD
+                üzerindeki dosyalar akış halinde okunur
         """
         self.base_path = Path(base_path) if base_path else Path.cwd()
         self.errors: List[ValidationError] = []
         self.warnings: List[ValidationError] = []
         self.loaded_modules: Dict[str, Dict] = {}
+        self.cache = cache
+        self.profiler = profiler
+        self.stream = stream
+        
+        if levels is None:
+            levels = load_levels(self.base_path / "paktlang" / "meta" / "paktlang.meta.json")
+        unknown = set(levels) - set(LEVELS)
+        if unknown:
+            raise ValueError(f"Bilinmeyen doğrulama seviyesi: {', '.join(sorted(unknown))}")
+        self.levels = tuple(level for level in LEVELS if level in levels)
+        self.registry = registry or RULES
+        self.rules = self.registry.compile(self.levels, profiler)
+        
+        if cache is not None:
+            cache.fingerprint = self.rules_fingerprint(self.levels, self.registry)
+    
+    def fork(self) -> "SchemaValidator":
+        """
+        Aynı seviye ve kurallarla, boş sonuç durumuyla yeni validator.
+        
+        Derlenmiş kurallar durumsuzdur ve paylaşılır; bu yüzden her thread
+        veya istek kendi kopyasıyla aynı anda çalışabilir. Önbellek ve
+        profiler thread-safe olmadığı için kopyaya aktarılmaz.
+        """
+        clone = copy.copy(self)
+        clone.errors = []
+        clone.warnings = []
+        clone.loaded_modules = {}
+        clone.cache = None
+        clone.profiler = None
+        if self.profiler is not None:
+            # Süre ölçen sarmalayıcılar profiler'a yazar; kopya sade kurallarla çalışır
+            clone.rules = self.registry.compile(self.levels)
+        return clone
+    
+    @classmethod
+    def rules_fingerprint(cls, levels: Tuple[str, ...] = LEVELS,
+                          registry: RuleRegistry = RULES) -> str:
+        """Doğrulama kurallarının parmak izi (önbellek geçerliliği için)"""
+        rules = {
+            "errors": cls.ERROR_CODES,
+            "types": BASE_TYPES + ERP_TYPES,
+            "module": REQUIRED_MODULE_FIELDS,
+            "table": REQUIRED_TABLE_FIELDS,
+            "column": REQUIRED_COLUMN_FIELDS,
+            "reserved": RESERVED_KEYWORDS,
+            "levels": list(levels),
+            "rules": registry.signature()
+        }
+        raw = json.dumps(rules, sort_keys=True, ensure_ascii=False)
+        h = hashlib.sha256(raw.encode('utf-8'))
+        # Kontrol kodu değiştiğinde de önbellekteki sonuçlar geçersiz olur
+        for source in sorted(Path(__file__).parent.glob("*.py")):
+            h.update(source.read_bytes())
+        return h.hexdigest()
     
     def validate_json_syntax(self, file_path: str) -> Tuple[bool, Optional[Dict]]:
         """JSON syntax doğrulaması"""
@@ -95,7 +185,7 @@ class SchemaValidator:
             return True, data
         except json.JSONDecodeError as e:
             self.errors.append(ValidationError(
-                "PL001", f"JSON parse hatası: {str(e)}", file_path
+                "PL001", f"JSON parse hatası: {str(e)}", file_path, line=e.lineno, column=e.colno
             ))
             return False, None
         except FileNotFoundError:
@@ -106,8 +196,7 @@ class SchemaValidator:
     
     def validate_type(self, type_name: str, column_path: str) -> bool:
         """Veri tipi doğrulaması"""
-        all_types = self.BASE_TYPES + self.ERP_TYPES
-        if type_name not in all_types:
+        if not isinstance(type_name, str) or type_name not in KNOWN_TYPES:
             self.errors.append(ValidationError(
                 "PL002", f"Bilinmeyen veri tipi: {type_name}", column_path
             ))
@@ -115,151 +204,329 @@ class SchemaValidator:
         return True
     
     def validate_column(self, column: Dict, table_name: str, col_index: int) -> bool:
-        """Kolon doğrulaması"""
-        col_path = f"{table_name}.columns[{col_index}]"
-        is_valid = True
-        
-        # Zorunlu alanlar
-        for field in self.REQUIRED_COLUMN_FIELDS:
-            if field not in column:
-                self.errors.append(ValidationError(
-                    "PL003", f"Zorunlu alan eksik: {field}", col_path
-                ))
-                is_valid = False
+        """Kolon doğrulaması (seçili seviyelerin kolon kuralları)"""
+        return self.rules.check_column(column, table_name, col_index, self.errors, self.warnings)
+    
+    def validate_table(self, table: Dict, module_name: str, table_index: int) -> bool:
+        """Tablo ve kolonlarının doğrulaması"""
+        return self.rules.check_table(table, module_name, table_index, self.errors, self.warnings)
+    
+    def validate_module(self, file_path: str) -> Tuple[bool, List[ValidationError]]:
+        """Modül şemasını doğrular"""
+        if self.cache is None:
+            outcome = self._validate_file(file_path)
+        else:
+            outcome = self._collect_outcomes([Path(file_path)])[0]
+            self.cache.save()
         
-        if not is_valid:
-            return False
+        self.errors = [ValidationError.from_dict(e) for e in outcome["errors"]]
+        self.warnings = [ValidationError.from_dict(w) for w in outcome["warnings"]]
         
-        col_name = column.get("name", "unknown")
-        col_path = f"{table_name}.{col_name}"
+        data = outcome["data"]
+        if data is None and outcome["entry"] is not None:
+            data = self.cache.load_data(outcome["entry"])
+        if data is not None:
+            self.loaded_modules[data.get("module", Path(file_path).stem)] = data
         
-        # Tip doğrulama
-        if "type" in column:
-            self.validate_type(column["type"], col_path)
+        return outcome["valid"], self.errors + self.warnings
+    
+    def validate_module_stream(self, file_path: str, on_table=None) -> Tuple[bool, List[ValidationError]]:
+        """
+        Modül şemasını akış halinde doğrular; tablolar doğrulandıktan sonra
+        bellekte tutulmaz (bellek kullanımı en büyük tablo ile sınırlıdır).
         
-        # Reserved keyword kontrolü
-        if col_name.lower() in self.RESERVED_KEYWORDS:
-            self.errors.append(ValidationError(
-                "PL010", f"Reserved keyword kullanılmış: {col_name}", col_path
-            ))
+        Args:
+            on_table: Verilirse her tablo doğrulandıktan sonra çağrılır
+        """
+        self.errors = []
+        self.warnings = []
+        try:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                is_valid, _ = self._stream_module(f, file_path, keep=False, on_table=on_table)
+        except FileNotFoundError:
+            self.errors.append(ValidationError("PL001", "Dosya bulunamadı", file_path))
             is_valid = False
+        return is_valid, self.errors + self.warnings
+    
+    def _stream_module(self, fp, file_path: str, keep: bool = True,
+                       on_table=None) -> Tuple[bool, Optional[Dict]]:
+        """
+        Modülü tablo tablo ayrıştırıp doğrular; bulgular self.errors ve
+        self.warnings'e kaynak konumlarıyla eklenir.
         
-        # Pattern doğrulama (varsa)
-        if "pattern" in column:
-            try:
-                re.compile(column["pattern"])
-            except re.error:
-                self.errors.append(ValidationError(
-                    "PL008", f"Geçersiz regex pattern", col_path
-                ))
-                is_valid = False
+        Modül kuralları dosya sonunda (tüm üst seviye alanlar okunduktan
+        sonra) çalışır; bulgu sırası tek seferde doğrulama ile aynıdır.
         
-        # Enum değerleri kontrolü
-        if column.get("type") == "enum":
-            if "values" not in column or not column["values"]:
-                self.errors.append(ValidationError(
-                    "PL003", "Enum tipi için 'values' zorunlu", col_path
-                ))
-                is_valid = False
+        Returns:
+            (geçerli mi, keep ise modül verisi yoksa None)
+        """
+        stem = Path(file_path).stem
+        header: Dict[str, Any] = {}
+        positions = {}
+        tables = [] if keep else None
+        table_errors: List[ValidationError] = []
+        table_warnings: List[ValidationError] = []
+        tables_valid = True
+        module_name = None
+        check_table = self.rules.check_table
         
-        # Decimal constraints
-        if column.get("type") == "decimal":
-            precision = column.get("precision", 18)
-            scale = column.get("scale", 2)
-            if scale > precision:
-                self.errors.append(ValidationError(
-                    "PL009", f"Scale ({scale}) precision'dan ({precision}) büyük olamaz", col_path
-                ))
-                is_valid = False
+        try:
+            for event in iter_module(fp, arrays=("tables",)):
+                kind = event[0]
+                if kind == "item":
+                    _, _, index, table, origin, text = event
+                    if module_name is None:
+                        module_name = header.get("module", stem)
+                    errors, warnings = [], []
+                    if not check_table(table, module_name, index, errors, warnings):
+                        tables_valid = False
+                    if errors or warnings:
+                        annotate_table(errors + warnings, table, index, text, origin, module_name)
+                        table_errors.extend(errors)
+                        table_warnings.extend(warnings)
+                    if keep:
+                        tables.append(table)
+                    if on_table is not None:
+                        on_table(table)
+                elif kind == "key":
+                    _, key, value, position = event
+                    header[key] = value
+                    positions[key] = position
+                else:
+                    header["tables"] = tables if keep else []
+                    positions["tables"] = event[3]
+        except StreamError as e:
+            self.errors.append(ValidationError(
+                "PL001", f"JSON parse hatası: {e}", file_path, line=e.line, column=e.column
+            ))
+            return False, None
+        except UnicodeDecodeError as e:
+            self.errors.append(ValidationError("PL001", f"JSON parse hatası: {e}", file_path))
+            return False, None
         
-        return is_valid
-    
-    def validate_table(self, table: Dict, module_name: str, table_index: int) -> bool:
-        """Tablo doğrulaması"""
-        table_path = f"{module_name}.tables[{table_index}]"
-        is_valid = True
+        name = header.get("module", stem)
+        if module_name is not None and module_name != name:
+            # "module" alanı tablolardan sonra geldi; path'ler gerçek modül adına taşınır
+            for issue in table_errors + table_warnings:
+                issue.path = name + issue.path[len(module_name):]
         
-        # Zorunlu alanlar
-        for field in self.REQUIRED_TABLE_FIELDS:
-            if field not in table:
-                self.errors.append(ValidationError(
-                    "PL003", f"Zorunlu alan eksik: {field}", table_path
-                ))
-                is_valid = False
+        errors, warnings = [], []
+        valid = self.rules.check_module_header(header, name, errors, warnings)
+        annotate_header(errors + warnings, positions)
+        if valid is not None:
+            errors.extend(table_errors)
+            warnings.extend(table_warnings)
+            valid = valid and tables_valid
+        self.errors.extend(errors)
+        self.warnings.extend(warnings)
         
-        if not is_valid:
+        if not keep:
+            return bool(valid), None
+        self.loaded_modules[name] = header
+        return bool(valid), header
+    
+    def _streams(self, file_path: str, content: Optional[bytes]) -> bool:
+        if self.stream is not None:
+            return self.stream
+        if content is not None:
+            return len(content) >= self.STREAM_THRESHOLD
+        try:
+            return os.path.getsize(file_path) >= self.STREAM_THRESHOLD
+        except OSError:
             return False
+    
+    def _locate_module_issues(self, file_path: str, content: Optional[bytes], data: Dict):
+        """Tek seferde doğrulanan modülün bulgularına kaynak konum ekler"""
+        issues = self.errors + self.warnings
+        module_name = data.get("module", Path(file_path).stem)
+        try:
+            if content is not None:
+                annotate_module(io.StringIO(content.decode('utf-8')), issues, module_name)
+            else:
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    annotate_module(f, issues, module_name)
+        except (OSError, ValueError):
+            # Konum bilgisi yardımcıdır; bulunamazsa bulgular konumsuz kalır
+            pass
+    
+    def _validate_file(self, file_path: str, content: Optional[bytes] = None) -> Dict:
+        """
+        Dosyayı ayrıştırıp doğrular (büyük dosyalar akış halinde).
         
-        table_name = table.get("pl_table", "unknown")
-        table_path = f"{module_name}.{table_name}"
+        Returns:
+            valid, errors, warnings (dict listeleri) ve ayrıştırılmış data
+            içeren sonuç; entry önbellek kaydı içindir ve burada hep None'dır
+        """
+        self.errors = []
+        self.warnings = []
+        prof = self.profiler
+        if prof is not None:
+            prof.counters["files"] += 1
+            patterns = len(PATTERNS)
+            started = mark = prof.clock()
         
-        # Kolon adları benzersizlik kontrolü
-        column_names = []
-        for i, column in enumerate(table.get("columns", [])):
-            col_name = column.get("name")
-            if col_name:
-                if col_name in column_names:
+        if self._streams(file_path, content):
+            if content is None:
+                try:
+                    with open(file_path, 'r', encoding='utf-8') as f:
+                        is_valid, data = self._stream_module(f, file_path)
+                except FileNotFoundError:
+                    self.errors.append(ValidationError("PL001", "Dosya bulunamadı", file_path))
+                    is_valid, data = False, None
+            else:
+                fp = io.TextIOWrapper(io.BytesIO(content), encoding='utf-8')
+                is_valid, data = self._stream_module(fp, file_path)
+            if prof is not None:
+                mark = prof.phase("stream", mark)
+        else:
+            if content is None:
+                is_valid, data = self.validate_json_syntax(file_path)
+            else:
+                try:
+                    data = json.loads(content.decode('utf-8'))
+                    is_valid = True
+                except json.JSONDecodeError as e:
                     self.errors.append(ValidationError(
-                        "PL004", f"Duplike kolon adı: {col_name}", table_path
+                        "PL001", f"JSON parse hatası: {str(e)}", file_path,
+                        line=e.lineno, column=e.colno
                     ))
-                    is_valid = False
-                else:
-                    column_names.append(col_name)
+                    is_valid, data = False, None
+                except UnicodeDecodeError as e:
+                    self.errors.append(ValidationError(
+                        "PL001", f"JSON parse hatası: {str(e)}", file_path
+                    ))
+                    is_valid, data = False, None
+            if is_valid and not isinstance(data, dict):
+                self.errors.append(ValidationError(
+                    "PL001", "Geçersiz modül: modül bir JSON nesnesi olmalı", file_path
+                ))
+                is_valid, data = False, None
+            if prof is not None:
+                prof.lap("PL001", mark)
+                mark = prof.phase("parse", mark)
             
-            # Kolon doğrulama
-            if not self.validate_column(column, table_path, i):
-                is_valid = False
-        
-        # Primary key kontrolü
-        has_pk = any(col.get("primary_key") for col in table.get("columns", []))
-        if not has_pk:
-            self.warnings.append(ValidationError(
-                "PL003", "Primary key tanımlanmamış", table_path, "warning"
-            ))
+            if is_valid:
+                is_valid, _ = self._validate_module_data(data, file_path)
+                if self.errors or self.warnings:
+                    if prof is not None:
+                        mark = prof.phase("module_rules", mark)
+                    self._locate_module_issues(file_path, content, data)
+                    if prof is not None:
+                        mark = prof.phase("positions", mark)
         
-        return is_valid
+        outcome = {
+            "valid": is_valid,
+            "errors": [e.to_dict() for e in self.errors],
+            "warnings": [w.to_dict() for w in self.warnings],
+            "data": data,
+            "entry": None
+        }
+        if prof is not None:
+            now = prof.phase("module_rules", mark)
+            prof.counters["regex_compiled"] += len(PATTERNS) - patterns
+            prof.module(Path(file_path).stem, now - started, data,
+                        outcome["errors"] + outcome["warnings"])
+        return outcome
     
-    def validate_module(self, file_path: str) -> Tuple[bool, List[ValidationError]]:
-        """Modül şemasını doğrular"""
-        self.errors = []
-        self.warnings = []
+    def _collect_outcomes(self, files: List[Path], jobs: int = 1) -> List[Dict]:
+        """Dosyaları doğrular; sonuçlar dosya sırasıyla döner"""
+        return list(self._iter_outcomes(files, jobs))
+    
+    def _iter_outcomes(self, files: List[Path], jobs: int = 1) -> Iterator[Dict]:
+        """
+        Dosyaları doğrular; sonuçlar dosya sırasıyla, hazır oldukça üretilir.
         
-        # JSON syntax
-        is_valid, data = self.validate_json_syntax(file_path)
-        if not is_valid:
-            return False, self.errors
+        Önbellekte güncel sonucu olan dosyalar ayrıştırılmaz. Kalanlar
+        jobs > 1 ise process havuzunda paralel doğrulanır. Üretici erken
+        kapatılırsa başlamamış doğrulamalar iptal edilir.
+        """
+        outcomes: List[Optional[Dict]] = [None] * len(files)
+        pending = []
+        probes = {}
+        prof = self.profiler
+        if prof is not None:
+            mark = prof.clock()
         
-        module_name = data.get("module", Path(file_path).stem)
+        for i, json_file in enumerate(files):
+            if self.cache is None:
+                pending.append((i, str(json_file), None))
+                continue
+            
+            try:
+                probe = self.cache.probe(str(json_file))
+            except FileNotFoundError:
+                pending.append((i, str(json_file), None))
+                continue
+            
+            if probe.fresh:
+                results = self.cache.results(probe.entry)
+                if results is not None:
+                    outcomes[i] = dict(results, data=None, entry=probe.entry)
+                    if prof is not None:
+                        prof.counters["cache_hits"] += 1
+                    continue
+                if probe.content is None:
+                    with open(probe.path, 'rb') as f:
+                        probe.content = f.read()
+            
+            probes[i] = probe
+            pending.append((i, str(json_file), probe.content))
         
-        # Zorunlu modül alanları
-        for field in self.REQUIRED_MODULE_FIELDS:
-            if field not in data:
-                self.errors.append(ValidationError(
-                    "PL003", f"Zorunlu alan eksik: {field}", module_name
-                ))
-                is_valid = False
+        if prof is not None and self.cache is not None:
+            prof.phase("cache_probe", mark)
         
-        # Versiyon format kontrolü
-        version = data.get("version", "")
-        if not re.match(r'^\d+\.\d+\.\d+$', version):
-            self.errors.append(ValidationError(
-                "PL007", f"Geçersiz versiyon formatı: {version} (beklenen: X.Y.Z)", module_name
-            ))
-            is_valid = False
+        pool = None
+        profile = prof is not None
+        if jobs > 1 and len(pending) > 1:
+            from concurrent.futures import ProcessPoolExecutor
+            
+            pool = ProcessPoolExecutor(max_workers=min(jobs, len(pending)))
+            tasks = [(p, c, profile, self.levels, self.registry, self.stream) for _, p, c in pending]
+            done = pool.map(_validate_file_worker, tasks)
+        else:
+            done = (self._validate_file(p, c) for _, p, c in pending)
         
-        # Tablo doğrulamaları
-        for i, table in enumerate(data.get("tables", [])):
-            if not self.validate_table(table, module_name, i):
-                is_valid = False
+        try:
+            for i in range(len(files)):
+                outcome = outcomes[i]
+                if outcome is None:
+                    outcome = next(done)
+                    if pool is not None and profile:
+                        prof.merge(outcome.pop("profile"))
+                    probe = probes.get(i)
+                    if probe is not None:
+                        if prof is not None:
+                            mark = prof.clock()
+                        results = {k: outcome[k] for k in ("valid", "errors", "warnings")}
+                        if probe.fresh:
+                            self.cache.store_results(probe.entry, results)
+                            outcome["entry"] = probe.entry
+                        else:
+                            outcome["entry"] = self.cache.store(probe, outcome["data"], results=results)
+                        if prof is not None:
+                            prof.phase("cache_store", mark)
+                outcomes[i] = None
+                yield outcome
+        finally:
+            if pool is not None:
+                pool.shutdown(cancel_futures=True)
+    
+    def _validate_module_data(self, data: Dict, file_path: str) -> Tuple[bool, List[ValidationError]]:
+        """Ayrıştırılmış modül verisini doğrular"""
+        module_name = data.get("module", Path(file_path).stem)
+        is_valid = self.rules.check_module(data, module_name, self.errors, self.warnings)
         
         # Bağımlılık kontrolü
         self.loaded_modules[module_name] = data
         
         return is_valid, self.errors + self.warnings
     
-    def validate_foreign_keys(self, modules: Dict[str, Dict]) -> List[ValidationError]:
+    def validate_foreign_keys(self, modules: Dict[str, Dict],
+                              index: SymbolIndex = None) -> List[ValidationError]:
         """Modüller arası foreign key tutarlılığını kontrol eder"""
         errors = []
+        if index is None:
+            index = SchemaModel.build(modules)
         
         for module_name, module_data in modules.items():
             for table in module_data.get("tables", []):
@@ -274,83 +541,465 @@ class SchemaValidator:
                     target_module = fk.get("module", module_name)
                     target_table = fk.get("table")
                     target_column = fk.get("column")
+                    col_path = f"{module_name}.{table_name}.{column.get('name')}"
                     
                     # Hedef modül var mı?
-                    if target_module not in modules:
+                    if not index.has_module(target_module):
                         errors.append(ValidationError(
                             "PL005",
                             f"Foreign key hedef modülü bulunamadı: {target_module}",
-                            f"{module_name}.{table_name}.{column.get('name')}"
+                            col_path
                         ))
                         continue
                     
                     # Hedef tablo var mı?
-                    target_mod = modules[target_module]
-                    target_tables = [t.get("pl_table") for t in target_mod.get("tables", [])]
-                    
-                    if target_table not in target_tables:
+                    target = index.table(target_module, target_table)
+                    if target is None:
                         errors.append(ValidationError(
                             "PL005",
                             f"Foreign key hedef tablosu bulunamadı: {target_module}.{target_table}",
-                            f"{module_name}.{table_name}.{column.get('name')}"
+                            col_path
+                        ))
+                        continue
+                    
+                    # Hedef kolon var mı?
+                    if target_column and target_column not in target.columns:
+                        errors.append(ValidationError(
+                            "PL005",
+                            f"Foreign key hedef kolonu bulunamadı: {target_module}.{target_table}.{target_column}",
+                            col_path
                         ))
         
         return errors
     
-    def validate_all(self, modules_path: str = None) -> Dict[str, Any]:
-        """Tüm modülleri doğrular"""
+    def _check_ref(self, index: SymbolIndex, ref: Dict, path: str) -> List[ValidationError]:
+        """{module, table, column} referansını kontrol eder"""
+        module_name = ref.get("module")
+        table_name = ref.get("table")
+        column_name = ref.get("column")
+        
+        if not index.has_module(module_name):
+            return [ValidationError("PL005", f"Modül bulunamadı: {module_name}", path)]
+        
+        table = index.table(module_name, table_name)
+        if table is None:
+            return [ValidationError(
+                "PL005", f"Tablo bulunamadı: {module_name}.{table_name}", path
+            )]
+        
+        if column_name and column_name not in table.columns:
+            return [ValidationError(
+                "PL005", f"Kolon bulunamadı: {module_name}.{table_name}.{column_name}", path
+            )]
+        return []
+    
+    def validate_relations(self, relations: Dict, index: SymbolIndex) -> List[ValidationError]:
+        """relations.json referanslarını sembol index'i üzerinden kontrol eder"""
+        errors = []
+        
+        for rel in relations.get("cross_module_relationships", []):
+            rel_path = f"relations.{rel.get('id', '?')}"
+            for end in ("source", "target"):
+                errors.extend(self._check_ref(index, rel.get(end, {}), f"{rel_path}.{end}"))
+        
+        for flow in relations.get("data_flows", []):
+            flow_path = f"relations.{flow.get('id', '?')}"
+            for i, step in enumerate(flow.get("steps", [])):
+                errors.extend(self._check_ref(index, step, f"{flow_path}.steps[{i}]"))
+        
+        for rule in relations.get("referential_integrity_rules", []):
+            rule_path = f"relations.{rule.get('rule_id', '?')}"
+            tables = [rule.get("source_table")] + list(rule.get("affected_tables", []))
+            for table_name in tables:
+                if index.find_table(table_name) is None:
+                    errors.append(ValidationError(
+                        "PL005", f"Tablo bulunamadı: {table_name}", rule_path
+                    ))
+        
+        return errors
+    
+    def validate_views(self, modules: Dict[str, Dict], index: SymbolIndex) -> List[ValidationError]:
+        """View base_tables ve kolon kaynaklarını kontrol eder (uyarı olarak)"""
+        warnings = []
+        
+        for module_name, module_data in modules.items():
+            for view in module_data.get("views", []):
+                view_path = f"{module_name}.{view.get('name')}"
+                base_tables = view.get("base_tables", [])
+                
+                for table_name in base_tables:
+                    if index.find_table(table_name, module_name) is None:
+                        warnings.append(ValidationError(
+                            "PL005", f"View tablosu bulunamadı: {table_name}", view_path, "warning"
+                        ))
+                
+                for column in view.get("columns", []):
+                    source = column.get("source")
+                    if not source:
+                        continue
+                    _, col = index.resolve_source(source, module_name, base_tables)
+                    if col is None:
+                        warnings.append(ValidationError(
+                            "PL005", f"View kolon kaynağı çözülemedi: {source}",
+                            f"{view_path}.{column.get('name')}", "warning"
+                        ))
+        
+        return warnings
+    
+    def validate_dependencies(self, modules: Dict[str, Dict],
+                              relations: Dict = None) -> List[ValidationError]:
+        """
+        Modül ve tablo bağımlılık döngülerini tespit eder (PL006).
+        
+        Beyan edilmiş modül bağımlılıklarındaki döngüler ve tüm kenarları
+        zorunlu (NOT NULL) FK olan tablo döngüleri hatadır; FK/ilişkilerden
+        çıkarılan modül döngüleri ve opsiyonel FK döngüleri uyarıdır.
+        Tablonun kendine referansı (hiyerarşi) döngü sayılmaz.
+        """
+        issues = []
+        
+        module_graph = build_module_graph(modules, relations)
+        for cycle in module_graph.cycles(include_self_loops=False):
+            severity = "error" if cycle_is_declared(module_graph, cycle) else "warning"
+            issues.append(ValidationError(
+                "PL006", f"Modül bağımlılık döngüsü: {' -> '.join(cycle)}", cycle[0], severity
+            ))
+        
+        table_graph = build_table_graph(modules, relations)
+        for cycle in table_graph.cycles(include_self_loops=False):
+            severity = "error" if cycle_is_required(table_graph, cycle) else "warning"
+            issues.append(ValidationError(
+                "PL006", f"Foreign key döngüsü: {' -> '.join(cycle)}", cycle[0], severity
+            ))
+        
+        return issues
+    
+    def validate_cross_module(self, modules: Dict[str, Dict],
+                              relations: Dict = None) -> List[ValidationError]:
+        """
+        Modüller arası tüm referans kontrolleri; şema modeli (SymbolIndex
+        arayüzüyle) bir kez oluşturulur ve kontroller arasında paylaşılır.
+        """
+        if not self.rules.cross_module:
+            return []
+        
+        prof = self.profiler
+        if prof is not None:
+            mark = prof.clock()
+        index = SchemaModel.build(modules)
+        if prof is not None:
+            prof.phase("symbol_index", mark)
+        
+        issues = []
+        for _, check in self.rules.cross:
+            issues.extend(check(self, modules, relations, index))
+        
+        if prof is not None:
+            for module_data in modules.values():
+                for table in module_data.get("tables", []):
+                    prof.counters["foreign_keys"] += sum(
+                        1 for c in table.get("columns", []) if c.get("foreign_key"))
+                prof.counters["view_columns"] += sum(
+                    len(v.get("columns", [])) for v in module_data.get("views", []))
+            if relations:
+                prof.counters["relation_refs"] += 2 * len(relations.get("cross_module_relationships", [])) + sum(
+                    len(f.get("steps", [])) for f in relations.get("data_flows", []))
+        return issues
+    
+    def locate_issues(self, issues: List[ValidationError], modules_dir: Path,
+                      relations_file: Path = None, sources: Dict[Path, bytes] = None):
+        """
+        Modüller arası bulgulara kaynak konum ekler.
+        
+        Sadece bulgusu olan modül dosyaları akış halinde bir kez okunur;
+        relations bulguları relations.json içindeki ilgili kayda işaret eder.
+        
+        Args:
+            sources: Dosya yolu -> içerik; verilen dosyalar diskten okunmaz
+                (editörde açık, kaydedilmemiş dokümanlar)
+        """
+        sources = sources or {}
+        refs: Dict[str, Dict[str, set]] = {}
+        relation_issues = []
+        for issue in issues:
+            if issue.line is not None:
+                continue
+            parts = issue.path.split(".")
+            if parts[0] == "relations":
+                relation_issues.append(issue)
+            elif len(parts) >= 2:
+                # modül.tablo[.kolon] veya modül.view[.kolon]
+                column = parts[2] if len(parts) > 2 else None
+                refs.setdefault(parts[0], {}).setdefault(parts[1], set()).add(column)
+        
+        for module_name, names in refs.items():
+            module_file = modules_dir / f"{module_name}.json"
+            try:
+                if module_file in sources:
+                    found = reference_positions(io.StringIO(sources[module_file].decode('utf-8')), names)
+                else:
+                    with open(module_file, 'r', encoding='utf-8') as f:
+                        found = reference_positions(f, names)
+            except (OSError, ValueError):
+                continue
+            for issue in issues:
+                parts = issue.path.split(".")
+                if issue.line is None and parts[0] == module_name and len(parts) >= 2:
+                    position = found.get((parts[1], parts[2] if len(parts) > 2 else None))
+                    if position is not None:
+                        issue.line, issue.column = position
+        
+        if relation_issues and relations_file is not None:
+            self._locate_relation_issues(relation_issues, relations_file, sources.get(relations_file))
+    
+    def _locate_relation_issues(self, issues: List[ValidationError], relations_file: Path,
+                                content: Optional[bytes] = None):
+        try:
+            if content is None:
+                with open(relations_file, 'r', encoding='utf-8') as f:
+                    text = f.read()
+            else:
+                text = content.decode('utf-8')
+            relations = json.loads(text)
+        except (OSError, ValueError):
+            return
+        
+        records = {}
+        for section, id_key in (("cross_module_relationships", "id"), ("data_flows", "id"),
+                                ("referential_integrity_rules", "rule_id")):
+            for i, record in enumerate(relations.get(section, [])):
+                records.setdefault(str(record.get(id_key, "?")), [section, i])
+        
+        for issue in issues:
+            # relations.<id>[.source|.target|.steps[i]]
+            _, _, rest = issue.path.partition(".")
+            record_id, _, tail = rest.partition(".")
+            steps = records.get(record_id)
+            if steps is None:
+                continue
+            steps = list(steps)
+            if tail.startswith("steps[") and tail.endswith("]"):
+                steps += ["steps", int(tail[6:-1])]
+            elif tail:
+                steps.append(tail)
+            offset = locate(text, steps)
+            if offset is not None:
+                issue.line, issue.column = offset_position(text, offset, (1, 1))
+    
+    def _modules_dir(self, modules_path: str = None) -> Path:
         if modules_path:
-            modules_dir = Path(modules_path)
-        else:
-            modules_dir = self.base_path / "paktlang" / "modules" / "core"
-        
-        results = {
-            "valid": True,
-            "modules": {},
-            "errors": [],
-            "warnings": [],
-            "summary": {}
-        }
+            return Path(modules_path)
+        return self.base_path / "paktlang" / "modules" / "core"
+    
+    def _relations_file(self, modules_dir: Path) -> Path:
+        """Modül dizinine göre relations.json yolu (modules/core -> relations/)"""
+        return modules_dir.parent.parent / "relations" / "relations.json"
+    
+    def _load_json(self, file_path: Path, builder=module_header) -> Optional[Any]:
+        """JSON dosyasını (varsa önbellekten) doğrulamadan yükler; hata durumunda None"""
+        if self.cache is None:
+            try:
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+            except (OSError, ValueError):
+                return None
         
-        all_modules = {}
+        try:
+            probe = self.cache.probe(str(file_path))
+        except OSError:
+            return None
+        if probe.fresh:
+            data = self.cache.load_data(probe.entry)
+            if data is not None:
+                return data
+            with open(probe.path, 'rb') as f:
+                probe.content = f.read()
+        try:
+            data = json.loads(probe.content.decode('utf-8'))
+        except ValueError:
+            return None
+        header = builder(data) if isinstance(data, dict) else None
+        self.cache.store(probe, data, header=header)
+        return data
+    
+    def load_schema(self, modules_path: str = None) -> Tuple[Dict[str, Dict], Optional[Dict]]:
+        """
+        Modülleri ve relations.json'u doğrulama yapmadan yükler.
         
-        # Her modülü doğrula
-        for json_file in modules_dir.glob("*.json"):
-            module_name = json_file.stem
-            is_valid, issues = self.validate_module(str(json_file))
-            
-            results["modules"][module_name] = {
-                "valid": is_valid,
-                "errors": [e.to_dict() for e in self.errors],
-                "warnings": [w.to_dict() for w in self.warnings]
-            }
-            
-            if not is_valid:
-                results["valid"] = False
-                results["errors"].extend([e.to_dict() for e in self.errors])
-            
-            results["warnings"].extend([w.to_dict() for w in self.warnings])
-            
-            # Modülü yükle
-            _, data = self.validate_json_syntax(str(json_file))
+        Returns:
+            (dosya adı -> modül verisi, relations verisi veya None)
+        """
+        modules_dir = self._modules_dir(modules_path)
+        modules = {}
+        for json_file in sorted(modules_dir.glob("*.json")):
+            data = self._load_json(json_file)
+            if isinstance(data, dict):
+                modules[json_file.stem] = data
+        
+        relations = None
+        relations_file = self._relations_file(modules_dir)
+        if relations_file.exists():
+            relations = self._load_json(relations_file, relations_header)
+        
+        if self.cache is not None:
+            self.cache.save()
+        return modules, relations
+    
+    def load_model(self, modules_path: str = None) -> SchemaModel:
+        """
+        Modüllerin sıkıştırılmış şema modeli (bkz. model.SchemaModel).
+        
+        Önbellek verilmişse model önbellek dizinine yazılır ve mmap ile
+        açılır; modül dosyaları değişmediyse hiçbir JSON ayrıştırılmaz ve
+        aynı dosyayı açan process'ler tek kopyayı paylaşır.
+        """
+        if self.cache is None:
+            modules, _ = self.load_schema(modules_path)
+            return SchemaModel.build(modules)
+        
+        modules_dir = self._modules_dir(modules_path)
+        digests = {}
+        for json_file in sorted(modules_dir.glob("*.json")):
+            try:
+                _, entry = self.cache.header(str(json_file))
+            except (ValueError, UnicodeDecodeError, AttributeError):
+                # load_schema ile aynı: ayrıştırılamayan modüller atlanır
+                continue
+            digests[json_file.stem] = entry["digest"]
+        self.cache.save()
+        key = bytes.fromhex(self.cache.cross_key(digests))
+        
+        path = self.cache.cache_dir / MODEL_FILE
+        try:
+            model = SchemaModel.open(path)
+            if model.key == key:
+                return model
+            model.close()
+        except (OSError, ValueError):
+            pass
+        
+        modules, _ = self.load_schema(modules_path)
+        SchemaModel.build(modules, key).save(path)
+        return SchemaModel.open(path)
+    
+    def _cached_cross_module(self, entries: Dict[str, Dict], loaded: Dict[str, Dict],
+                             modules_dir: Path, relations_file: Path) -> List[Dict]:
+        """
+        Modüller arası kontroller; modül ve relations içerikleri değişmediyse
+        önceki sonuç döner ve hiçbir dosya yüklenmez.
+        """
+        digests = {name: e["digest"] for name, e in entries.items()}
+        relations_entry = None
+        if relations_file.exists():
+            try:
+                _, relations_entry = self.cache.header(str(relations_file), relations_header)
+                digests["\0relations"] = relations_entry["digest"]
+            except (json.JSONDecodeError, UnicodeDecodeError) as e:
+                return [ValidationError(
+                    "PL001", f"JSON parse hatası: {str(e)}", str(relations_file),
+                    line=getattr(e, "lineno", None), column=getattr(e, "colno", None)
+                ).to_dict()]
+        
+        key = self.cache.cross_key(digests)
+        issues = self.cache.get_cross(key)
+        if issues is not None:
+            return issues
+        
+        all_modules = {}
+        for module_name, entry in entries.items():
+            data = loaded.get(module_name) or self.cache.load_data(entry)
             if data:
                 all_modules[module_name] = data
+        relations = self.cache.load_data(relations_entry) if relations_entry else None
         
-        # Cross-module foreign key kontrolü
-        fk_errors = self.validate_foreign_keys(all_modules)
-        if fk_errors:
-            results["valid"] = False
-            results["errors"].extend([e.to_dict() for e in fk_errors])
-        
-        # Özet
-        results["summary"] = {
-            "total_modules": len(results["modules"]),
-            "valid_modules": sum(1 for m in results["modules"].values() if m["valid"]),
-            "total_errors": len(results["errors"]),
-            "total_warnings": len(results["warnings"])
-        }
+        issues = self.validate_cross_module(all_modules, relations)
+        self.locate_issues(issues, modules_dir, relations_file)
+        issues = [e.to_dict() for e in issues]
+        self.cache.set_cross(key, issues)
+        return issues
+    
+    def validate_all(self, modules_path: str = None, jobs: int = 1) -> Dict[str, Any]:
+        """
+        Tüm modülleri doğrular.
         
-        return results
+        Args:
+            modules_path: Modül dizini (varsayılan: paktlang/modules/core)
+            jobs: Paralel doğrulama için process sayısı (1: sıralı)
+        """
+        sink = ReportSink()
+        run_diagnostics(self.iter_validation(modules_path, jobs), sink)
+        return sink.result
+    
+    def iter_validation(self, modules_path: str = None, jobs: int = 1) -> Iterator[Tuple]:
+        """
+        validate_all() ile aynı doğrulama; bulgular toplanmadan, hazır
+        oldukça üretilir (bkz. diagnostics.run_diagnostics):
+        
+            ("module", dosya adı, sonuç, dosya yolu)  sonuç: valid, errors, warnings
+            ("issue", bulgu, dosya yolu veya None)     modüller arası bulgu
+        
+        Modüller dosya adı sırasıyla gelir; modüller arası kontroller tüm
+        modüller okunduktan sonra çalışır. Üretici erken kapatılırsa kalan
+        modüller doğrulanmaz.
+        """
+        modules_dir = self._modules_dir(modules_path)
+        relations_file = self._relations_file(modules_dir)
+        all_modules = {}
+        cache_entries = {}
+        
+        try:
+            # Her modülü doğrula (dosya adı sırasıyla - çıktı deterministik)
+            json_files = sorted(modules_dir.glob("*.json"))
+            for json_file, outcome in zip(json_files, self._iter_outcomes(json_files, jobs)):
+                module_name = json_file.stem
+                data = outcome.pop("data")
+                if data:
+                    all_modules[module_name] = data
+                    self.loaded_modules[data.get("module", module_name)] = data
+                entry = outcome.pop("entry")
+                if entry is not None:
+                    cache_entries[module_name] = entry
+                yield ("module", module_name, outcome, str(json_file))
+            
+            # Cross-module referans kontrolü (foreign key, view, relations)
+            if self.cache is not None:
+                cross_issues = self._cached_cross_module(cache_entries, all_modules, modules_dir, relations_file)
+            else:
+                relations = None
+                if relations_file.exists():
+                    is_valid, relations = self.validate_json_syntax(str(relations_file))
+                    if not is_valid:
+                        yield ("issue", self.errors.pop().to_dict(), str(relations_file))
+                cross_issues = self.validate_cross_module(all_modules, relations)
+                self.locate_issues(cross_issues, modules_dir, relations_file)
+                cross_issues = [e.to_dict() for e in cross_issues]
+            
+            for issue in cross_issues:
+                yield ("issue", issue, self._issue_file(issue, modules_dir, relations_file))
+        finally:
+            if self.cache is not None:
+                self.cache.save()
+    
+    @staticmethod
+    def _issue_file(issue: Dict, modules_dir: Path, relations_file: Path) -> Optional[str]:
+        """Modüller arası bulgunun kaynak dosyası (locate_issues ile aynı eşleme)"""
+        head = issue.get("path", "").split(".", 1)[0]
+        if head == "relations" or issue.get("path") == str(relations_file):
+            return str(relations_file)
+        module_file = modules_dir / f"{head}.json"
+        return str(module_file) if head and module_file.exists() else None
+
+
+def _validate_file_worker(args: Tuple[str, Optional[bytes], bool, Tuple[str, ...], RuleRegistry,
+                                      Optional[bool]]) -> Dict:
+    """Process havuzu için modül doğrulama (her process kendi validator'ını kullanır)"""
+    file_path, content, profile, levels, registry, stream = args
+    profiler = Profiler() if profile else None
+    validator = SchemaValidator(profiler=profiler, levels=levels, registry=registry, stream=stream)
+    outcome = validator._validate_file(file_path, content)
+    if profiler is not None:
+        outcome["profile"] = profiler.to_dict()
+    return outcome
 
 
 def main():
@@ -361,13 +1010,26 @@ def main():
     parser.add_argument("path", nargs="?", help="Şema dosyası veya modüller dizini")
     parser.add_argument("--all", action="store_true", help="Tüm modülleri doğrula")
     parser.add_argument("--json", action="store_true", help="JSON formatında çıktı")
+    parser.add_argument("--jobs", "-j", type=int, default=1,
+                        help="Paralel doğrulama process sayısı (0: CPU sayısı)")
+    parser.add_argument("--level", action="append", choices=LEVELS,
+                        help="Sadece bu doğrulama seviyesi (tekrarlanabilir)")
+    parser.add_argument("--profile", action="store_true",
+                        help="Faz, kural ve modül bazında süre/sayaç dökümü")
+    parser.add_argument("--stream", action="store_true",
+                        help="Modül dosyalarını tablo tablo akış halinde oku")
     
     args = parser.parse_args()
     
-    validator = SchemaValidator()
+    from .profiling import format_profile
+    profiler = Profiler() if args.profile else None
+    validator = SchemaValidator(profiler=profiler, levels=args.level,
+                                stream=True if args.stream else None)
     
     if args.all or not args.path:
-        results = validator.validate_all(args.path)
+        results = validator.validate_all(args.path, jobs=args.jobs or os.cpu_count() or 1)
+        if profiler is not None:
+            results["profile"] = profiler.to_dict(results["errors"] + results["warnings"])
         
         if args.json:
             print(json.dumps(results, indent=2, ensure_ascii=False))
@@ -381,23 +1043,31 @@ def main():
                 print(f"{status} {mod_name}")
                 
                 for err in mod_result["errors"]:
-                    print(f"  [ERROR] [{err['code']}] {err['message']}")
+                    where = f" ({err['line']}:{err['column']})" if "line" in err else ""
+                    print(f"  [ERROR] [{err['code']}] {err['message']}{where}")
                 
                 for warn in mod_result["warnings"]:
-                    print(f"  [WARN] [{warn['code']}] {warn['message']}")
+                    where = f" ({warn['line']}:{warn['column']})" if "line" in warn else ""
+                    print(f"  [WARN] [{warn['code']}] {warn['message']}{where}")
             
             print(f"\n{'='*50}")
             print(f"Toplam: {results['summary']['valid_modules']}/{results['summary']['total_modules']} modul gecerli")
             print(f"Hatalar: {results['summary']['total_errors']}, Uyarilar: {results['summary']['total_warnings']}")
+            if profiler is not None:
+                print(format_profile(results["profile"]))
     else:
         is_valid, issues = validator.validate_module(args.path)
+        profile = profiler.to_dict(i.to_dict() for i in issues) if profiler is not None else None
         
         if args.json:
-            print(json.dumps({
+            output = {
                 "valid": is_valid,
                 "errors": [e.to_dict() for e in validator.errors],
                 "warnings": [w.to_dict() for w in validator.warnings]
-            }, indent=2, ensure_ascii=False))
+            }
+            if profile is not None:
+                output["profile"] = profile
+            print(json.dumps(output, indent=2, ensure_ascii=False))
         else:
             print(f"Dosya: {args.path}")
             print(f"Geçerli: {'Evet' if is_valid else 'Hayır'}\n")
@@ -407,6 +1077,8 @@ def main():
             
             for warn in validator.warnings:
                 print(f"⚠️ {warn}")
+            if profile is not None:
+                print(format_profile(profile))
 
 
 if __name__ == "__main__":
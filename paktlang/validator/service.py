@@ -0,0 +1,343 @@
+"""
+PaktLang Validation Service
+Servislere gömülü kullanım için durumsuz, thread-safe doğrulama API'si
+
+SchemaValidator sonuçları örnek üzerinde (errors, warnings, loaded_modules)
+tuttuğu için tek bir örnek thread'ler veya coroutine'ler arasında
+paylaşılamaz. ValidationService müşteriden bağımsız verileri (meta,
+seviyeler, derlenmiş kurallar) bir kez yükler ve salt okunur paylaşır; her
+çağrı kendi geçici validator'ı ile çalışır ve değiştirilemez sonuç döner:
+
+    service = ValidationService("/srv/paktlang")
+    result = service.validate_document(upload_bytes, "stok.json")
+    results = await service.validate_documents_async(uploads)
+
+Aynı içerikli modüllerin sonuçları boyut sınırlı bir LRU'da tutulur; sonuçlar
+değiştirilemez olduğu için müşteriler arasında güvenle paylaşılır.
+
+asyncio sadece async API kullanıldığında yüklenir; paket (ve CLI) açılışı
+buna bağlı değildir.
+"""
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from pathlib import Path, PurePosixPath
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, List, Mapping, NamedTuple, Optional, Tuple, Union
+
+from .rules import RuleRegistry
+from .schema_validator import SchemaValidator, ValidationError
+
+
+Document = Union[bytes, str]
+
+# Modül sonuç önbelleğinin varsayılan sınırları
+MAX_MODULES = 256
+MAX_BYTES = 64 * 1024 * 1024
+
+# Kaynak konumları için sanal dizin; yüklenen dokümanlar diske yazılmaz
+_UPLOAD_ROOT = Path("<upload>")
+
+
+class Issue(NamedTuple):
+    """Değiştirilemez doğrulama bulgusu (ValidationError karşılığı)"""
+    code: str
+    message: str
+    path: str = ""
+    severity: str = "error"
+    line: Optional[int] = None
+    column: Optional[int] = None
+
+    def __str__(self):
+        if self.line is not None:
+            return f"[{self.code}] {self.path} ({self.line}:{self.column}): {self.message}"
+        return f"[{self.code}] {self.path}: {self.message}"
+
+    def to_dict(self) -> Dict:
+        result = {
+            "code": self.code,
+            "message": self.message,
+            "path": self.path,
+            "severity": self.severity
+        }
+        if self.line is not None:
+            result["line"] = self.line
+            result["column"] = self.column
+        return result
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "Issue":
+        return cls(data["code"], data["message"], data.get("path", ""), data.get("severity", "error"),
+                   data.get("line"), data.get("column"))
+
+
+class ModuleResult(NamedTuple):
+    """Tek modül dokümanının değiştirilemez doğrulama sonucu"""
+    name: str
+    valid: bool
+    errors: Tuple[Issue, ...]
+    warnings: Tuple[Issue, ...]
+    digest: str
+
+    def to_dict(self) -> Dict:
+        return {
+            "valid": self.valid,
+            "errors": [e.to_dict() for e in self.errors],
+            "warnings": [w.to_dict() for w in self.warnings]
+        }
+
+
+class SchemaResult(NamedTuple):
+    """Modül seti ve relations için değiştirilemez doğrulama sonucu"""
+    valid: bool
+    modules: Mapping[str, ModuleResult]
+    errors: Tuple[Issue, ...]
+    warnings: Tuple[Issue, ...]
+
+    def to_dict(self) -> Dict:
+        """SchemaValidator.validate_all() ile aynı yapıda rapor"""
+        return {
+            "valid": self.valid,
+            "modules": {name: m.to_dict() for name, m in self.modules.items()},
+            "errors": [e.to_dict() for e in self.errors],
+            "warnings": [w.to_dict() for w in self.warnings],
+            "summary": {
+                "total_modules": len(self.modules),
+                "valid_modules": sum(1 for m in self.modules.values() if m.valid),
+                "total_errors": len(self.errors),
+                "total_warnings": len(self.warnings)
+            }
+        }
+
+
+def _issues(items: Iterable[Dict]) -> Tuple[Issue, ...]:
+    return tuple(Issue.from_dict(item) for item in items)
+
+
+def _content_bytes(content: Document) -> bytes:
+    return content.encode('utf-8') if isinstance(content, str) else bytes(content)
+
+
+def _digest(content: bytes) -> str:
+    return hashlib.blake2b(content, digest_size=16).hexdigest()
+
+
+class ValidationService:
+    """
+    Thread-safe, yeniden girilebilir doğrulama servisi.
+
+    Örnek üzerindeki tek değişken durum modül önbelleğidir ve kilitle
+    korunur; doğrulama kilit dışında, çağrıya özel validator ile yapılır.
+    """
+
+    def __init__(self, base_path: str = None, levels: List[str] = None,
+                 registry: RuleRegistry = None, stream: Optional[bool] = None,
+                 max_modules: int = MAX_MODULES, max_bytes: int = MAX_BYTES):
+        """
+        Args:
+            base_path: meta/paktlang.meta.json için ana dizin (seviyeler)
+            levels: Doğrulama seviyeleri (varsayılan: meta dosyasından)
+            registry: Kural kaydı (varsayılan: yerleşik kurallar)
+            stream: SchemaValidator ile aynı; büyük dokümanlar akış halinde
+            max_modules: Önbellekte tutulacak en fazla modül sonucu
+            max_bytes: Önbellekteki modüllerin toplam kaynak boyutu sınırı
+        """
+        self._template = SchemaValidator(base_path, levels=levels, registry=registry, stream=stream)
+        self.levels = self._template.levels
+        self.max_modules = max_modules
+        self.max_bytes = max_bytes
+        # (digest, dosya adı) -> (sonuç, ayrıştırılmış veri, boyut)
+        self._modules: "OrderedDict[Tuple[str, str], Tuple[Any, Optional[Dict], int]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def validate_document(self, content: Document, name: str = "module.json") -> ModuleResult:
+        """
+        Tek modül dokümanını doğrular.
+
+        Args:
+            content: Modül JSON içeriği
+            name: Dosya adı; modülde "module" alanı yoksa modül adı ve
+                PL001 bulgularının path'i buradan gelir
+        """
+        content = _content_bytes(content)
+        result, _ = self._module(content, name)
+        return result
+
+    def validate_schema(self, documents: Mapping[str, Document],
+                        relations: Optional[Document] = None) -> SchemaResult:
+        """
+        Modül setini (ve varsa relations.json'u) modüller arası kontrollerle
+        birlikte doğrular.
+
+        Args:
+            documents: Dosya adı ("stok.json") -> modül içeriği
+            relations: relations.json içeriği
+        """
+        sources = {}
+        digests = []
+        modules: Dict[str, ModuleResult] = {}
+        loaded: Dict[str, Dict] = {}
+        for file_name in sorted(documents):
+            content = _content_bytes(documents[file_name])
+            result, data = self._module(content, file_name)
+            stem = PurePosixPath(file_name).stem
+            modules[stem] = result
+            digests.append((file_name, result.digest))
+            sources[_UPLOAD_ROOT / "modules" / f"{stem}.json"] = content
+            if data:
+                loaded[stem] = data
+
+        errors: List[Issue] = []
+        warnings: List[Issue] = []
+        for result in modules.values():
+            if not result.valid:
+                errors.extend(result.errors)
+            warnings.extend(result.warnings)
+
+        if relations is not None:
+            relations = _content_bytes(relations)
+            digests.append(("\0relations", _digest(relations)))
+        cross = self._cross_module(tuple(digests), loaded, relations, sources)
+
+        valid = all(m.valid for m in modules.values())
+        for issue in cross:
+            if issue.severity == "error":
+                errors.append(issue)
+                valid = False
+            else:
+                warnings.append(issue)
+
+        return SchemaResult(valid, MappingProxyType(modules), tuple(errors), tuple(warnings))
+
+    async def validate_document_async(self, content: Document, name: str = "module.json",
+                                      executor=None) -> ModuleResult:
+        """validate_document(); olay döngüsünü bloklamadan executor'da çalışır"""
+        import asyncio
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, self.validate_document, content, name)
+
+    async def validate_documents_async(self, documents: Mapping[str, Document], limit: int = 8,
+                                       executor=None) -> Dict[str, ModuleResult]:
+        """
+        Birbirinden bağımsız dokümanları (ör. farklı müşterilerin
+        yüklemeleri) aynı anda doğrular.
+
+        Args:
+            documents: Dosya adı -> içerik
+            limit: Aynı anda doğrulanacak en fazla doküman
+            executor: Varsayılan: olay döngüsünün thread havuzu
+
+        Returns:
+            Dosya adı -> sonuç (girdi sırasıyla)
+        """
+        import asyncio
+        semaphore = asyncio.Semaphore(limit)
+
+        async def run(name: str, content: Document) -> ModuleResult:
+            async with semaphore:
+                return await self.validate_document_async(content, name, executor)
+
+        names = list(documents)
+        results = await asyncio.gather(*(run(name, documents[name]) for name in names))
+        return dict(zip(names, results))
+
+    async def validate_schema_async(self, documents: Mapping[str, Document],
+                                    relations: Optional[Document] = None,
+                                    executor=None) -> SchemaResult:
+        """validate_schema(); olay döngüsünü bloklamadan executor'da çalışır"""
+        import asyncio
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, self.validate_schema, documents, relations)
+
+    def stats(self) -> Dict[str, int]:
+        """Önbellek durumu"""
+        with self._lock:
+            return {
+                "modules": len(self._modules),
+                "bytes": self._bytes,
+                "hits": self.hits,
+                "misses": self.misses
+            }
+
+    def clear(self):
+        with self._lock:
+            self._modules.clear()
+            self._bytes = 0
+
+    def _lookup(self, key: Tuple[str, str]) -> Optional[Tuple[Any, Optional[Dict]]]:
+        with self._lock:
+            cached = self._modules.get(key)
+            if cached is None:
+                self.misses += 1
+                return None
+            self._modules.move_to_end(key)
+            self.hits += 1
+            return cached[0], cached[1]
+
+    def _store(self, key: Tuple[str, str], result: Any, data: Optional[Dict], size: int):
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._modules.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous[2]
+            self._modules[key] = (result, data, size)
+            self._bytes += size
+            while len(self._modules) > self.max_modules or self._bytes > self.max_bytes:
+                _, (_, _, evicted) = self._modules.popitem(last=False)
+                self._bytes -= evicted
+
+    def _module(self, content: bytes, name: str) -> Tuple[ModuleResult, Optional[Dict]]:
+        digest = _digest(content)
+        key = (digest, name)
+        cached = self._lookup(key)
+        if cached is not None:
+            return cached
+
+        validator = self._template.fork()
+        outcome = validator._validate_file(name, content)
+        data = outcome["data"]
+        module_name = PurePosixPath(name).stem
+        if isinstance(data, dict):
+            module_name = data.get("module", module_name)
+        result = ModuleResult(module_name, bool(outcome["valid"]), _issues(outcome["errors"]),
+                              _issues(outcome["warnings"]), digest)
+        # Ayrıştırılmış veri sadece modüller arası kontrollerde okunur, dışarı verilmez
+        self._store(key, result, data, len(content))
+        return result, data
+
+    def _cross_module(self, digests: Tuple[Tuple[str, str], ...], loaded: Dict[str, Dict],
+                      relations: Optional[bytes], sources: Dict[Path, bytes]) -> Tuple[Issue, ...]:
+        """Modüller arası kontroller; aynı doküman seti için sonuç önbellekten döner"""
+        key = ("\0cross", _digest(json.dumps(digests).encode('utf-8')))
+        cached = self._lookup(key)
+        if cached is not None:
+            return cached[0]
+
+        validator = self._template.fork()
+        relations_data = None
+        issues: List[ValidationError] = []
+        relations_file = _UPLOAD_ROOT / "relations" / "relations.json"
+        if relations is not None:
+            sources[relations_file] = relations
+            try:
+                relations_data = json.loads(relations.decode('utf-8'))
+            except json.JSONDecodeError as e:
+                issues.append(ValidationError(
+                    "PL001", f"JSON parse hatası: {str(e)}", "relations.json",
+                    line=e.lineno, column=e.colno
+                ))
+            except UnicodeDecodeError as e:
+                issues.append(ValidationError("PL001", f"JSON parse hatası: {str(e)}", "relations.json"))
+
+        cross = validator.validate_cross_module(loaded, relations_data)
+        validator.locate_issues(cross, _UPLOAD_ROOT / "modules", relations_file, sources)
+        issues.extend(cross)
+        result = _issues(e.to_dict() for e in issues)
+        self._store(key, result, None, 0)
+        return result
@@ -0,0 +1,442 @@
+"""
+PaktLang Streaming JSON
+Büyük modül dosyalarını parça parça okuyan ayrıştırıcı ve kaynak konum (satır/sütun) çözümleme
+"""
+
+import json
+import re
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Set, TextIO, Tuple, Union
+
+
+_WS = re.compile(r'[ \t\n\r]*')
+_DECODER = json.JSONDecoder()
+
+# Parça parça okunan üst seviye diziler; diğer anahtarlar tek seferde çözülür
+STREAMED_ARRAYS = ("tables", "views")
+
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+Position = Tuple[int, int]
+Step = Union[str, int]
+
+
+class StreamError(ValueError):
+    """JSON sözdizimi hatası (1 tabanlı satır/sütun ile)"""
+
+    def __init__(self, message: str, line: int, column: int):
+        # json.JSONDecodeError ile aynı biçim
+        super().__init__(f"{message}: line {line} column {column}")
+        self.msg = message
+        self.line = line
+        self.column = column
+
+
+class JsonStream:
+    """
+    Tampon üzerinde ilerleyen JSON okuyucu.
+
+    Değerler json.JSONDecoder.raw_decode (C hızında) ile çözülür; tampon
+    sadece tüketilmemiş kısmı ve bir sonraki parçayı tutar. Satır/sütun
+    takibi tampon içinde ileri doğru sayılarak yapılır.
+    """
+
+    def __init__(self, fp: TextIO, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        self.fp = fp
+        self.chunk_size = chunk_size
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+        # Konumu bilinen son tampon indeksi ve satır/sütunu
+        self._mark = 0
+        self._line = 1
+        self._col = 1
+
+    def _fill(self, size: int = None) -> bool:
+        if self.eof:
+            return False
+        chunk = self.fp.read(size or self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        self.buf += chunk
+        return True
+
+    def compact(self):
+        """Tüketilmiş kısmı tampondan atar"""
+        if self.pos < self.chunk_size:
+            return
+        self.position(self.pos)
+        self.buf = self.buf[self.pos:]
+        self._mark -= self.pos
+        self.pos = 0
+
+    def position(self, index: int) -> Position:
+        """Tampon indeksinin (1 tabanlı) satır/sütunu; indeksler artan sırayla sorulmalı"""
+        mark = self._mark
+        if index < mark:
+            raise ValueError("Konumlar artan sırayla sorulmalı")
+        newlines = self.buf.count("\n", mark, index)
+        if newlines:
+            self._line += newlines
+            self._col = index - self.buf.rfind("\n", mark, index)
+        else:
+            self._col += index - mark
+        self._mark = index
+        return self._line, self._col
+
+    def error(self, message: str, index: int = None) -> StreamError:
+        line, column = self.position(max(self.pos if index is None else index, self._mark))
+        return StreamError(message, line, column)
+
+    def skip_ws(self):
+        while True:
+            self.pos = _WS.match(self.buf, self.pos).end()
+            if self.pos < len(self.buf) or not self._fill():
+                return
+
+    def peek(self) -> str:
+        self.skip_ws()
+        return self.buf[self.pos] if self.pos < len(self.buf) else ""
+
+    def expect(self, char: str):
+        if self.peek() != char:
+            raise self.error(f"'{char}' bekleniyordu")
+        self.pos += 1
+
+    def value(self) -> Tuple[Any, int, int]:
+        """
+        Sıradaki JSON değerini çözer.
+
+        Returns:
+            (değer, başlangıç indeksi, bitiş indeksi)
+        """
+        self.skip_ws()
+        start = self.pos
+        size = self.chunk_size
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self.buf, start)
+            except json.JSONDecodeError as e:
+                if self._fill(size):
+                    size *= 2
+                    continue
+                raise self.error(e.msg, e.pos)
+            # Sayılar tampon sonunda bölünmüş olabilir ("12|3")
+            if end == len(self.buf) and self._fill(size):
+                continue
+            self.pos = end
+            return value, start, end
+
+
+def iter_module(fp: TextIO, arrays: Sequence[str] = STREAMED_ARRAYS,
+                chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Tuple]:
+    """
+    Modül dosyasını üst seviye anahtar anahtar okur.
+
+    Üretilen olaylar:
+        ("key", anahtar, değer, konum)
+        ("item", dizi anahtarı, indeks, değer, konum, kaynak metin)
+        ("array", dizi anahtarı, eleman sayısı, konum)
+
+    arrays içindeki diziler eleman eleman üretilir; bellekte aynı anda
+    sadece bir eleman ve okuma tamponu bulunur.
+    """
+    stream = JsonStream(fp, chunk_size)
+    stream.expect("{")
+    if stream.peek() == "}":
+        stream.pos += 1
+    else:
+        while True:
+            key, start, _ = stream.value()
+            if not isinstance(key, str):
+                raise stream.error("Anahtar string olmalı", start)
+            stream.expect(":")
+
+            if key in arrays and stream.peek() == "[":
+                array_pos = stream.position(stream.pos)
+                stream.pos += 1
+                count = 0
+                if stream.peek() == "]":
+                    stream.pos += 1
+                else:
+                    while True:
+                        value, start, end = stream.value()
+                        yield ("item", key, count, value, stream.position(start), stream.buf[start:end])
+                        count += 1
+                        stream.compact()
+                        char = stream.peek()
+                        stream.pos += 1
+                        if char == "]":
+                            break
+                        if char != ",":
+                            raise stream.error("',' veya ']' bekleniyordu", stream.pos - 1)
+                yield ("array", key, count, array_pos)
+            else:
+                value, start, _ = stream.value()
+                yield ("key", key, value, stream.position(start))
+
+            stream.compact()
+            char = stream.peek()
+            stream.pos += 1
+            if char == "}":
+                break
+            if char != ",":
+                raise stream.error("',' veya '}' bekleniyordu", stream.pos - 1)
+
+    if stream.peek():
+        raise stream.error("Fazladan veri")
+
+
+def _skip_ws(text: str, index: int) -> int:
+    return _WS.match(text, index).end()
+
+
+def locate(text: str, steps: Iterable[Step]) -> Optional[int]:
+    """
+    JSON metninde anahtar/indeks yolunun gösterdiği değerin başlangıcı.
+
+    Aradaki değerler raw_decode ile atlanır; metin bir tablo veya view
+    elemanı kadar küçük olduğu için ucuzdur. Yol bulunamazsa None.
+    """
+    index = _skip_ws(text, 0)
+    try:
+        for step in steps:
+            if isinstance(step, int):
+                if text[index] != "[":
+                    return None
+                index = _skip_ws(text, index + 1)
+                for _ in range(step):
+                    if text[index] == "]":
+                        return None
+                    _, index = _DECODER.raw_decode(text, index)
+                    index = _skip_ws(text, index)
+                    if text[index] == ",":
+                        index = _skip_ws(text, index + 1)
+                if text[index] == "]":
+                    return None
+            else:
+                if text[index] != "{":
+                    return None
+                index = _skip_ws(text, index + 1)
+                while True:
+                    if text[index] == "}":
+                        return None
+                    key, index = _DECODER.raw_decode(text, index)
+                    index = _skip_ws(text, _skip_ws(text, index) + 1)
+                    if key == step:
+                        break
+                    _, index = _DECODER.raw_decode(text, index)
+                    index = _skip_ws(text, index)
+                    if text[index] == ",":
+                        index = _skip_ws(text, index + 1)
+    except (IndexError, ValueError):
+        return None
+    return index
+
+
+def array_items(text: str, steps: Iterable[Step] = ()) -> List[Tuple[int, int]]:
+    """Yolun gösterdiği dizinin elemanlarının (başlangıç, bitiş) ofsetleri"""
+    index = locate(text, steps)
+    items = []
+    if index is None or text[index:index + 1] != "[":
+        return items
+    try:
+        index = _skip_ws(text, index + 1)
+        while text[index] != "]":
+            _, end = _DECODER.raw_decode(text, index)
+            items.append((index, end))
+            index = _skip_ws(text, end)
+            if text[index] == ",":
+                index = _skip_ws(text, index + 1)
+    except (IndexError, ValueError):
+        pass
+    return items
+
+
+def object_items(text: str, offset: int = 0) -> Dict[str, Tuple[int, int]]:
+    """offset'teki nesnenin anahtar -> değer (başlangıç, bitiş) ofsetleri"""
+    items: Dict[str, Tuple[int, int]] = {}
+    index = _skip_ws(text, offset)
+    if text[index:index + 1] != "{":
+        return items
+    try:
+        index = _skip_ws(text, index + 1)
+        while text[index] != "}":
+            key, index = _DECODER.raw_decode(text, index)
+            index = _skip_ws(text, _skip_ws(text, index) + 1)
+            _, end = _DECODER.raw_decode(text, index)
+            items[key] = (index, end)
+            index = _skip_ws(text, end)
+            if text[index] == ",":
+                index = _skip_ws(text, index + 1)
+    except (IndexError, ValueError):
+        pass
+    return items
+
+
+def value_end(text: str, offset: int) -> int:
+    """offset'te başlayan JSON değerinin bitiş ofseti (çözülemezse offset)"""
+    try:
+        return _DECODER.raw_decode(text, offset)[1]
+    except ValueError:
+        return offset
+
+
+def offset_position(text: str, offset: int, origin: Position) -> Position:
+    """Metin içi ofsetin, metnin başladığı konuma göre satır/sütunu"""
+    newlines = text.count("\n", 0, offset)
+    if not newlines:
+        return origin[0], origin[1] + offset
+    return origin[0] + newlines, offset - text.rfind("\n", 0, offset)
+
+
+# Kural kodu -> kolon içinde hatanın işaret edeceği anahtar
+COLUMN_KEYS = {"PL002": "type", "PL008": "pattern", "PL009": "scale", "PL010": "name"}
+
+# Modüller arası bulgularda kolonun işaret edilecek anahtarı (FK, view kaynağı)
+REFERENCE_KEYS = ("foreign_key", "source")
+
+
+def table_steps(table: Dict, table_path: str, issue) -> List[Step]:
+    """
+    Tablo içi bulgunun (path'i tablo veya kolon) tablo metnindeki yolu.
+
+    table_path: "modül.tablo"; kolon bulguları "modül.tablo.kolon" veya
+    "modül.tablo.columns[i]" path'i taşır. Yol çözülemezse [] (tablonun kendisi).
+    """
+    columns = table.get("columns") if isinstance(table, dict) else None
+    if not isinstance(columns, list):
+        return []
+    path = issue.path
+
+    if path == table_path:
+        if issue.code == "PL004":
+            # Duplike adın ikinci geçtiği kolon
+            name = issue.message.rsplit(": ", 1)[-1]
+            seen = False
+            for i, column in enumerate(columns):
+                if isinstance(column, dict) and column.get("name") == name:
+                    if seen:
+                        return ["columns", i, "name"]
+                    seen = True
+        return []
+
+    if not path.startswith(table_path + "."):
+        return []
+    rest = path[len(table_path) + 1:]
+    if rest.startswith("columns[") and rest.endswith("]"):
+        try:
+            return ["columns", int(rest[8:-1])]
+        except ValueError:
+            return []
+    matches = [i for i, column in enumerate(columns)
+               if isinstance(column, dict) and column.get("name") == rest]
+    if not matches:
+        return []
+    key = COLUMN_KEYS.get(issue.code)
+    index = matches[0]
+    if len(matches) > 1 and key:
+        # Aynı adlı kolonlardan değeri mesajda geçen (ör. bilinmeyen tip)
+        for i in matches:
+            if key in columns[i] and str(columns[i][key]) in issue.message:
+                index = i
+                break
+    return ["columns", index, key] if key and key in columns[index] else ["columns", index]
+
+
+def item_position(text: str, origin: Position, steps: List[Step]) -> Position:
+    """Eleman metni içinde yolun konumu; bulunamazsa elemanın kendisi"""
+    if not steps:
+        return origin
+    offset = locate(text, steps)
+    return origin if offset is None else offset_position(text, offset, origin)
+
+
+def set_position(issue, position: Optional[Position]):
+    if position is not None:
+        issue.line, issue.column = position
+
+
+def annotate_table(issues: Iterable, table: Dict, index: int, text: str, origin: Position,
+                   module_name: str):
+    """Tablonun kendi kurallarından gelen bulgulara konum ekler"""
+    table_path = f"{module_name}.{table.get('pl_table', 'unknown')}" if isinstance(table, dict) else ""
+    for issue in issues:
+        set_position(issue, item_position(text, origin, table_steps(table, table_path, issue)))
+
+
+def annotate_header(issues: Iterable, positions: Dict[str, Position]):
+    """Modül seviyesi bulgulara konum ekler (versiyon hatası "version" değerine)"""
+    for issue in issues:
+        if issue.code == "PL007" and "version" in positions:
+            set_position(issue, positions["version"])
+        else:
+            set_position(issue, (1, 1))
+
+
+def annotate_module(fp: TextIO, issues: List, module_name: str):
+    """
+    Tek seferde ayrıştırılmış modülün bulgularına, dosyayı bir kez daha
+    akış halinde okuyarak konum ekler (sadece bulgu varsa çağrılır).
+    """
+    pending = [i for i in issues if getattr(i, "line", None) is None]
+    if not pending:
+        return
+    header = [i for i in pending if i.path == module_name]
+    body = [i for i in pending if i.path != module_name]
+    positions = {}
+    for event in iter_module(fp, arrays=("tables",)):
+        if event[0] == "key":
+            positions[event[1]] = event[3]
+        elif event[0] == "item" and body:
+            _, _, index, table, origin, text = event
+            if not isinstance(table, dict):
+                continue
+            prefixes = (f"{module_name}.{table.get('pl_table', 'unknown')}",
+                        f"{module_name}.tables[{index}]")
+            matched = [i for i in body
+                       if i.path in prefixes or i.path.startswith(prefixes[0] + ".")]
+            if matched:
+                annotate_table(matched, table, index, text, origin, module_name)
+                body = [i for i in body if getattr(i, "line", None) is None]
+    annotate_header(header, positions)
+
+
+def reference_positions(fp: TextIO, refs: Dict[str, Set[Optional[str]]]) -> Dict[Tuple, Position]:
+    """
+    Modül dosyasını akış halinde bir kez okuyarak tablo/view ve kolon
+    referanslarının konumlarını bulur.
+
+    Args:
+        refs: tablo veya view adı -> kolon adları (None: elemanın kendisi)
+
+    Returns:
+        (ad, kolon adı veya None) -> (satır, sütun)
+    """
+    found: Dict[Tuple, Position] = {}
+    for event in iter_module(fp):
+        if event[0] != "item":
+            continue
+        _, key, _, value, origin, text = event
+        if not isinstance(value, dict):
+            continue
+        name = value.get("pl_table") if key == "tables" else value.get("name")
+        wanted = refs.get(name)
+        if not wanted:
+            continue
+        columns = value.get("columns")
+        for column_name in wanted:
+            if (name, column_name) in found:
+                continue
+            steps: List[Step] = []
+            if column_name is not None and isinstance(columns, list):
+                for i, column in enumerate(columns):
+                    if isinstance(column, dict) and column.get("name") == column_name:
+                        steps = ["columns", i]
+                        for ref_key in REFERENCE_KEYS:
+                            if ref_key in column:
+                                steps.append(ref_key)
+                                break
+                        break
+            found[(name, column_name)] = item_position(text, origin, steps)
+    return found
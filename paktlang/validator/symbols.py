@@ -0,0 +1,170 @@
+"""
+PaktLang Symbol Index
+Şema genelinde modül -> tablo -> kolon sembol tablosu
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+
+class ColumnSymbol:
+    """Kolon sembolü"""
+
+    __slots__ = ("module", "table", "name", "type", "primary_key", "unique", "foreign_key")
+
+    def __init__(self, module: str, table: str, column: Dict):
+        self.module = module
+        self.table = table
+        self.name = column_name(column)
+        self.type = column.get("type")
+        self.primary_key = bool(column.get("primary_key"))
+        self.unique = bool(column.get("unique"))
+        self.foreign_key = column.get("foreign_key") or None
+
+    @property
+    def is_key(self) -> bool:
+        """Referans hedefi olabilir mi (PK veya unique)"""
+        return self.primary_key or self.unique
+
+
+class TableSymbol:
+    """Tablo sembolü"""
+
+    __slots__ = ("module", "name", "columns", "primary_key")
+
+    def __init__(self, module: str, name: str):
+        self.module = module
+        self.name = name
+        self.columns: Dict[str, ColumnSymbol] = {}
+        self.primary_key: List[str] = []
+
+
+class SymbolIndex:
+    """
+    Modül -> tablo -> kolon sembol tablosu.
+
+    Bir kez oluşturulur ve tüm çapraz referans kontrolleri tarafından
+    paylaşılır; tüm aramalar O(1) sözlük erişimidir.
+    """
+
+    def __init__(self, modules: Dict[str, Dict]):
+        """
+        Args:
+            modules: Modül anahtarı -> ayrıştırılmış modül verisi
+        """
+        self.modules: Dict[str, Dict[str, TableSymbol]] = {}
+        # Nitelenmemiş tablo adı -> tabloyu tanımlayan modüller
+        self.table_modules: Dict[str, List[str]] = {}
+
+        for module_name, module_data in modules.items():
+            self.add_module(module_name, module_data)
+
+    def add_module(self, module_name: str, module_data: Dict):
+        """Modülü index'e ekler (aynı anahtarla varsa yerine koyar)"""
+        if module_name in self.modules:
+            self.remove_module(module_name)
+
+        tables: Dict[str, TableSymbol] = {}
+        for table in module_data.get("tables", []):
+            table_name = table.get("pl_table")
+            if not table_name:
+                continue
+
+            symbol = TableSymbol(module_name, table_name)
+            for column in table.get("columns", []):
+                col = ColumnSymbol(module_name, table_name, column)
+                if not col.name:
+                    continue
+                symbol.columns.setdefault(col.name, col)
+                if col.primary_key:
+                    symbol.primary_key.append(col.name)
+
+            tables[table_name] = symbol
+            self.table_modules.setdefault(table_name, []).append(module_name)
+
+        self.modules[module_name] = tables
+
+    def remove_module(self, module_name: str):
+        """Modülü index'ten çıkarır"""
+        for table_name in self.modules.pop(module_name, {}):
+            owners = self.table_modules.get(table_name, [])
+            if module_name in owners:
+                owners.remove(module_name)
+            if not owners:
+                self.table_modules.pop(table_name, None)
+
+    # ------------------------------------------------------------------
+    # Arama
+    # ------------------------------------------------------------------
+
+    def has_module(self, module_name: str) -> bool:
+        return module_name in self.modules
+
+    def table(self, module_name: str, table_name: str) -> Optional[TableSymbol]:
+        return self.modules.get(module_name, {}).get(table_name)
+
+    def column(self, module_name: str, table_name: str, column_name: str) -> Optional[ColumnSymbol]:
+        table = self.table(module_name, table_name)
+        if table is None:
+            return None
+        return table.columns.get(column_name)
+
+    def find_table(self, table_name: str, prefer_module: str = None) -> Optional[TableSymbol]:
+        """
+        Nitelenmemiş tablo adını çözer; önce tercih edilen modüle,
+        sonra tabloyu tanımlayan ilk modüle bakar.
+        """
+        if prefer_module is not None:
+            table = self.table(prefer_module, table_name)
+            if table is not None:
+                return table
+
+        owners = self.table_modules.get(table_name)
+        if not owners:
+            return None
+        return self.modules[owners[0]][table_name]
+
+    def resolve_source(self, source: str, module_name: str,
+                       base_tables: List[str]) -> Tuple[Optional[TableSymbol], Optional[ColumnSymbol]]:
+        """
+        View kolon kaynağını ("tablo.kolon" veya sadece "kolon") çözer.
+        Nitelenmemiş kolonlar base_tables içinde aranır.
+        """
+        if "." in source:
+            table_name, column_name = source.split(".", 1)
+            table = self.find_table(table_name, module_name)
+            if table is None:
+                return None, None
+            return table, table.columns.get(column_name)
+
+        for table_name in base_tables:
+            table = self.find_table(table_name, module_name)
+            if table is not None and source in table.columns:
+                return table, table.columns[source]
+        return None, None
+
+
+def iter_tables(modules: Dict[str, Dict]):
+    """(modül anahtarı, tablo tanımı) çiftlerini modül sırasıyla üretir"""
+    for module_name, module_data in modules.items():
+        for table in module_data.get("tables", []):
+            if table.get("pl_table"):
+                yield module_name, table
+
+
+def find_table(modules: Dict[str, Dict], ref: str) -> Optional[Tuple[str, Dict]]:
+    """
+    "tablo" veya "modül.tablo" referansını çözer.
+
+    Returns:
+        (modül anahtarı, tablo tanımı) veya bulunamazsa None
+    """
+    module_name, _, table_name = ref.rpartition(".")
+    for candidate, table in iter_tables(modules):
+        if table["pl_table"] == table_name and (not module_name or candidate == module_name):
+            return candidate, table
+    return None
+
+
+def column_name(column: Dict) -> Optional[str]:
+    """Kolon adı ("name", eski modüllerde "pl_column")"""
+    return column.get("name") or column.get("pl_column")
@@ -0,0 +1,103 @@
+"""
+PaktLang Type Registry
+meta/base_types.json ve meta/erp_types.json tip tanımlarının çözümlenmesi
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Dict, FrozenSet, List, Optional
+
+
+# Kolon seviyesinde tip kısıtlarını ezebilen alanlar
+COLUMN_OVERRIDES = (
+    "precision", "scale", "min", "max", "min_length", "max_length", "pattern", "trim"
+)
+
+
+class ColumnType:
+    """Bir kolonun etkin (ERP tipi + kolon ayarları birleşmiş) tip tanımı"""
+
+    __slots__ = (
+        "name", "base", "precision", "scale", "min", "max", "min_length",
+        "max_length", "pattern", "trim", "lowercase", "checksum", "values"
+    )
+
+    def __init__(self, name: str, base: str):
+        self.name = name
+        self.base = base
+        self.precision: Optional[int] = None
+        self.scale: Optional[int] = None
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+        self.min_length: Optional[int] = None
+        self.max_length: Optional[int] = None
+        self.pattern: Optional[str] = None
+        self.trim = False
+        self.lowercase = False
+        self.checksum: Optional[str] = None
+        self.values: Optional[List[Any]] = None
+
+    @property
+    def is_numeric(self) -> bool:
+        return self.base in ("integer", "bigint", "decimal")
+
+    def to_dict(self) -> Dict:
+        return {slot: getattr(self, slot) for slot in self.__slots__}
+
+
+class TypeRegistry:
+    """Temel ve ERP tiplerini tek yerden çözer"""
+
+    def __init__(self, base_types: Dict[str, Dict], erp_types: Dict[str, Dict]):
+        self.base_types = base_types
+        self.erp_types = erp_types
+        self.names: FrozenSet[str] = frozenset(base_types) | frozenset(erp_types)
+
+    @classmethod
+    def load(cls, meta_dir: str) -> "TypeRegistry":
+        """meta/ dizinindeki tip dosyalarını yükler"""
+        meta_dir = Path(meta_dir)
+        with open(meta_dir / "base_types.json", 'r', encoding='utf-8') as f:
+            base_types = json.load(f).get("base_types", {})
+        with open(meta_dir / "erp_types.json", 'r', encoding='utf-8') as f:
+            erp_types = json.load(f).get("erp_types", {})
+        return cls(base_types, erp_types)
+
+    def base_of(self, type_name: str) -> Optional[str]:
+        """Tipin temel tipi (bilinmiyorsa None)"""
+        if type_name in self.base_types:
+            return type_name
+        erp = self.erp_types.get(type_name)
+        if erp is not None:
+            return erp.get("base_type")
+        return None
+
+    def resolve(self, column: Dict) -> ColumnType:
+        """Kolon tanımından etkin tip bilgisini üretir"""
+        type_name = column.get("type")
+        base = self.base_of(type_name) or type_name
+        ctype = ColumnType(type_name, base)
+
+        # Temel tip varsayılanları (örn. decimal 18,2)
+        for key, spec in self.base_types.get(base, {}).get("constraints", {}).items():
+            if key in COLUMN_OVERRIDES and isinstance(spec, dict) and "default" in spec:
+                setattr(ctype, key, spec["default"])
+
+        # ERP tipi genişletmeleri
+        erp = self.erp_types.get(type_name)
+        if erp is not None:
+            for key, value in erp.get("extends", {}).items():
+                if key in COLUMN_OVERRIDES:
+                    setattr(ctype, key, value)
+            metadata = erp.get("metadata", {})
+            ctype.checksum = metadata.get("validation")
+            ctype.lowercase = bool(metadata.get("lowercase"))
+
+        # Kolon seviyesindeki ayarlar
+        for key in COLUMN_OVERRIDES:
+            if key in column:
+                setattr(ctype, key, column[key])
+        if column.get("values"):
+            ctype.values = list(column["values"])
+
+        return ctype
@@ -0,0 +1,320 @@
+"""
+PaktLang Watch Mode
+Şema ağacını bellekte tutup sadece değişen modülleri yeniden doğrular
+"""
+
+import json
+import time
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from .graph import build_module_graph
+from .schema_validator import SchemaValidator, ValidationError
+from .symbols import SymbolIndex
+
+
+class IncrementalValidator:
+    """
+    Bellekte tutulan şema üzerinde artımlı doğrulama.
+
+    Bir modül dosyası değiştiğinde sadece o modül ayrıştırılıp doğrulanır;
+    foreign key ve view kontrolleri değişen modül ile ona (module_dependencies
+    ve FK kenarları üzerinden) bağımlı modüller için tekrarlanır. Sembol
+    index'i yerinde güncellenir. relations.json değişikliği sadece ilişki ve
+    döngü kontrollerini, meta/ ve mappings/ değişikliği tam doğrulamayı
+    tetikler.
+
+    overlay'deki dosyalar (editörde açık dokümanlar) diskten değil
+    bellekteki içerikten okunur.
+    """
+
+    def __init__(self, base_path: str = None, modules_path: str = None,
+                 validator: SchemaValidator = None):
+        self.validator = validator or SchemaValidator(base_path)
+        self.modules_dir = self.validator._modules_dir(modules_path)
+        self.root = self.modules_dir.parent.parent
+        self.relations_file = self.validator._relations_file(self.modules_dir)
+        # Dosya yolu -> bellekteki içerik (diskteki dosyanın yerine geçer)
+        self.overlay: Dict[Path, bytes] = {}
+
+        self.modules: Dict[str, Dict] = {}
+        self.outcomes: Dict[str, Dict] = {}
+        self.relations: Optional[Dict] = None
+        self.relations_errors: List[Dict] = []
+        self.index = SymbolIndex({})
+        self.module_graph = build_module_graph({})
+
+        # Modül bazlı çapraz kontrol sonuçları ve global sonuçlar
+        self.fk_issues: Dict[str, List[Dict]] = {}
+        self.view_issues: Dict[str, List[Dict]] = {}
+        self.global_issues: List[Dict] = []
+        # Global bulguların kaynak konumları; ilgili dosya yeniden yüklenince silinir
+        self.global_positions: Dict[Tuple[str, str, str], Tuple[int, int]] = {}
+
+    @property
+    def watch_dirs(self) -> List[Path]:
+        """İzlenecek dizinler: modules/, relations/, meta/, mappings/"""
+        return [
+            self.modules_dir,
+            self.relations_file.parent,
+            self.root / "meta",
+            self.root / "mappings"
+        ]
+
+    # ------------------------------------------------------------------
+    # Yükleme
+    # ------------------------------------------------------------------
+
+    def load(self) -> Dict:
+        """Tüm ağacı yükler ve doğrular"""
+        self.modules = {}
+        self.outcomes = {}
+        self.index = SymbolIndex({})
+        self.global_positions = {}
+
+        files = set(self.modules_dir.glob("*.json"))
+        files.update(p for p in self.overlay if self._classify(p) == "module")
+        for json_file in sorted(files):
+            self._load_module(json_file)
+        self._load_relations()
+        self._refresh_cross(list(self.modules))
+        self._refresh_global()
+
+        return {"changed": [], "revalidated": sorted(self.outcomes), "full": True}
+
+    def _load_module(self, json_file: Path):
+        module_key = json_file.stem
+        self._forget_positions(lambda path: path.split(".")[0] == module_key)
+        content = self.overlay.get(json_file)
+        if content is None and not json_file.exists():
+            self.outcomes.pop(module_key, None)
+            self.modules.pop(module_key, None)
+            self.index.remove_module(module_key)
+            return
+
+        outcome = self.validator._validate_file(str(json_file), content)
+        data = outcome["data"]
+        self.outcomes[module_key] = {k: outcome[k] for k in ("valid", "errors", "warnings")}
+
+        if isinstance(data, dict):
+            self.modules[module_key] = data
+            self.index.add_module(module_key, data)
+        else:
+            self.modules.pop(module_key, None)
+            self.index.remove_module(module_key)
+
+    def _load_relations(self):
+        self.relations = None
+        self.relations_errors = []
+        self._forget_positions(lambda path: path.startswith("relations."))
+        content = self.overlay.get(self.relations_file)
+        if content is not None:
+            try:
+                self.relations = json.loads(content.decode('utf-8'))
+            except ValueError as e:
+                self.relations_errors = [ValidationError(
+                    "PL001", f"JSON parse hatası: {str(e)}", str(self.relations_file),
+                    line=getattr(e, "lineno", None), column=getattr(e, "colno", None)
+                ).to_dict()]
+            return
+        if not self.relations_file.exists():
+            return
+
+        is_valid, data = self.validator.validate_json_syntax(str(self.relations_file))
+        if is_valid:
+            self.relations = data
+        else:
+            self.relations_errors = [self.validator.errors.pop().to_dict()]
+
+    def _refresh_cross(self, module_keys: Iterable[str]):
+        """Verilen modüllerin FK ve view kontrollerini yeniler"""
+        for module_key in module_keys:
+            data = self.modules.get(module_key)
+            if data is None:
+                self.fk_issues.pop(module_key, None)
+                self.view_issues.pop(module_key, None)
+                continue
+            subset = {module_key: data}
+            fk_issues = self.validator.validate_foreign_keys(subset, self.index)
+            view_issues = self.validator.validate_views(subset, self.index)
+            self.validator.locate_issues(fk_issues + view_issues, self.modules_dir, sources=self.overlay)
+            self.fk_issues[module_key] = [e.to_dict() for e in fk_issues]
+            self.view_issues[module_key] = [e.to_dict() for e in view_issues]
+
+    def _refresh_global(self):
+        """relations.json ve döngü kontrollerini yeniler (doğrusal zaman)"""
+        self.module_graph = build_module_graph(self.modules, self.relations)
+        found = []
+        if self.relations:
+            found.extend(self.validator.validate_relations(self.relations, self.index))
+        found.extend(self.validator.validate_dependencies(self.modules, self.relations))
+
+        # Konumu bilinen bulgular için dosyalar yeniden okunmaz
+        positions = self.global_positions
+        pending = []
+        for issue in found:
+            position = positions.get((issue.code, issue.path, issue.message))
+            if position is None:
+                pending.append(issue)
+            else:
+                issue.line, issue.column = position
+        if pending:
+            self.validator.locate_issues(pending, self.modules_dir, self.relations_file, self.overlay)
+            for issue in pending:
+                if issue.line is not None:
+                    positions[(issue.code, issue.path, issue.message)] = (issue.line, issue.column)
+
+        self.global_issues = list(self.relations_errors) + [e.to_dict() for e in found]
+
+    def _forget_positions(self, matches: Callable[[str], bool]):
+        for key in [k for k in self.global_positions if matches(k[1])]:
+            del self.global_positions[key]
+
+    # ------------------------------------------------------------------
+    # Artımlı güncelleme
+    # ------------------------------------------------------------------
+
+    def _classify(self, path: Path) -> str:
+        path = Path(path)
+        if path.parent == self.modules_dir and path.suffix == ".json":
+            return "module"
+        if path == self.relations_file:
+            return "relations"
+        if path.parent in (self.root / "meta", self.root / "mappings"):
+            return "global"
+        return "other"
+
+    def set_document(self, path: Path, content: Optional[bytes]) -> Dict:
+        """
+        Dosyanın bellekteki içeriğini ayarlar (None: diske geri dön) ve
+        ağacı günceller.
+        """
+        path = Path(path)
+        if content is None:
+            self.overlay.pop(path, None)
+        else:
+            self.overlay[path] = content
+        return self.update([path])
+
+    def update(self, changed_paths: Iterable[Path]) -> Dict:
+        """
+        Değişen dosyalara göre ağacı günceller.
+
+        Returns:
+            changed (dosyalar), revalidated (yeniden doğrulanan modüller),
+            full (tam doğrulama yapıldı mı) ve elapsed_ms
+        """
+        started = time.perf_counter()
+        changed = [Path(p) for p in changed_paths]
+        kinds = {p: self._classify(p) for p in changed}
+
+        if "global" in kinds.values():
+            result = self.load()
+        else:
+            changed_modules = sorted(p.stem for p, kind in kinds.items() if kind == "module")
+            for path, kind in kinds.items():
+                if kind == "module":
+                    self._load_module(path)
+            if "relations" in kinds.values():
+                self._load_relations()
+
+            # Graf güncellenir, sonra bağımlı modüller bulunur
+            self._refresh_global()
+            affected = [
+                m for m in self.module_graph.dependents(changed_modules)
+                if m in self.modules or m in changed_modules
+            ]
+            for module_key in changed_modules:
+                if module_key not in affected:
+                    affected.append(module_key)
+            self._refresh_cross(affected)
+            result = {"changed": [], "revalidated": sorted(affected), "full": False}
+
+        result["changed"] = [str(p) for p in changed]
+        result["elapsed_ms"] = round((time.perf_counter() - started) * 1000, 2)
+        return result
+
+    # ------------------------------------------------------------------
+    # Rapor
+    # ------------------------------------------------------------------
+
+    def report(self) -> Dict:
+        """validate_all ile aynı yapıda güncel doğrulama raporu"""
+        results = {
+            "valid": True,
+            "modules": {},
+            "errors": [],
+            "warnings": [],
+            "summary": {}
+        }
+
+        for module_key in sorted(self.outcomes):
+            outcome = self.outcomes[module_key]
+            results["modules"][module_key] = outcome
+            if not outcome["valid"]:
+                results["valid"] = False
+                results["errors"].extend(outcome["errors"])
+            results["warnings"].extend(outcome["warnings"])
+
+        cross_issues = []
+        for bucket in (self.fk_issues, self.view_issues):
+            for module_key in sorted(bucket):
+                cross_issues.extend(bucket[module_key])
+        cross_issues.extend(self.global_issues)
+
+        cross_errors = [i for i in cross_issues if i["severity"] == "error"]
+        if cross_errors:
+            results["valid"] = False
+            results["errors"].extend(cross_errors)
+        results["warnings"].extend(i for i in cross_issues if i["severity"] != "error")
+
+        results["summary"] = {
+            "total_modules": len(results["modules"]),
+            "valid_modules": sum(1 for m in results["modules"].values() if m["valid"]),
+            "total_errors": len(results["errors"]),
+            "total_warnings": len(results["warnings"])
+        }
+        return results
+
+
+class SchemaWatcher:
+    """
+    Dizinleri stat (mtime/size) taramasıyla izler. Harici bağımlılık
+    gerektirmez; sadece dizin girdileri okunur, dosya içerikleri okunmaz.
+    """
+
+    def __init__(self, dirs: Iterable[Path], interval: float = 0.2, pattern: str = "*.json"):
+        self.dirs = [Path(d) for d in dirs]
+        self.interval = interval
+        self.pattern = pattern
+        self._state = self.snapshot()
+
+    def snapshot(self) -> Dict[Path, Tuple[int, int]]:
+        state = {}
+        for directory in self.dirs:
+            if not directory.is_dir():
+                continue
+            for path in directory.glob(self.pattern):
+                try:
+                    st = path.stat()
+                except OSError:
+                    continue
+                state[path] = (st.st_mtime_ns, st.st_size)
+        return state
+
+    def poll(self) -> List[Path]:
+        """Son taramadan bu yana eklenen, silinen veya değişen dosyalar"""
+        current = self.snapshot()
+        changed = [p for p, sig in current.items() if self._state.get(p) != sig]
+        changed.extend(p for p in self._state if p not in current)
+        self._state = current
+        return sorted(changed)
+
+    def run(self, callback: Callable[[List[Path]], None],
+            stop: Callable[[], bool] = None):
+        """Değişiklik oldukça callback'i çağırır; stop() True dönene kadar çalışır"""
+        while not (stop and stop()):
+            time.sleep(self.interval)
+            changed = self.poll()
+            if changed:
+                callback(changed)